@@ -120,8 +120,13 @@ MODERNRPC_METHODS_MODULES = [
     'mathesar.rpc.tables',
     'mathesar.rpc.tables.metadata',
     'mathesar.rpc.tables.privileges',
+    'mathesar.rpc.tables.search_indexes',
     'mathesar.rpc.users'
 ]
+MODERNRPC_HANDLERS = [
+    'mathesar.rpc.batch.MathesarJSONRPCHandler',
+    'modernrpc.handlers.XMLRPCHandler',
+]
 
 TEMPLATES = [
     {
@@ -306,3 +311,18 @@ FALLBACK_LANGUAGE = 'en'
 SALT_KEY = SECRET_KEY
 
 PER_USER_DATABASES_ENABLED = os.environ.get('PER_USER_DATABASES_ENABLED') in ['t', 'true', 'True']
+
+# Connections to user databases are pooled per (server, database, role, sslmode)
+MATHESAR_CONNECTION_POOL_ENABLED = os.environ.get('MATHESAR_CONNECTION_POOL_ENABLED', default='true') in ['t', 'true', 'True']
+MATHESAR_CONNECTION_POOL_OPTIONS = {
+    'max_size': int(os.environ.get('MATHESAR_CONNECTION_POOL_MAX_SIZE', default=10)),
+    'max_idle': float(os.environ.get('MATHESAR_CONNECTION_POOL_MAX_IDLE', default=300)),
+    'max_lifetime': float(os.environ.get('MATHESAR_CONNECTION_POOL_MAX_LIFETIME', default=3600)),
+    'timeout': float(os.environ.get('MATHESAR_CONNECTION_POOL_TIMEOUT', default=30)),
+}
+# Seconds for which each worker process may reuse resolved connection parameters
+MATHESAR_CONNECTION_PARAMS_CACHE_TTL = float(os.environ.get('MATHESAR_CONNECTION_PARAMS_CACHE_TTL', default=60))
+# Estimated row count at which records.list (in "auto" count mode) stops counting rows exactly
+MATHESAR_COUNT_ESTIMATE_THRESHOLD = int(os.environ.get('MATHESAR_COUNT_ESTIMATE_THRESHOLD', default=1000000))
+# Maximum number of threads processing the independent calls of a read-only JSON-RPC batch
+MATHESAR_RPC_BATCH_MAX_WORKERS = int(os.environ.get('MATHESAR_RPC_BATCH_MAX_WORKERS', default=4))
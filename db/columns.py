@@ -1,3 +1,4 @@
+from datetime import timedelta
 import json
 
 from db import connection as db_conn
@@ -67,6 +68,148 @@ def alter_columns_in_table(table_oid, column_data_list, conn):
     return len(column_data_list)
 
 
+def validate_column_cast(
+        table_oid, column_data, conn, max_failures=20, sample_size=None,
+        time_budget=None, exact_count=False
+):
+    """
+    Find the values of a column which can't be cast to a new type.
+
+    For a description of column_data, see _transform_column_alter_dict.
+    Only its "id", "type", "type_options", and "cast_options" are used.
+    See the `msar.validate_column_cast` function for info on the other
+    arguments, and the result.
+
+    Args:
+        table_oid: The OID of the table containing the column.
+        column_data: A dict describing the column and the type to check.
+        max_failures: The maximum number of failing values to return.
+        sample_size: The number of values to check, or None for all.
+        time_budget: The number of seconds after which to stop checking
+            new batches of rows, or None for no limit.
+        exact_count: Whether to keep checking after max_failures values
+            have failed, to count all failing values.
+    """
+    alter_def = _transform_column_alter_dict(column_data)
+    return db_conn.exec_msar_func(
+        conn, 'validate_column_cast',
+        table_oid,
+        alter_def['attnum'],
+        json.dumps(alter_def.get('type')),
+        json.dumps(alter_def.get('cast_options', {})),
+        max_failures,
+        sample_size,
+        timedelta(seconds=time_budget) if time_budget is not None else None,
+        exact_count,
+    ).fetchone()[0]
+
+
+def start_online_retype(table_oid, column_data, conn):
+    """
+    Start retyping a column without blocking the table for the whole retype.
+
+    For a description of column_data, see _transform_column_alter_dict.
+    Only its "id", "type", "type_options", and "cast_options" are used.
+    The same column_data should be passed to backfill_online_retype and
+    finish_online_retype. See the `msar.start_online_retype` function for
+    a description of the whole process, and the result.
+
+    Args:
+        table_oid: The OID of the table containing the column.
+        column_data: A dict describing the column and its new type.
+    """
+    alter_def = _transform_column_alter_dict(column_data)
+    return db_conn.exec_msar_func(
+        conn, 'start_online_retype',
+        table_oid,
+        alter_def['attnum'],
+        json.dumps(alter_def.get('type')),
+        json.dumps(alter_def.get('cast_options', {})),
+    ).fetchone()[0]
+
+
+def backfill_online_retype(table_oid, column_data, after_key, batch_size, conn):
+    """
+    Fill the new values of a column being retyped online, for a batch of rows.
+
+    Returns a dict with the "count" of rows filled, and the "last_key" to
+    pass as after_key for the next batch.
+
+    Args:
+        table_oid: The OID of the table containing the column.
+        column_data: The dict given to start_online_retype.
+        after_key: The "last_key" of the previous batch, or None.
+        batch_size: The number of rows to fill.
+    """
+    alter_def = _transform_column_alter_dict(column_data)
+    return db_conn.exec_msar_func(
+        conn, 'backfill_online_retype',
+        table_oid,
+        alter_def['attnum'],
+        json.dumps(alter_def.get('type')),
+        json.dumps(alter_def.get('cast_options', {})),
+        after_key,
+        batch_size,
+    ).fetchone()[0]
+
+
+def add_online_retype_not_null_check(table_oid, column_attnum, conn):
+    return db_conn.exec_msar_func(
+        conn, 'add_online_retype_not_null_check', table_oid, column_attnum
+    ).fetchone()[0]
+
+
+def validate_online_retype_not_null_check(table_oid, column_attnum, conn):
+    db_conn.exec_msar_func(
+        conn, 'validate_online_retype_not_null_check', table_oid, column_attnum
+    )
+
+
+def finish_online_retype(table_oid, column_data, conn):
+    """
+    Replace a column being retyped online by its new values.
+
+    Returns the new attnum of the column.
+
+    Args:
+        table_oid: The OID of the table containing the column.
+        column_data: The dict given to start_online_retype.
+    """
+    alter_def = _transform_column_alter_dict(column_data)
+    return db_conn.exec_msar_func(
+        conn, 'finish_online_retype',
+        table_oid,
+        alter_def['attnum'],
+        json.dumps(alter_def.get('type')),
+        json.dumps(alter_def.get('cast_options', {})),
+    ).fetchone()[0]
+
+
+def cancel_online_retype(table_oid, column_attnum, conn):
+    db_conn.exec_msar_func(conn, 'cancel_online_retype', table_oid, column_attnum)
+
+
+def move_column_in_summary_templates(
+        table_oid, old_attnum, new_attnum, templates, conn
+):
+    """
+    Update the record summary templates referring to a replaced column.
+
+    Returns a dict mapping table OIDs (as strings) to the updated
+    templates, for those of the templates which were changed.
+
+    Args:
+        table_oid: The OID of the table whose column was replaced.
+        old_attnum: The attnum of the replaced column.
+        new_attnum: The attnum of the new column.
+        templates: A dict mapping table OIDs to record summary templates.
+    """
+    return db_conn.exec_msar_func(
+        conn, 'move_column_in_summary_templates',
+        table_oid, old_attnum, new_attnum, json.dumps(templates)
+    ).fetchone()[0]
+
+
 # TODO This function wouldn't be needed if we had the same form in the DB
 # as the RPC API function.
 def _transform_column_alter_dict(data):
@@ -1,7 +1,28 @@
+import threading
+
 import psycopg
 from psycopg.rows import dict_row
+from psycopg.types.json import set_json_loads
+from psycopg_pool import ConnectionPool
 from uuid import uuid4
 
+# Statements run on a pooled connection before it's handed back to the pool,
+# so one borrower can't leak session state (settings, temp tables, cursors,
+# advisory locks) to the next.
+POOLED_CONNECTION_RESET_SQL = """
+CLOSE ALL;
+RESET ALL;
+DISCARD TEMP;
+DISCARD SEQUENCES;
+UNLISTEN *;
+SELECT pg_catalog.pg_advisory_unlock_all();
+"""
+
+POOL_KEY_FIELDS = ('host', 'port', 'dbname', 'user', 'sslmode')
+
+_connection_pools = {}
+_connection_pools_lock = threading.Lock()
+
 
 def exec_msar_func(conn, func_name, *args):
     """
@@ -18,7 +39,7 @@ def exec_msar_func(conn, func_name, *args):
     )
 
 
-def exec_msar_func_server_cursor(conn, func_name, *args):
+def exec_msar_func_server_cursor(conn, func_name, *args, json_loads=None):
     """
     Execute an msar function using a psycopg (3) connection and a server cursor.
 
@@ -26,6 +47,8 @@ def exec_msar_func_server_cursor(conn, func_name, *args):
         conn: a psycopg connection or cursor
         func_name: The unqualified msar_function name (danger; not sanitized)
         *args: The list of parameters to pass
+        json_loads: (optional) The function with which to decode JSON
+            results, instead of `json.loads`.
 
     Note:
         The server cursor must be properly closed during usage.
@@ -35,6 +58,8 @@ def exec_msar_func_server_cursor(conn, func_name, *args):
         since the with statement automatically closes the cursor.
     """
     server_cursor = conn.cursor(name=str(uuid4()))
+    if json_loads is not None:
+        set_json_loads(json_loads, server_cursor)
     return server_cursor.execute(
         f"SELECT msar.{func_name}({','.join(['%s'] * len(args))})", args
     )
@@ -70,3 +95,122 @@ def mathesar_connection(*args, **kwargs):
     """
     kwargs.update(application_name="Mathesar " + kwargs.get("application_name", ""))
     return psycopg.connect(*args, **kwargs)
+
+
+def _reset_pooled_connection(conn):
+    conn.autocommit = True
+    conn.execute(POOLED_CONNECTION_RESET_SQL)
+    conn.autocommit = False
+
+
+def _close_pools(pools):
+    for pool in pools:
+        pool.close()
+
+
+def mathesar_pooled_connection(
+        *,
+        host,
+        port,
+        dbname,
+        user,
+        password,
+        sslmode,
+        application_name="",
+        max_size=10,
+        max_idle=300,
+        max_lifetime=3600,
+        timeout=30,
+):
+    """
+    Return a context manager yielding a connection from a shared pool.
+
+    Pools are kept per (host, port, dbname, user, sslmode), and created
+    on first use. The connection is committed (or rolled back on error)
+    and returned to the pool when the context exits, so it must be used
+    as:
+        with mathesar_pooled_connection(...) as conn:
+            ...
+
+    If the password for an existing pool has changed, the pool is closed
+    and replaced, so that we never keep serving connections
+    authenticated with stale credentials.
+
+    Args:
+        max_size: The maximum number of connections kept in each pool.
+        max_idle: Seconds after which an idle connection is closed.
+        max_lifetime: Seconds after which any connection is replaced.
+        timeout: Seconds to wait for a free connection before failing.
+    """
+    key = (host, port, dbname, user, sslmode)
+    stale_pools = []
+    with _connection_pools_lock:
+        pool = _connection_pools.get(key)
+        if pool is not None and pool.kwargs['password'] != password:
+            stale_pools.append(_connection_pools.pop(key))
+            pool = None
+        if pool is None:
+            pool = ConnectionPool(
+                kwargs={
+                    'host': host,
+                    'port': port,
+                    'dbname': dbname,
+                    'user': user,
+                    'password': password,
+                    'sslmode': sslmode,
+                    'application_name': "Mathesar " + application_name,
+                },
+                min_size=0,
+                max_size=max_size,
+                max_idle=max_idle,
+                max_lifetime=max_lifetime,
+                timeout=timeout,
+                check=ConnectionPool.check_connection,
+                reset=_reset_pooled_connection,
+                name='{user}@{host}:{port}/{dbname}'.format(**dict(zip(POOL_KEY_FIELDS, key))),
+                open=True,
+            )
+            _connection_pools[key] = pool
+    _close_pools(stale_pools)
+    return pool.connection()
+
+
+def close_connection_pools(**match):
+    """
+    Close and forget the connection pools matching the given key parts.
+
+    Any of `host`, `port`, `dbname`, `user`, and `sslmode` may be given;
+    a pool is closed if it matches all of them. With no arguments, every
+    pool is closed. Connections currently checked out of a closed pool
+    are closed when they're returned.
+    """
+    unknown_fields = set(match) - set(POOL_KEY_FIELDS)
+    if unknown_fields:
+        raise ValueError(f"Unknown pool key field(s): {sorted(unknown_fields)}")
+    with _connection_pools_lock:
+        closing_keys = [
+            key for key in _connection_pools
+            if all(
+                dict(zip(POOL_KEY_FIELDS, key))[field] == value
+                for field, value in match.items()
+            )
+        ]
+        closing_pools = [_connection_pools.pop(key) for key in closing_keys]
+    _close_pools(closing_pools)
+    return len(closing_pools)
+
+
+def get_connection_pool_stats():
+    """
+    Return a list describing each open connection pool, and its stats.
+
+    The stats are those reported by psycopg_pool's `get_stats()`
+    (e.g., `pool_size`, `pool_available`, `requests_waiting`), and don't
+    include any credentials.
+    """
+    with _connection_pools_lock:
+        pools = list(_connection_pools.items())
+    return [
+        {**dict(zip(POOL_KEY_FIELDS, key)), **pool.get_stats()}
+        for key, pool in pools
+    ]
@@ -4,9 +4,11 @@ MATHESAR_PREFIX = "mathesar_"
 MSAR_PUBLIC_SCHEMA = 'msar'
 MSAR_PRIVATE_SCHEMA = f"__{MSAR_PUBLIC_SCHEMA}"
 TYPES_SCHEMA = f"{MATHESAR_PREFIX}types"
+SUMMARY_CACHE_SCHEMA = f"{MSAR_PUBLIC_SCHEMA}_summary_cache"
 
 INTERNAL_SCHEMAS = {
     TYPES_SCHEMA,
     MSAR_PUBLIC_SCHEMA,
     MSAR_PRIVATE_SCHEMA,
+    SUMMARY_CACHE_SCHEMA,
 }
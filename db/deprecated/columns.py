@@ -250,6 +250,24 @@ def get_column_name_from_attnum(table_oid, attnum, engine, metadata, connection_
     return column_name
 
 
+def get_column_names_from_attnums(table_oid_attnum_pairs, engine, metadata, connection_to_use=None):
+    """
+    Returns a dict mapping each given (table oid, attnum) pair to its column name, in one query.
+    """
+    pairs = set(table_oid_attnum_pairs)
+    if not pairs:
+        return {}
+    statement = _statement_for_triples_of_column_name_and_attnum_and_table_oid(
+        list({oid for oid, _ in pairs}), list({attnum for _, attnum in pairs}), engine, metadata=metadata,
+    )
+    return {
+        (table_oid, attnum): column_name
+        for column_name, attnum, table_oid
+        in execute_statement(engine, statement, connection_to_use).fetchall()
+        if (table_oid, attnum) in pairs
+    }
+
+
 def _statement_for_triples_of_column_name_and_attnum_and_table_oid(
     table_oids, attnums, engine, metadata
 ):
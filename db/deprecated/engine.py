@@ -1,4 +1,6 @@
 import copy
+import threading
+from collections import OrderedDict
 
 from sqlalchemy import create_engine as sa_create_engine
 from sqlalchemy.engine import URL
@@ -18,6 +20,53 @@ def create_future_engine_with_custom_types(
     return engine
 
 
+ENGINE_CACHE_SIZE = 32
+
+_engine_cache = OrderedDict()
+_engine_cache_lock = threading.Lock()
+
+
+def get_cached_future_engine_with_custom_types(
+        username, password, hostname, database, port
+):
+    """
+    Return an engine with custom types for the given role and database.
+
+    Engines are cached, so that their connection pools, type maps, and
+    the reflected tables cached for them (see
+    `db.deprecated.tables.reflect_table_from_oid`) are reused between
+    calls. Callers must not dispose of the returned engine. The least
+    recently used engine is disposed of when there are more than
+    `ENGINE_CACHE_SIZE` of them.
+    """
+    key = (hostname, port, database, username)
+    with _engine_cache_lock:
+        cached = _engine_cache.get(key)
+        if cached is not None and cached[0] == password:
+            _engine_cache.move_to_end(key)
+            return cached[1]
+    engine = create_future_engine_with_custom_types(
+        username, password, hostname, database, port
+    )
+    with _engine_cache_lock:
+        stale = _engine_cache.pop(key, None)
+        _engine_cache[key] = (password, engine)
+        evicted = [stale] if stale is not None else []
+        while len(_engine_cache) > ENGINE_CACHE_SIZE:
+            evicted.append(_engine_cache.popitem(last=False)[1])
+    for _, evicted_engine in evicted:
+        evicted_engine.dispose()
+    return engine
+
+
+def clear_engine_cache():
+    with _engine_cache_lock:
+        engines = [engine for _, engine in _engine_cache.values()]
+        _engine_cache.clear()
+    for engine in engines:
+        engine.dispose()
+
+
 def create_future_engine(
         username, password, hostname, database, port, *args, **kwargs
 ):
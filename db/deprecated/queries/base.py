@@ -7,7 +7,7 @@ from db.deprecated.columns import get_column_name_from_attnum
 from db.deprecated.tables import reflect_table_from_oid
 from db.deprecated.transforms.operations import apply
 from db.deprecated.transforms import base
-from db.deprecated.utils import execute_pg_query
+from db.deprecated.utils import execute_pg_query, stream_pg_query
 from db.deprecated.metadata import get_empty_metadata
 
 
@@ -121,6 +121,19 @@ class DBQuery:
         )
         return execute_pg_query(self.engine, final_relation)
 
+    def stream_records(self, batch_size, **kwargs):
+        """
+        Like `get_records`, but yields the records in lists of at most
+        `batch_size`, fetched from a server-side cursor.
+        """
+        fallback_to_default_ordering = not self._is_sorting_transform_used
+        final_relation = apply.apply_transformations_deprecated(
+            table=self.transformed_relation,
+            fallback_to_default_ordering=fallback_to_default_ordering,
+            **kwargs
+        )
+        return stream_pg_query(self.engine, final_relation, batch_size)
+
     @property
     def _is_sorting_transform_used(self):
         """
@@ -142,32 +155,24 @@ class DBQuery:
         )
         return execute_pg_query(self.engine, relation)[0][col_name]
 
-    # NOTE if too expensive, can be rewritten to parse DBQuery spec, instead of leveraging sqlalchemy
     @property
     def all_sa_columns_map(self):
         """
-        Expensive! use with care.
+        Map each alias used anywhere in this query to its SA column.
+
+        This includes the initial columns, the output columns of each
+        transformation, and the output columns of the query.
         """
-        initial_columns_map = {
-            col.name: MathesarColumn.from_column(col, engine=self.engine)
-            for col in self.initial_relation.columns
-        }
-        output_columns_map = {
-            col.name: col for col in self.sa_output_columns
-        }
-        transforms_columns_map = {} if self.transformations is None else {
-            col.name: MathesarColumn.from_column(col, engine=self.engine)
-            for i in range(len(self.transformations))
-            for col in DBQuery(
-                base_table_oid=self.base_table_oid,
-                initial_columns=self.initial_columns,
-                engine=self.engine,
-                transformations=self.transformations[:i],
-                name=f'{self.name}_{i}'
-            ).transformed_relation.columns
-        }
-        map_of_alias_to_sa_col = initial_columns_map | transforms_columns_map | output_columns_map
-        return map_of_alias_to_sa_col
+        relations = self._get_relations_per_transform_prefix()
+        columns_map = {}
+        # Later relations take precedence. The last relation's columns are
+        # the output columns, added below.
+        for relation in relations[:-1]:
+            for col in relation.columns:
+                columns_map[col.name] = MathesarColumn.from_column(col, engine=self.engine)
+        for col in self.sa_output_columns:
+            columns_map[col.name] = col
+        return columns_map
 
     @property
     def sa_output_columns(self):
@@ -187,15 +192,30 @@ class DBQuery:
         A query describes a relation. This property is the result of parsing a
         query into a relation.
         """
-        transformations = self.transformations
-        if transformations:
-            transformed = apply.apply_transformations(
-                self.initial_relation,
-                transformations,
-            )
-            return transformed
-        else:
-            return self.initial_relation
+        return self._get_relations_per_transform_prefix()[-1]
+
+    def _get_relations_per_transform_prefix(self):
+        """
+        Return the initial relation, followed by the relation after each
+        transformation is applied.
+
+        The relations are built in a single pass, and memoized until the
+        initial columns or transformations of the query change.
+        """
+        transformations = tuple(self.transformations)
+        cache_key = (
+            self.base_table_oid,
+            tuple(id(col) for col in self.initial_columns),
+            tuple(id(transform) for transform in transformations),
+        )
+        cached = getattr(self, '_relations_cache', None)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        relations = [self.initial_relation]
+        for transform in transformations:
+            relations.append(apply.apply_transformations(relations[-1], [transform]))
+        self._relations_cache = (cache_key, relations, self.initial_columns, transformations)
+        return relations
 
     @property
     def initial_relation(self):
@@ -1,20 +1,129 @@
-from sqlalchemy import Table
-from db.deprecated.utils import engine_to_psycopg_conn
-from db.schemas import get_schema
-from db.tables import get_table
+import threading
+from collections import OrderedDict
 
+from sqlalchemy import Table, select, text
+from sqlalchemy.exc import NoSuchTableError
 
-def reflect_table_from_oid(oid, engine, metadata, connection_to_use=None, keep_existing=False):
-    with engine_to_psycopg_conn(engine) as conn:
-        table_json = get_table(oid, conn)
-        schema_name = get_schema(table_json["schema"], conn)["name"]
-    extend_existing = not keep_existing
-    autoload_with = engine if connection_to_use is None else connection_to_use
-    return Table(
-        table_json['name'],
-        metadata,
+from db.deprecated.metadata import get_empty_metadata
+from db.deprecated.utils import execute_statement, get_pg_catalog_table
+
+REFLECTED_TABLE_CACHE_SIZE = 512
+
+# The xmin of a catalog row changes whenever the row is updated, so this
+# fingerprint changes after any DDL affecting the table, its columns,
+# defaults, or constraints, or the name of its schema.
+_TABLE_IDENTITY_QUERY = text(
+    """
+    SELECT
+      c.relname,
+      n.nspname,
+      concat_ws(
+        ':',
+        c.xmin,
+        n.xmin,
+        (
+          SELECT string_agg(a.attnum || '.' || a.xmin, ',' ORDER BY a.attnum)
+          FROM pg_catalog.pg_attribute a
+          WHERE a.attrelid = c.oid AND a.attnum > 0
+        ),
+        (
+          SELECT string_agg(d.oid || '.' || d.xmin, ',' ORDER BY d.oid)
+          FROM pg_catalog.pg_attrdef d
+          WHERE d.adrelid = c.oid
+        ),
+        (
+          SELECT string_agg(con.oid || '.' || con.xmin, ',' ORDER BY con.oid)
+          FROM pg_catalog.pg_constraint con
+          WHERE con.conrelid = c.oid
+        )
+      )
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.oid = :oid
+    """
+)
+
+_reflected_tables = OrderedDict()
+_reflected_tables_lock = threading.Lock()
+
+
+def _get_table_identity(oid, engine):
+    """Return the name, schema name, and DDL fingerprint of a table."""
+    with engine.connect() as conn:
+        row = conn.execute(_TABLE_IDENTITY_QUERY, {"oid": oid}).first()
+    if row is None:
+        raise NoSuchTableError(f"No table with oid {oid}")
+    return row
+
+
+def _get_reflected_table_cache_key(oid, engine):
+    url = engine.url
+    return (url.host or url.query.get("host"), url.port, url.database, url.username, oid)
+
+
+def _get_cached_reflected_table(oid, engine, table_name, schema_name, fingerprint):
+    """
+    Return the table with the given oid, reflected into its own MetaData.
+
+    Tables are only reflected again when their DDL fingerprint changes.
+    """
+    key = _get_reflected_table_cache_key(oid, engine)
+    with _reflected_tables_lock:
+        cached = _reflected_tables.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _reflected_tables.move_to_end(key)
+            return cached[1]
+    table = Table(
+        table_name,
+        get_empty_metadata(),
         schema=schema_name,
-        autoload_with=autoload_with,
-        extend_existing=extend_existing,
-        keep_existing=keep_existing
+        autoload_with=engine,
     )
+    with _reflected_tables_lock:
+        _reflected_tables[key] = (fingerprint, table)
+        _reflected_tables.move_to_end(key)
+        while len(_reflected_tables) > REFLECTED_TABLE_CACHE_SIZE:
+            _reflected_tables.popitem(last=False)
+    return table
+
+
+def clear_reflected_table_cache():
+    with _reflected_tables_lock:
+        _reflected_tables.clear()
+
+
+def get_table_names_from_oids(oids, engine, metadata):
+    """Return a dict mapping each of the given table oids to its name, in one query."""
+    oids = list(set(oids))
+    if not oids:
+        return {}
+    pg_class = get_pg_catalog_table("pg_class", engine, metadata=metadata)
+    statement = select(pg_class.c.oid, pg_class.c.relname).where(pg_class.c.oid.in_(oids))
+    return dict(execute_statement(engine, statement).fetchall())
+
+
+def reflect_table_from_oid(oid, engine, metadata, connection_to_use=None, keep_existing=False):
+    """
+    Return the SQLAlchemy Table for the given oid, within `metadata`.
+
+    Unless a `connection_to_use` is given (e.g., one inside a transaction
+    which may have changed the table), the table is copied from a cache of
+    reflected tables instead of being reflected again. If `metadata`
+    already holds the table, that's returned.
+    """
+    table_name, schema_name, fingerprint = _get_table_identity(oid, engine)
+    if connection_to_use is not None:
+        return Table(
+            table_name,
+            metadata,
+            schema=schema_name,
+            autoload_with=connection_to_use,
+            extend_existing=not keep_existing,
+            keep_existing=keep_existing
+        )
+    existing_table = metadata.tables.get(f"{schema_name}.{table_name}")
+    if existing_table is not None:
+        return existing_table
+    return _get_cached_reflected_table(
+        oid, engine, table_name, schema_name, fingerprint
+    ).to_metadata(metadata)
@@ -48,6 +48,21 @@ def execute_pg_query(engine, query, connection_to_use=None):
     return execute_statement(engine, executable, connection_to_use=connection_to_use).fetchall()
 
 
+def stream_pg_query(engine, query, batch_size):
+    """
+    Execute the query using a server-side cursor, yielding lists of at most
+    `batch_size` rows, so the whole result is never held in memory.
+    """
+    col_list = stringify_json_cols(query)
+    executable = sqlalchemy.select(col_list)
+    with engine.connect() as conn:
+        streaming_conn = conn.execution_options(
+            stream_results=True, max_row_buffer=batch_size
+        )
+        result = execute_statement(engine, executable, connection_to_use=streaming_conn)
+        yield from result.partitions(batch_size)
+
+
 def get_module_members_that_satisfy(module, predicate):
     """
     Looks at the members of the provided module and filters them using the provided predicate.
@@ -78,8 +93,25 @@ def ignore_type_warning(f):
     return warning_ignored_func
 
 
+# The structure of the system catalogs only changes with the server
+# version, so they're reflected once per database.
+_pg_catalog_tables = {}
+
+
 @ignore_type_warning
 def get_pg_catalog_table(table_name, engine, metadata):
+    if f'pg_catalog.{table_name}' in metadata.tables:
+        return _reflect_pg_catalog_table(table_name, engine, metadata)
+    url = engine.url
+    key = (url.host or url.query.get('host'), url.port, url.database, table_name)
+    catalog_table = _pg_catalog_tables.get(key)
+    if catalog_table is None:
+        catalog_table = _reflect_pg_catalog_table(table_name, engine, sqlalchemy.MetaData())
+        _pg_catalog_tables[key] = catalog_table
+    return catalog_table.to_metadata(metadata)
+
+
+def _reflect_pg_catalog_table(table_name, engine, metadata):
     table = sqlalchemy.Table(table_name, metadata, autoload_with=engine, schema='pg_catalog')
     # Refresh metadata if it hasn't reflected correctly. Refer https://github.com/centerofci/mathesar/issues/2138
     if len(table.c) < 1:
@@ -18,6 +18,10 @@ def list_records_from_table(
     joined_columns=None,
     return_record_summaries=False,
     table_record_summary_templates=None,
+    count_mode='exact',
+    count_estimate_threshold=None,
+    use_cursor=False,
+    cursor=None,
 ):
     """
     Get records from a table.
@@ -39,6 +43,13 @@ def list_records_from_table(
             "join_path" represents linkages via a simple many-to-many mapping to a column in another table.
         return_record_summaries: Whether to return self record summaries.
         table_record_summary_templates: A dict of record summary templates, per table.
+        count_mode: How to count matching records; one of 'exact',
+            'estimated', 'none', or 'auto'.
+        count_estimate_threshold: The estimated count at which the 'auto'
+            count mode returns the estimate rather than an exact count.
+        use_cursor: Whether to return a cursor for the next page.
+        cursor: The cursor returned with the previous page. If given, we
+            seek to the rows following that page, and ignore the offset.
     """
     result = db_conn.exec_msar_func(
         conn,
@@ -52,6 +63,10 @@ def list_records_from_table(
         _json_or_none(joined_columns),
         return_record_summaries,
         _json_or_none(table_record_summary_templates),
+        count_mode,
+        count_estimate_threshold,
+        use_cursor,
+        cursor,
     ).fetchone()[0]
     return result
 
@@ -97,6 +112,8 @@ def search_records_from_table(
     offset=0,
     return_record_summaries=False,
     table_record_summary_templates=None,
+    count_mode='exact',
+    count_estimate_threshold=None,
 ):
     """
     Get records from a table, according to a search specification
@@ -109,6 +126,10 @@ def search_records_from_table(
         limit: The maximum number of rows we'll return.
         return_record_summaries: Whether to return self record summaries.
         table_record_summary_templates: A dict of record summary templates, per table.
+        count_mode: How to count matching records; one of 'exact',
+            'estimated', 'none', or 'auto'.
+        count_estimate_threshold: The estimated count at which the 'auto'
+            count mode returns the estimate rather than an exact count.
 
     The search definition objects should have the form
     {"attnum": <int>, "literal": <text>}
@@ -123,6 +144,8 @@ def search_records_from_table(
         offset,
         return_record_summaries,
         _json_or_none(table_record_summary_templates),
+        count_mode,
+        count_estimate_threshold,
     ).fetchone()[0]
     return result
 
@@ -149,6 +172,27 @@ def list_by_record_summaries(
     return result
 
 
+def enable_record_summary_cache(conn, table_oid, table_record_summary_templates=None):
+    """
+    Cache the record summaries of a table, or rebuild its existing cache.
+
+    Args:
+        table_oid: The OID of the table whose record summaries we'll cache.
+        table_record_summary_templates: A dict mapping table OIDs to record
+            summary templates.
+    """
+    db_conn.exec_msar_func(
+        conn,
+        'enable_record_summary_cache',
+        table_oid,
+        _json_or_none(table_record_summary_templates),
+    )
+
+
+def disable_record_summary_cache(conn, table_oid):
+    db_conn.exec_msar_func(conn, 'disable_record_summary_cache', table_oid)
+
+
 def delete_records_from_table(conn, record_ids, table_oid):
     """
     Delete records from table by id.
@@ -237,3 +281,38 @@ def insert_from_select(
         json.dumps(mappings)
     ).fetchone()[0]
     return result
+
+
+def prepare_binary_copy_into_table(conn, table_oid, column_attnums):
+    """
+    Get a binary COPY statement for the given columns, and their types.
+
+    Returns None if any of the columns doesn't exist.
+
+    Args:
+      table_oid: The OID of the table to copy into.
+      column_attnums: The attnums of the columns to copy into.
+    """
+    return db_conn.exec_msar_func(
+        conn, 'prepare_binary_copy_into_table', table_oid, column_attnums
+    ).fetchone()[0]
+
+
+def copy_rows_into_table(conn, copy_info, rows):
+    """
+    Copy rows into an existing table using binary COPY, returning the number
+    of rows copied.
+
+    Args:
+      copy_info: The result of `prepare_binary_copy_into_table`.
+      rows: An iterable of rows, each holding a value for every column
+        being copied, already converted to the matching Python type.
+    """
+    row_count = 0
+    cursor = conn.cursor()
+    with cursor.copy(copy_info['copy_sql']) as copy:
+        copy.set_types(copy_info['column_types'])
+        for row in rows:
+            copy.write_row(row)
+            row_count += 1
+    return row_count
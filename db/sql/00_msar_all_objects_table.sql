@@ -572,10 +572,12 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.add_mathesar_table(oid,text,jsonb,jsonb,regrole,text)', 'FUNCTION', NULL),
   ('msar', 'msar.add_mathesar_table(oid,text,jsonb,jsonb,text)', 'FUNCTION', NULL),
   ('msar', 'msar.add_month_to_vector(point,date)', 'FUNCTION', NULL),
+  ('msar', 'msar.add_online_retype_not_null_check(regclass,smallint)', 'FUNCTION', NULL),
   ('msar', 'msar.add_pkey_column(regclass,msar.pkey_kind,boolean,text)', 'FUNCTION', NULL),
   ('msar', 'msar.add_pkey_column(regclass,msar.pkey_kind,text)', 'FUNCTION', NULL),
   ('msar', 'msar.add_record_to_table(oid,jsonb,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.add_record_to_table(oid,jsonb,boolean,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.add_search_indexes(oid,smallint[])', 'FUNCTION', NULL),
   ('msar', 'msar.add_temp_table(text,__msar.col_def[])', 'FUNCTION', NULL),
   ('msar', 'msar.add_time_to_vector(point,time without time zone)', 'FUNCTION', NULL),
   ('msar', 'msar.all_mathesar_objects', 'TABLE', NULL),
@@ -583,12 +585,14 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.alter_columns(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.alter_table(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.auto_generate_record_summary_template(oid)', 'FUNCTION', NULL),
+  ('msar', 'msar.backfill_online_retype(regclass,smallint,jsonb,jsonb,text,integer)', 'FUNCTION', NULL),
   ('msar', 'msar.build_all_columns_expr(regclass)', 'FUNCTION', NULL),
   ('msar', 'msar.build_cast_expr(regclass,smallint,regtype)', 'FUNCTION', NULL),
   ('msar', 'msar.build_cast_expr(text,text,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_column_expr(jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_column_expr(text,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_columns_expr(regclass,smallint[])', 'FUNCTION', NULL),
+  ('msar', 'msar.build_count_cte_query(oid,text,text,bigint)', 'FUNCTION', NULL),
   ('msar', 'msar.build_database_privilege_replace_expr(regrole,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_empty_record_summary_query()', 'FUNCTION', NULL),
   ('msar', 'msar.build_expr(oid,jsonb)', 'FUNCTION', NULL),
@@ -600,15 +604,21 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.build_grouping_results_jsonb_expr(oid,text,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_groups_cte_expr(oid,text,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_groups_cte_expr(oid,text,text,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_inference_sample_expr(regclass,smallint[],integer)', 'FUNCTION', NULL),
   ('msar', 'msar.insert_from_select(regclass,regclass,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_insert_lookup_table(jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_join_expr(jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_joined_columns_summaries_ctes(text,jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_joined_columns_summaries_expr(jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_linked_record_summaries_ctes(oid,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_linked_record_summaries_ctes(oid,jsonb,text)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_next_cursor_expr(text,jsonb,text,integer)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_online_retype_cast_expr(regclass,smallint,jsonb,jsonb,text)', 'FUNCTION', NULL),
   ('msar', 'msar.build_order_by_expr(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_record_list_query_components_with_ctes(oid,integer,integer,jsonb,jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_record_list_query_components_with_ctes(oid,integer,integer,jsonb,jsonb,jsonb,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_record_list_query_components_with_ctes(oid,integer,integer,jsonb,jsonb,jsonb,jsonb,text)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_record_summary_query_for_keys(text,text)', 'FUNCTION', NULL),
   ('msar', 'msar.build_record_summary_query_for_table(oid,smallint,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_record_summary_query_from_template(oid,smallint,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_results_eq_cte_expr(oid,text,jsonb)', 'FUNCTION', NULL),
@@ -617,15 +627,19 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.build_results_setof_jsonb_expr(text)', 'FUNCTION', NULL),
   ('msar', 'msar.build_revoke_membership_expr(regrole,oid[])', 'FUNCTION', NULL),
   ('msar', 'msar.build_schema_privilege_replace_expr(regnamespace,regrole,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_seek_expr(oid,jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_selectable_column_expr(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.build_self_summary_json_expr(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.build_single_insert_expr(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_source_update_cte_join_condition_expr(regclass,smallint,smallint[],text,text)', 'FUNCTION', NULL),
   ('msar', 'msar.build_source_update_move_cols_equal_expr(regclass,smallint[],text)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_summary_cache_linked_keys_query(oid,smallint,jsonb,oid)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_summary_cache_trigger_sql(oid,text,oid)', 'FUNCTION', NULL),
   ('msar', 'msar.build_summary_cte_expr_for_table(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.build_summary_expr(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.build_summary_join_expr_for_table(oid,text)', 'FUNCTION', NULL),
   ('msar', 'msar.build_summary_json_expr_for_table(oid)', 'FUNCTION', NULL),
+  ('msar', 'msar.build_table_export_query(oid,integer,integer,jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_table_privilege_replace_expr(regclass,regrole,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_total_order_expr(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_type_text(jsonb)', 'FUNCTION', NULL),
@@ -639,6 +653,7 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.build_unqualified_columns_expr(regclass,smallint[])', 'FUNCTION', NULL),
   ('msar', 'msar.build_update_expr(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.build_where_clause(oid,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.cancel_online_retype(regclass,smallint)', 'FUNCTION', NULL),
   ('msar', 'msar.cast_to__double_quote_char_double_quote_("char")', 'FUNCTION', NULL),
   ('msar', 'msar.cast_to__double_quote_char_double_quote_(bigint)', 'FUNCTION', NULL),
   ('msar', 'msar.cast_to__double_quote_char_double_quote_(bit)', 'FUNCTION', NULL),
@@ -1028,6 +1043,7 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.cast_to_uri(text)', 'FUNCTION', NULL),
   ('msar', 'msar.cast_to_uuid(text)', 'FUNCTION', NULL),
   ('msar', 'msar.cast_to_uuid(uuid)', 'FUNCTION', NULL),
+  ('msar', 'msar.check_column_cast(regclass,smallint,text,jsonb,integer)', 'FUNCTION', NULL),
   ('msar', 'msar.check_column_mathesar_money_compat(regclass,smallint,numeric)', 'FUNCTION', NULL),
   ('msar', 'msar.check_column_numeric_compat(regclass,smallint,numeric)', 'FUNCTION', NULL),
   ('msar', 'msar.check_column_type_compat(regclass,smallint,regtype,numeric)', 'FUNCTION', NULL),
@@ -1050,10 +1066,13 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.create_schema(text,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.create_schema(text,regrole,text)', 'FUNCTION', NULL),
   ('msar', 'msar.create_schema_if_not_exists(text)', 'FUNCTION', NULL),
+  ('msar', 'msar.create_summary_cache_tables(regclass)', 'FUNCTION', NULL),
+  ('msar', 'msar.decode_records_cursor(text,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.degrees_to_month(double precision)', 'FUNCTION', NULL),
   ('msar', 'msar.degrees_to_time(double precision)', 'FUNCTION', NULL),
   ('msar', 'msar.delete_records_from_table(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.describe_column_default(regclass,smallint)', 'FUNCTION', NULL),
+  ('msar', 'msar.disable_record_summary_cache(regclass)', 'FUNCTION', NULL),
   ('msar', 'msar.downsize_table_sample(numeric)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_col_default(regclass,smallint)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_columns(oid,integer[])', 'FUNCTION', NULL),
@@ -1062,23 +1081,29 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.drop_constraint(text,text,text)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_database_query(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_database_query(text)', 'FUNCTION', NULL),
+  ('msar', 'msar.drop_orphaned_summary_caches()', 'FUNCTION', NULL),
   ('msar', 'msar.drop_role(regrole)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_schema(oid,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_schema(oid,boolean,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_schema(text,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_schema(text,boolean,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_schemas(regnamespace[])', 'FUNCTION', NULL),
+  ('msar', 'msar.drop_search_indexes(oid,smallint[])', 'FUNCTION', NULL),
+  ('msar', 'msar.drop_summary_cache_tables(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_table(oid,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_table(oid,boolean,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.drop_table(text,text,boolean,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.email_domain_name(mathesar_types.email)', 'FUNCTION', NULL),
   ('msar', 'msar.email_local_part(mathesar_types.email)', 'FUNCTION', NULL),
+  ('msar', 'msar.enable_record_summary_cache(regclass,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.encode_records_cursor(jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.expr_templates', 'TABLE', NULL),
   ('msar', 'msar.expr_templates', 'TYPE', NULL),
   ('msar', 'msar.extract_columns_from_table(oid,integer[],text,text)', 'FUNCTION', NULL),
   ('msar', 'msar.extract_smallints(jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.find_mathesar_money_attrs(regclass,smallint,numeric)', 'FUNCTION', NULL),
   ('msar', 'msar.find_numeric_separators(regclass,smallint,numeric)', 'FUNCTION', NULL),
+  ('msar', 'msar.finish_online_retype(regclass,smallint,jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.form_insert(jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.format_data(anyelement)', 'FUNCTION', NULL),
   ('msar', 'msar.format_data(date)', 'FUNCTION', NULL),
@@ -1107,6 +1132,7 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.get_database_name(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_default_summary_column(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_duplicate_col_defs(oid,smallint[],text[],boolean)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_estimated_row_count(oid,text)', 'FUNCTION', NULL),
   ('msar', 'msar.get_extracted_col_def_jsonb(oid,integer[])', 'FUNCTION', NULL),
   ('msar', 'msar.get_extracted_con_def_jsonb(oid,integer[])', 'FUNCTION', NULL),
   ('msar', 'msar.get_fkey_action_from_char("char")', 'FUNCTION', NULL),
@@ -1115,12 +1141,17 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.get_fresh_copy_name(oid,smallint)', 'FUNCTION', NULL),
   ('msar', 'msar.get_fully_qualified_object_name(text,text)', 'FUNCTION', NULL),
   ('msar', 'msar.get_interval_fields(integer)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_joinable_tables_fingerprint()', 'FUNCTION', NULL),
+  ('msar', 'msar.get_joinable_tables_from(oid,integer)', 'FUNCTION', NULL),
   ('msar', 'msar.get_joinable_tables(integer)', 'FUNCTION', NULL),
   ('msar', 'msar.get_joinable_tables(integer,oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_joined_columns_expr_json(jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_linked_table_oids(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_mathesar_money_array(text)', 'FUNCTION', NULL),
   ('msar', 'msar.get_numeric_array(text)', 'FUNCTION', NULL),
   ('msar', 'msar.get_object_counts()', 'FUNCTION', NULL),
+  ('msar', 'msar.get_online_retype_shadow_name(smallint)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_online_retype_trigger_function(regclass,smallint)', 'FUNCTION', NULL),
   ('msar', 'msar.get_other_column_ids(regclass,smallint[])', 'FUNCTION', NULL),
   ('msar', 'msar.get_pk_column(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_pk_column(text,text)', 'FUNCTION', NULL),
@@ -1129,6 +1160,8 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.get_record_from_table(oid,anycompatible,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.get_record_from_table(oid,anycompatible,boolean,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_record_from_table(oid,anycompatible,jsonb,boolean,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_record_summary_template(oid,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_record_summary_template_tables(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_relation_name(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_relation_namespace_oid(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_relation_oid(text,text)', 'FUNCTION', NULL),
@@ -1140,26 +1173,41 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.get_schema_objects_table(regnamespace[])', 'FUNCTION', NULL),
   ('msar', 'msar.get_schema_oid(text)', 'FUNCTION', NULL),
   ('msar', 'msar.get_score_expr(oid,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_search_index_oid(oid,smallint)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_search_match_expr(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_simple_mapping_join_cte(jsonb,text)', 'FUNCTION', NULL),
   ('msar', 'msar.get_simple_mapping_regclass(jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_selectable_columns(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.get_selectable_pkey_attnum(regclass)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_summary_cache_meta(oid)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_summary_cache(oid)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_summary_cache_trigger_function(regclass)', 'FUNCTION', NULL),
   ('msar', 'msar.get_table(regclass)', 'FUNCTION', NULL),
   ('msar', 'msar.get_tab_col_info_map(jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_table_columns_and_records(oid,integer,integer,jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_table_info(regnamespace)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_total_order_keys(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_total_order(oid)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_type_inference_sequence()', 'FUNCTION', NULL),
   ('msar', 'msar.get_type_options(regtype,integer,integer)', 'FUNCTION', NULL),
   ('msar', 'msar.get_unique_local_identifier(text[],text)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_usable_summary_cache(oid,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.get_valid_target_type_strings(regtype)', 'FUNCTION', NULL),
+  ('msar', 'msar.get_values_type_compat(text[],regtype)', 'FUNCTION', NULL),
   ('msar', 'msar.grant_usage_on_custom_mathesar_types_to_public()', 'FUNCTION', NULL),
   ('msar', 'msar.has_dependents(oid,smallint)', 'FUNCTION', NULL),
   ('msar', 'msar.infer_column_data_type(regclass,smallint)', 'FUNCTION', NULL),
   ('msar', 'msar.infer_column_data_type(regclass,smallint,numeric)', 'FUNCTION', NULL),
+  ('msar', 'msar.infer_import_column_data_types(regclass,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.infer_table_column_data_types(regclass)', 'FUNCTION', NULL),
+  ('msar', 'msar.infer_table_column_data_types(regclass,integer)', 'FUNCTION', NULL),
+  ('msar', 'msar.infer_values_data_type(text[])', 'FUNCTION', NULL),
+  ('msar', 'msar.infer_values_data_type(text[],regtype[])', 'FUNCTION', NULL),
   ('msar', 'msar.is_default_possibly_dynamic(oid,integer)', 'FUNCTION', NULL),
   ('msar', 'msar.is_mathesar_id_column(oid,integer)', 'FUNCTION', NULL),
+  ('msar', 'msar.is_online_retype_shadow_name(text)', 'FUNCTION', NULL),
   ('msar', 'msar.is_pkey_col(oid,integer)', 'FUNCTION', NULL),
+  ('msar', 'msar.is_summary_cache_orphaned(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.joinable_tables', 'TYPE', NULL),
   ('msar', 'msar.jsonb_keys_to_array(jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.list_column_privileges_for_current_role(regclass,smallint)', 'FUNCTION', NULL),
@@ -1170,14 +1218,18 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.list_records_from_table(oid,integer,integer,jsonb,jsonb,jsonb,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.list_records_from_table(oid,integer,integer,jsonb,jsonb,jsonb,boolean,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.list_records_from_table(oid,integer,integer,jsonb,jsonb,jsonb,jsonb,boolean,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.list_records_from_table(oid,integer,integer,jsonb,jsonb,jsonb,jsonb,boolean,jsonb,text,bigint)', 'FUNCTION', NULL),
+  ('msar', 'msar.list_records_from_table(oid,integer,integer,jsonb,jsonb,jsonb,jsonb,boolean,jsonb,text,bigint,boolean,text)', 'FUNCTION', NULL),
   ('msar', 'msar.list_roles()', 'FUNCTION', NULL),
   ('msar', 'msar.list_schema_privileges(regnamespace)', 'FUNCTION', NULL),
   ('msar', 'msar.list_schema_privileges_for_current_role(regnamespace)', 'FUNCTION', NULL),
   ('msar', 'msar.list_schemas()', 'FUNCTION', NULL),
+  ('msar', 'msar.list_search_indexes(oid)', 'FUNCTION', NULL),
   ('msar', 'msar.list_table_privileges(regclass)', 'FUNCTION', NULL),
   ('msar', 'msar.list_table_privileges_for_current_role(regclass)', 'FUNCTION', NULL),
   ('msar', 'msar.mathesar_system_schemas()', 'FUNCTION', NULL),
   ('msar', 'msar.month_to_degrees(date)', 'FUNCTION', NULL),
+  ('msar', 'msar.move_column_in_summary_templates(oid,smallint,smallint,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.move_columns_to_referenced_table(regclass,regclass,smallint[])', 'FUNCTION', NULL),
   ('msar', 'msar.obj_description(oid,text)', 'FUNCTION', NULL),
   ('msar', 'msar.patch_record_in_table(oid,anycompatible,jsonb,boolean)', 'FUNCTION', NULL),
@@ -1189,6 +1241,7 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.pkey_kind', 'TYPE', NULL),
   ('msar', 'msar.point_to_month(point)', 'FUNCTION', NULL),
   ('msar', 'msar.point_to_time(point)', 'FUNCTION', NULL),
+  ('msar', 'msar.prepare_binary_copy_into_table(regclass,smallint[])', 'FUNCTION', NULL),
   ('msar', 'msar.prepare_table_for_import(oid,text,jsonb,boolean,text,text,text,text,text)', 'FUNCTION', NULL),
   ('msar', 'msar.prepare_table_for_import(oid,text,text[],text)', 'FUNCTION', NULL),
   ('msar', 'msar.prepare_temp_table_for_import(text,text[])', 'FUNCTION', NULL),
@@ -1207,6 +1260,7 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.retype_column(regclass,smallint,text)', 'FUNCTION', NULL),
   ('msar', 'msar.retype_column(regclass,smallint,text,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.reset_mash(regclass,smallint,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.retype_columns(regclass,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.role_info_table()', 'FUNCTION', NULL),
   ('msar', 'msar.sanitize_direction(text)', 'FUNCTION', NULL),
   ('msar', 'msar.schema_exists(text)', 'FUNCTION', NULL),
@@ -1214,6 +1268,7 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.search_records_from_table(oid,jsonb,integer,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.search_records_from_table(oid,jsonb,integer,boolean,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.search_records_from_table(oid,jsonb,integer,integer,boolean,jsonb)', 'FUNCTION', NULL),
+  ('msar', 'msar.search_records_from_table(oid,jsonb,integer,integer,boolean,jsonb,text,bigint)', 'FUNCTION', NULL),
   ('msar', 'msar.set_col_default(regclass,smallint,text)', 'FUNCTION', NULL),
   ('msar', 'msar.set_members_to_role(regrole,oid[])', 'FUNCTION', NULL),
   ('msar', 'msar.set_not_null(regclass,smallint,boolean)', 'FUNCTION', NULL),
@@ -1221,6 +1276,7 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.set_old_col_default(regclass,smallint,text,text,boolean,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.set_pkey_column(regclass,integer,msar.pkey_kind,boolean)', 'FUNCTION', NULL),
   ('msar', 'msar.set_schema_description(oid,text)', 'FUNCTION', NULL),
+  ('msar', 'msar.start_online_retype(regclass,smallint,jsonb,jsonb)', 'FUNCTION', NULL),
   ('msar', 'msar.table_info_table()', 'FUNCTION', NULL),
   ('msar', 'msar.time_to_degrees(time without time zone)', 'FUNCTION', NULL),
   ('msar', 'msar.top_level_domains', 'TABLE', NULL),
@@ -1236,7 +1292,9 @@ INSERT INTO msar.all_mathesar_objects VALUES
   ('msar', 'msar.uri_parts(text)', 'FUNCTION', NULL),
   ('msar', 'msar.uri_path(text)', 'FUNCTION', NULL),
   ('msar', 'msar.uri_query(text)', 'FUNCTION', NULL),
-  ('msar', 'msar.uri_scheme(text)', 'FUNCTION', NULL);
+  ('msar', 'msar.uri_scheme(text)', 'FUNCTION', NULL),
+  ('msar', 'msar.validate_column_cast(regclass,smallint,jsonb,jsonb,integer,integer,interval,boolean)', 'FUNCTION', NULL),
+  ('msar', 'msar.validate_online_retype_not_null_check(regclass,smallint)', 'FUNCTION', NULL);
 
 
 --
@@ -25,6 +25,16 @@ BEGIN
       AND relname LIKE 'mathesar_temp_table%'
     ON CONFLICT DO NOTHING;
 
+  INSERT INTO msar.all_mathesar_objects
+    SELECT
+      relnamespace::regnamespace::text AS obj_schema,
+      oid::regclass::text AS obj_name,
+      'TABLE' AS obj_kind,
+      null AS custom_type
+    FROM pg_class
+    WHERE relnamespace::regnamespace::text='msar_summary_cache' AND relkind='r'
+    ON CONFLICT DO NOTHING;
+
   INSERT INTO msar.all_mathesar_objects
     SELECT oid::regprocedure::text AS obj_name, 'FUNCTION' AS obj_kind, null AS custom_type
     FROM pg_proc
@@ -1,11 +1,19 @@
 SELECT msar.drop_all_msar_objects(
-  schemas_to_remove => ARRAY['msar', '__msar', 'mathesar_types', 'mathesar_inference_schema', 'msar_views'],
+  schemas_to_remove => ARRAY[
+    'msar',
+    '__msar',
+    'mathesar_types',
+    'mathesar_inference_schema',
+    'msar_views',
+    'msar_summary_cache'
+  ],
   remove_custom_types => false,
   strict => false
 );
 
 CREATE SCHEMA IF NOT EXISTS __msar;
 CREATE SCHEMA IF NOT EXISTS msar;
+CREATE SCHEMA IF NOT EXISTS msar_summary_cache;
 
 ----------------------------------------------------------------------------------------------------
 ----------------------------------------------------------------------------------------------------
@@ -21,7 +29,7 @@ Return a text array of the Mathesar System schemas.
 
 Update this function whenever the list changes.
 */
-SELECT ARRAY['msar', '__msar', 'mathesar_types']
+SELECT ARRAY['msar', '__msar', 'mathesar_types', 'msar_summary_cache']
 $$ LANGUAGE SQL STABLE;
 
 
@@ -366,6 +374,19 @@ SELECT attname::text FROM pg_attribute WHERE attrelid=rel_id AND attnum=col_id A
 $$ LANGUAGE sql RETURNS NULL ON NULL INPUT;
 
 
+CREATE OR REPLACE FUNCTION msar.is_online_retype_shadow_name(att_name text) RETURNS boolean AS $$/*
+Return whether a column name is that of a shadow column added to retype a column online.
+
+Shadow columns only exist while a column is being retyped (see msar.start_online_retype), and are
+hidden from the columns and records listed by Mathesar.
+
+Args:
+  att_name: The name of the column.
+*/
+SELECT starts_with(att_name, '__msar_retype_');
+$$ LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
+
+
 CREATE OR REPLACE FUNCTION
 msar.get_column_name(rel_id oid, col_name text) RETURNS text AS $$/*
 Return the UNQUOTED name for a given column in a given relation (e.g., table).
@@ -880,6 +901,19 @@ ORDER BY conkey, target_oid, confkey;
 $$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
 
 
+CREATE OR REPLACE FUNCTION msar.get_linked_table_oids(tab_id oid) RETURNS oid[] AS $$/*
+Return the OIDs of the tables referenced by the foreign keys of a table.
+
+These are the tables whose record summaries may be given along with the table's records (see
+msar.get_fkey_map_table).
+
+Args:
+  tab_id: The OID of the table containing the foreign key columns.
+*/
+SELECT COALESCE(array_agg(DISTINCT target_oid), ARRAY[]::oid[]) FROM msar.get_fkey_map_table(tab_id);
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
 CREATE OR REPLACE FUNCTION
 msar.list_column_privileges_for_current_role(tab_id regclass, attnum smallint) RETURNS jsonb AS $$/*
 Return a JSONB array of all privileges current_user holds on the passed table.
@@ -962,7 +996,11 @@ FROM pg_catalog.pg_attribute pga
   LEFT JOIN pg_catalog.pg_index pgi ON pga.attrelid=pgi.indrelid
     AND pga.attnum=ANY(pgi.indkey) AND pgi.indisprimary
   LEFT JOIN pg_catalog.pg_type pgt ON pga.atttypid=pgt.oid
-WHERE pga.attrelid=tab_id AND pga.attnum > 0 and NOT attisdropped;
+WHERE
+  pga.attrelid=tab_id
+  AND pga.attnum > 0
+  AND NOT attisdropped
+  AND NOT msar.is_online_retype_shadow_name(attname);
 $$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
 
 
@@ -1958,7 +1996,18 @@ DECLARE
   undropped_objects text[];
   drop_success boolean := false;
   drop_failed boolean := false;
+  cached_tab_id regclass;
 BEGIN
+  -- The trigger functions of record summary caches are in the schemas of the cached tables, and
+  -- can't be dropped before the triggers using them.
+  FOR cached_tab_id IN
+    SELECT tgrelid
+    FROM pg_catalog.pg_trigger
+      JOIN pg_catalog.pg_class ON pg_class.oid = tgrelid
+    WHERE tgname = 'msar_summary_cache_insert' AND relnamespace = ANY(sch_ids)
+  LOOP
+    PERFORM msar.disable_record_summary_cache(cached_tab_id);
+  END LOOP;
   SET client_min_messages = WARNING;
   FOR obj IN
     SELECT obj_id, obj_schema, obj_name, obj_kind
@@ -3065,6 +3114,8 @@ BEGIN
     msar.get_relation_schema_name(tab_id),
     msar.get_relation_name(tab_id)
   );
+  -- The record summary cache of the table isn't dropped along with it.
+  PERFORM msar.disable_record_summary_cache(tab_id);
   EXECUTE format(
     'DROP TABLE %s %s',
     relation_name,
@@ -3304,7 +3355,7 @@ BEGIN
   ON pgc.relnamespace = pgn.oid
   WHERE pgc.oid = rel_id;
   -- Aggregate TEXT type column names of the created table
-  SELECT string_agg(quote_ident(attname), ', ') INTO col_names_sql
+  SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO col_names_sql
   FROM pg_catalog.pg_attribute
   WHERE attrelid = rel_id AND atttypid = 'TEXT'::regtype::oid;
   -- Create a properly formatted COPY SQL string
@@ -3379,7 +3430,7 @@ BEGIN
   WHERE pgc.relname = uq_tab_name AND pgc.relpersistence = 't';
 
   -- Aggregate TEXT type column names of the created table
-  SELECT string_agg(quote_ident(attname), ', ') INTO col_names_sql
+  SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO col_names_sql
   FROM pg_catalog.pg_attribute
   WHERE attrelid = rel_id AND atttypid = 'TEXT'::regtype::oid;
 
@@ -3486,6 +3537,39 @@ END;
 $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
 
+CREATE OR REPLACE FUNCTION
+msar.prepare_binary_copy_into_table(tab_id regclass, col_ids smallint[]) RETURNS jsonb AS $$/*
+Return a JSON object with a statement for a binary `COPY FROM` into the given columns of a table,
+and the types of those columns. Returns NULL if any of the columns doesn't exist.
+
+The returned JSON object will have the form:
+  {
+    "copy_sql": <str>,
+    "column_types": [<str>, ...]
+  }
+
+The column types are given without modifiers (e.g., `numeric` for a `numeric(5, 2)` column), in
+the same order as `col_ids`. The COPY applies the modifiers when receiving the values.
+
+Args:
+  tab_id: The OID of the table to copy into.
+  col_ids: The attnums of the columns to copy into, in the order their values will be sent.
+*/
+SELECT CASE WHEN count(*) = cardinality(col_ids) THEN
+  jsonb_build_object(
+    'copy_sql', format(
+      'COPY %s (%s) FROM STDIN (FORMAT BINARY)',
+      tab_id::regclass,
+      string_agg(quote_ident(attname), ', ' ORDER BY ord)
+    ),
+    'column_types', jsonb_agg(atttypid::regtype ORDER BY ord)
+  )
+END
+FROM unnest(col_ids) WITH ORDINALITY AS x(col_id, ord)
+  JOIN pg_catalog.pg_attribute ON attrelid = tab_id AND attnum = col_id AND NOT attisdropped;
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
 CREATE OR REPLACE FUNCTION
 msar.get_preview(
   tab_id oid,
@@ -3602,6 +3686,11 @@ CREATE OR REPLACE FUNCTION msar.build_cast_expr(
 ) RETURNS text AS $$/*
 Build an expression for casting a column in Mathesar, returning the text of that expression.
 
+When casting to numeric or mathesar_money, if any of the separators (or currency symbols) found by
+type inference are given in cast_options, we use the casting function taking them as arguments,
+with missing ones taken to be absent from the values. That function is inlined into the query
+casting a column, and is much faster than the one finding the separators of each value separately.
+
 Args:
   val: This is quite general, and isn't sanitized in any way. It can be either a literal or a column
        identifier, since we want to be able to produce a casting expression in either case.
@@ -3611,21 +3700,21 @@ Args:
 SELECT msar.get_cast_function_name(type_::regtype) || '(' ||
 CONCAT_WS(', ',
   val,
-  CASE WHEN NULLIF(cast_options, '{}'::jsonb) IS NOT NULL THEN
-    CASE type_::regtype
-      WHEN 'numeric'::regtype THEN
+  CASE
+    WHEN type_::regtype = 'numeric'::regtype
+      AND cast_options ?| ARRAY['group_sep', 'decimal_p'] THEN
         CONCAT_WS(', ',
-          'group_sep =>' || quote_literal(cast_options ->> 'group_sep') || '::"char"',
-          'decimal_p =>' || quote_literal(cast_options ->> 'decimal_p') || '::"char"'
+          'group_sep =>' || quote_literal(COALESCE(cast_options ->> 'group_sep', '')) || '::"char"',
+          'decimal_p =>' || quote_literal(COALESCE(cast_options ->> 'decimal_p', '')) || '::"char"'
         )
-      WHEN 'mathesar_types.mathesar_money'::regtype THEN
+    WHEN type_::regtype = 'mathesar_types.mathesar_money'::regtype
+      AND cast_options ?| ARRAY['group_sep', 'decimal_p', 'curr_pref', 'curr_suff'] THEN
         CONCAT_WS(', ',
-          'group_sep =>' || quote_literal(cast_options ->> 'group_sep') || '::"char"',
-          'decimal_p =>' || quote_literal(cast_options ->> 'decimal_p') || '::"char"',
+          'group_sep =>' || quote_literal(COALESCE(cast_options ->> 'group_sep', '')) || '::"char"',
+          'decimal_p =>' || quote_literal(COALESCE(cast_options ->> 'decimal_p', '')) || '::"char"',
           'curr_pref =>' || quote_literal(COALESCE(cast_options ->> 'curr_pref', '')) || '::text',
           'curr_suff =>' || quote_literal(COALESCE(cast_options ->> 'curr_suff', '')) || '::text'
         )
-    END
   END
 ) || ')'
 $$ LANGUAGE SQL RETURNS NULL ON NULL INPUT;
@@ -3795,213 +3884,892 @@ $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
 
 CREATE OR REPLACE FUNCTION
-msar.alter_columns(tab_id oid, col_alters jsonb) RETURNS integer[] AS $$/*
-Alter columns of the given table in bulk, returning the IDs of the columns so altered.
-
-Args:
-  tab_id: The OID of the table whose columns we'll alter.
-  col_alters: a JSONB describing the alterations to make.
+msar.check_column_cast(
+  tab_id regclass,
+  col_id smallint,
+  new_type text,
+  cast_options jsonb,
+  sample_size integer DEFAULT NULL
+) RETURNS void AS $$/*
+Check that a column's values can be cast to a new type, raising the casting error if not.
 
-The col_alters JSONB should have the form:
-[
-  {
-    "attnum": <int>,
-    "type": <obj> (optional),
-    "default": <any> (optional),
-    "not_null": <bool> (optional),
-    "delete": <bool> (optional),
-    "name": <str> (optional),
-  },
-  {
-    ...
-  },
-  ...
-]
+The error is raised with the column (and its table) attached, so that it can be attributed to the
+column when several columns are checked.
 
-Note that for all alterations, we create and execute separate SQL queries rather than combining them
-into a giant SQL statement. This has the benefit of providing better error messages(for users)
-and better code readability(for us) at the cost of a minor performance hit.
+Args:
+  tab_id: The OID of the table containing the column to check.
+  col_id: The attnum of the column to check.
+  new_type: The target type to which we'd alter the column.
+  cast_options: Suggestions to be used while type casting.
+  sample_size: (optional) The number of rows to check, taken from the start of the table. If NULL,
+    all rows are checked.
 */
 DECLARE
-  col RECORD;
-  return_attnum_arr integer[];
-  is_default_dynamic boolean;
+  col_name text := msar.get_column_name(tab_id, col_id);
+  err_state text;
+  err_message text;
+  err_detail text;
+  err_hint text;
 BEGIN
-  FOR col IN
-    SELECT
-      (col_alter_obj ->> 'attnum')::smallint AS attnum,
-      (col_alter_obj -> 'not_null')::boolean AS not_null,
-      (col_alter_obj ->> 'name')::text AS new_name,
-      (col_alter_obj -> 'delete')::boolean AS delete_,
-      msar.build_type_text_complete(col_alter_obj -> 'type', format_type(pga.atttypid, null)) AS new_type,
-      COALESCE((col_alter_obj -> 'cast_options')::jsonb, '{}'::jsonb) AS cast_options,
-      pg_get_expr(adbin, tab_id) AS old_default,
-      col_alter_obj -> 'default' AS new_default,
-
-      col_alter_obj->>'description' AS comment_,
-      __msar.jsonb_key_exists(col_alter_obj, 'description') AS has_comment
-
-    FROM jsonb_array_elements(col_alters) AS x(col_alter_obj)
-      INNER JOIN pg_catalog.pg_attribute AS pga ON pga.attnum=(x.col_alter_obj ->> 'attnum')::smallint AND pga.attrelid=tab_id
-      LEFT JOIN pg_catalog.pg_attrdef AS pgat ON pgat.adnum=(x.col_alter_obj ->> 'attnum')::smallint AND pgat.adrelid=tab_id
-    WHERE NOT msar.is_mathesar_id_column(tab_id, (x.col_alter_obj ->> 'attnum')::integer)
-  LOOP
-    PERFORM msar.set_not_null(tab_id, col.attnum, col.not_null);
-    PERFORM msar.rename_column(tab_id, col.attnum, col.new_name);
-
-    IF col.delete_ THEN
-      PERFORM msar.drop_columns(tab_id, col.attnum);
-    END IF;
-
-    IF col.has_comment THEN
-      PERFORM msar.comment_on_column(tab_id, col.attnum, col.comment_);
-    END IF;
-
-    -- is_default_possibly_dynamic check must happen before we drop the default.
-    is_default_dynamic := msar.is_default_possibly_dynamic(tab_id, col.attnum);
-
-    IF col.new_type IS NOT NULL OR jsonb_typeof(col.new_default)='null' THEN
-      PERFORM msar.drop_col_default(tab_id, col.attnum);
-    END IF;
-    PERFORM msar.retype_column(tab_id, col.attnum, col.new_type, col.cast_options);
-    IF col.new_default #>> '{}' IS NOT NULL THEN
-      -- set new default
-      PERFORM msar.set_col_default(tab_id, col.attnum, col.new_default #>> '{}');
-    ELSEIF (col.new_default IS NULL OR jsonb_typeof(col.new_default)<>'null') AND col.new_type IS NOT NULL THEN
-      -- preserve old default
-      -- when a new_default is absent and col is retyped with a new_type.
-      -- Note: We don't want to preserve old default for jsonb_typeof(col.new_default)='null'
-      -- as we consider it as an intent to drop the default.
-      PERFORM msar.set_old_col_default(tab_id, col.attnum, col.old_default, col.new_type, is_default_dynamic, col.cast_options);
-    END IF;
-
-    -- PG13 doesn't allow concat b/w integer[] and smallint need to typecast
-    return_attnum_arr := return_attnum_arr || col.attnum::integer;
-  END LOOP;
-  RETURN return_attnum_arr; -- do we really need this??
+  EXECUTE format(
+    'SELECT count(%s) FROM (SELECT %I FROM %I.%I %s) AS sample',
+    msar.build_cast_expr(quote_ident(col_name), new_type, cast_options),
+    col_name,
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    'LIMIT ' || sample_size
+  );
+EXCEPTION WHEN data_exception OR raise_exception THEN
+  GET STACKED DIAGNOSTICS
+    err_state = RETURNED_SQLSTATE,
+    err_message = MESSAGE_TEXT,
+    err_detail = PG_EXCEPTION_DETAIL,
+    err_hint = PG_EXCEPTION_HINT;
+  RAISE EXCEPTION USING
+    ERRCODE = err_state,
+    MESSAGE = err_message,
+    DETAIL = err_detail,
+    HINT = err_hint,
+    COLUMN = col_name,
+    TABLE = msar.get_relation_name(tab_id),
+    SCHEMA = msar.get_relation_schema_name(tab_id);
 END;
-$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
-
-
--- Comment on column -------------------------------------------------------------------------------
+$$ LANGUAGE plpgsql;
 
 
 CREATE OR REPLACE FUNCTION
-msar.comment_on_column(
-  tab_id oid,
-  col_id integer,
-  comment_ text
-) RETURNS text AS $$/*
-Change the description of a column, returning command executed.
+msar.retype_columns(tab_id regclass, col_retypes jsonb) RETURNS text AS $$/*
+Alter the types of several columns at once, returning the text of the expression executed.
+
+All columns are altered by a single ALTER TABLE statement, so the table is rewritten only once. The
+casts of all columns are first checked on a sample of rows, so that a retype bound to fail usually
+does so before rewriting the table, and so that we can tell which column a casting error comes from.
+Should the ALTER TABLE fail anyway, the casts are checked on all rows to find the failing column.
+Either way, the error is raised with the failing column attached. To find all failing values before
+retyping a column, see msar.validate_column_cast.
 
 Args:
-  tab_id: The OID of the table containg the column whose comment we will change.
-  col_id: The ATTNUM of the column whose comment we will change.
-  comment_: The new comment.
+  tab_id: The OID of the table containing the columns whose types we'll alter.
+  col_retypes: A JSONB array of objects, each with the "attnum" of a column, the "new_type" to which
+    we'll alter it, and (optionally) "cast_options" for casting its values.
 */
 DECLARE
-  comment_sql text;
+  retype_cols_sql text;
+  col record;
 BEGIN
+  IF jsonb_array_length(col_retypes) = 0 THEN
+    RETURN NULL;
+  END IF;
+  FOR col IN SELECT * FROM jsonb_to_recordset(col_retypes) AS x(attnum smallint, new_type text, cast_options jsonb)
+  LOOP
+    PERFORM msar.check_column_cast(
+      tab_id, col.attnum, col.new_type, COALESCE(col.cast_options, '{}'::jsonb), 1000
+    );
+  END LOOP;
   SELECT format(
-    'COMMENT ON COLUMN %I.%I.%I IS %L',
+    'ALTER TABLE %I.%I %s',
     msar.get_relation_schema_name(tab_id),
     msar.get_relation_name(tab_id),
-    msar.get_column_name(tab_id, col_id),
-    comment_
-  ) INTO comment_sql;
-  EXECUTE comment_sql;
-  RETURN comment_sql;
+    string_agg(
+      format(
+        'ALTER COLUMN %I TYPE %s USING %s',
+        msar.get_column_name(tab_id, attnum),
+        new_type,
+        msar.build_cast_expr(
+          quote_ident(msar.get_column_name(tab_id, attnum)),
+          new_type,
+          COALESCE(cast_options, '{}'::jsonb)
+        )
+      ),
+      ', ' ORDER BY ordinality
+    )
+  )
+  FROM jsonb_to_recordset(col_retypes) WITH ORDINALITY AS x(attnum smallint, new_type text, cast_options jsonb)
+  INTO retype_cols_sql;
+  BEGIN
+    EXECUTE retype_cols_sql;
+  EXCEPTION WHEN data_exception OR raise_exception THEN
+    FOR col IN SELECT * FROM jsonb_to_recordset(col_retypes) AS x(attnum smallint, new_type text, cast_options jsonb)
+    LOOP
+      PERFORM msar.check_column_cast(
+        tab_id, col.attnum, col.new_type, COALESCE(col.cast_options, '{}'::jsonb)
+      );
+    END LOOP;
+    RAISE;
+  END;
+  RETURN retype_cols_sql;
 END;
-$$ LANGUAGE plpgsql;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
 
-----------------------------------------------------------------------------------------------------
-----------------------------------------------------------------------------------------------------
--- MATHESAR LINK FUNCTIONS
---
--- Add a link to the table.
-----------------------------------------------------------------------------------------------------
-----------------------------------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION
+msar.validate_column_cast(
+  tab_id regclass,
+  col_id smallint,
+  type_ jsonb,
+  cast_options jsonb DEFAULT '{}'::jsonb,
+  max_failures integer DEFAULT 20,
+  sample_size integer DEFAULT NULL,
+  time_budget interval DEFAULT NULL,
+  exact_count boolean DEFAULT false
+) RETURNS jsonb AS $$/*
+Find the values of a column which can't be cast to a new type, without altering the column.
 
--- Create a Many-to-One or a One-to-One link -------------------------------------------------------
+Values are cast in the same way as when retyping the column (see msar.build_cast_expr). Rows are
+checked in batches, in primary key order, so that each batch is found through the primary key
+index. A batch is first cast as a whole, and only a batch which fails is checked row by row. When
+there's no time budget, the whole column (or sample) is first cast in a single pass, so a column
+whose values can all be cast is checked as fast as it can be read. Unless an exact count is
+requested, checking stops as soon as max_failures values have failed, since each failing row is
+cast in a subtransaction of its own.
 
+The result has the form:
+{
+  "checked_count": <int>,
+  "failure_count": <int>,
+  "failures": [{"key": <any>, "value": <str>, "error": <str>}, ...],
+  "complete": <bool>
+}
 
-CREATE OR REPLACE FUNCTION
-msar.add_foreign_key_column(
-  col_name text,
-  rel_id oid,
-  frel_id oid,
-  unique_link boolean DEFAULT false
-) RETURNS smallint AS $$/*
-Create a many-to-one or a one-to-one link between tables, returning the attnum of the newly created
-column, returning the attnum of the added column.
+Here, "checked_count" is the number of non-null values checked, "failures" gives the primary key,
+value and casting error of the first (in primary key order) failing values, and "complete" tells
+whether every non-null value of the column was checked. If checking stopped at max_failures,
+"failure_count" is only the number of failing values found so far.
 
 Args:
-  col_name: Name of the new column to be created in the referrer table, unquoted.
-  rel_id: The OID of the referrer table, named for conrelid in the pg_attribute table.
-  frel_id: The OID of the referent table, named for confrelid in the pg_attribute table.
-  unique_link: Whether to make the link one-to-one instead of many-to-one.
+  tab_id: The OID of the table containing the column to check.
+  col_id: The attnum of the column to check.
+  type_: A JSONB object with the "name" and (optionally) "options" of the type to which we'd alter
+    the column, as given to msar.alter_columns.
+  cast_options: Suggestions to be used while type casting.
+  max_failures: The maximum number of failing values to return.
+  sample_size: (optional) The number of non-null values to check, from the start of the table in
+    primary key order. If NULL, all values are checked.
+  time_budget: (optional) Stop checking new batches of rows after this much time.
+  exact_count: Whether to keep checking after max_failures values have failed, to count them all.
 */
 DECLARE
-  pk_col_id smallint;
-  col_defs jsonb;
-  added_col_ids smallint[];
-  con_defs jsonb;
-BEGIN
-  pk_col_id := msar.get_pk_column(frel_id);
-  col_defs := jsonb_build_array(
-    jsonb_build_object(
-      'name', col_name,
-      'type', jsonb_build_object('name', msar.get_column_type(frel_id, pk_col_id))
-    )
+  batch_size integer := 10000;
+  started_at timestamptz := clock_timestamp();
+  col_name text := msar.get_column_name(tab_id, col_id);
+  pkey_name text := msar.get_column_name(tab_id, msar.get_selectable_pkey_attnum(tab_id));
+  pkey_type text;
+  rel_expr text := format(
+    '%I.%I', msar.get_relation_schema_name(tab_id), msar.get_relation_name(tab_id)
   );
-  added_col_ids := msar.add_columns(rel_id , col_defs , false);
-  con_defs := jsonb_build_array(
-    jsonb_build_object(
-      'name', null,
-      'type', 'f',
-      'columns', added_col_ids,
-      'deferrable', false,
-      'fkey_relation_id', frel_id::integer,
-      'fkey_columns', jsonb_build_array(pk_col_id)
-    )
+  cast_expr text;
+  first_key text;
+  last_key text;
+  batch_count bigint;
+  batch_checked bigint;
+  checked_count bigint := 0;
+  failure_count bigint := 0;
+  failures jsonb := '[]'::jsonb;
+  failing_row record;
+  err_message text;
+  complete boolean := true;
+BEGIN
+  IF pkey_name IS NULL THEN
+    RAISE EXCEPTION 'Only casts of columns in tables with a single-column primary key may be validated';
+  END IF;
+  SELECT format_type(atttypid, atttypmod) INTO pkey_type
+  FROM pg_catalog.pg_attribute WHERE attrelid = tab_id AND attname = pkey_name;
+  cast_expr := msar.build_cast_expr(
+    quote_ident(col_name),
+    (
+      SELECT msar.build_type_text_complete(type_, format_type(atttypid, null))
+      FROM pg_catalog.pg_attribute WHERE attrelid = tab_id AND attnum = col_id
+    ),
+    COALESCE(cast_options, '{}'::jsonb)
   );
-  IF unique_link THEN
-    con_defs := jsonb_build_array(
-      jsonb_build_object(
-        'name', null,
-        'type', 'u',
-        'columns', added_col_ids)
-    ) || con_defs;
+
+  IF time_budget IS NULL THEN
+    BEGIN
+      EXECUTE format(
+        'SELECT count((%1$s) IS NULL) FROM (SELECT %2$I FROM %3$s WHERE %2$I IS NOT NULL %4$s) AS sample',
+        cast_expr, col_name, rel_expr, 'ORDER BY ' || quote_ident(pkey_name) || ' LIMIT ' || sample_size
+      ) INTO checked_count;
+      RETURN jsonb_build_object(
+        'checked_count', checked_count,
+        'failure_count', 0,
+        'failures', failures,
+        'complete', sample_size IS NULL OR checked_count < sample_size
+      );
+    EXCEPTION WHEN data_exception OR raise_exception THEN
+      checked_count := 0;
+    END;
   END IF;
-  PERFORM msar.add_constraints(rel_id , con_defs);
-  RETURN added_col_ids[1];
-END;
-$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
--- Create a Many-to-Many link ----------------------------------------------------------------------
+  LOOP
+    EXECUTE format(
+      $q$
+        SELECT count(*), (array_agg(key ORDER BY key))[1]::text, (array_agg(key ORDER BY key DESC))[1]::text
+        FROM (
+          SELECT %1$I AS key FROM %2$s
+          WHERE %3$I IS NOT NULL AND ($1 IS NULL OR %1$I > $1::%4$s)
+          ORDER BY %1$I LIMIT $2
+        ) AS batch
+      $q$,
+      pkey_name, rel_expr, col_name, pkey_type
+    ) INTO batch_count, first_key, last_key
+    USING last_key, LEAST(batch_size, sample_size - checked_count);
+    EXIT WHEN batch_count = 0;
 
+    BEGIN
+      EXECUTE format(
+        'SELECT count(%1$s) FROM %2$s WHERE %3$I BETWEEN $1::%4$s AND $2::%4$s',
+        cast_expr, rel_expr, pkey_name, pkey_type
+      ) USING first_key, last_key;
+    EXCEPTION WHEN data_exception OR raise_exception THEN
+      batch_checked := 0;
+      FOR failing_row IN EXECUTE format(
+        $q$
+          SELECT to_jsonb(%1$I) AS key, %1$I::text AS key_text, %2$I::text AS value FROM %3$s
+          WHERE %2$I IS NOT NULL AND %1$I BETWEEN $1::%4$s AND $2::%4$s
+          ORDER BY %1$I
+        $q$,
+        pkey_name, col_name, rel_expr, pkey_type
+      ) USING first_key, last_key
+      LOOP
+        BEGIN
+          EXECUTE format(
+            'SELECT %1$s FROM %2$s WHERE %3$I = $1::%4$s', cast_expr, rel_expr, pkey_name, pkey_type
+          ) USING failing_row.key_text;
+        EXCEPTION WHEN data_exception OR raise_exception THEN
+          GET STACKED DIAGNOSTICS err_message = MESSAGE_TEXT;
+          failure_count := failure_count + 1;
+          IF jsonb_array_length(failures) < max_failures THEN
+            failures := failures || jsonb_build_object(
+              'key', failing_row.key, 'value', failing_row.value, 'error', err_message
+            );
+          END IF;
+        END;
+        batch_checked := batch_checked + 1;
+        IF NOT exact_count AND failure_count >= max_failures THEN
+          batch_count := batch_checked;
+          last_key := failing_row.key_text;
+          EXIT;
+        END IF;
+      END LOOP;
+    END;
 
-CREATE OR REPLACE FUNCTION
-msar.add_mapping_table(
-  sch_id oid,
-  tab_name text,
-  mapping_columns jsonb
-) RETURNS oid AS $$/*
-Create a many-to-many link between tables, returning the oid of the newly created table.
+    checked_count := checked_count + batch_count;
+    EXIT WHEN checked_count >= sample_size
+      OR clock_timestamp() - started_at >= time_budget
+      OR (NOT exact_count AND failure_count >= max_failures);
+  END LOOP;
 
-Args:
-  sch_id: The OID of the schema in which new referrer table is to be created.
-  tab_name: Name of the referrer table to be created.
-  mapping_columns: An array of objects giving the foreign key columns for the new table.
+  IF batch_count > 0 THEN
+    EXECUTE format(
+      'SELECT NOT EXISTS (SELECT 1 FROM %1$s WHERE %2$I IS NOT NULL AND %3$I > $1::%4$s)',
+      rel_expr, col_name, pkey_name, pkey_type
+    ) INTO complete USING last_key;
+  END IF;
+  RETURN jsonb_build_object(
+    'checked_count', checked_count,
+    'failure_count', failure_count,
+    'failures', failures,
+    'complete', complete
+  );
+END;
+$$ LANGUAGE plpgsql;
 
-The elements of the mapping_columns array must have the form
-  {"column_name": <str>, "referent_table_oid": <int>}
 
-*/
-DECLARE
-  added_table_id oid;
-BEGIN
+-- Online retype ----------------------------------------------------------------------------------
+--
+-- Altering a column's type rewrites its table while holding an ACCESS EXCLUSIVE lock, which blocks
+-- all reads and writes of large tables for a long time. An online retype instead:
+--
+-- 1. adds a "shadow" column of the new type, kept in sync by a trigger (msar.start_online_retype),
+-- 2. fills the shadow column in short batches of rows (msar.backfill_online_retype),
+-- 3. checks the shadow column has no NULLs, if the column is NOT NULL, without blocking writes
+--    (msar.add_online_retype_not_null_check, msar.validate_online_retype_not_null_check),
+-- 4. replaces the column with the shadow column, in a short transaction (msar.finish_online_retype).
+--
+-- Each step should be run in its own transaction. msar.cancel_online_retype undoes steps 1 to 3.
+--
+-- While a column is being retyped, its shadow column is hidden from the columns and records listed
+-- by Mathesar (see msar.is_online_retype_shadow_name), and writes of values to the column which
+-- can't be cast to the new type fail, since the trigger can't fill the shadow column for them.
+
+
+CREATE OR REPLACE FUNCTION msar.get_online_retype_shadow_name(col_id smallint) RETURNS text AS $$/*
+Return the name of the shadow column used for retyping a column online.
+
+Args:
+  col_id: The attnum of the column being retyped.
+*/
+SELECT '__msar_retype_' || col_id;
+$$ LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.build_online_retype_cast_expr(
+  tab_id regclass,
+  col_id smallint,
+  type_ jsonb,
+  cast_options jsonb,
+  val text
+) RETURNS text AS $$/*
+Build the expression casting a value of a column being retyped online, and the new type's name.
+
+Args:
+  tab_id: The OID of the table containing the column being retyped.
+  col_id: The attnum of the column being retyped.
+  type_: A JSONB object with the "name" and (optionally) "options" of the new type, as given to
+    msar.alter_columns.
+  cast_options: Suggestions to be used while type casting.
+  val: The expression giving the value to cast (see msar.build_cast_expr).
+*/
+SELECT msar.build_cast_expr(
+  val,
+  msar.build_type_text_complete(type_, format_type(atttypid, null)),
+  COALESCE(cast_options, '{}'::jsonb)
+)
+FROM pg_catalog.pg_attribute WHERE attrelid = tab_id AND attnum = col_id;
+$$ LANGUAGE SQL STABLE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_online_retype_trigger_function(tab_id regclass, col_id smallint) RETURNS text AS $$/*
+Return the qualified, quoted name of the trigger function filling the shadow column of a column.
+
+The function is specific to the column, and is in the schema of its table.
+
+Args:
+  tab_id: The OID of the table containing the column being retyped.
+  col_id: The attnum of the column being retyped.
+*/
+SELECT format(
+  '%I.%I',
+  msar.get_relation_schema_name(tab_id),
+  msar.get_online_retype_shadow_name(col_id) || '_' || tab_id::oid
+);
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.start_online_retype(
+  tab_id regclass,
+  col_id smallint,
+  type_ jsonb,
+  cast_options jsonb DEFAULT '{}'::jsonb
+) RETURNS jsonb AS $$/*
+Add a shadow column of the new type for a column, and a trigger keeping it in sync with the column.
+
+Only columns of tables with a single-column primary key, and without any dependent objects (other
+than their default), may be retyped online. The trigger calls a function assigning the cast value
+directly, which is created for the column in the schema of its table. Returns an object with the
+"shadow_attnum" of the shadow column, and the "estimated_rows" of the table.
+
+Args:
+  tab_id: The OID of the table containing the column to retype.
+  col_id: The attnum of the column to retype.
+  type_: A JSONB object with the "name" and (optionally) "options" of the new type, as given to
+    msar.alter_columns.
+  cast_options: Suggestions to be used while type casting.
+*/
+DECLARE
+  shadow_name text := msar.get_online_retype_shadow_name(col_id);
+BEGIN
+  IF msar.get_selectable_pkey_attnum(tab_id) IS NULL THEN
+    RAISE EXCEPTION 'Only columns of tables with a single-column primary key may be retyped online';
+  END IF;
+  IF EXISTS (
+    SELECT 1 FROM pg_catalog.pg_depend
+    WHERE
+      refclassid = 'pg_catalog.pg_class'::regclass
+      AND refobjid = tab_id
+      AND refobjsubid = col_id
+      AND classid <> 'pg_catalog.pg_attrdef'::regclass
+      AND NOT (
+        classid = 'pg_catalog.pg_constraint'::regclass
+        AND objid IN (SELECT oid FROM pg_catalog.pg_constraint WHERE contype = 'n')
+      )
+  ) THEN
+    RAISE EXCEPTION 'Columns with dependent objects (e.g., indexes, constraints, or views) may not be retyped online';
+  END IF;
+  EXECUTE format(
+    'ALTER TABLE %I.%I ADD COLUMN %I %s',
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    shadow_name,
+    (
+      SELECT msar.build_type_text_complete(type_, format_type(atttypid, null))
+      FROM pg_catalog.pg_attribute WHERE attrelid = tab_id AND attnum = col_id
+    )
+  );
+  EXECUTE format(
+    'CREATE FUNCTION %s() RETURNS trigger AS %L LANGUAGE plpgsql',
+    msar.get_online_retype_trigger_function(tab_id, col_id),
+    format(
+      'BEGIN NEW.%I := %s; RETURN NEW; END;',
+      shadow_name,
+      msar.build_online_retype_cast_expr(
+        tab_id, col_id, type_, cast_options, 'NEW.' || quote_ident(msar.get_column_name(tab_id, col_id))
+      )
+    )
+  );
+  EXECUTE format(
+    'CREATE TRIGGER %I BEFORE INSERT OR UPDATE OF %I ON %I.%I FOR EACH ROW EXECUTE FUNCTION %s()',
+    shadow_name,
+    msar.get_column_name(tab_id, col_id),
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    msar.get_online_retype_trigger_function(tab_id, col_id)
+  );
+  RETURN jsonb_build_object(
+    'shadow_attnum', msar.get_attnum(tab_id, shadow_name),
+    'estimated_rows', (SELECT greatest(reltuples, 0)::bigint FROM pg_catalog.pg_class WHERE oid = tab_id)
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION
+msar.backfill_online_retype(
+  tab_id regclass,
+  col_id smallint,
+  type_ jsonb,
+  cast_options jsonb,
+  after_key text,
+  batch_size integer
+) RETURNS jsonb AS $$/*
+Fill the shadow column of a column being retyped online, for the next batch of rows.
+
+Rows are taken in primary key order, after the given key. Returns an object with the "count" of
+rows filled, and the "last_key" (as text) of the batch, to be passed as `after_key` for the next
+batch. A count of 0 means the whole table has been filled.
+
+Args:
+  tab_id: The OID of the table containing the column being retyped.
+  col_id: The attnum of the column being retyped.
+  type_: The new type of the column, as given to msar.start_online_retype.
+  cast_options: Suggestions to be used while type casting.
+  after_key: The last key of the previous batch, as text, or NULL for the first batch.
+  batch_size: The number of rows to fill.
+*/
+DECLARE
+  pkey_name text := msar.get_column_name(tab_id, msar.get_selectable_pkey_attnum(tab_id));
+  batch_count bigint;
+  last_key text;
+BEGIN
+  EXECUTE format(
+    $q$
+      WITH batch AS (
+        SELECT %1$I FROM %2$I.%3$I WHERE $1 IS NULL OR %1$I > $1::%4$s ORDER BY %1$I LIMIT $2
+      ), filled AS (
+        UPDATE %2$I.%3$I SET %5$I = %6$s FROM batch WHERE %2$I.%3$I.%1$I = batch.%1$I
+        RETURNING %2$I.%3$I.%1$I AS key
+      )
+      SELECT count(*), (array_agg(key ORDER BY key DESC))[1]::text FROM filled
+    $q$,
+    pkey_name,
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    (
+      SELECT format_type(atttypid, atttypmod) FROM pg_catalog.pg_attribute
+      WHERE attrelid = tab_id AND attname = pkey_name
+    ),
+    msar.get_online_retype_shadow_name(col_id),
+    msar.build_online_retype_cast_expr(
+      tab_id, col_id, type_, cast_options, quote_ident(msar.get_column_name(tab_id, col_id))
+    )
+  ) INTO batch_count, last_key USING after_key, batch_size;
+  RETURN jsonb_build_object('count', batch_count, 'last_key', last_key);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION
+msar.add_online_retype_not_null_check(tab_id regclass, col_id smallint) RETURNS boolean AS $$/*
+Add an unvalidated check that the shadow column of a NOT NULL column being retyped has no NULLs.
+
+Adding the check only takes a short lock, since existing rows aren't checked. They're checked by
+msar.validate_online_retype_not_null_check, which doesn't block writes, in another transaction.
+Once validated, the check lets msar.finish_online_retype make the shadow column NOT NULL without
+scanning the table. Returns whether the check was added, i.e., whether the column is NOT NULL.
+
+Args:
+  tab_id: The OID of the table containing the column being retyped.
+  col_id: The attnum of the column being retyped.
+*/
+DECLARE
+  shadow_name text := msar.get_online_retype_shadow_name(col_id);
+BEGIN
+  IF NOT (SELECT attnotnull FROM pg_catalog.pg_attribute WHERE attrelid = tab_id AND attnum = col_id) THEN
+    RETURN false;
+  END IF;
+  EXECUTE format(
+    'ALTER TABLE %I.%I ADD CONSTRAINT %I CHECK (%I IS NOT NULL) NOT VALID',
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    shadow_name || '_not_null',
+    shadow_name
+  );
+  RETURN true;
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.validate_online_retype_not_null_check(tab_id regclass, col_id smallint) RETURNS void AS $$/*
+Validate the check added by msar.add_online_retype_not_null_check, if any.
+
+Args:
+  tab_id: The OID of the table containing the column being retyped.
+  col_id: The attnum of the column being retyped.
+*/
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM pg_catalog.pg_constraint
+    WHERE conrelid = tab_id AND conname = msar.get_online_retype_shadow_name(col_id) || '_not_null'
+  ) THEN
+    EXECUTE format(
+      'ALTER TABLE %I.%I VALIDATE CONSTRAINT %I',
+      msar.get_relation_schema_name(tab_id),
+      msar.get_relation_name(tab_id),
+      msar.get_online_retype_shadow_name(col_id) || '_not_null'
+    );
+  END IF;
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.finish_online_retype(
+  tab_id regclass,
+  col_id smallint,
+  type_ jsonb,
+  cast_options jsonb DEFAULT '{}'::jsonb
+) RETURNS smallint AS $$/*
+Replace a column being retyped online by its shadow column, returning the new attnum of the column.
+
+The shadow column takes the name, nullability, default, and description of the column. As with
+msar.alter_columns, the default is cast to the new type (see msar.set_old_col_default). This takes
+an ACCESS EXCLUSIVE lock on the table, but doesn't scan it, so the lock is only held briefly. To
+avoid blocking other queries while waiting for the lock, set a `lock_timeout` before calling this.
+
+Args:
+  tab_id: The OID of the table containing the column being retyped.
+  col_id: The attnum of the column being retyped.
+  type_: The new type of the column, as given to msar.start_online_retype.
+  cast_options: Suggestions to be used while type casting.
+*/
+DECLARE
+  sch_name text := msar.get_relation_schema_name(tab_id);
+  rel_name text := msar.get_relation_name(tab_id);
+  col_name text := msar.get_column_name(tab_id, col_id);
+  shadow_name text := msar.get_online_retype_shadow_name(col_id);
+  new_col_id smallint;
+  old_col record;
+BEGIN
+  EXECUTE format('LOCK TABLE %I.%I IN ACCESS EXCLUSIVE MODE', sch_name, rel_name);
+  SELECT
+    pga.attnotnull AS not_null,
+    pg_get_expr(pgat.adbin, tab_id) AS default_,
+    msar.is_default_possibly_dynamic(tab_id, col_id) AS is_default_dynamic,
+    msar.col_description(tab_id, col_id) AS description,
+    msar.build_type_text_complete(type_, format_type(pga.atttypid, null)) AS new_type
+  INTO old_col
+  FROM pg_catalog.pg_attribute AS pga
+    LEFT JOIN pg_catalog.pg_attrdef AS pgat ON pgat.adrelid = tab_id AND pgat.adnum = col_id
+  WHERE pga.attrelid = tab_id AND pga.attnum = col_id;
+
+  EXECUTE format('DROP TRIGGER %I ON %I.%I', shadow_name, sch_name, rel_name);
+  EXECUTE format('DROP FUNCTION %s()', msar.get_online_retype_trigger_function(tab_id, col_id));
+  EXECUTE format('ALTER TABLE %I.%I DROP COLUMN %I', sch_name, rel_name, col_name);
+  EXECUTE format('ALTER TABLE %I.%I RENAME COLUMN %I TO %I', sch_name, rel_name, shadow_name, col_name);
+  new_col_id := msar.get_attnum(tab_id, col_name);
+
+  IF old_col.not_null THEN
+    PERFORM msar.set_not_null(tab_id, new_col_id, true);
+    EXECUTE format(
+      'ALTER TABLE %I.%I DROP CONSTRAINT IF EXISTS %I', sch_name, rel_name, shadow_name || '_not_null'
+    );
+  END IF;
+  PERFORM msar.set_old_col_default(
+    tab_id,
+    new_col_id,
+    old_col.default_,
+    old_col.new_type,
+    old_col.is_default_dynamic,
+    COALESCE(cast_options, '{}'::jsonb)
+  );
+  PERFORM msar.comment_on_column(tab_id, new_col_id, old_col.description);
+  RETURN new_col_id;
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION
+msar.cancel_online_retype(tab_id regclass, col_id smallint) RETURNS void AS $$/*
+Drop the shadow column (and its trigger, trigger function, and check) of a column being retyped
+online, if any.
+
+Args:
+  tab_id: The OID of the table containing the column being retyped.
+  col_id: The attnum of the column being retyped.
+*/
+BEGIN
+  EXECUTE format(
+    'DROP TRIGGER IF EXISTS %I ON %I.%I',
+    msar.get_online_retype_shadow_name(col_id),
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id)
+  );
+  EXECUTE format(
+    'DROP FUNCTION IF EXISTS %s()', msar.get_online_retype_trigger_function(tab_id, col_id)
+  );
+  EXECUTE format(
+    'ALTER TABLE %I.%I DROP COLUMN IF EXISTS %I',
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    msar.get_online_retype_shadow_name(col_id)
+  );
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.alter_columns(tab_id oid, col_alters jsonb) RETURNS integer[] AS $$/*
+Alter columns of the given table in bulk, returning the IDs of the columns so altered.
+
+Args:
+  tab_id: The OID of the table whose columns we'll alter.
+  col_alters: a JSONB describing the alterations to make.
+
+The col_alters JSONB should have the form:
+[
+  {
+    "attnum": <int>,
+    "type": <obj> (optional),
+    "default": <any> (optional),
+    "not_null": <bool> (optional),
+    "delete": <bool> (optional),
+    "name": <str> (optional),
+  },
+  {
+    ...
+  },
+  ...
+]
+
+Note that for most alterations, we create and execute separate SQL queries rather than combining
+them into a giant SQL statement. This has the benefit of providing better error messages(for users)
+and better code readability(for us) at the cost of a minor performance hit. Type changes are the
+exception: each of them rewrites the whole table, so they're combined into a single statement (see
+msar.retype_columns), after all other alterations, and before setting defaults.
+*/
+DECLARE
+  col RECORD;
+  return_attnum_arr integer[];
+  col_retypes jsonb := '[]'::jsonb;
+  col_defaults jsonb := '[]'::jsonb;
+BEGIN
+  FOR col IN
+    SELECT
+      (col_alter_obj ->> 'attnum')::smallint AS attnum,
+      (col_alter_obj -> 'not_null')::boolean AS not_null,
+      (col_alter_obj ->> 'name')::text AS new_name,
+      (col_alter_obj -> 'delete')::boolean AS delete_,
+      msar.build_type_text_complete(col_alter_obj -> 'type', format_type(pga.atttypid, null)) AS new_type,
+      COALESCE((col_alter_obj -> 'cast_options')::jsonb, '{}'::jsonb) AS cast_options,
+      pg_get_expr(adbin, tab_id) AS old_default,
+      col_alter_obj -> 'default' AS new_default,
+
+      col_alter_obj->>'description' AS comment_,
+      __msar.jsonb_key_exists(col_alter_obj, 'description') AS has_comment
+
+    FROM jsonb_array_elements(col_alters) AS x(col_alter_obj)
+      INNER JOIN pg_catalog.pg_attribute AS pga ON pga.attnum=(x.col_alter_obj ->> 'attnum')::smallint AND pga.attrelid=tab_id
+      LEFT JOIN pg_catalog.pg_attrdef AS pgat ON pgat.adnum=(x.col_alter_obj ->> 'attnum')::smallint AND pgat.adrelid=tab_id
+    WHERE NOT msar.is_mathesar_id_column(tab_id, (x.col_alter_obj ->> 'attnum')::integer)
+  LOOP
+    PERFORM msar.set_not_null(tab_id, col.attnum, col.not_null);
+    PERFORM msar.rename_column(tab_id, col.attnum, col.new_name);
+
+    IF col.delete_ THEN
+      PERFORM msar.drop_columns(tab_id, col.attnum);
+    END IF;
+
+    IF col.has_comment THEN
+      PERFORM msar.comment_on_column(tab_id, col.attnum, col.comment_);
+    END IF;
+
+    -- is_default_possibly_dynamic check must happen before we drop the default.
+    col_defaults := col_defaults || jsonb_build_object(
+      'attnum', col.attnum,
+      'new_type', col.new_type,
+      'cast_options', col.cast_options,
+      'old_default', col.old_default,
+      'new_default', col.new_default #>> '{}',
+      -- preserve old default
+      -- when a new_default is absent and col is retyped with a new_type.
+      -- Note: We don't want to preserve old default for jsonb_typeof(col.new_default)='null'
+      -- as we consider it as an intent to drop the default.
+      'preserve_old_default',
+        (col.new_default IS NULL OR jsonb_typeof(col.new_default)<>'null') AND col.new_type IS NOT NULL,
+      'is_default_dynamic', msar.is_default_possibly_dynamic(tab_id, col.attnum)
+    );
+
+    IF col.new_type IS NOT NULL OR jsonb_typeof(col.new_default)='null' THEN
+      PERFORM msar.drop_col_default(tab_id, col.attnum);
+    END IF;
+    IF col.new_type IS NOT NULL AND NOT COALESCE(col.delete_, false) THEN
+      col_retypes := col_retypes || jsonb_build_object(
+        'attnum', col.attnum, 'new_type', col.new_type, 'cast_options', col.cast_options
+      );
+    END IF;
+
+    -- PG13 doesn't allow concat b/w integer[] and smallint need to typecast
+    return_attnum_arr := return_attnum_arr || col.attnum::integer;
+  END LOOP;
+
+  PERFORM msar.retype_columns(tab_id, col_retypes);
+
+  FOR col IN
+    SELECT * FROM jsonb_to_recordset(col_defaults) AS x(
+      attnum smallint,
+      new_type text,
+      cast_options jsonb,
+      old_default text,
+      new_default text,
+      preserve_old_default boolean,
+      is_default_dynamic boolean
+    )
+  LOOP
+    IF col.new_default IS NOT NULL THEN
+      -- set new default
+      PERFORM msar.set_col_default(tab_id, col.attnum, col.new_default);
+    ELSEIF col.preserve_old_default THEN
+      PERFORM msar.set_old_col_default(tab_id, col.attnum, col.old_default, col.new_type, col.is_default_dynamic, col.cast_options);
+    END IF;
+  END LOOP;
+  RETURN return_attnum_arr; -- do we really need this??
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
+-- Comment on column -------------------------------------------------------------------------------
+
+
+CREATE OR REPLACE FUNCTION
+msar.comment_on_column(
+  tab_id oid,
+  col_id integer,
+  comment_ text
+) RETURNS text AS $$/*
+Change the description of a column, returning command executed.
+
+Args:
+  tab_id: The OID of the table containg the column whose comment we will change.
+  col_id: The ATTNUM of the column whose comment we will change.
+  comment_: The new comment.
+*/
+DECLARE
+  comment_sql text;
+BEGIN
+  SELECT format(
+    'COMMENT ON COLUMN %I.%I.%I IS %L',
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    msar.get_column_name(tab_id, col_id),
+    comment_
+  ) INTO comment_sql;
+  EXECUTE comment_sql;
+  RETURN comment_sql;
+END;
+$$ LANGUAGE plpgsql;
+
+
+----------------------------------------------------------------------------------------------------
+----------------------------------------------------------------------------------------------------
+-- MATHESAR LINK FUNCTIONS
+--
+-- Add a link to the table.
+----------------------------------------------------------------------------------------------------
+----------------------------------------------------------------------------------------------------
+
+-- Create a Many-to-One or a One-to-One link -------------------------------------------------------
+
+
+CREATE OR REPLACE FUNCTION
+msar.add_foreign_key_column(
+  col_name text,
+  rel_id oid,
+  frel_id oid,
+  unique_link boolean DEFAULT false
+) RETURNS smallint AS $$/*
+Create a many-to-one or a one-to-one link between tables, returning the attnum of the newly created
+column, returning the attnum of the added column.
+
+Args:
+  col_name: Name of the new column to be created in the referrer table, unquoted.
+  rel_id: The OID of the referrer table, named for conrelid in the pg_attribute table.
+  frel_id: The OID of the referent table, named for confrelid in the pg_attribute table.
+  unique_link: Whether to make the link one-to-one instead of many-to-one.
+*/
+DECLARE
+  pk_col_id smallint;
+  col_defs jsonb;
+  added_col_ids smallint[];
+  con_defs jsonb;
+BEGIN
+  pk_col_id := msar.get_pk_column(frel_id);
+  col_defs := jsonb_build_array(
+    jsonb_build_object(
+      'name', col_name,
+      'type', jsonb_build_object('name', msar.get_column_type(frel_id, pk_col_id))
+    )
+  );
+  added_col_ids := msar.add_columns(rel_id , col_defs , false);
+  con_defs := jsonb_build_array(
+    jsonb_build_object(
+      'name', null,
+      'type', 'f',
+      'columns', added_col_ids,
+      'deferrable', false,
+      'fkey_relation_id', frel_id::integer,
+      'fkey_columns', jsonb_build_array(pk_col_id)
+    )
+  );
+  IF unique_link THEN
+    con_defs := jsonb_build_array(
+      jsonb_build_object(
+        'name', null,
+        'type', 'u',
+        'columns', added_col_ids)
+    ) || con_defs;
+  END IF;
+  PERFORM msar.add_constraints(rel_id , con_defs);
+  RETURN added_col_ids[1];
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+-- Create a Many-to-Many link ----------------------------------------------------------------------
+
+
+CREATE OR REPLACE FUNCTION
+msar.add_mapping_table(
+  sch_id oid,
+  tab_name text,
+  mapping_columns jsonb
+) RETURNS oid AS $$/*
+Create a many-to-many link between tables, returning the oid of the newly created table.
+
+Args:
+  sch_id: The OID of the schema in which new referrer table is to be created.
+  tab_name: Name of the referrer table to be created.
+  mapping_columns: An array of objects giving the foreign key columns for the new table.
+
+The elements of the mapping_columns array must have the form
+  {"column_name": <str>, "referent_table_oid": <int>}
+
+*/
+DECLARE
+  added_table_id oid;
+BEGIN
   added_table_id := msar.add_mathesar_table(sch_id, tab_name, NULL, NULL, NULL, NULL, NULL) ->> 'oid';
   PERFORM msar.add_foreign_key_column(column_name, added_table_id, referent_table_oid)
   FROM jsonb_to_recordset(mapping_columns) AS x(column_name text, referent_table_oid oid);
@@ -4515,6 +5283,204 @@ SELECT 'ORDER BY ' || msar.build_total_order_expr(tab_id, order_)
 $$ LANGUAGE SQL STABLE;
 
 
+CREATE OR REPLACE FUNCTION
+msar.get_total_order_keys(tab_id oid, order_ jsonb) RETURNS jsonb AS $$/*
+Get the keys of the deterministic ordering given by msar.build_total_order_expr.
+
+Returns a JSONB array of objects of the form
+  {"attnum": <int>, "direction": <"ASC" or "DESC">}
+i.e., the given ordering followed by the primary key (or all orderable columns if there's no
+primary key). Only columns to which the user has access are included.
+
+Args:
+  tab_id: The OID of the table whose columns we'll order by.
+  order_: A JSONB array defining any desired ordering of columns.
+*/
+SELECT COALESCE(
+  jsonb_agg(
+    jsonb_build_object(
+      'attnum', attnum,
+      'direction', COALESCE(msar.sanitize_direction(direction), 'ASC')
+    ) ORDER BY ordinality
+  ),
+  '[]'::jsonb
+)
+FROM ROWS FROM (
+  jsonb_to_recordset(
+    COALESCE(
+      COALESCE(order_, '[]'::jsonb) || msar.get_pkey_order(tab_id),
+      COALESCE(order_, '[]'::jsonb) || msar.get_total_order(tab_id)
+    )
+  ) AS (attnum smallint, direction text)
+) WITH ORDINALITY AS x(attnum, direction, ordinality)
+WHERE has_column_privilege(tab_id, attnum, 'SELECT');
+$$ LANGUAGE SQL STABLE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.encode_records_cursor(order_keys jsonb, values_ jsonb) RETURNS text AS $$/*
+Encode the position of a record in a total ordering as an opaque cursor string.
+
+Args:
+  order_keys: The ordering, as produced by msar.get_total_order_keys.
+  values_: A JSONB array with the text representation of the record's value for each order key.
+*/
+SELECT translate(
+  encode(
+    convert_to(jsonb_build_object('order', order_keys, 'values', values_)::text, 'UTF8'),
+    'base64'
+  ),
+  E'\n',
+  ''
+);
+$$ LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT PARALLEL SAFE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.decode_records_cursor(cursor_ text, order_keys jsonb) RETURNS jsonb AS $$/*
+Decode a cursor produced by msar.encode_records_cursor, returning the values it holds.
+
+Raises an exception if the cursor can't be decoded, or if it was produced for a different ordering.
+
+Args:
+  cursor_: The cursor string.
+  order_keys: The ordering which the cursor should have been produced for.
+*/
+DECLARE
+  cursor_obj jsonb;
+BEGIN
+  BEGIN
+    cursor_obj := convert_from(decode(cursor_, 'base64'), 'UTF8')::jsonb;
+  EXCEPTION WHEN OTHERS THEN
+    RAISE EXCEPTION 'Invalid cursor: %', cursor_
+      USING ERRCODE = '22023'; -- invalid_parameter_value
+  END;
+  IF cursor_obj -> 'order' IS DISTINCT FROM order_keys
+    OR jsonb_typeof(cursor_obj -> 'values') IS DISTINCT FROM 'array'
+    OR jsonb_array_length(cursor_obj -> 'values') <> jsonb_array_length(order_keys)
+  THEN
+    RAISE EXCEPTION 'The cursor does not match the requested ordering'
+      USING ERRCODE = '22023', -- invalid_parameter_value
+      HINT = 'Request the first page again, without a cursor.';
+  END IF;
+  RETURN cursor_obj -> 'values';
+END;
+$$ LANGUAGE plpgsql IMMUTABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.build_seek_expr(tab_id oid, order_keys jsonb, values_ jsonb) RETURNS text AS $$/*
+Build an SQL expression true for the rows of a table which come after a given row in an ordering.
+
+The expression compares the same formatted values which the ORDER BY expression produced by
+msar.build_order_by_expr sorts on, so it can be combined with that to seek to the page following
+the given row, rather than skipping an OFFSET worth of rows. When all the order keys are NOT NULL
+and have the same direction, we use a single row comparison, which can make use of a multicolumn
+index. Otherwise, we expand the comparison, respecting the default NULLS LAST (for ASC) and NULLS
+FIRST (for DESC) placement of nulls.
+
+Args:
+  tab_id: The OID of the table whose rows we'll filter.
+  order_keys: The ordering, as produced by msar.get_total_order_keys.
+  values_: A JSONB array with the text representation of the given row's value for each order key.
+*/
+DECLARE
+  key_exprs text[];
+  directions text[];
+  key_values text[];
+  key_not_nulls boolean[];
+  prefix_exprs text[] := '{}';
+  seek_exprs text[] := '{}';
+  after_expr text;
+BEGIN
+  SELECT
+    array_agg(
+      format('msar.format_data(%I.%I)', msar.get_relation_name(tab_id), attname)
+      ORDER BY key_idx
+    ),
+    array_agg(key_obj ->> 'direction' ORDER BY key_idx),
+    array_agg(value_obj #>> '{}' ORDER BY key_idx),
+    array_agg(attnotnull ORDER BY key_idx)
+  INTO key_exprs, directions, key_values, key_not_nulls
+  FROM jsonb_array_elements(order_keys) WITH ORDINALITY AS k(key_obj, key_idx)
+    JOIN jsonb_array_elements(values_) WITH ORDINALITY AS v(value_obj, value_idx)
+      ON key_idx = value_idx
+    JOIN pg_catalog.pg_attribute
+      ON attrelid = tab_id AND attnum = (key_obj ->> 'attnum')::smallint;
+
+  IF key_exprs IS NULL THEN
+    RETURN 'false';
+  END IF;
+
+  IF true = ALL(key_not_nulls) AND array_length(array(SELECT DISTINCT unnest(directions)), 1) = 1 THEN
+    RETURN format(
+      '(%s) %s (%s)',
+      array_to_string(key_exprs, ', '),
+      CASE directions[1] WHEN 'DESC' THEN '<' ELSE '>' END,
+      (SELECT string_agg(format('%L', key_value), ', ') FROM unnest(key_values) AS key_value)
+    );
+  END IF;
+
+  FOR i IN 1..array_length(key_exprs, 1) LOOP
+    after_expr := CASE
+      WHEN directions[i] = 'DESC' AND key_values[i] IS NULL THEN
+        format('%s IS NOT NULL', key_exprs[i])
+      WHEN directions[i] = 'DESC' THEN
+        format('%s < %L', key_exprs[i], key_values[i])
+      WHEN key_values[i] IS NULL THEN
+        NULL  -- Nulls are last in ascending order, so nothing comes after them.
+      WHEN key_not_nulls[i] THEN
+        format('%s > %L', key_exprs[i], key_values[i])
+      ELSE
+        format('(%1$s > %2$L OR %1$s IS NULL)', key_exprs[i], key_values[i])
+    END;
+    IF after_expr IS NOT NULL THEN
+      seek_exprs := seek_exprs || format('(%s)', concat_ws(' AND ', VARIADIC prefix_exprs || after_expr));
+    END IF;
+    prefix_exprs := prefix_exprs || format('%s IS NOT DISTINCT FROM %L', key_exprs[i], key_values[i]);
+  END LOOP;
+  RETURN COALESCE(NULLIF(array_to_string(seek_exprs, ' OR '), ''), 'false');
+END;
+$$ LANGUAGE plpgsql STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.build_next_cursor_expr(
+  cte_name text,
+  order_keys jsonb,
+  order_by_expr text,
+  limit_ integer
+) RETURNS text AS $$/*
+Build an SQL aggregate expression giving the cursor for the page following the listed records.
+
+The cursor holds the order key values of the last listed record. It's NULL when fewer than `limit_`
+records were listed (i.e., when there is no following page).
+
+Args:
+  cte_name: The name of the CTE holding the listed records, with columns named by attnum.
+  order_keys: The ordering of the records, as produced by msar.get_total_order_keys.
+  order_by_expr: The ORDER BY expression corresponding to order_keys.
+  limit_: The maximum number of records listed in a page.
+*/
+SELECT CASE WHEN limit_ IS NULL OR jsonb_array_length(order_keys) = 0 THEN 'NULL' ELSE
+  format(
+    $c$
+      CASE WHEN count(1) >= %1$L THEN
+        msar.encode_records_cursor(%2$L::jsonb, jsonb_agg(jsonb_build_array(%3$s) %4$s) -> -1)
+      END
+    $c$,
+    /* %1 */ limit_,
+    /* %2 */ order_keys,
+    /* %3 */ (
+      SELECT string_agg(format('%I.%I::text', cte_name, key_obj ->> 'attnum'), ', ' ORDER BY key_idx)
+      FROM jsonb_array_elements(order_keys) WITH ORDINALITY AS k(key_obj, key_idx)
+    ),
+    /* %4 */ order_by_expr
+  )
+END;
+$$ LANGUAGE SQL STABLE;
+
+
 CREATE OR REPLACE FUNCTION
 msar.build_grouping_columns_expr(tab_id oid, group_ jsonb) RETURNS TEXT AS $$/*
 Build a column expression for use in grouping window functions.
@@ -4715,6 +5681,7 @@ WHERE
   attrelid = tab_id
   AND attnum > 0
   AND NOT attisdropped
+  AND NOT msar.is_online_retype_shadow_name(attname)
   AND has_column_privilege(attrelid, attnum, 'SELECT');
 $$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
 
@@ -4776,6 +5743,7 @@ FROM pg_catalog.pg_attribute pga JOIN pg_catalog.pg_type pgt ON pga.atttypid = p
 WHERE pga.attrelid = tab_id
   AND pga.attnum > 0
   AND NOT pga.attisdropped
+  AND NOT msar.is_online_retype_shadow_name(pga.attname)
   AND has_column_privilege(pga.attrelid, pga.attnum, 'SELECT')
 ORDER BY (CASE WHEN pgt.typcategory='S' THEN 0 ELSE 1 END), pga.attnum
 LIMIT 1;
@@ -4997,6 +5965,24 @@ SELECT jsonb_build_array(jsonb_build_array(msar.get_default_summary_column(tab_i
 $$ LANGUAGE sql STABLE RETURNS NULL ON NULL INPUT;
 
 
+CREATE OR REPLACE FUNCTION msar.get_record_summary_template(
+  tab_id oid,
+  table_record_summary_templates jsonb
+) RETURNS jsonb AS $$/*
+Return the record summary template to use for a table.
+
+Args:
+  tab_id: the OID of the table for which we're getting the template.
+  table_record_summary_templates: A JSON object that maps table OIDs to record summary templates.
+    If it has no template for the table, one is generated automatically.
+*/
+SELECT COALESCE(
+  NULLIF(table_record_summary_templates -> tab_id::text, 'null'::jsonb),
+  msar.auto_generate_record_summary_template(tab_id)
+);
+$$ LANGUAGE SQL STABLE;
+
+
 CREATE OR REPLACE FUNCTION msar.build_record_summary_query_for_table(
   tab_id oid,
   key_col_id smallint DEFAULT NULL,
@@ -5014,22 +6000,48 @@ Args:
 SELECT msar.build_record_summary_query_from_template(
   tab_id,
   COALESCE(key_col_id, msar.get_selectable_pkey_attnum(tab_id)),
-  COALESCE(
-    NULLIF(table_record_summary_templates -> tab_id::text, 'null'::jsonb),
-    msar.auto_generate_record_summary_template(tab_id)
-  )
+  msar.get_record_summary_template(tab_id, table_record_summary_templates)
 );
 $$ LANGUAGE SQL STABLE;
 
 
+CREATE OR REPLACE FUNCTION msar.build_record_summary_query_for_keys(
+  summary_query text,
+  keys_query text
+) RETURNS TEXT AS $$/*
+Restrict a record summary query to the records whose keys are returned by another query.
+
+The restriction is pushed down to the summarized table, so only the records we need are summarized.
+
+Args:
+  summary_query: A query giving record summaries, as built by
+    msar.build_record_summary_query_from_template.
+  keys_query: A query returning a single column of keys of the records to summarize. If NULL, the
+    summary query is returned unrestricted.
+*/
+SELECT CASE WHEN keys_query IS NULL OR summary_query = msar.build_empty_record_summary_query()
+  THEN summary_query
+  ELSE format(
+    'SELECT * FROM (%1$s) AS summaries WHERE key IN (%2$s)', summary_query, keys_query
+  )
+END;
+$$ LANGUAGE SQL STABLE;
+
+
 CREATE OR REPLACE FUNCTION msar.build_linked_record_summaries_ctes(
   tab_id oid,
-  table_record_summary_templates jsonb DEFAULT NULL
+  table_record_summary_templates jsonb DEFAULT NULL,
+  results_cte_name text DEFAULT NULL
 ) RETURNS TEXT AS $$/*
 Build an SQL text expression defining a sequence of CTEs that give summaries for linked records.
 
 Args:
   tab_id: The table for whose fkey values' linked records we'll get summaries.
+  table_record_summary_templates: (optional) A JSON object that maps table OIDs to record summary
+    templates.
+  results_cte_name: (optional) The name of a CTE with the records of the table whose linked records
+    we'll summarize. When given, only the records linked from that CTE are summarized, rather than
+    all records of the linked tables.
 */
 SELECT
   ', ' ||
@@ -5038,10 +6050,13 @@ SELECT
       format(
         $q$summary_cte_%1$s AS (%2$s)$q$,
         conkey,
-        msar.build_record_summary_query_for_table(
-          target_oid,
-          confkey,
-          table_record_summary_templates
+        msar.build_record_summary_query_for_keys(
+          msar.build_record_summary_query_for_table(
+            target_oid,
+            confkey,
+            table_record_summary_templates
+          ),
+          'SELECT ' || quote_ident(conkey::text) || ' FROM ' || quote_ident(results_cte_name)
         )
       ),
       ', '
@@ -5193,6 +6208,104 @@ END;
 $$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
 
 
+CREATE OR REPLACE FUNCTION
+msar.get_estimated_row_count(tab_id oid, where_clause text) RETURNS bigint AS $$/*
+Estimate the number of rows of a table satisfying a WHERE clause, without scanning the table.
+
+If there's no WHERE clause, and the table has statistics, we derive the estimate from
+`pg_class.reltuples`, scaled by the current size of the table (the same way the planner does).
+Otherwise, we use the planner's estimate for the filtered query, from EXPLAIN.
+
+Args:
+  tab_id: The OID of the table whose rows we'll count.
+  where_clause: (optional) An SQL WHERE clause, as produced by msar.build_where_clause.
+*/
+DECLARE
+  rel_kind "char";
+  rel_tuples real;
+  rel_pages integer;
+  rel_size bigint;
+  query_plan jsonb;
+BEGIN
+  SELECT relkind, reltuples, relpages INTO rel_kind, rel_tuples, rel_pages
+  FROM pg_catalog.pg_class WHERE oid = tab_id;
+  IF where_clause IS NULL AND rel_kind = 'r' THEN
+    rel_size := pg_catalog.pg_relation_size(tab_id) / current_setting('block_size')::integer;
+    IF rel_size = 0 THEN
+      RETURN 0;
+    -- reltuples is -1 (or 0 before PostgreSQL 14) for tables which have never been analyzed.
+    ELSIF rel_tuples > 0 AND rel_pages > 0 THEN
+      RETURN round(rel_tuples / rel_pages * rel_size);
+    END IF;
+  END IF;
+  EXECUTE format(
+    'EXPLAIN (FORMAT JSON) SELECT 1 FROM %I.%I %s',
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    where_clause
+  ) INTO query_plan;
+  RETURN (query_plan -> 0 -> 'Plan' ->> 'Plan Rows')::bigint;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.build_count_cte_query(
+  tab_id oid,
+  where_clause text,
+  count_mode text,
+  count_estimate_threshold bigint
+) RETURNS jsonb AS $$/*
+Build a query giving the count of rows of a table satisfying a WHERE clause, per the count mode.
+
+Returns a JSON object with the keys `count_mode` (the kind of count the query gives: 'exact',
+'estimated', or 'none'), and `count_cte_query` (a query giving that count in a `count` column).
+
+Args:
+  tab_id: The OID of the table whose rows we'll count.
+  where_clause: (optional) An SQL WHERE clause, as produced by msar.build_where_clause.
+  count_mode: One of
+    - 'exact' (default): Count the matching rows. This requires scanning them.
+    - 'estimated': Use msar.get_estimated_row_count, which doesn't scan the table.
+    - 'none': Don't count rows. The count is NULL.
+    - 'auto': Use the estimate if it's at least count_estimate_threshold, else an exact count.
+  count_estimate_threshold: The estimated row count above which 'auto' mode doesn't count exactly.
+*/
+DECLARE
+  row_count_estimate bigint;
+BEGIN
+  count_mode := COALESCE(count_mode, 'exact');
+  IF count_mode NOT IN ('exact', 'estimated', 'none', 'auto') THEN
+    RAISE EXCEPTION 'Invalid count mode: %', count_mode
+      USING HINT = 'Use one of exact, estimated, none, or auto.';
+  END IF;
+  IF count_mode = 'none' THEN
+    RETURN jsonb_build_object(
+      'count_mode', 'none',
+      'count_cte_query', 'SELECT NULL::bigint AS count'
+    );
+  ELSIF count_mode IN ('estimated', 'auto') THEN
+    row_count_estimate := msar.get_estimated_row_count(tab_id, where_clause);
+  END IF;
+  IF count_mode = 'estimated' OR row_count_estimate >= count_estimate_threshold THEN
+    RETURN jsonb_build_object(
+      'count_mode', 'estimated',
+      'count_cte_query', format('SELECT %L::bigint AS count', row_count_estimate)
+    );
+  END IF;
+  RETURN jsonb_build_object(
+    'count_mode', 'exact',
+    'count_cte_query', format(
+      $q$SELECT count(1) AS count FROM %1$I.%2$I %3$s$q$,
+      msar.get_relation_schema_name(tab_id),
+      msar.get_relation_name(tab_id),
+      where_clause
+    )
+  );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+
 CREATE OR REPLACE FUNCTION msar.build_record_list_query_components_with_ctes(
   tab_id oid,
   limit_ integer,
@@ -5200,7 +6313,8 @@ CREATE OR REPLACE FUNCTION msar.build_record_list_query_components_with_ctes(
   order_ jsonb,
   filter_ jsonb,
   group_ jsonb,
-  joined_columns jsonb
+  joined_columns jsonb,
+  cursor_ text DEFAULT NULL
 ) RETURNS jsonb AS $$/*
   Constructs the components necessary for generating enriched query results,
   including expressions, clauses, selectable_column list, and CTEs, for a table.
@@ -5214,6 +6328,8 @@ CREATE OR REPLACE FUNCTION msar.build_record_list_query_components_with_ctes(
     group_: An array of group definition objects
     joined_columns: (optional) A jsonb list defining columns joined via a simple many-to-many linkage.
       See msar.get_joined_columns_expr_json for more details.
+    cursor_: (optional) A cursor produced by msar.encode_records_cursor. If given, only rows after
+      the one it points to (in the total ordering) are returned, and offset_ is ignored.
 
   Behavior:
     Fetches metadata about the table (selectable_column list, schema name, table name etc.,)
@@ -5221,23 +6337,41 @@ CREATE OR REPLACE FUNCTION msar.build_record_list_query_components_with_ctes(
     Generates two SQL queries:
       1. A query for paginated results (`results_cte_query`).
       2. A query to count the total matching rows (`count_cte_query`).
+    Seeks past the cursor (if given) only in the first query, so the count is unaffected by it.
     Returns a jsonb object combining metadata, the expressions, and the generated SQL queries.
 */
 DECLARE
   expr_object jsonb;
   joinable_expr_object jsonb;
+  order_keys jsonb;
+  results_where_clause text;
   results_cte_query text;
   count_cte_query text;
 BEGIN
+  order_keys := msar.get_total_order_keys(tab_id, order_);
   SELECT jsonb_build_object(
     'relation_name', msar.get_relation_name(tab_id),
     'relation_schema_name', msar.get_relation_schema_name(tab_id),
     'selectable_columns_expr', msar.build_selectable_column_expr(tab_id),
     'grouping_expr', msar.build_grouping_expr(tab_id, group_),
     'order_by_expr', msar.build_order_by_expr(tab_id, order_),
-    'where_clause', msar.build_where_clause(tab_id, filter_)
+    'where_clause', msar.build_where_clause(tab_id, filter_),
+    'order_keys', order_keys
   ) INTO expr_object;
 
+  results_where_clause :=
+    CASE
+      WHEN cursor_ IS NOT NULL THEN
+        'WHERE ' || concat_ws(
+          ' AND ',
+          '(' || msar.build_expr(tab_id, filter_) || ')',
+          '(' || msar.build_seek_expr(
+            tab_id, order_keys, msar.decode_records_cursor(cursor_, order_keys)
+          ) || ')'
+        )
+      ELSE expr_object ->> 'where_clause'
+    END;
+
   joinable_expr_object :=
     CASE
       WHEN joined_columns IS NOT NULL THEN
@@ -5256,11 +6390,11 @@ BEGIN
     /* %3 */ expr_object ->> 'relation_schema_name',
     /* %4 */ expr_object ->> 'relation_name',
     /* %5 */ joinable_expr_object ->> 'join_sql_expr',
-    /* %6 */ expr_object ->> 'where_clause',
+    /* %6 */ results_where_clause,
     /* %7 */ joinable_expr_object ->> 'join_group_by_expr',
     /* %8 */ expr_object ->> 'order_by_expr',
     /* %9 */ limit_,
-    /* %10 */ offset_
+    /* %10 */ CASE WHEN cursor_ IS NULL THEN offset_ END
   ) INTO results_cte_query;
 
   SELECT format(
@@ -5288,7 +6422,11 @@ msar.list_records_from_table(
   group_ jsonb,
   joined_columns jsonb DEFAULT NULL,
   return_record_summaries boolean DEFAULT false,
-  table_record_summary_templates jsonb DEFAULT NULL
+  table_record_summary_templates jsonb DEFAULT NULL,
+  count_mode text DEFAULT 'exact',
+  count_estimate_threshold bigint DEFAULT NULL,
+  use_cursor boolean DEFAULT false,
+  cursor_ text DEFAULT NULL
 ) RETURNS jsonb AS $$/*
 Get records from a table. Only columns to which the user has access are returned.
 
@@ -5304,12 +6442,24 @@ Args:
   return_record_summaries : Whether to return a summary for each record listed.
   table_record_summary_templates: (optional) A JSON object that maps table OIDs to record summary
     templates.
+  count_mode: (optional) How to count the matching rows. See msar.build_count_cte_query.
+  count_estimate_threshold: (optional) The estimated row count at which 'auto' count mode switches
+    from an exact count to the estimate.
+  use_cursor: Whether to return a `next_cursor` for keyset pagination. Implied by cursor_.
+  cursor_: (optional) The `next_cursor` returned with the previous page. If given, we seek directly
+    to the rows following that page, rather than skipping `offset_` rows from the start, and
+    `offset_` is ignored.
 
 The order definition objects should have the form
   {"attnum": <int>, "direction": <text>}
+
+The `count_mode` key of the result gives the kind of count returned in `count`. When using
+cursors, the `next_cursor` key of the result gives the cursor for the next page, or null if this is
+the last page. A cursor is only valid with the same `order_` as the page which produced it.
 */
 DECLARE
   expr_and_ctes jsonb;
+  count_info jsonb;
   records jsonb;
 BEGIN
   SELECT msar.build_record_list_query_components_with_ctes(
@@ -5319,8 +6469,12 @@ BEGIN
     order_,
     filter_,
     group_,
-    joined_columns
+    joined_columns,
+    cursor_
   ) INTO expr_and_ctes;
+  count_info := msar.build_count_cte_query(
+    tab_id, expr_and_ctes ->> 'where_clause', count_mode, count_estimate_threshold
+  );
 
   EXECUTE format(
     $q$
@@ -5362,9 +6516,10 @@ BEGIN
     ),
     records_json_cte AS ( SELECT jsonb_build_object(
       'results', %4$s,
-      'count', coalesce(max(count_cte.count), 0),
+      'count', %14$s,
+      'count_mode', %15$L,
       'grouping', %5$s
-    ) AS rj
+    ) || %16$s AS rj
     FROM enriched_results_cte
       LEFT JOIN groups_cte ON enriched_results_cte.__mathesar_gid = groups_cte.id
       CROSS JOIN count_cte
@@ -5372,7 +6527,7 @@ BEGIN
     SELECT records_json_cte.rj || summaries_json_cte.sj
     FROM records_json_cte, summaries_json_cte;
     $q$,
-    /* %1 */ expr_and_ctes ->> 'count_cte_query',
+    /* %1 */ count_info ->> 'count_cte_query',
     /* %2 */ expr_and_ctes ->> 'results_cte_query',
     /* %3 */ expr_and_ctes ->> 'order_by_expr',
     /* %4 */ COALESCE(
@@ -5390,14 +6545,19 @@ BEGIN
       msar.build_groups_cte_expr(tab_id, 'results_eq_cte', 'results_ranked_cte', group_),
       'NULL AS id'
     ),
-    /* %7 */ msar.build_record_summary_query_for_table(
-      tab_id,
-      null,
-      table_record_summary_templates
+    /* %7 */ msar.build_record_summary_query_for_keys(
+      msar.build_record_summary_query_for_table(
+        tab_id,
+        null,
+        table_record_summary_templates
+      ),
+      'SELECT ' || quote_ident(msar.get_selectable_pkey_attnum(tab_id)::text)
+      || ' FROM enriched_results_cte'
     ),
     /* %8 */ msar.build_linked_record_summaries_ctes(
       tab_id,
-      table_record_summary_templates
+      table_record_summary_templates,
+      'enriched_results_cte'
     ),
     /* %9 */ msar.build_summary_join_expr_for_table(tab_id, 'enriched_results_cte'),
     /* %10 */ COALESCE(
@@ -5421,13 +6581,69 @@ BEGIN
     /* %13 */ COALESCE(
       NULLIF(msar.build_joined_columns_summaries_expr(joined_columns), ''),
       'SELECT COUNT(1) AS count_hack'
-    )
+    ),
+    /* %14 */ CASE
+      WHEN count_info ->> 'count_mode' = 'none' THEN 'NULL'
+      ELSE 'coalesce(max(count_cte.count), 0)'
+    END,
+    /* %15 */ count_info ->> 'count_mode',
+    /* %16 */ CASE
+      WHEN use_cursor OR cursor_ IS NOT NULL THEN format(
+        'jsonb_build_object(%L, %s)',
+        'next_cursor',
+        msar.build_next_cursor_expr(
+          'enriched_results_cte',
+          expr_and_ctes -> 'order_keys',
+          expr_and_ctes ->> 'order_by_expr',
+          limit_
+        )
+      )
+      ELSE '''{}''::jsonb'
+    END
   ) INTO records;
   RETURN records;
 END;
 $$ LANGUAGE plpgsql STABLE;
 
 
+CREATE OR REPLACE FUNCTION
+msar.build_table_export_query(
+  tab_id oid,
+  limit_ integer,
+  offset_ integer,
+  order_ jsonb,
+  filter_ jsonb
+) RETURNS text AS $$/*
+Build a query giving the records of a table for export, e.g., via `COPY (...) TO STDOUT`.
+
+The query filters, orders, and formats values the same way as msar.get_table_columns_and_records,
+but names the output columns after the table's columns (rather than by attnum), so COPY can use them
+as a header. Only columns to which the user has access are included.
+
+Args:
+  tab_id: The OID of the table whose records we'll export.
+  limit_: The maximum number of rows we'll export.
+  offset_: The number of rows to skip before exporting records from following rows.
+  order_: An array of ordering definition objects.
+  filter_: An array of filter definition objects.
+*/
+SELECT format(
+  'SELECT %s FROM (%s) AS export_cte',
+  COALESCE(
+    string_agg(
+      format('export_cte.%I AS %I', sel_column.key, sel_column.value),
+      ', ' ORDER BY sel_column.key::smallint
+    ),
+    'NULL'
+  ),
+  msar.build_record_list_query_components_with_ctes(
+    tab_id, limit_, offset_, order_, filter_, null, null
+  ) ->> 'results_cte_query'
+)
+FROM jsonb_each_text(msar.get_selectable_columns(tab_id)) AS sel_column;
+$$ LANGUAGE SQL STABLE;
+
+
 CREATE OR REPLACE FUNCTION
 msar.get_table_columns_and_records(
   tab_id oid,
@@ -5494,6 +6710,174 @@ WHERE
 $$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
 
 
+CREATE OR REPLACE FUNCTION
+msar.get_search_match_expr(tab_id oid, parameters_ jsonb) RETURNS text AS $$/*
+Build a condition true for exactly the records to which msar.get_score_expr gives a positive score.
+
+Rather than computing the score, we OR together one predicate per searched column: a substring
+ILIKE for string (and uuid) columns, and an equality otherwise. Each of these can be answered by an
+index (a trigram index from msar.add_search_indexes, or a btree index, respectively), so the planner
+can find matching records with a bitmap OR of index scans, rather than scoring every row.
+
+Args:
+  tab_id: The OID of the table whose records we're searching.
+  parameters_: An array of search definition objects, as for msar.get_score_expr.
+*/
+SELECT '(' || string_agg(
+  CASE WHEN pgt.typcategory = 'S' OR pgt.typname = 'uuid' THEN
+    format('%I::text ILIKE %L', pga.attname, '%' || x.literal || '%')
+  ELSE
+    format('%I = %L', pga.attname, x.literal)
+  END,
+  ' OR '
+) || ')'
+FROM jsonb_to_recordset(parameters_) AS x(attnum smallint, literal text)
+  INNER JOIN pg_catalog.pg_attribute AS pga ON x.attnum = pga.attnum
+  INNER JOIN pg_catalog.pg_type AS pgt ON pga.atttypid = pgt.oid
+WHERE
+  pga.attrelid = tab_id
+  AND NOT pga.attisdropped
+  AND has_column_privilege(tab_id, x.attnum, 'SELECT')
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_search_index_oid(tab_id oid, col_id smallint) RETURNS oid AS $$/*
+Return the OID of a trigram GIN index usable for searching the given column, or NULL if none exists.
+
+We consider non-partial, single-column indexes using the gin_trgm_ops operator class (from the
+pg_trgm extension) on either the column itself, or an expression of it (e.g., a cast to text).
+
+Args:
+  tab_id: The OID of the table containing the column.
+  col_id: The attnum of the column.
+*/
+SELECT pgi.indexrelid
+FROM pg_catalog.pg_index AS pgi
+  INNER JOIN pg_catalog.pg_opclass AS pgo ON pgo.oid = pgi.indclass[0]
+  INNER JOIN pg_catalog.pg_depend AS pgd ON
+    pgd.classid = 'pg_catalog.pg_class'::regclass
+    AND pgd.objid = pgi.indexrelid
+    AND pgd.refclassid = 'pg_catalog.pg_class'::regclass
+    AND pgd.refobjid = tab_id
+    AND pgd.refobjsubid = col_id
+WHERE
+  pgi.indrelid = tab_id
+  AND pgi.indnatts = 1
+  AND pgi.indpred IS NULL
+  AND pgo.opcname = 'gin_trgm_ops'
+ORDER BY pgi.indexrelid
+LIMIT 1;
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION msar.list_search_indexes(tab_id oid) RETURNS jsonb AS $$/*
+Describe the search indexes of a table's searchable columns.
+
+Returns a JSON array with an object for each column which records searches match by substring
+(i.e., string and uuid columns), and to which the user has access. Each has the form:
+  {"attnum": <int>, "index_name": <text or null>, "index_size": <bytes, or null>}
+
+Args:
+  tab_id: The OID of the table whose search indexes we'll list.
+*/
+SELECT COALESCE(
+  jsonb_agg(
+    jsonb_build_object(
+      'attnum', pga.attnum,
+      'index_name', idx.relname,
+      'index_size', pg_catalog.pg_relation_size(idx.oid)
+    ) ORDER BY pga.attnum
+  ),
+  '[]'::jsonb
+)
+FROM pg_catalog.pg_attribute AS pga
+  INNER JOIN pg_catalog.pg_type AS pgt ON pga.atttypid = pgt.oid
+  LEFT JOIN pg_catalog.pg_class AS idx ON idx.oid = msar.get_search_index_oid(tab_id, pga.attnum)
+WHERE
+  pga.attrelid = tab_id
+  AND pga.attnum > 0
+  AND NOT pga.attisdropped
+  AND (pgt.typcategory = 'S' OR pgt.typname = 'uuid')
+  AND has_column_privilege(tab_id, pga.attnum, 'SELECT');
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.add_search_indexes(tab_id oid, col_ids smallint[]) RETURNS void AS $$/*
+Add trigram GIN indexes on the given columns, so records searches can use them.
+
+The pg_trgm extension is installed if it isn't already. Columns which already have a search index
+are skipped. Only string and uuid columns can be given. The indexes are maintained by PostgreSQL
+as the data changes, and are dropped along with their columns.
+
+Args:
+  tab_id: The OID of the table containing the columns.
+  col_ids: The attnums of the columns to index.
+*/
+DECLARE
+  trgm_schema_name name;
+  col_id smallint;
+BEGIN
+  SELECT extnamespace::regnamespace::name INTO trgm_schema_name
+  FROM pg_catalog.pg_extension WHERE extname = 'pg_trgm';
+  IF trgm_schema_name IS NULL THEN
+    BEGIN
+      CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    EXCEPTION WHEN insufficient_privilege THEN
+      RAISE EXCEPTION 'The pg_trgm extension is needed for search indexes, but could not be installed'
+        USING ERRCODE = '42501', -- insufficient_privilege
+        HINT = 'A superuser or the database owner can run CREATE EXTENSION pg_trgm.';
+    END;
+    SELECT extnamespace::regnamespace::name INTO trgm_schema_name
+    FROM pg_catalog.pg_extension WHERE extname = 'pg_trgm';
+  END IF;
+  FOREACH col_id IN ARRAY col_ids LOOP
+    IF NOT EXISTS (
+      SELECT 1 FROM msar.list_search_indexes(tab_id) AS searchable_col
+      WHERE searchable_col @> jsonb_build_array(jsonb_build_object('attnum', col_id))
+    ) THEN
+      RAISE EXCEPTION 'Column % of table % can not have a search index', col_id, tab_id::regclass
+        USING ERRCODE = '42804', -- datatype_mismatch
+        HINT = 'Only string and uuid columns are searched by substring.';
+    END IF;
+    IF msar.get_search_index_oid(tab_id, col_id) IS NULL THEN
+      EXECUTE format(
+        'CREATE INDEX ON %I.%I USING gin ((%I::text) %I.gin_trgm_ops)',
+        msar.get_relation_schema_name(tab_id),
+        msar.get_relation_name(tab_id),
+        msar.get_column_name(tab_id, col_id),
+        trgm_schema_name
+      );
+    END IF;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION
+msar.drop_search_indexes(tab_id oid, col_ids smallint[]) RETURNS void AS $$/*
+Drop the search indexes (see msar.get_search_index_oid) on the given columns of a table.
+
+Args:
+  tab_id: The OID of the table containing the columns.
+  col_ids: The attnums of the columns whose search indexes we'll drop.
+*/
+DECLARE
+  col_id smallint;
+  index_id oid;
+BEGIN
+  FOREACH col_id IN ARRAY col_ids LOOP
+    index_id := msar.get_search_index_oid(tab_id, col_id);
+    WHILE index_id IS NOT NULL LOOP
+      EXECUTE format('DROP INDEX %s', index_id::regclass);
+      index_id := msar.get_search_index_oid(tab_id, col_id);
+    END LOOP;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+
 CREATE OR REPLACE FUNCTION
 msar.search_records_from_table(
   tab_id oid,
@@ -5501,7 +6885,9 @@ msar.search_records_from_table(
   limit_ integer,
   offset_ integer DEFAULT 0,
   return_record_summaries boolean DEFAULT false,
-  table_record_summary_templates jsonb DEFAULT NULL
+  table_record_summary_templates jsonb DEFAULT NULL,
+  count_mode text DEFAULT 'exact',
+  count_estimate_threshold bigint DEFAULT NULL
 ) RETURNS jsonb AS $$/*
 Get records from a table, filtering and sorting according to a search specification.
 
@@ -5512,19 +6898,30 @@ Args:
   search_: An array of search definition objects.
   limit_: The maximum number of rows we'll return.
   offset_: The number of rows to skip before returning records from following rows
+  count_mode: (optional) How to count the matching rows. See msar.build_count_cte_query.
+  count_estimate_threshold: (optional) The estimated row count at which 'auto' count mode switches
+    from an exact count to the estimate.
 
 The search definition objects should have the form
   {"attnum": <int>, "literal": <any>}
+
+Matching records are found with msar.get_search_match_expr, which can use search indexes (see
+msar.add_search_indexes). The score from msar.get_score_expr is only computed to sort them.
 */
 DECLARE
+  count_info jsonb;
   records jsonb;
 BEGIN
+  count_info := msar.build_count_cte_query(
+    tab_id,
+    'WHERE ' || msar.get_search_match_expr(tab_id, search_),
+    count_mode,
+    count_estimate_threshold
+  );
   EXECUTE format(
     $q$
     WITH
-    count_cte AS (
-      SELECT count(1) AS count FROM %2$I.%3$I %4$s
-    ),
+    count_cte AS ( %12$s ),
     results_cte AS (
       SELECT %1$s FROM %2$I.%3$I %4$s %7$s LIMIT %5$L OFFSET %6$L
     ),
@@ -5551,7 +6948,8 @@ BEGIN
     results_json_cte AS (
       SELECT jsonb_build_object(
         'results', coalesce(jsonb_agg(row_to_json(results_cte.*)), jsonb_build_array()),
-        'count', coalesce(max(count_cte.count), 0)
+        'count', %13$s,
+        'count_mode', %14$L
       ) AS rj
       FROM results_cte CROSS JOIN count_cte
     )
@@ -5561,7 +6959,7 @@ BEGIN
     /* %1 */ COALESCE(msar.build_selectable_column_expr(tab_id), 'NULL'),
     /* %2 */ msar.get_relation_schema_name(tab_id),
     /* %3 */ msar.get_relation_name(tab_id),
-    /* %4 */ 'WHERE ' || msar.get_score_expr(tab_id, search_) || ' > 0',
+    /* %4 */ 'WHERE ' || msar.get_search_match_expr(tab_id, search_),
     /* %5 */ limit_,
     /* %6 */ offset_,
     /* %7 */ 'ORDER BY ' || NULLIF(
@@ -5571,12 +6969,16 @@ BEGIN
       ),
       ''
     ),
-    /* %8 */ msar.build_record_summary_query_for_table(
-      tab_id,
-      msar.get_selectable_pkey_attnum(tab_id),
-      table_record_summary_templates
+    /* %8 */ msar.build_record_summary_query_for_keys(
+      msar.build_record_summary_query_for_table(
+        tab_id,
+        msar.get_selectable_pkey_attnum(tab_id),
+        table_record_summary_templates
+      ),
+      'SELECT ' || quote_ident(msar.get_selectable_pkey_attnum(tab_id)::text)
+      || ' FROM results_cte'
     ),
-    /* %9 */ msar.build_linked_record_summaries_ctes(tab_id),
+    /* %9 */ msar.build_linked_record_summaries_ctes(tab_id, NULL, 'results_cte'),
     /* %10 */ msar.build_summary_join_expr_for_table(tab_id, 'results_cte'),
     /* %11 */ COALESCE(
       NULLIF(
@@ -5589,7 +6991,13 @@ BEGIN
       ), 'COUNT(1) AS count_hack'
       -- count_hack ensures that summary_cte is not empty,
       -- which in turn helps to generate summaries_json_cte
-    )
+    ),
+    /* %12 */ count_info ->> 'count_cte_query',
+    /* %13 */ CASE
+      WHEN count_info ->> 'count_mode' = 'none' THEN 'NULL'
+      ELSE 'coalesce(max(count_cte.count), 0)'
+    END,
+    /* %14 */ count_info ->> 'count_mode'
   ) INTO records;
   RETURN records;
 END;
@@ -5859,6 +7267,627 @@ END;
 $$ LANGUAGE plpgsql;
 
 
+CREATE OR REPLACE FUNCTION msar.get_summary_cache(tab_id oid) RETURNS regclass AS $$/*
+Return the record summary cache of a table, or NULL if it doesn't have one.
+
+A record summary cache is a table in the msar_summary_cache schema, named by the OID of the table it
+summarizes. Its `key` column holds the primary key of each record, and its `summary` column the
+summary of that record.
+*/
+SELECT to_regclass(format('msar_summary_cache.%I', tab_id::text));
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION msar.get_summary_cache_meta(tab_id oid) RETURNS regclass AS $$/*
+Return the table describing the record summary cache of a table, or NULL if it doesn't have one.
+
+The table has a single row, giving the `template` used to render the cached summaries, the
+`key_attnum` of the summarized table's primary key, the `linked_tables` the template refers to, the
+OID of the `trigger_function` keeping the cache up to date, and whether the cache is `stale`.
+*/
+SELECT to_regclass(format('msar_summary_cache.%I', tab_id::text || '_meta'));
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_summary_cache_trigger_function(tab_id regclass) RETURNS text AS $$/*
+Return the qualified, quoted name of the trigger function keeping the record summary cache of a
+table up to date.
+
+The function is specific to the table, and is in the schema of the table, since it's owned by the
+table's owner, who may not create objects in the msar_summary_cache schema.
+
+Args:
+  tab_id: The OID of the summarized table.
+*/
+SELECT format(
+  '%I.%I',
+  msar.get_relation_schema_name(tab_id),
+  '__msar_summary_cache_' || tab_id::oid
+);
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_record_summary_template_tables(tab_id oid, template jsonb) RETURNS oid[] AS $$/*
+Return the OIDs of the tables that a record summary template refers to through foreign keys.
+
+Args:
+  tab_id: The OID of the table the template summarizes.
+  template: A record summary template (see msar.build_record_summary_query_from_template).
+*/
+DECLARE
+  template_part jsonb;
+  ref_chain smallint[];
+  fk_col_id smallint;
+  contextual_tab_id oid;
+  ref_tab_id oid;
+  tab_ids oid[] := ARRAY[]::oid[];
+BEGIN
+  FOR template_part IN SELECT jsonb_array_elements(template) LOOP
+    ref_chain := msar.extract_smallints(template_part);
+    contextual_tab_id := tab_id;
+    FOREACH fk_col_id IN ARRAY ref_chain[1:cardinality(ref_chain) - 1] LOOP
+      ref_tab_id := NULL;
+      SELECT confrelid INTO ref_tab_id
+      FROM pg_catalog.pg_constraint
+      WHERE contype = 'f' AND conrelid = contextual_tab_id AND conkey = ARRAY[fk_col_id];
+      EXIT WHEN ref_tab_id IS NULL;
+      tab_ids := array_append(tab_ids, ref_tab_id);
+      contextual_tab_id := ref_tab_id;
+    END LOOP;
+  END LOOP;
+  RETURN ARRAY(SELECT DISTINCT unnest(tab_ids));
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.move_column_in_summary_templates(
+  tab_id oid,
+  old_col_id smallint,
+  new_col_id smallint,
+  templates jsonb
+) RETURNS jsonb AS $$/*
+Update record summary templates referring to a column which has been replaced by a new column.
+
+Template parts are followed through foreign keys (see msar.build_record_summary_query_from_template)
+to find those ending at the old column, which are changed to end at the new one instead. Only the
+templates which were changed are returned.
+
+Args:
+  tab_id: The OID of the table whose column has been replaced.
+  old_col_id: The attnum of the replaced column.
+  new_col_id: The attnum of the new column.
+  templates: A JSON object mapping table OIDs to record summary templates.
+*/
+DECLARE
+  template_entry record;
+  template_part jsonb;
+  new_template jsonb;
+  ref_chain smallint[];
+  fk_col_id smallint;
+  contextual_tab_id oid;
+  moved_templates jsonb := '{}'::jsonb;
+BEGIN
+  FOR template_entry IN SELECT key, value FROM jsonb_each(templates)
+    WHERE jsonb_typeof(value) = 'array'
+  LOOP
+    new_template := '[]'::jsonb;
+    FOR template_part IN SELECT jsonb_array_elements(template_entry.value) LOOP
+      ref_chain := msar.extract_smallints(template_part);
+      contextual_tab_id := template_entry.key::oid;
+      FOREACH fk_col_id IN ARRAY ref_chain[1:cardinality(ref_chain) - 1] LOOP
+        SELECT confrelid INTO contextual_tab_id
+        FROM pg_catalog.pg_constraint
+        WHERE contype = 'f' AND conrelid = contextual_tab_id AND conkey = ARRAY[fk_col_id];
+        EXIT WHEN contextual_tab_id IS NULL;
+      END LOOP;
+      IF contextual_tab_id = tab_id AND ref_chain[cardinality(ref_chain)] = old_col_id THEN
+        template_part := to_jsonb(ref_chain[1:cardinality(ref_chain) - 1] || new_col_id);
+      END IF;
+      new_template := new_template || jsonb_build_array(template_part);
+    END LOOP;
+    IF new_template <> template_entry.value THEN
+      moved_templates := moved_templates || jsonb_build_object(template_entry.key, new_template);
+    END IF;
+  END LOOP;
+  RETURN moved_templates;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+
+CREATE OR REPLACE FUNCTION msar.build_summary_cache_linked_keys_query(
+  tab_id oid,
+  key_attnum smallint,
+  template jsonb,
+  linked_tab_id oid
+) RETURNS text AS $$/*
+Return a query for the keys of the records whose summaries show changed records of a linked table.
+
+The changed records are read from the `msar_new_rows` transition table of an update of the linked
+table. Returns NULL if the template doesn't refer to the linked table.
+
+Args:
+  tab_id: The OID of the summarized table.
+  key_attnum: The attnum of the summarized table's primary key.
+  template: The record summary template of the cache.
+  linked_tab_id: The OID of the changed table.
+*/
+DECLARE
+  template_part jsonb;
+  ref_chain smallint[];
+  fk_col_id smallint;
+  contextual_tab_id oid;
+  ref_tab_id oid;
+  ref_col_id smallint;
+  prev_alias text;
+  alias text;
+  join_clauses text;
+  key_queries text[] := ARRAY[]::text[];
+BEGIN
+  FOR template_part IN SELECT jsonb_array_elements(template) LOOP
+    ref_chain := msar.extract_smallints(template_part);
+    contextual_tab_id := tab_id;
+    prev_alias := 'base';
+    join_clauses := '';
+    FOREACH fk_col_id IN ARRAY ref_chain[1:cardinality(ref_chain) - 1] LOOP
+      ref_tab_id := NULL;
+      SELECT confrelid, confkey[1] INTO ref_tab_id, ref_col_id
+      FROM pg_catalog.pg_constraint
+      WHERE contype = 'f' AND conrelid = contextual_tab_id AND conkey = ARRAY[fk_col_id];
+      EXIT WHEN ref_tab_id IS NULL;
+      IF ref_tab_id = linked_tab_id THEN
+        key_queries := array_append(key_queries, format(
+          'SELECT base.%1$I AS key FROM %2$I.%3$I AS base%4$s'
+          ' WHERE %5$I.%6$I IN (SELECT %7$I FROM msar_new_rows)',
+          /* 1 */ msar.get_column_name(tab_id, key_attnum),
+          /* 2 */ msar.get_relation_schema_name(tab_id),
+          /* 3 */ msar.get_relation_name(tab_id),
+          /* 4 */ join_clauses,
+          /* 5 */ prev_alias,
+          /* 6 */ msar.get_column_name(contextual_tab_id, fk_col_id),
+          /* 7 */ msar.get_column_name(ref_tab_id, ref_col_id)
+        ));
+      END IF;
+      alias := prev_alias || '_' || fk_col_id;
+      join_clauses := join_clauses || format(
+        ' JOIN %1$I.%2$I AS %3$I ON %3$I.%4$I = %5$I.%6$I',
+        /* 1 */ msar.get_relation_schema_name(ref_tab_id),
+        /* 2 */ msar.get_relation_name(ref_tab_id),
+        /* 3 */ alias,
+        /* 4 */ msar.get_column_name(ref_tab_id, ref_col_id),
+        /* 5 */ prev_alias,
+        /* 6 */ msar.get_column_name(contextual_tab_id, fk_col_id)
+      );
+      prev_alias := alias;
+      contextual_tab_id := ref_tab_id;
+    END LOOP;
+  END LOOP;
+  RETURN NULLIF(array_to_string(key_queries, ' UNION '), '');
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+
+CREATE OR REPLACE FUNCTION msar.build_summary_cache_trigger_sql(
+  tab_id oid,
+  trigger_op text,
+  linked_tab_id oid
+) RETURNS text[] AS $$/*
+Return the statements updating the record summary cache of a table after a statement changed it.
+
+The statements refer to the transition tables of the triggers created by
+msar.enable_record_summary_cache, so they must be run by the trigger function.
+
+An update of a linked table refreshes the summaries showing the updated records. Other changes to
+linked tables can't change any summary, since the foreign keys the template follows are enforced,
+and the changes they cascade fire the triggers of the referencing tables. If the template no longer
+refers to an updated linked table, e.g., since a foreign key was dropped, the cache is marked as
+stale.
+
+Args:
+  tab_id: The OID of the summarized table.
+  trigger_op: The operation which fired the trigger, i.e., its TG_OP.
+  linked_tab_id: The OID of the changed table if it's a linked table, or NULL.
+*/
+DECLARE
+  cache_name text := msar.get_summary_cache(tab_id)::text;
+  meta_name text := msar.get_summary_cache_meta(tab_id)::text;
+  cache_template jsonb;
+  key_attnum smallint;
+  key_col_name text;
+  summary_query text;
+  linked_keys_query text;
+  sql_statements text[] := ARRAY[]::text[];
+BEGIN
+  IF trigger_op = 'TRUNCATE' THEN
+    RETURN ARRAY[format('TRUNCATE %s', cache_name)];
+  END IF;
+  EXECUTE format('SELECT template, key_attnum FROM %s', meta_name)
+  INTO cache_template, key_attnum;
+  key_col_name := msar.get_column_name(tab_id, key_attnum);
+  summary_query := msar.build_record_summary_query_from_template(tab_id, key_attnum, cache_template);
+  IF linked_tab_id IS NOT NULL THEN
+    linked_keys_query := msar.build_summary_cache_linked_keys_query(
+      tab_id, key_attnum, cache_template, linked_tab_id
+    );
+    IF linked_keys_query IS NULL THEN
+      RETURN ARRAY[format('UPDATE %s SET stale = true WHERE NOT stale', meta_name)];
+    END IF;
+    RETURN ARRAY[format(
+      $q$
+      INSERT INTO %1$s
+      SELECT * FROM (%2$s) AS summaries WHERE key IN (%3$s)
+      ON CONFLICT (key) DO UPDATE SET summary = EXCLUDED.summary
+      $q$,
+      cache_name,
+      summary_query,
+      linked_keys_query
+    )];
+  END IF;
+  IF trigger_op IN ('UPDATE', 'DELETE') THEN
+    sql_statements := array_append(sql_statements, format(
+      'DELETE FROM %1$s WHERE key IN (SELECT %2$I FROM msar_old_rows)',
+      cache_name,
+      key_col_name
+    ));
+  END IF;
+  IF trigger_op IN ('INSERT', 'UPDATE') THEN
+    sql_statements := array_append(sql_statements, format(
+      $q$
+      INSERT INTO %1$s
+      SELECT * FROM (%2$s) AS summaries WHERE key IN (SELECT %3$I FROM msar_new_rows)
+      ON CONFLICT (key) DO UPDATE SET summary = EXCLUDED.summary
+      $q$,
+      cache_name,
+      summary_query,
+      key_col_name
+    ));
+  END IF;
+  RETURN sql_statements;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.is_summary_cache_orphaned(tab_id oid) RETURNS boolean AS $$/*
+Return whether the record summary cache named by a table OID no longer belongs to a table.
+
+That's the case if the table was dropped, and taken its triggers with it, even if its OID has since
+been reused by another table.
+
+Args:
+  tab_id: The OID in the name of the cache.
+*/
+SELECT NOT EXISTS (
+  SELECT 1 FROM pg_catalog.pg_trigger
+  WHERE tgrelid = tab_id AND tgname = 'msar_summary_cache_insert'
+);
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.create_summary_cache_tables(tab_id regclass) RETURNS void AS $$/*
+Create the (empty) record summary cache of a table, and the table describing it.
+
+Users may only use the msar_summary_cache schema, so this runs with the privileges of the role
+which installed Mathesar, and owns both tables. The owner of the summarized table is granted
+privileges to read and write them. Only members of that role may call this function.
+
+Args:
+  tab_id: The OID of the summarized table.
+*/
+DECLARE
+  tab_owner regrole;
+  key_type text;
+  cache_name text := format('msar_summary_cache.%I', tab_id::oid::text);
+  meta_name text := format('msar_summary_cache.%I', tab_id::oid::text || '_meta');
+  trgm_opclass text;
+BEGIN
+  SELECT relowner::regrole INTO tab_owner FROM pg_catalog.pg_class WHERE oid = tab_id;
+  IF NOT pg_catalog.pg_has_role(session_user, tab_owner, 'USAGE') THEN
+    RAISE EXCEPTION 'Only members of the role owning % may cache its record summaries', tab_id
+    USING ERRCODE = 'insufficient_privilege';
+  END IF;
+  SELECT pg_catalog.format_type(atttypid, atttypmod) INTO key_type
+  FROM pg_catalog.pg_constraint
+    JOIN pg_catalog.pg_attribute ON attrelid = conrelid AND attnum = conkey[1]
+  WHERE conrelid = tab_id AND contype = 'p' AND cardinality(conkey) = 1;
+  IF key_type IS NULL THEN
+    RAISE EXCEPTION 'Only tables with a single-column primary key may cache their record summaries';
+  END IF;
+
+  EXECUTE format('DROP TABLE IF EXISTS %1$s, %2$s', cache_name, meta_name);
+  EXECUTE format('CREATE TABLE %1$s (key %2$s PRIMARY KEY, summary text)', cache_name, key_type);
+  EXECUTE format(
+    $t$
+    CREATE TABLE %s (
+      template jsonb, key_attnum smallint, linked_tables oid[], trigger_function oid, stale boolean
+    )
+    $t$,
+    meta_name
+  );
+
+  SELECT format('%I.%I', nsp.nspname, opc.opcname) INTO trgm_opclass
+  FROM pg_catalog.pg_opclass AS opc
+    JOIN pg_catalog.pg_am AS am ON am.oid = opc.opcmethod
+    JOIN pg_catalog.pg_namespace AS nsp ON nsp.oid = opc.opcnamespace
+  WHERE am.amname = 'gin' AND opc.opcname = 'gin_trgm_ops'
+  LIMIT 1;
+  IF trgm_opclass IS NOT NULL THEN
+    EXECUTE format('CREATE INDEX ON %1$s USING gin (summary %2$s)', cache_name, trgm_opclass);
+  END IF;
+
+  EXECUTE format(
+    'GRANT SELECT, INSERT, UPDATE, DELETE, TRUNCATE ON %1$s, %2$s TO %3$s',
+    cache_name,
+    meta_name,
+    tab_owner
+  );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog, pg_temp;
+
+
+CREATE OR REPLACE FUNCTION
+msar.drop_summary_cache_tables(tab_id oid) RETURNS void AS $$/*
+Drop the record summary cache of a table, and the table describing it, if they exist.
+
+Like msar.create_summary_cache_tables, this runs with the privileges of the role which installed
+Mathesar. Only members of the role owning the table may call it, unless the cache is orphaned (see
+msar.is_summary_cache_orphaned).
+
+Args:
+  tab_id: The OID of the summarized table.
+*/
+DECLARE
+  tab_owner regrole;
+BEGIN
+  SELECT relowner::regrole INTO tab_owner FROM pg_catalog.pg_class WHERE oid = tab_id;
+  IF NOT msar.is_summary_cache_orphaned(tab_id)
+      AND NOT pg_catalog.pg_has_role(session_user, tab_owner, 'USAGE') THEN
+    RAISE EXCEPTION 'Only members of the role owning % may drop its record summary cache', tab_id
+    USING ERRCODE = 'insufficient_privilege';
+  END IF;
+  EXECUTE format(
+    'DROP TABLE IF EXISTS msar_summary_cache.%I, msar_summary_cache.%I',
+    tab_id::text,
+    tab_id::text || '_meta'
+  );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog, pg_temp;
+
+
+CREATE OR REPLACE FUNCTION msar.drop_orphaned_summary_caches() RETURNS void AS $$/*
+Drop the record summary caches of tables which have been dropped.
+
+Caches are named by the OIDs of the tables they summarize, so they aren't dropped along with those
+tables. They're ignored once orphaned (see msar.get_usable_summary_cache), and dropped by this
+function, which is run whenever a cache is enabled.
+*/
+DECLARE
+  orphan_tab_id oid;
+BEGIN
+  FOR orphan_tab_id IN
+    SELECT relname::oid
+    FROM pg_catalog.pg_class
+    WHERE relnamespace = 'msar_summary_cache'::regnamespace
+      AND relkind = 'r'
+      AND CASE WHEN relname ~ '^[0-9]+$' THEN msar.is_summary_cache_orphaned(relname::oid) END
+  LOOP
+    PERFORM msar.drop_summary_cache_tables(orphan_tab_id);
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION
+msar.disable_record_summary_cache(tab_id regclass) RETURNS void AS $$/*
+Drop the record summary cache of a table, along with the triggers keeping it up to date.
+
+Does nothing if the table doesn't have a record summary cache.
+
+Args:
+  tab_id: The OID of the summarized table.
+*/
+DECLARE
+  trigger_function regprocedure;
+  trg record;
+BEGIN
+  SELECT tgfoid INTO trigger_function
+  FROM pg_catalog.pg_trigger
+  WHERE tgrelid = tab_id AND tgname = 'msar_summary_cache_insert';
+  -- The function may also be left over from a dropped table which had the same OID.
+  trigger_function := coalesce(
+    trigger_function,
+    to_regprocedure(msar.get_summary_cache_trigger_function(tab_id) || '()')
+  );
+  IF trigger_function IS NOT NULL THEN
+    -- The triggers on the table and on its linked tables all call the same function.
+    FOR trg IN
+      SELECT tgname, tgrelid::regclass AS trigger_tab_id
+      FROM pg_catalog.pg_trigger
+      WHERE tgfoid = trigger_function
+    LOOP
+      EXECUTE format('DROP TRIGGER %I ON %s', trg.tgname, trg.trigger_tab_id);
+    END LOOP;
+    EXECUTE format('DROP FUNCTION %s', trigger_function);
+  END IF;
+  PERFORM msar.drop_summary_cache_tables(tab_id);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION msar.enable_record_summary_cache(
+  tab_id regclass,
+  table_record_summary_templates jsonb DEFAULT NULL
+) RETURNS void AS $$/*
+Cache the record summaries of a table, so that listing and searching them needn't render them all.
+
+If the table already has a record summary cache, it's rebuilt from scratch. This is how a stale cache
+is refreshed, and how a cache is brought in line with a new template.
+
+The triggers keeping the cache up to date are owned by the owner of the table, and render summaries
+with that role's privileges. Hence, only members of that role read from the cache (see
+msar.get_usable_summary_cache), and only they may enable it.
+
+Statement-level triggers on the table update the summaries of the records it changes, and triggers
+on the tables linked from the template update the summaries showing the linked records they update
+(see msar.build_summary_cache_trigger_sql). A stale cache is ignored until it's refreshed.
+
+The summaries are indexed for searching with pg_trgm, if it's installed.
+
+Args:
+  tab_id: The OID of the table whose record summaries we'll cache.
+  table_record_summary_templates: (optional) A JSON object that maps table OIDs to record summary
+    templates.
+*/
+DECLARE
+  tab_owner regrole;
+  cache_template jsonb := msar.get_record_summary_template(tab_id, table_record_summary_templates);
+  key_attnum smallint := msar.get_selectable_pkey_attnum(tab_id);
+  linked_tab_ids oid[];
+  linked_tab_id regclass;
+  cache_name text := format('msar_summary_cache.%I', tab_id::oid::text);
+  meta_name text := format('msar_summary_cache.%I', tab_id::oid::text || '_meta');
+  function_name text := msar.get_summary_cache_trigger_function(tab_id);
+BEGIN
+  SELECT relowner::regrole INTO tab_owner FROM pg_catalog.pg_class WHERE oid = tab_id;
+  IF NOT pg_catalog.pg_has_role(tab_owner, 'USAGE') THEN
+    RAISE EXCEPTION 'Only members of the role owning % may cache its record summaries', tab_id
+    USING ERRCODE = 'insufficient_privilege';
+  END IF;
+  IF key_attnum IS NULL THEN
+    RAISE EXCEPTION 'Only tables with a single-column primary key may cache their record summaries';
+  END IF;
+
+  PERFORM msar.disable_record_summary_cache(tab_id);
+  PERFORM msar.drop_orphaned_summary_caches();
+  PERFORM msar.create_summary_cache_tables(tab_id);
+
+  linked_tab_ids := msar.get_record_summary_template_tables(tab_id, cache_template);
+  EXECUTE format(
+    'INSERT INTO %1$s SELECT * FROM (%2$s) AS summaries',
+    cache_name,
+    msar.build_record_summary_query_from_template(tab_id, key_attnum, cache_template)
+  );
+
+  -- The trigger function does nothing once the cache, or the table, is gone, e.g., if Mathesar is
+  -- uninstalled. It marks the cache as stale if Mathesar's functions are gone, but not the cache.
+  EXECUTE format(
+    $f$
+    CREATE FUNCTION %1$s() RETURNS trigger AS $t$
+    DECLARE
+      sql_statement text;
+    BEGIN
+      IF to_regclass(%2$L) IS NULL THEN
+        RETURN NULL;
+      END IF;
+      IF NOT EXISTS (
+        SELECT 1
+        FROM %2$s AS meta
+          JOIN pg_catalog.pg_trigger AS trg ON trg.tgfoid = meta.trigger_function
+        WHERE trg.tgrelid = %3$s AND trg.tgname = 'msar_summary_cache_insert'
+      ) THEN
+        RETURN NULL;
+      END IF;
+      IF to_regprocedure('msar.build_summary_cache_trigger_sql(oid, text, oid)') IS NULL THEN
+        UPDATE %2$s SET stale = true WHERE NOT stale;
+      ELSE
+        FOREACH sql_statement IN ARRAY msar.build_summary_cache_trigger_sql(
+          %3$s, TG_OP, CASE WHEN TG_NARGS > 0 THEN TG_RELID END
+        ) LOOP
+          EXECUTE sql_statement;
+        END LOOP;
+      END IF;
+      RETURN NULL;
+    END;
+    $t$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog, pg_temp
+    $f$,
+    /* 1 */ function_name,
+    /* 2 */ meta_name,
+    /* 3 */ tab_id::oid
+  );
+  EXECUTE format('ALTER FUNCTION %1$s() OWNER TO %2$s', function_name, tab_owner);
+  EXECUTE format('INSERT INTO %s VALUES ($1, $2, $3, $4, false)', meta_name)
+  USING cache_template, key_attnum, linked_tab_ids, (function_name || '()')::regprocedure::oid;
+
+  EXECUTE format(
+    $t$
+    CREATE TRIGGER msar_summary_cache_insert AFTER INSERT ON %1$s
+    REFERENCING NEW TABLE AS msar_new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION %2$s();
+    CREATE TRIGGER msar_summary_cache_update AFTER UPDATE ON %1$s
+    REFERENCING OLD TABLE AS msar_old_rows NEW TABLE AS msar_new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION %2$s();
+    CREATE TRIGGER msar_summary_cache_delete AFTER DELETE ON %1$s
+    REFERENCING OLD TABLE AS msar_old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION %2$s();
+    CREATE TRIGGER msar_summary_cache_truncate AFTER TRUNCATE ON %1$s
+    FOR EACH STATEMENT EXECUTE FUNCTION %2$s();
+    $t$,
+    tab_id,
+    function_name
+  );
+  -- Triggers on linked tables pass an argument, so the trigger function can tell them apart.
+  FOREACH linked_tab_id IN ARRAY linked_tab_ids LOOP
+    EXECUTE format(
+      $t$
+      CREATE TRIGGER %1$I AFTER UPDATE ON %2$s
+      REFERENCING NEW TABLE AS msar_new_rows
+      FOR EACH STATEMENT EXECUTE FUNCTION %3$s('linked')
+      $t$,
+      'msar_summary_cache_' || tab_id::oid,
+      linked_tab_id,
+      function_name
+    );
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_usable_summary_cache(tab_id oid, template jsonb) RETURNS regclass AS $$/*
+Return the record summary cache of a table, if the current user may use it for the given template.
+
+That's the case if the cache is up to date, was rendered with the given template, and belongs to the
+table (rather than to a dropped table which had the same OID), and the current user is a member of
+the role owning both the table and the trigger function keeping the cache up to date. Otherwise,
+return NULL, so that the summaries are rendered on the fly.
+
+Args:
+  tab_id: The OID of the summarized table.
+  template: The record summary template the summaries should be rendered with.
+*/
+DECLARE
+  cache_id regclass := msar.get_summary_cache(tab_id);
+  meta_id regclass := msar.get_summary_cache_meta(tab_id);
+  trigger_function oid;
+  is_usable boolean;
+BEGIN
+  SELECT trg.tgfoid INTO trigger_function
+  FROM pg_catalog.pg_class AS tab
+    JOIN pg_catalog.pg_trigger AS trg
+      ON trg.tgrelid = tab.oid AND trg.tgname = 'msar_summary_cache_insert'
+    JOIN pg_catalog.pg_proc AS fn ON fn.oid = trg.tgfoid
+  WHERE tab.oid = tab_id
+    AND fn.proowner = tab.relowner
+    AND pg_catalog.pg_has_role(tab.relowner, 'USAGE');
+  IF cache_id IS NULL OR meta_id IS NULL OR trigger_function IS NULL THEN
+    RETURN NULL;
+  END IF;
+  EXECUTE format(
+    $q$
+    SELECT NOT stale AND template = $1 AND key_attnum = $2 AND trigger_function = $3 FROM %s
+    $q$,
+    meta_id
+  )
+  INTO is_usable
+  USING template, msar.get_selectable_pkey_attnum(tab_id), trigger_function;
+  RETURN CASE WHEN is_usable THEN cache_id END;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+
 CREATE OR REPLACE FUNCTION msar.list_by_record_summaries(
   tab_id oid,
   limit_ integer,
@@ -5886,6 +7915,9 @@ Args:
 
 */
 DECLARE
+  summary_cache regclass := msar.get_usable_summary_cache(
+    tab_id, msar.get_record_summary_template(tab_id, table_record_summary_templates)
+  );
   search_where_clause text := '';
   mapping_join_path jsonb;
   mapped_record_pkey text;
@@ -5923,7 +7955,10 @@ BEGIN
       )
     FROM count_all_results, results, agg_mapping_cte
     $q$,
-    /* 1 */ msar.build_record_summary_query_for_table(tab_id, NULL, table_record_summary_templates),
+    /* 1 */ CASE WHEN summary_cache IS NULL
+      THEN msar.build_record_summary_query_for_table(tab_id, NULL, table_record_summary_templates)
+      ELSE format('SELECT key, summary FROM %s', summary_cache)
+    END,
     /* 2 */ search_where_clause,
     /* 3 */ limit_,
     /* 4 */ offset_,
@@ -40,16 +40,18 @@ CREATE TYPE msar.joinable_tables AS (
 
 
 CREATE OR REPLACE FUNCTION
-msar.get_joinable_tables(max_depth integer) RETURNS SETOF msar.joinable_tables AS $$/*
+msar.get_joinable_tables_from(table_id oid, max_depth integer)
+RETURNS SETOF msar.joinable_tables AS $$/*
 This function returns a table of msar.joinable_tables objects, giving paths to various
-joinable tables.
+tables joinable to a given base table.
 
 Args:
+  table_id: The OID of the base table from which the paths start.
   max_depth: This controls how far to search for joinable tables.
 
-The base and target are OIDs of a base table, and a target table that can be
-joined by some combination of joins along single-column foreign key column
-restrictions in either way.
+The target is the OID of a table that can be joined to the base table by some
+combination of joins along single-column foreign key column restrictions in
+either way. The search only follows paths starting at the base table.
 */
 WITH RECURSIVE symmetric_fkeys AS (
   SELECT
@@ -93,6 +95,7 @@ search_fkey_graph(
     jsonb_build_array(jsonb_build_array(sfk.fkey_oid, sfk.reversed)),
     sfk.multiple_results
   FROM symmetric_fkeys sfk
+  WHERE sfk.left_rel=table_id::bigint
 UNION ALL
   SELECT
     sfk.left_rel,
@@ -127,6 +130,64 @@ UNION ALL
   FROM search_fkey_graph
 )
 SELECT * FROM output_cte;
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_joinable_tables(max_depth integer) RETURNS SETOF msar.joinable_tables AS $$/*
+This function returns a table of msar.joinable_tables objects, giving paths to various
+joinable tables.
+
+Args:
+  max_depth: This controls how far to search for joinable tables.
+
+The base and target are OIDs of a base table, and a target table that can be
+joined by some combination of joins along single-column foreign key column
+restrictions in either way.
+*/
+SELECT jt.*
+FROM (
+  SELECT conrelid FROM pg_constraint WHERE contype='f' AND array_length(conkey, 1)=1
+  UNION
+  SELECT confrelid FROM pg_constraint WHERE contype='f' AND array_length(conkey, 1)=1
+) AS base_tables(base_id),
+LATERAL msar.get_joinable_tables_from(base_tables.base_id, max_depth) AS jt;
+$$ LANGUAGE SQL STABLE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_joinable_tables_fingerprint() RETURNS text AS $$/*
+Return a fingerprint of the catalog entries that joinable tables are found from.
+
+The fingerprint changes whenever a foreign key or primary key is added, dropped or altered, or a
+table linked by a foreign key is renamed, or has its columns changed. It's derived from the
+physical locations and transaction IDs of the current versions of those catalog entries, which
+change whenever the entries are written. So, it's much cheaper to get than the joinable tables
+themselves, and can be used to tell whether joinable tables found earlier are still valid.
+*/
+WITH fkey_tables AS (
+  SELECT conrelid AS rel_id FROM pg_catalog.pg_constraint WHERE contype='f'
+  UNION
+  SELECT confrelid FROM pg_catalog.pg_constraint WHERE contype='f'
+)
+SELECT md5(concat_ws(
+  ';',
+  (
+    SELECT string_agg(concat_ws(':', oid, xmin, ctid), ',' ORDER BY oid)
+    FROM pg_catalog.pg_constraint
+    WHERE contype='f' OR (contype='p' AND conrelid IN (SELECT rel_id FROM fkey_tables))
+  ),
+  (
+    SELECT string_agg(concat_ws(':', oid, xmin, ctid), ',' ORDER BY oid)
+    FROM pg_catalog.pg_class
+    WHERE oid IN (SELECT rel_id FROM fkey_tables)
+  ),
+  (
+    SELECT string_agg(concat_ws(':', attrelid, attnum, xmin, ctid), ',' ORDER BY attrelid, attnum)
+    FROM pg_catalog.pg_attribute
+    WHERE attrelid IN (SELECT rel_id FROM fkey_tables) AND attnum > 0
+  )
+));
 $$ LANGUAGE SQL STABLE;
 
 
@@ -134,7 +195,7 @@ CREATE OR REPLACE FUNCTION
 msar.get_joinable_tables(max_depth integer, table_id oid) RETURNS
 jsonb AS $$
   WITH jt_cte AS (
-    SELECT * FROM msar.get_joinable_tables(max_depth) WHERE base=table_id
+    SELECT * FROM msar.get_joinable_tables_from(table_id, max_depth)
   ), target_cte AS (
     SELECT pga.attrelid AS tt_oid, 
       jsonb_build_object(
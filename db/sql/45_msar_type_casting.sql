@@ -830,24 +830,19 @@ $$ LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
 CREATE OR REPLACE FUNCTION msar.cast_to_mathesar_money(text)
 RETURNS mathesar_types.mathesar_money AS $$
 DECLARE
-  decimal_point text;
-  is_negative boolean;
   money_arr text[];
-  money_num text;
 BEGIN
   SELECT msar.get_mathesar_money_array($1::text) INTO money_arr;
   IF money_arr IS NULL THEN
     RAISE EXCEPTION '% cannot be cast to mathesar_types.mathesar_money', $1;
   END IF;
-  SELECT money_arr[1] INTO money_num;
-  SELECT ltrim(to_char(1, 'D'), ' ') INTO decimal_point;
-  IF money_arr[2] IS NOT NULL THEN
-    SELECT regexp_replace(money_num, money_arr[2], '', 'gq') INTO money_num;
-  END IF;
-  IF money_arr[3] IS NOT NULL THEN
-    SELECT regexp_replace(money_num, money_arr[3], decimal_point, 'q') INTO money_num;
-  END IF;
-  RETURN money_num::mathesar_types.mathesar_money;
+  RETURN msar.cast_to_mathesar_money(
+    $1,
+    coalesce(money_arr[2], '')::"char",
+    coalesce(money_arr[3], '')::"char",
+    money_arr[4],
+    money_arr[5]
+  );
 END;
 $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
@@ -877,13 +872,26 @@ $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
 CREATE OR REPLACE FUNCTION
 msar.cast_to_mathesar_money(num text, group_sep "char", decimal_p "char", curr_pref text, curr_suff text)
-RETURNS mathesar_types.mathesar_money AS $$
-  SELECT CASE WHEN num ~ '^.*(-|\(.+\)).*$' THEN -- Handle negative values
-    ('-' || replace(replace(replace(replace(replace(replace(replace(num, '-', ''), '(', ''), ')', ''), curr_pref, ''), curr_suff, ''), group_sep, ''), decimal_p, ltrim(to_char(1, 'D'), ' ')))::mathesar_types.mathesar_money
-  ELSE
-    replace(replace(replace(replace(num, curr_pref, ''), curr_suff, ''), group_sep, ''), decimal_p, ltrim(to_char(1, 'D'), ' '))::mathesar_types.mathesar_money
-  END;
-$$ LANGUAGE SQL RETURNS NULL ON NULL INPUT;
+RETURNS mathesar_types.mathesar_money AS $$/*
+Cast to mathesar_money with prechosen separators and currency symbols.
+
+Like msar.cast_to_numeric(text, "char", "char"), this doesn't check the format of the number, and
+is a single SQL expression, so that it can be inlined into the query casting a column. Values
+containing a minus sign, or wrapped in parentheses, are negative.
+
+Args:
+  num: The string we'll cast to mathesar_money.
+  group_sep: Any instance of this character will be removed from `num` before casting.
+  decimal_p: Any instance of this character will be replaced with a period before casting.
+  curr_pref: Any instance of this string will be removed from `num` before casting.
+  curr_suff: Any instance of this string will be removed from `num` before casting.
+*/
+SELECT CASE WHEN num ~ '-|\(.+\)' THEN -- Handle negative values
+  ('-' || replace(replace(replace(replace(replace(replace(replace(num, '-', ''), '(', ''), ')', ''), curr_pref, ''), curr_suff, ''), group_sep, ''), decimal_p, '.'))::mathesar_types.mathesar_money
+ELSE
+  replace(replace(replace(replace(num, curr_pref, ''), curr_suff, ''), group_sep, ''), decimal_p, '.')::mathesar_types.mathesar_money
+END;
+$$ LANGUAGE SQL STABLE PARALLEL SAFE;
 
 
 -- msar.cast_to_money
@@ -1868,28 +1876,15 @@ $$ LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
 
 CREATE OR REPLACE FUNCTION msar.cast_to_numeric(text) RETURNS numeric AS $$
 DECLARE
-  decimal_point text;
-  is_negative boolean;
   numeric_arr text[];
-  numeric text;
 BEGIN
   SELECT msar.get_numeric_array($1::text) INTO numeric_arr;
   IF numeric_arr IS NULL THEN
     RAISE EXCEPTION '% cannot be cast to numeric', $1;
   END IF;
-  SELECT numeric_arr[1] INTO numeric;
-  SELECT ltrim(to_char(1, 'D'), ' ') INTO decimal_point;
-  SELECT $1::text ~ '^-.*$' INTO is_negative;
-  IF numeric_arr[2] IS NOT NULL THEN
-    SELECT regexp_replace(numeric, numeric_arr[2], '', 'gq') INTO numeric;
-  END IF;
-  IF numeric_arr[3] IS NOT NULL THEN
-    SELECT regexp_replace(numeric, numeric_arr[3], decimal_point, 'q') INTO numeric;
-  END IF;
-  IF is_negative THEN
-    RETURN ('-' || numeric)::numeric;
-  END IF;
-  RETURN numeric::numeric;
+  RETURN msar.cast_to_numeric(
+    $1, coalesce(numeric_arr[2], '')::"char", coalesce(numeric_arr[3], '')::"char"
+  );
 END;
 $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
@@ -1899,15 +1894,18 @@ msar.cast_to_numeric(num text, group_sep "char", decimal_p "char") RETURNS numer
 Cast to numeric with prechosen group and decimal separators.
 
 For performance, this function does not check for correctness of the given number format. It simply
-replaces and removes characters as directed, then attempts to cast to numeric.
+replaces and removes characters as directed, then attempts to cast to numeric. It's a single SQL
+expression, so that it can be inlined into the query casting a column, rather than being called for
+each value. Note that the input of numeric always uses a period as its decimal point, whatever the
+locale.
 
 Args:
   num: The string we'll cast to numeric.
   group_sep: Any instance of this character will be removed from `num` before casting.
-  decimal_p: Any instance of this character will be replaced with the locale decimal before casting.
+  decimal_p: Any instance of this character will be replaced with a period before casting.
 */
-SELECT replace(replace(num, group_sep, ''), decimal_p, ltrim(to_char(1, 'D'), ' '))::numeric;
-$$ LANGUAGE SQL RETURNS NULL ON NULL INPUT;
+SELECT replace(replace(num, group_sep, ''), decimal_p, '.')::numeric;
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE RETURNS NULL ON NULL INPUT;
 
 
 CREATE OR REPLACE FUNCTION msar.cast_to_numeric(boolean) RETURNS numeric AS $$
@@ -216,6 +216,148 @@ EXCEPTION WHEN OTHERS THEN END;
 $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
 
+CREATE OR REPLACE FUNCTION msar.get_type_inference_sequence() RETURNS regtype[] AS $$/*
+Return the types we try when inferring the type of a text column, in order of preference.
+
+Types which aren't installed are skipped.
+*/
+SELECT array_agg(pg_catalog.to_regtype(t) ORDER BY ord)
+  FILTER (WHERE pg_catalog.to_regtype(t) IS NOT NULL)
+FROM unnest(ARRAY[
+  'boolean',
+  'date',
+  'numeric',
+  'mathesar_types.mathesar_money',
+  'uuid',
+  'timestamp without time zone',
+  'timestamp with time zone',
+  'time without time zone',
+  'interval',
+  'mathesar_types.email',
+  'mathesar_types.mathesar_json_array',
+  'mathesar_types.mathesar_json_object',
+  'mathesar_types.uri'
+]) WITH ORDINALITY AS x(t, ord);
+$$ LANGUAGE SQL STABLE;
+
+
+CREATE OR REPLACE FUNCTION
+msar.get_values_type_compat(
+  vals text[],
+  typ_id regtype,
+  OUT compat_details msar.type_compat_details
+) AS $$/*
+Get info about the compatibility of a given type for a set of text values.
+
+This mirrors `msar.check_column_type_compat`, but works on values which have already been read,
+rather than scanning a table. The separators (and currency symbols) for numeric and money are
+discovered from all of the values, rather than from a smaller sample.
+
+Args:
+  vals: The (ideally distinct) non-null values to check.
+  typ_id: The OID of the type we'll check against the values.
+
+Returns:
+  Info about how to successfully cast the values to the given type.
+*/
+DECLARE
+  group_sep text[];
+  decimal_p text[];
+  curr_pref text[];
+  curr_suff text[];
+BEGIN
+  CASE typ_id
+    WHEN 'numeric'::regtype THEN
+      SELECT
+        array_remove(array_agg(DISTINCT n[2]), null),
+        array_remove(array_agg(DISTINCT n[3]), null)
+      FROM (SELECT msar.get_numeric_array(v) AS n FROM unnest(vals) AS x(v)) AS numarr
+      INTO group_sep, decimal_p;
+      IF array_length(group_sep, 1) > 1 OR array_length(decimal_p, 1) > 1 THEN
+        RETURN;
+      END IF;
+      compat_details.group_sep := coalesce(group_sep[1], '');
+      compat_details.decimal_p := coalesce(decimal_p[1], '');
+      PERFORM msar.cast_to_numeric(v, compat_details.group_sep, compat_details.decimal_p)
+      FROM unnest(vals) AS x(v);
+    WHEN 'mathesar_types.mathesar_money'::regtype THEN
+      SELECT
+        array_remove(array_agg(DISTINCT n[2]), null),
+        array_remove(array_agg(DISTINCT n[3]), null),
+        array_remove(array_agg(DISTINCT n[4]), null),
+        array_remove(array_agg(DISTINCT n[5]), null)
+      FROM (SELECT msar.get_mathesar_money_array(v) AS n FROM unnest(vals) AS x(v)) AS moneyarr
+      INTO group_sep, decimal_p, curr_pref, curr_suff;
+      IF array_length(group_sep, 1) > 1
+        OR array_length(decimal_p, 1) > 1
+        OR array_length(curr_pref, 1) > 1
+        OR array_length(curr_suff, 1) > 1
+      THEN
+        RETURN;
+      END IF;
+      compat_details.group_sep := coalesce(group_sep[1], '');
+      compat_details.decimal_p := coalesce(decimal_p[1], '');
+      compat_details.curr_pref := coalesce(curr_pref[1], '');
+      compat_details.curr_suff := coalesce(curr_suff[1], '');
+      PERFORM msar.cast_to_mathesar_money(
+        v,
+        compat_details.group_sep,
+        compat_details.decimal_p,
+        compat_details.curr_pref,
+        compat_details.curr_suff
+      )
+      FROM unnest(vals) AS x(v);
+    ELSE
+      EXECUTE format(
+        'SELECT %1$s(v) FROM unnest($1) AS x(v);',
+        msar.get_cast_function_name(typ_id)
+      ) USING vals;
+  END CASE;
+  compat_details.mathesar_casting = true;
+  compat_details.type_compatible = true;
+EXCEPTION WHEN OTHERS THEN
+  compat_details := NULL;
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.infer_values_data_type(
+  vals text[],
+  typ_ids regtype[] DEFAULT msar.get_type_inference_sequence()
+) RETURNS jsonb AS $$/*
+Infer the best type for a set of text values.
+
+The result has the same form as that of `msar.infer_column_data_type`. If there are no values, or
+none of the given types fit them, we infer `text`.
+
+Args:
+  vals: The (ideally distinct) non-null values whose type we're inferring.
+  typ_ids: The types to try, in order of preference.
+*/
+DECLARE
+  test_type regtype;
+  test_type_details msar.type_compat_details;
+BEGIN
+  IF cardinality(vals) > 0 AND cardinality(typ_ids) > 0 THEN
+    FOREACH test_type IN ARRAY typ_ids
+      LOOP
+        test_type_details := msar.get_values_type_compat(vals, test_type);
+        IF test_type_details.type_compatible THEN
+          RETURN jsonb_strip_nulls(
+            jsonb_build_object(
+              'type', test_type,
+              'details', to_jsonb(test_type_details) - 'type_compatible'
+            )
+          );
+        END IF;
+      END LOOP;
+  END IF;
+  RETURN jsonb_build_object('type', 'text'::regtype);
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
 CREATE OR REPLACE FUNCTION
 msar.infer_column_data_type(
   tab_id regclass, col_id smallint, test_perc numeric DEFAULT 100
@@ -233,28 +375,11 @@ DECLARE
   inferred_type regtype;
   inferred_type_details jsonb;
   test_type_details msar.type_compat_details;
-  infer_sequence_raw text[] := ARRAY[
-    'boolean',
-    'date',
-    'numeric',
-    'mathesar_types.mathesar_money',
-    'uuid',
-    'timestamp without time zone',
-    'timestamp with time zone',
-    'time without time zone',
-    'interval',
-    'mathesar_types.email',
-    'mathesar_types.mathesar_json_array',
-    'mathesar_types.mathesar_json_object',
-    'mathesar_types.uri'
-  ];
   infer_sequence regtype[];
   column_nonempty boolean;
   test_type regtype;
 BEGIN
-  infer_sequence := array_agg(pg_catalog.to_regtype(t))
-    FILTER (WHERE pg_catalog.to_regtype(t) IS NOT NULL)
-    FROM unnest(infer_sequence_raw) AS x(t);
+  infer_sequence := msar.get_type_inference_sequence();
   EXECUTE format(
     'SELECT EXISTS (SELECT 1 FROM %1$I.%2$I WHERE %3$I IS NOT NULL)',
     msar.get_relation_schema_name(tab_id),
@@ -282,41 +407,126 @@ $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
 
 
 CREATE OR REPLACE FUNCTION
-msar.infer_table_column_data_types(tab_id regclass) RETURNS jsonb AS $$/*
+msar.build_inference_sample_expr(
+  tab_id regclass,
+  col_ids smallint[],
+  sample_size integer
+) RETURNS text AS $$/*
+Return a subquery (for use in a FROM clause) selecting the given columns from a bounded, repeatable
+sample of at most `sample_size` rows of the table. The subquery is aliased as `sample`.
+
+The sampling percentage is sized from the table's estimated row count (see
+msar.get_estimated_row_count). For tables without statistics, e.g., tables which have never been
+analyzed, we count at most 100 * `sample_size` rows instead, and only fall back to the estimate if
+there are more. Up to 100 * `sample_size` rows, we use row-level BERNOULLI sampling; beyond that, we
+use page-level SYSTEM sampling, so that at most a few times `sample_size` rows' worth of pages are
+read, however big the table is. Both use REPEATABLE, so the sample is the same from run to run while
+the table is unchanged.
+
+Args:
+  tab_id: The OID of the table to sample.
+  col_ids: The attnums of the columns to select.
+  sample_size: The maximum number of rows to sample.
+*/
+DECLARE
+  row_estimate numeric;
+  sample_perc numeric;
+BEGIN
+  IF (SELECT reltuples > 0 FROM pg_catalog.pg_class WHERE oid = tab_id) THEN
+    row_estimate := msar.get_estimated_row_count(tab_id, NULL);
+  ELSE
+    -- reltuples is -1 (or 0 before PostgreSQL 14) for tables which have never been analyzed, and 0
+    -- for tables which were empty when last analyzed. Either way, it tells us nothing. The
+    -- planner's estimate for such a table assumes it has at least 10 pages, so it's far too high
+    -- for small tables, which we count instead.
+    EXECUTE format(
+      'SELECT count(1) FROM (SELECT 1 FROM %1$I.%2$I LIMIT %3$s) AS bounded',
+      msar.get_relation_schema_name(tab_id),
+      msar.get_relation_name(tab_id),
+      100 * sample_size
+    ) INTO row_estimate;
+    IF row_estimate = 100 * sample_size THEN
+      row_estimate := GREATEST(row_estimate, msar.get_estimated_row_count(tab_id, NULL));
+    END IF;
+  END IF;
+  -- Oversample a bit, since the row estimate may be stale.
+  sample_perc := LEAST(100, round(100 * 2 * sample_size / GREATEST(row_estimate, 1), 6));
+  RETURN format(
+    '(SELECT %1$s FROM %2$I.%3$I TABLESAMPLE %4$s(%5$s) REPEATABLE(0) LIMIT %6$s) AS sample',
+    (
+      SELECT string_agg(format('%I', msar.get_column_name(tab_id, col_id)), ', ')
+      FROM unnest(col_ids) AS x(col_id)
+    ),
+    msar.get_relation_schema_name(tab_id),
+    msar.get_relation_name(tab_id),
+    CASE WHEN row_estimate > 100 * sample_size THEN 'SYSTEM' ELSE 'BERNOULLI' END,
+    sample_perc,
+    sample_size
+  );
+END;
+$$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.infer_table_column_data_types(tab_id regclass, sample_size integer DEFAULT 10000)
+RETURNS jsonb AS $$/*
 Infer the best type for each column in the table.
 
 Currently we only suggest different types for columns which originate as type `text`.
 
 Args:
   tab_id: The OID of the table whose columns we're inferring types for.
+  sample_size: The maximum number of rows to base the inference on.
 
 The response JSON will have attnum keys, and values will be the result of `format_type`
 for the inferred type of each column. Restricted to columns to which the user has access.
 
-For tables with at most 9900 rows, we infer based on entire row set. For tables with more rows, we
-decrease the percentage used to maintain an inference row set of 9,900-10,000 rows, down to a
-minimum of 5% of the rows. This increases the performance of inference on large tables, at the cost
-of possibly misidentifying the type of a column.
-
-| row count  | perc |
-|------------+------|
-|   <= 9,900 | 100% |
-|     19,900 |  50% |
-|     39,900 |  25% |
-|     99,900 |  10% |
-| >= 199,900 |   5% |
+The table is sampled once (see `msar.build_inference_sample_expr`), collecting the distinct non-null
+values of every text column in a single query. The candidate types are then checked against those
+values (see `msar.infer_values_data_type`), without reading the table again. Tables with at most
+`sample_size` rows are inferred based on their entire row set. For bigger tables, the cost of
+inference is bounded by `sample_size`, at the cost of possibly misidentifying the type of a column.
 */
 DECLARE
-  test_perc integer;
+  text_attnums smallint[];
+  sample_query text;
+  text_col_values jsonb[];
 BEGIN
-EXECUTE(
+SELECT
+  array_agg(attnum ORDER BY attnum),
   format(
-    'SELECT GREATEST(LEAST(10000 / (COUNT(1) + 1), 100), 5) FROM %1$I.%2$I TABLESAMPLE SYSTEM(1)',
-    msar.get_relation_schema_name(tab_id),
-    msar.get_relation_name(tab_id)
+    'SELECT ARRAY[%1$s] FROM %2$s',
+    string_agg(
+      format('to_jsonb(array_agg(DISTINCT %1$I) FILTER (WHERE %1$I IS NOT NULL))', attname),
+      ', ' ORDER BY attnum
+    ),
+    msar.build_inference_sample_expr(tab_id, array_agg(attnum ORDER BY attnum), sample_size)
   )
-) INTO test_perc;
-RETURN jsonb_object_agg(attnum, msar.infer_column_data_type(attrelid, attnum, test_perc))
+FROM pg_catalog.pg_attribute
+WHERE
+  attrelid = tab_id
+  AND attnum > 0
+  AND NOT attisdropped
+  AND atttypid = 'text'::regtype
+  AND has_column_privilege(attrelid, attnum, 'SELECT')
+INTO text_attnums, sample_query;
+IF text_attnums IS NOT NULL THEN
+  EXECUTE sample_query INTO text_col_values;
+END IF;
+RETURN jsonb_object_agg(
+  attnum,
+  CASE WHEN atttypid = 'text'::regtype THEN
+    msar.infer_values_data_type(
+      ARRAY(
+        SELECT jsonb_array_elements_text(
+          coalesce(text_col_values[array_position(text_attnums, attnum)], '[]'::jsonb)
+        )
+      )
+    )
+  ELSE
+    jsonb_build_object('type', atttypid::regtype)
+  END
+)
 FROM pg_catalog.pg_attribute
 WHERE
   attrelid = tab_id
@@ -325,3 +535,59 @@ WHERE
   AND has_column_privilege(attrelid, attnum, 'SELECT');
 END;
 $$ LANGUAGE plpgsql RETURNS NULL ON NULL INPUT;
+
+
+CREATE OR REPLACE FUNCTION
+msar.infer_import_column_data_types(tab_id regclass, col_samples jsonb) RETURNS jsonb AS $$/*
+Infer the best type for each column of a freshly imported table, from samples of its values.
+
+The samples are gathered while the rows are copied into the table, so the table itself isn't read.
+The result has the same form as that of `msar.infer_table_column_data_types`.
+
+Args:
+  tab_id: The OID of the imported table.
+  col_samples: A JSON array with an element for each `text` column of the table, in attnum order.
+    Each element is an object of the form {"values": [<str>, ...], "candidates": [<str>, ...]},
+    where "values" are distinct non-null values of the column, and "candidates" are the names of
+    the types which weren't ruled out for the column while importing. An element may also have
+    "stats" about the column's values (e.g., its ratio of nulls), which are kept in the result.
+*/
+WITH text_cols AS (
+  SELECT
+    attnum,
+    row_number() OVER (ORDER BY attnum) AS sample_idx
+  FROM pg_catalog.pg_attribute
+  WHERE
+    attrelid = tab_id
+    AND attnum > 0
+    AND NOT attisdropped
+    AND atttypid = 'text'::regtype
+)
+SELECT jsonb_object_agg(
+  pga.attnum,
+  CASE WHEN pga.atttypid = 'text'::regtype THEN
+    msar.infer_values_data_type(
+      ARRAY(SELECT jsonb_array_elements_text(coalesce(sample -> 'values', '[]'::jsonb))),
+      ARRAY(
+        SELECT seq.typ_id
+        FROM unnest(msar.get_type_inference_sequence()) WITH ORDINALITY AS seq(typ_id, ord)
+        WHERE seq.typ_id IN (
+          SELECT pg_catalog.to_regtype(c)
+          FROM jsonb_array_elements_text(coalesce(sample -> 'candidates', '[]'::jsonb)) AS x(c)
+        )
+        ORDER BY seq.ord
+      )
+    ) || jsonb_strip_nulls(jsonb_build_object('stats', sample -> 'stats'))
+  ELSE
+    jsonb_build_object('type', pga.atttypid::regtype)
+  END
+)
+FROM pg_catalog.pg_attribute AS pga
+  LEFT JOIN text_cols USING (attnum)
+  LEFT JOIN LATERAL (SELECT col_samples -> (text_cols.sample_idx::integer - 1)) AS s(sample) ON true
+WHERE
+  pga.attrelid = tab_id
+  AND pga.attnum > 0
+  AND NOT pga.attisdropped
+  AND has_column_privilege(pga.attrelid, pga.attnum, 'SELECT');
+$$ LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT;
@@ -30,6 +30,8 @@ $$ LANGUAGE plpgsql;
 
 
 GRANT USAGE ON SCHEMA __msar, msar, mathesar_types TO PUBLIC;
+-- Record summary caches are only created through msar.create_summary_cache_tables.
+GRANT USAGE ON SCHEMA msar_summary_cache TO PUBLIC;
 GRANT EXECUTE ON ALL FUNCTIONS IN SCHEMA msar, __msar, mathesar_types TO PUBLIC;
 GRANT SELECT ON ALL TABLES IN SCHEMA msar, __msar, mathesar_types TO PUBLIC;
 SELECT msar.grant_usage_on_custom_mathesar_types_to_public();
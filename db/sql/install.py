@@ -39,7 +39,7 @@ def install(conn):
 
 def uninstall(
         conn,
-        schemas_to_remove=['msar', '__msar', 'mathesar_types'],
+        schemas_to_remove=['msar', '__msar', 'mathesar_types', 'msar_summary_cache'],
         strict=True
 ):
     """Remove msar and __msar schemas safely."""
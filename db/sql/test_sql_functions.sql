@@ -1623,6 +1623,106 @@ END;
 $f$ LANGUAGE plpgsql;
 
 
+
+
+CREATE OR REPLACE FUNCTION test_infer_table_column_data_types_bounded_sample() RETURNS SETOF TEXT AS $f$
+BEGIN
+  PERFORM __setup_type_inference();
+  RETURN NEXT is(
+    msar.build_inference_sample_expr('"Types Test"'::regclass, ARRAY[3, 5]::smallint[], 10),
+    '(SELECT "Boolean", "Numeric" FROM public."Types Test" '
+    || 'TABLESAMPLE BERNOULLI(100) REPEATABLE(0) LIMIT 10) AS sample'
+  );
+  -- Tables without statistics which have many rows are sampled by page, however many they have.
+  CREATE TABLE big_inference_table AS SELECT i, i::text AS t FROM generate_series(1, 20000) AS i;
+  RETURN NEXT matches(
+    msar.build_inference_sample_expr('big_inference_table'::regclass, ARRAY[2]::smallint[], 10),
+    'TABLESAMPLE SYSTEM\(0\.\d+\)'
+  );
+  ANALYZE big_inference_table;
+  RETURN NEXT matches(
+    msar.build_inference_sample_expr('big_inference_table'::regclass, ARRAY[2]::smallint[], 10),
+    'TABLESAMPLE SYSTEM\(0\.1\d*\)'
+  );
+  RETURN NEXT is(
+    (SELECT count(*) FROM jsonb_object_keys(msar.infer_table_column_data_types('"Types Test"'::regclass, 1))),
+    8::bigint
+  );
+  -- The sample is repeatable, so the inference is too.
+  RETURN NEXT is(
+    msar.infer_table_column_data_types('"Types Test"'::regclass, 2),
+    msar.infer_table_column_data_types('"Types Test"'::regclass, 2)
+  );
+END;
+$f$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION test_infer_values_data_type() RETURNS SETOF TEXT AS $f$
+BEGIN
+  RETURN NEXT is(
+    msar.infer_values_data_type(ARRAY['0', '1', 't', 'false']),
+    jsonb_build_object('type', 'boolean', 'details', jsonb_build_object('mathesar_casting', true))
+  );
+  RETURN NEXT is(
+    msar.infer_values_data_type(ARRAY['1,234.5', '12', '-3']),
+    jsonb_build_object(
+      'type', 'numeric',
+      'details', jsonb_build_object('mathesar_casting', true, 'decimal_p', '.', 'group_sep', ',')
+    )
+  );
+  RETURN NEXT is(
+    msar.infer_values_data_type(ARRAY['$9,850,000.00', '-$320', '$(123.12)']),
+    jsonb_build_object(
+      'type', 'mathesar_types.mathesar_money',
+      'details', jsonb_build_object(
+        'curr_pref', '$', 'curr_suff', '', 'decimal_p', '.', 'group_sep', ',', 'mathesar_casting', true
+      )
+    )
+  );
+  RETURN NEXT is(
+    msar.infer_values_data_type(ARRAY['cat', 'bat']),
+    jsonb_build_object('type', 'text')
+  );
+  RETURN NEXT is(
+    msar.infer_values_data_type(ARRAY[]::text[]),
+    jsonb_build_object('type', 'text')
+  );
+END;
+$f$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION test_infer_import_column_data_types() RETURNS SETOF TEXT AS $f$
+DECLARE
+  tab_id regclass;
+BEGIN
+  CREATE TABLE import_types_test (id integer PRIMARY KEY, "A" text, "B" text, "C" text);
+  tab_id := 'import_types_test'::regclass;
+  RETURN NEXT is(
+    msar.infer_values_data_type(ARRAY['1', '0'], ARRAY['uuid', 'numeric']::regtype[]) ->> 'type',
+    'numeric'
+  );
+  RETURN NEXT is(
+    msar.infer_import_column_data_types(
+      tab_id,
+      jsonb_build_array(
+        jsonb_build_object('values', jsonb_build_array('t', 'no'), 'candidates', jsonb_build_array('boolean', 'date')),
+        -- Candidates ruled out while importing aren't tried.
+        jsonb_build_object('values', jsonb_build_array('1', '0'), 'candidates', jsonb_build_array('date')),
+        jsonb_build_object(
+          'values', jsonb_build_array(),
+          'candidates', jsonb_build_array('boolean'),
+          'stats', jsonb_build_object('null_ratio', 1)
+        )
+      )
+    ),
+    jsonb_build_object(
+      '1', jsonb_build_object('type', 'integer'),
+      '2', jsonb_build_object('type', 'boolean', 'details', jsonb_build_object('mathesar_casting', true)),
+      '3', jsonb_build_object('type', 'text'),
+      '4', jsonb_build_object('type', 'text', 'stats', jsonb_build_object('null_ratio', 1))
+    )
+  );
+END;
+$f$ LANGUAGE plpgsql;
+
 CREATE OR REPLACE FUNCTION test_retype_col_sql_for_correct_inference() RETURNS SETOF TEXT AS $f$
 DECLARE
   tab_id regclass;
@@ -2164,6 +2264,25 @@ END;
 $f$ LANGUAGE plpgsql;
 
 
+CREATE OR REPLACE FUNCTION test_prepare_binary_copy_into_table() RETURNS SETOF TEXT AS $f$
+BEGIN
+  PERFORM __setup_insert_from_select();
+  RETURN NEXT is(
+    msar.prepare_binary_copy_into_table('dest'::regclass, ARRAY[4, 2, 6]::smallint[]),
+    jsonb_build_object(
+      'copy_sql', 'COPY dest (amount, value, price) FROM STDIN (FORMAT BINARY)',
+      'column_types', jsonb_build_array('numeric', 'integer', 'mathesar_types.mathesar_money')
+    )
+  );
+  RETURN NEXT is(
+    msar.prepare_binary_copy_into_table('dest'::regclass, ARRAY[1, 7]::smallint[]),
+    NULL,
+    'prepare_binary_copy_into_table() returns NULL for missing columns'
+  );
+END;
+$f$ LANGUAGE plpgsql;
+
+
 CREATE OR REPLACE FUNCTION __setup_column_alter() RETURNS SETOF TEXT AS $$
 BEGIN
   CREATE SCHEMA test_schema;
@@ -2230,6 +2349,152 @@ END;
 $f$ LANGUAGE plpgsql;
 
 
+CREATE OR REPLACE FUNCTION __count_table_rewrites() RETURNS event_trigger AS $$
+BEGIN
+  UPDATE table_rewrites SET count = count + 1;
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_alter_columns_type_rewrites_once() RETURNS SETOF TEXT AS $f$
+DECLARE
+  col_alters_jsonb jsonb := $j$[
+    {"attnum": 2, "type": {"name": "varchar", "options": {"length": 48}}},
+    {"attnum": 3, "type": {"name": "integer"}},
+    {"attnum": 4, "type": {"name": "integer"}},
+    {"attnum": 6, "type": {"name": "date"}}
+  ]$j$;
+BEGIN
+  PERFORM __setup_column_alter();
+  INSERT INTO test_schema.col_alters (col1, col2, "Col sp") VALUES ('a', 1, '2'), ('b', 3, '4');
+  CREATE TABLE table_rewrites (count integer);
+  INSERT INTO table_rewrites VALUES (0);
+  CREATE EVENT TRIGGER count_table_rewrites ON table_rewrite EXECUTE FUNCTION __count_table_rewrites();
+  RETURN NEXT is(
+    msar.alter_columns('test_schema.col_alters'::regclass::oid, col_alters_jsonb), ARRAY[2, 3, 4, 6]
+  );
+  DROP EVENT TRIGGER count_table_rewrites;
+  RETURN NEXT is((SELECT count FROM table_rewrites), 1, 'the table should be rewritten once');
+  RETURN NEXT col_type_is('test_schema', 'col_alters', 'Col sp', 'integer', 'type should be integer');
+  RETURN NEXT col_default_is('test_schema', 'col_alters', 'col2', 5, 'default should be 5');
+  RETURN NEXT col_default_is('test_schema', 'col_alters', 'coltim', '(now())::date', 'default should be now()');
+  RETURN NEXT results_eq(
+    'SELECT "Col sp" FROM test_schema.col_alters ORDER BY id',
+    'VALUES (2), (4)'
+  );
+END;
+$f$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_retype_columns_attributes_errors() RETURNS SETOF TEXT AS $f$
+DECLARE
+  tab_id regclass;
+  col_retypes jsonb := $j$[
+    {"attnum": 2, "new_type": "integer"},
+    {"attnum": 3, "new_type": "integer"}
+  ]$j$;
+  err_column text;
+BEGIN
+  CREATE TABLE retypes (id integer PRIMARY KEY, good text, bad text);
+  INSERT INTO retypes SELECT i, i::text, i::text FROM generate_series(1, 3000) AS i;
+  tab_id := 'retypes'::regclass;
+
+  -- Failing values within the sample are found before the table is altered.
+  UPDATE retypes SET bad = 'x' WHERE id = 5;
+  BEGIN
+    PERFORM msar.retype_columns(tab_id, col_retypes);
+  EXCEPTION WHEN invalid_text_representation THEN
+    GET STACKED DIAGNOSTICS err_column = COLUMN_NAME;
+  END;
+  RETURN NEXT is(err_column, 'bad');
+
+  -- Failing values past the sample are found after altering the table fails.
+  err_column := NULL;
+  UPDATE retypes SET bad = id::text WHERE id = 5;
+  UPDATE retypes SET bad = 'x' WHERE id = 2500;
+  BEGIN
+    PERFORM msar.retype_columns(tab_id, col_retypes);
+  EXCEPTION WHEN invalid_text_representation THEN
+    GET STACKED DIAGNOSTICS err_column = COLUMN_NAME;
+  END;
+  RETURN NEXT is(err_column, 'bad');
+  RETURN NEXT col_type_is('retypes', 'good', 'text');
+
+  UPDATE retypes SET bad = id::text WHERE id = 2500;
+  RETURN NEXT is(
+    msar.retype_columns(tab_id, col_retypes),
+    'ALTER TABLE public.retypes '
+    || 'ALTER COLUMN good TYPE integer USING msar.cast_to_integer(good), '
+    || 'ALTER COLUMN bad TYPE integer USING msar.cast_to_integer(bad)'
+  );
+  RETURN NEXT col_type_is('retypes', 'bad', 'integer');
+END;
+$f$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_validate_column_cast() RETURNS SETOF TEXT AS $f$
+DECLARE
+  tab_id regclass;
+  col_type jsonb := '{"name": "integer"}';
+BEGIN
+  CREATE TABLE cast_checks (id integer PRIMARY KEY, val text);
+  INSERT INTO cast_checks SELECT i, i::text FROM generate_series(1, 25000) AS i;
+  INSERT INTO cast_checks VALUES (25001, NULL);
+  tab_id := 'cast_checks'::regclass;
+
+  RETURN NEXT is(
+    msar.validate_column_cast(tab_id, 2::smallint, col_type),
+    '{"checked_count": 25000, "failure_count": 0, "failures": [], "complete": true}'::jsonb
+  );
+
+  UPDATE cast_checks SET val = 'x' || id WHERE id IN (7, 12000, 12001, 24000);
+  RETURN NEXT is(
+    msar.validate_column_cast(tab_id, 2::smallint, col_type, max_failures => 2),
+    jsonb_build_object(
+      'checked_count', 12000,
+      'failure_count', 2,
+      'failures', jsonb_build_array(
+        jsonb_build_object(
+          'key', 7, 'value', 'x7', 'error', 'invalid input syntax for type integer: "x7"'
+        ),
+        jsonb_build_object(
+          'key', 12000, 'value', 'x12000', 'error', 'invalid input syntax for type integer: "x12000"'
+        )
+      ),
+      'complete', false
+    )
+  );
+  -- All values are checked when an exact count is requested.
+  RETURN NEXT is(
+    msar.validate_column_cast(
+      tab_id, 2::smallint, col_type, max_failures => 2, exact_count => true
+    ) - 'failures',
+    '{"checked_count": 25000, "failure_count": 4, "complete": true}'::jsonb
+  );
+  -- Only the first values are checked in sample-only mode.
+  RETURN NEXT is(
+    msar.validate_column_cast(tab_id, 2::smallint, col_type, sample_size => 12000) - 'failures',
+    '{"checked_count": 12000, "failure_count": 2, "complete": false}'::jsonb
+  );
+  RETURN NEXT is(
+    msar.validate_column_cast(tab_id, 2::smallint, col_type, sample_size => 100) - 'failures',
+    '{"checked_count": 100, "failure_count": 1, "complete": false}'::jsonb
+  );
+  -- At least one batch is checked, however small the time budget.
+  RETURN NEXT is(
+    msar.validate_column_cast(tab_id, 2::smallint, col_type, time_budget => '0'::interval) - 'failures',
+    '{"checked_count": 10000, "failure_count": 1, "complete": false}'::jsonb
+  );
+  RETURN NEXT is(
+    msar.validate_column_cast(tab_id, 2::smallint, '{"name": "text"}') ->> 'failure_count',
+    '0'
+  );
+  -- Nothing is altered.
+  RETURN NEXT col_type_is('cast_checks', 'val', 'text');
+END;
+$f$ LANGUAGE plpgsql;
+
+
 CREATE OR REPLACE FUNCTION test_alter_columns_type_options() RETURNS SETOF TEXT AS $f$
 DECLARE
   col_alters_jsonb jsonb := $j$[
@@ -3829,6 +4094,7 @@ BEGIN
     ),
     $j${
       "count": 1,
+      "count_mode": "exact",
       "results": [
         {
           "1": 1, "2": "John", "3": 42, "4": "1980-05-12 AD", "5": true,
@@ -3878,6 +4144,7 @@ BEGIN
     ),
     $j${
       "count": 3,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": 5, "3": "sdflkj", "4": "\"s\"", "5": "{\"a\": \"val\"}"},
         {"1": 2, "2": 34, "3": "sdflfflsk", "4": null, "5": "[1, 2, 3, 4]"},
@@ -3900,6 +4167,7 @@ BEGIN
     ),
     $j${
       "count": 3,
+      "count_mode": "exact",
       "results": [
         {"1": 2, "2": 34, "3": "sdflfflsk", "4": null, "5": "[1, 2, 3, 4]"},
         {"1": 1, "2": 5, "3": "sdflkj", "4": "\"s\"", "5": "{\"a\": \"val\"}"}
@@ -3921,6 +4189,7 @@ BEGIN
     ),
     $j${
       "count": 3,
+      "count_mode": "exact",
       "results": [
         {"1": 2, "2": 34, "3": "sdflfflsk", "4": null, "5": "[1, 2, 3, 4]"},
         {"1": 1, "2": 5, "3": "sdflkj", "4": "\"s\"", "5": "{\"a\": \"val\"}"}
@@ -3942,6 +4211,7 @@ BEGIN
     ),
     $j${
       "count": 0,
+      "count_mode": "exact",
       "results": [],
       "grouping": null,
       "joined_record_summaries": null,
@@ -3960,6 +4230,7 @@ BEGIN
     ),
     $j${
       "count": 3,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": 5, "3": "sdflkj", "4": "\"s\"", "5": "{\"a\": \"val\"}"}
       ],
@@ -3980,6 +4251,7 @@ BEGIN
     ),
     $j${
       "count": 0,
+      "count_mode": "exact",
       "results": [],
       "grouping": null,
       "joined_record_summaries": null,
@@ -3991,6 +4263,179 @@ END;
 $$ LANGUAGE plpgsql;
 
 
+CREATE OR REPLACE FUNCTION test_list_records_from_table_count_modes() RETURNS SETOF TEXT AS $$
+DECLARE
+  rel_id oid;
+  list_result jsonb;
+BEGIN
+  PERFORM __setup_list_records_table();
+  rel_id := 'atable'::regclass::oid;
+  ANALYZE atable;
+  list_result := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => null, filter_ => null,
+    group_ => null, count_mode => 'none'
+  );
+  RETURN NEXT is(list_result -> 'count', 'null'::jsonb);
+  RETURN NEXT is(list_result ->> 'count_mode', 'none');
+  RETURN NEXT is(jsonb_array_length(list_result -> 'results'), 2);
+  list_result := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => null, filter_ => null,
+    group_ => null, count_mode => 'estimated'
+  );
+  RETURN NEXT is((list_result -> 'count')::integer, 3);
+  RETURN NEXT is(list_result ->> 'count_mode', 'estimated');
+  list_result := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => null, filter_ => null,
+    group_ => null, count_mode => 'auto', count_estimate_threshold => 3
+  );
+  RETURN NEXT is((list_result -> 'count')::integer, 3);
+  RETURN NEXT is(list_result ->> 'count_mode', 'estimated');
+  list_result := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => null, filter_ => null,
+    group_ => null, count_mode => 'auto', count_estimate_threshold => 1000
+  );
+  RETURN NEXT is((list_result -> 'count')::integer, 3);
+  RETURN NEXT is(list_result ->> 'count_mode', 'exact');
+  RETURN NEXT throws_ok(
+    format(
+      'SELECT msar.list_records_from_table(%s, null, null, null, null, null, count_mode => %L)',
+      rel_id, 'bogus'
+    ),
+    'Invalid count mode: bogus'
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_search_records_from_table_count_modes() RETURNS SETOF TEXT AS $$
+DECLARE
+  rel_id oid;
+  search_result jsonb;
+BEGIN
+  PERFORM __setup_search_records_table();
+  rel_id := 'search_table'::regclass::oid;
+  search_result := msar.search_records_from_table(
+    tab_id => rel_id,
+    search_ => jsonb_build_array(jsonb_build_object('attnum', 3, 'literal', 'bc')),
+    limit_ => 10,
+    count_mode => 'none'
+  );
+  RETURN NEXT is(search_result -> 'count', 'null'::jsonb);
+  RETURN NEXT is(search_result ->> 'count_mode', 'none');
+  RETURN NEXT is(jsonb_array_length(search_result -> 'results'), 2);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_list_records_from_table_with_cursor() RETURNS SETOF TEXT AS $$
+DECLARE
+  rel_id oid;
+  order_ jsonb := '[{"attnum": 2, "direction": "desc"}]';
+  filter_ jsonb := '{"type": "lesser", "args": [{"type": "attnum", "value": 2}, {"type": "literal", "value": 30}]}';
+  first_page jsonb;
+  next_page jsonb;
+BEGIN
+  PERFORM __setup_list_records_table();
+  rel_id := 'atable'::regclass::oid;
+  INSERT INTO atable (col1, col2) VALUES (null, 'nullish'), (5, 'dupe');
+  first_page := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => order_, filter_ => null,
+    group_ => null, use_cursor => true
+  );
+  RETURN NEXT is(
+    first_page -> 'results',
+    msar.list_records_from_table(rel_id, 2, 0, order_, null, null) -> 'results'
+  );
+  RETURN NEXT isnt(first_page ->> 'next_cursor', null);
+  next_page := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => order_, filter_ => null,
+    group_ => null, cursor_ => first_page ->> 'next_cursor'
+  );
+  RETURN NEXT is(
+    next_page -> 'results',
+    msar.list_records_from_table(rel_id, 2, 2, order_, null, null) -> 'results'
+  );
+  RETURN NEXT is((next_page -> 'count')::integer, 5);
+  -- The offset is ignored when given a cursor.
+  RETURN NEXT is(
+    msar.list_records_from_table(
+      tab_id => rel_id, limit_ => 2, offset_ => 2, order_ => order_, filter_ => null,
+      group_ => null, cursor_ => first_page ->> 'next_cursor'
+    ) -> 'results',
+    next_page -> 'results'
+  );
+  next_page := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => order_, filter_ => null,
+    group_ => null, cursor_ => next_page ->> 'next_cursor'
+  );
+  RETURN NEXT is(
+    next_page -> 'results',
+    msar.list_records_from_table(rel_id, 2, 4, order_, null, null) -> 'results'
+  );
+  RETURN NEXT is(next_page -> 'next_cursor', 'null'::jsonb);
+
+  -- Filters apply along with the cursor.
+  first_page := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 1, offset_ => null, order_ => order_, filter_ => filter_,
+    group_ => null, use_cursor => true
+  );
+  next_page := msar.list_records_from_table(
+    tab_id => rel_id, limit_ => 2, offset_ => null, order_ => order_, filter_ => filter_,
+    group_ => null, cursor_ => first_page ->> 'next_cursor'
+  );
+  RETURN NEXT is(
+    next_page -> 'results',
+    msar.list_records_from_table(rel_id, 2, 1, order_, filter_, null) -> 'results'
+  );
+
+  -- The next_cursor key is only returned when using cursors.
+  RETURN NEXT ok(NOT msar.list_records_from_table(rel_id, 2, 0, order_, null, null) ? 'next_cursor');
+  RETURN NEXT throws_ok(
+    format(
+      'SELECT msar.list_records_from_table(%s, 2, null, null, null, null, cursor_ => %L)',
+      rel_id, first_page ->> 'next_cursor'
+    ),
+    'The cursor does not match the requested ordering'
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_build_seek_expr() RETURNS SETOF TEXT AS $$
+DECLARE
+  rel_id oid;
+BEGIN
+  PERFORM __setup_list_records_table();
+  rel_id := 'atable'::regclass::oid;
+  RETURN NEXT is(
+    msar.get_total_order_keys(rel_id, '[{"attnum": 2, "direction": "desc"}]'),
+    '[{"attnum": 2, "direction": "DESC"}, {"attnum": 1, "direction": "ASC"}]'::jsonb
+  );
+  RETURN NEXT is(
+    msar.build_seek_expr(rel_id, msar.get_total_order_keys(rel_id, null), '["2"]'),
+    '(msar.format_data(atable.id)) > (''2'')'
+  );
+  RETURN NEXT is(
+    msar.build_seek_expr(
+      rel_id, msar.get_total_order_keys(rel_id, '[{"attnum": 2, "direction": "desc"}]'), '["5", "1"]'
+    ),
+    '(msar.format_data(atable.col1) < ''5'') OR '
+    '(msar.format_data(atable.col1) IS NOT DISTINCT FROM ''5'' AND msar.format_data(atable.id) > ''1'')'
+  );
+  RETURN NEXT is(
+    msar.build_seek_expr(
+      rel_id, msar.get_total_order_keys(rel_id, '[{"attnum": 2, "direction": "asc"}]'), '[null, "4"]'
+    ),
+    '(msar.format_data(atable.col1) IS NOT DISTINCT FROM NULL AND msar.format_data(atable.id) > ''4'')'
+  );
+  RETURN NEXT throws_ok(
+    format('SELECT msar.decode_records_cursor(%L, %L)', 'not a cursor!', '[]'),
+    'Invalid cursor: not a cursor!'
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
 CREATE OR REPLACE FUNCTION test_list_records_from_table_with_filter()
 RETURNS SETOF TEXT AS $$
 DECLARE
@@ -4010,6 +4455,7 @@ BEGIN
     ),
     $j${
       "count": 1,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": 5, "3": "sdflkj", "4": "\"s\"", "5": "{\"a\": \"val\"}"}
       ],
@@ -4030,6 +4476,7 @@ BEGIN
     ),
     $j${
       "count": 1,
+      "count_mode": "exact",
       "results": [
         {"1":1,"2":5,"3":"sdflkj","4":"\"s\"","5":"{\"a\": \"val\"}"}
       ],
@@ -4050,6 +4497,7 @@ BEGIN
     ),
     $j${
       "count": 1,
+      "count_mode": "exact",
       "results": [
         {"1": 2, "2": 34, "3": "sdflfflsk", "4": null, "5": "[1, 2, 3, 4]"}
       ],
@@ -4071,6 +4519,7 @@ BEGIN
     ),
     $j${
       "count": 2,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": 5, "3": "sdflkj", "4": "\"s\"", "5": "{\"a\": \"val\"}"},
         {"1": 3, "2": 2, "3": "abcde", "4": "{\"k\": 3242348}", "5": "true"}
@@ -4092,6 +4541,7 @@ BEGIN
     ),
     $j${
       "count": 2,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": 5, "3": "sdflkj", "4": "\"s\"", "5": "{\"a\": \"val\"}"},
         {"1": 3, "2": 2, "3": "abcde", "4": "{\"k\": 3242348}", "5": "true"}
@@ -4123,6 +4573,7 @@ BEGIN
     ),
     $j${
       "count": 21,
+      "count_mode": "exact",
       "results": [
         {"1": 5, "2": "Abigail", "3": "Abbott", "4": "2020-07-05 AD"},
         {"1": 8, "2": "Abigail", "3": "Abbott", "4": "2020-10-30 AD"},
@@ -4187,6 +4638,7 @@ BEGIN
     ),
     $j${
       "count": 21,
+      "count_mode": "exact",
       "results": [
         {"1": 5, "2": "Abigail", "3": "Abbott", "4": "2020-07-05 AD"},
         {"1": 8, "2": "Abigail", "3": "Abbott", "4": "2020-10-30 AD"},
@@ -4220,6 +4672,7 @@ BEGIN
     ),
     $j${
       "count": 21,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": "Aaron", "3": "Adams", "4": "2020-03-21 AD"},
         {"1": 2, "2": "Abigail", "3": "Acosta", "4": "2020-04-16 AD"},
@@ -4249,6 +4702,7 @@ BEGIN
     ),
     $j${
       "count": 21,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": "Aaron", "3": "Adams", "4": "2020-03-21 AD"},
         {"1": 2, "2": "Abigail", "3": "Acosta", "4": "2020-04-16 AD"},
@@ -4291,6 +4745,7 @@ BEGIN
     ),
     $j${
       "count": 2,
+      "count_mode": "exact",
       "results": [
         {"1":1,"2":5,"3":"sdflkj","4":"\"s\"","5":"{\"a\": \"val\"}"},
         {"1":2,"2":34,"3":"sdflfflsk","4":null,"5":"[1, 2, 3, 4]"}
@@ -4327,6 +4782,7 @@ BEGIN
     ),
     $j${
       "count": 12,
+      "count_mode": "exact",
       "results": [
         {"1":2,"2":"Abigail","3":"Acosta","4":"2020-04-16 AD"},
         {"1":4,"2":"Abigail","3":"Adams","4":"2020-05-29 AD"},
@@ -4378,6 +4834,7 @@ BEGIN
     ),
     $j${
      "count": 6,
+     "count_mode": "exact",
      "results": [
         {"1": 1, "2": "Tools", "3": null},
         {"1": 2, "2": "Power tools", "3": 1},
@@ -4421,6 +4878,7 @@ BEGIN
     ),
     $j${
       "count": 2,
+      "count_mode": "exact",
       "results": [
         {"1":2,"2":"Power tools","3":1},
         {"1":3,"2":"Hand tools","3":1}
@@ -4552,6 +5010,7 @@ BEGIN
     ),
     jsonb_build_object(
       'count', 8,
+      'count_mode', 'exact',
       'results', '[
         {
           "1": 1,
@@ -4861,6 +5320,44 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+
+CREATE OR REPLACE FUNCTION test_build_table_export_query() RETURNS SETOF TEXT AS $$
+DECLARE
+  rel_id oid;
+  export_result jsonb;
+BEGIN
+  PERFORM __setup_get_table_columns_records();
+  rel_id := 'table_for_export'::regclass::oid;
+  EXECUTE format(
+    'SELECT jsonb_agg(to_jsonb(export_row)) FROM (%s) AS export_row',
+    msar.build_table_export_query(
+      rel_id, 2, null, '[{"attnum": 2, "direction": "desc"}]', null
+    )
+  ) INTO export_result;
+  RETURN NEXT is(
+    export_result,
+    $j$[
+      {"id": 2, "col1": 34, "col2": "sdflfflsk", "col3": null, "col4": "[1, 2, 3, 4]"},
+      {"id": 1, "col1": 5, "col2": "sdflkj", "col3": "\"s\"", "col4": "{\"a\": \"val\"}"}
+    ]$j$::jsonb
+  );
+  EXECUTE format(
+    'SELECT jsonb_agg(to_jsonb(export_row)) FROM (%s) AS export_row',
+    msar.build_table_export_query(
+      rel_id,
+      null,
+      null,
+      null,
+      '{"type": "lesser", "args": [{"type": "attnum", "value": 2}, {"type": "literal", "value": 5}]}'
+    )
+  ) INTO export_result;
+  RETURN NEXT is(
+    export_result,
+    $j$[{"id": 3, "col1": 2, "col2": "abcde", "col3": "{\"k\": 3242348}", "col4": "true"}]$j$::jsonb
+  );
+END;
+$$ LANGUAGE plpgsql;
+
 -- msar.get_current_role ---------------------------------------------------------------------------
 
 CREATE OR REPLACE FUNCTION __setup_get_current_role() RETURNS SETOF TEXT AS $$
@@ -5489,6 +5986,70 @@ END;
 $$ LANGUAGE plpgsql;
 
 
+CREATE OR REPLACE FUNCTION test_get_search_match_expr() RETURNS SETOF TEXT AS $$
+DECLARE
+  rel_id oid;
+BEGIN
+  PERFORM __setup_search_records_table();
+  rel_id := 'search_table'::regclass::oid;
+  RETURN NEXT is(
+    msar.get_search_match_expr(rel_id, '[{"attnum": 3, "literal": "bc"}]'),
+    '(col2::text ILIKE ''%bc%'')'
+  );
+  RETURN NEXT is(
+    msar.get_search_match_expr(rel_id, '[{"attnum": 2, "literal": 12}]'),
+    '(col1 = ''12'')'
+  );
+  RETURN NEXT is(msar.get_search_match_expr(rel_id, '[]'), null);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_search_indexes() RETURNS SETOF TEXT AS $$
+DECLARE
+  rel_id oid;
+BEGIN
+  PERFORM __setup_search_records_table();
+  rel_id := 'search_table'::regclass::oid;
+  RETURN NEXT is(
+    msar.list_search_indexes(rel_id),
+    '[{"attnum": 3, "index_name": null, "index_size": null}]'::jsonb
+  );
+  PERFORM msar.add_search_indexes(rel_id, ARRAY[3]::smallint[]);
+  PERFORM msar.add_search_indexes(rel_id, ARRAY[3]::smallint[]);
+  RETURN NEXT is(
+    (SELECT count(*) FROM pg_catalog.pg_index WHERE indrelid = rel_id AND NOT indisprimary),
+    1::bigint
+  );
+  RETURN NEXT isnt(msar.get_search_index_oid(rel_id, 3::smallint), null);
+  RETURN NEXT is(
+    msar.list_search_indexes(rel_id) -> 0 ->> 'index_name',
+    (SELECT relname::text FROM pg_catalog.pg_class WHERE oid = msar.get_search_index_oid(rel_id, 3::smallint))
+  );
+  RETURN NEXT ok((msar.list_search_indexes(rel_id) -> 0 ->> 'index_size')::bigint > 0);
+  -- Searches give the same results with the index.
+  RETURN NEXT is(
+    msar.search_records_from_table(rel_id, '[{"attnum": 3, "literal": "bc"}]', null) -> 'results',
+    jsonb_build_array(
+      jsonb_build_object('1', 1, '2', 1, '3', 'bcdea'),
+      jsonb_build_object('1', 4, '2', 2, '3', 'abcde')
+    )
+  );
+  RETURN NEXT throws_ok(
+    format('SELECT msar.add_search_indexes(%s, ARRAY[2]::smallint[])', rel_id),
+    '42804',
+    'Column 2 of table search_table can not have a search index'
+  );
+  PERFORM msar.drop_search_indexes(rel_id, ARRAY[2, 3]::smallint[]);
+  RETURN NEXT is(msar.get_search_index_oid(rel_id, 3::smallint), null);
+  RETURN NEXT is(
+    msar.list_search_indexes(rel_id),
+    '[{"attnum": 3, "index_name": null, "index_size": null}]'::jsonb
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
 CREATE OR REPLACE FUNCTION test_search_uuid_records_from_table() RETURNS SETOF TEXT AS $$
 DECLARE
   rel_id oid;
@@ -6041,6 +6602,7 @@ BEGIN
     ),
     $j${
       "count": 7,
+      "count_mode": "exact",
       "results": [
         {"1": 1, "2": 2.345, "3": 3, "4": "Fred Fredrickson", "5": 95, "6": "ffredrickson@example.edu"},
         {"1": 2, "2": 1.234, "3": 1, "4": "Gabby Gabberson", "5": 100, "6": "ggabberson@example.edu"},
@@ -6086,6 +6648,7 @@ BEGIN
     ),
     $j${
       "count": 7,
+      "count_mode": "exact",
       "results": [
         {"1": 2, "2": 1.234, "3": 1, "4": "Gabby Gabberson", "5": 100, "6": "ggabberson@example.edu"},
         {"1": 3, "2": 1.234, "3": 2, "4": "Hank Hankson", "5": 75, "6": "hhankson@example.edu"},
@@ -6117,6 +6680,7 @@ BEGIN
     ),
     $j${
       "count": 7,
+      "count_mode": "exact",
       "results": [
         {"1": 2, "2": 1.234, "3": 1, "4": "Gabby Gabberson", "5": 100, "6": "ggabberson@example.edu"},
         {"1": 3, "2": 1.234, "3": 2, "4": "Hank Hankson", "5": 75, "6": "hhankson@example.edu"}
@@ -6367,6 +6931,43 @@ END;
 $$ LANGUAGE plpgsql;
 
 
+CREATE OR REPLACE FUNCTION test_linked_record_summaries_for_page_only()
+RETURNS SETOF TEXT AS $$
+DECLARE
+  plan json;
+BEGIN
+  CREATE TABLE makers (id integer PRIMARY KEY, name text);
+  CREATE TABLE cars (id integer PRIMARY KEY, model text, maker integer REFERENCES makers);
+  INSERT INTO makers SELECT i, 'Maker ' || i FROM generate_series(1, 20000) AS i;
+  INSERT INTO cars SELECT i, 'Model ' || i, i * 7 FROM generate_series(1, 100) AS i;
+  ANALYZE makers, cars;
+
+  RETURN NEXT is(
+    msar.list_records_from_table('cars'::regclass::oid, 2, 0, NULL, NULL, NULL)
+      -> 'linked_record_summaries',
+    '{"3": {"7": "Maker 7", "14": "Maker 14"}}'::jsonb
+  );
+  -- However large the linked table, we only summarize the records linked from the page.
+  EXECUTE format(
+    $q$
+      EXPLAIN (ANALYZE, FORMAT JSON)
+      WITH results_cte AS (SELECT id AS "1", maker AS "3" FROM cars ORDER BY id LIMIT 2)%s
+      SELECT * FROM summary_cte_3
+    $q$,
+    msar.build_linked_record_summaries_ctes('cars'::regclass::oid, NULL, 'results_cte')
+  ) INTO plan;
+  RETURN NEXT cmp_ok(
+    (
+      SELECT max((scan ->> 'Actual Rows')::numeric * (scan ->> 'Actual Loops')::numeric)
+      FROM jsonb_path_query(plan::jsonb, 'strict $.** ? (@."Relation Name" == "makers")') AS scan
+    ),
+    '<=',
+    2::numeric
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
 CREATE OR REPLACE FUNCTION test_add_record_to_table_with_preview() RETURNS SETOF TEXT AS $$
 BEGIN
   PERFORM __setup_preview_fkey_cols();
@@ -7619,6 +8220,103 @@ END;
 $$ LANGUAGE plpgsql;
 
 
+CREATE OR REPLACE FUNCTION test_cast_to_numeric_finding_separators() RETURNS SETOF TEXT AS $$
+BEGIN
+  RETURN NEXT is(msar.cast_to_numeric('-1,234.5'), -1234.5::numeric);
+  RETURN NEXT is(msar.cast_to_numeric('+12'), 12::numeric);
+  RETURN NEXT is(msar.cast_to_numeric('1.234.567,8'), 1234567.8::numeric);
+  RETURN NEXT is(msar.cast_to_numeric('1''234.5'), 1234.5::numeric);
+  RETURN NEXT is(msar.cast_to_mathesar_money('-$1,234.50'), -1234.5::mathesar_types.mathesar_money);
+  RETURN NEXT is(msar.cast_to_mathesar_money('(1.234,5 €)'), -1234.5::mathesar_types.mathesar_money);
+  RETURN NEXT throws_ok(
+    $q$SELECT msar.cast_to_numeric('1,2,3')$q$, 'P0001', '1,2,3 cannot be cast to numeric'
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_build_cast_expr_with_separators() RETURNS SETOF TEXT AS $$
+BEGIN
+  RETURN NEXT is(
+    msar.build_cast_expr('val', 'numeric', '{}'),
+    'msar.cast_to_numeric(val)'
+  );
+  RETURN NEXT is(
+    msar.build_cast_expr('val', 'numeric', '{"mathesar_casting": true}'),
+    'msar.cast_to_numeric(val)'
+  );
+  -- Separators not given are taken to be absent from the values.
+  RETURN NEXT is(
+    msar.build_cast_expr('val', 'numeric', '{"decimal_p": ","}'),
+    'msar.cast_to_numeric(val, group_sep =>''''::"char", decimal_p =>'',''::"char")'
+  );
+  RETURN NEXT is(
+    msar.build_cast_expr('val', 'mathesar_types.mathesar_money', '{"curr_pref": "$"}'),
+    'msar.cast_to_mathesar_money(val, group_sep =>''''::"char", decimal_p =>''''::"char", '
+    || 'curr_pref =>''$''::text, curr_suff =>''''::text)'
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_cast_with_separators_benchmark() RETURNS SETOF TEXT AS $$/*
+Compare casting a column with and without the separators found by type inference.
+
+With the separators, the casting functions should be inlined into the query, rather than called for
+each value, and be much faster than finding the separators of each value.
+*/
+DECLARE
+  plan_line text;
+  plan text := '';
+  started timestamptz;
+  finding_time interval;
+  given_time interval;
+BEGIN
+  CREATE TABLE cast_benchmark AS
+    SELECT
+      to_char(i * 1.5, 'FM9,999,990.0') AS num,
+      '$' || to_char(i * 1.5, 'FM9,999,990.0') AS money
+    FROM generate_series(1, 50000) AS i;
+
+  FOR plan_line IN EXECUTE
+    'EXPLAIN (VERBOSE, COSTS OFF) SELECT '
+    || msar.build_cast_expr('num', 'numeric', '{"group_sep": ",", "decimal_p": "."}') || ', '
+    || msar.build_cast_expr(
+      'money',
+      'mathesar_types.mathesar_money',
+      '{"group_sep": ",", "decimal_p": ".", "curr_pref": "$", "curr_suff": ""}'
+    )
+    || ' FROM cast_benchmark'
+  LOOP
+    plan := plan || plan_line;
+  END LOOP;
+  RETURN NEXT unlike(plan, '%cast_to_%', 'Casts with separators are inlined');
+
+  started := clock_timestamp();
+  PERFORM sum(msar.cast_to_numeric(num)) FROM cast_benchmark;
+  finding_time := clock_timestamp() - started;
+  started := clock_timestamp();
+  PERFORM sum(msar.cast_to_numeric(num, ',', '.')) FROM cast_benchmark;
+  given_time := clock_timestamp() - started;
+  RETURN NEXT diag(format('numeric: %s finding separators, %s given them', finding_time, given_time));
+  RETURN NEXT cmp_ok(given_time, '<', finding_time, 'Casting to numeric with separators is faster');
+
+  started := clock_timestamp();
+  PERFORM sum(msar.cast_to_mathesar_money(money)) FROM cast_benchmark;
+  finding_time := clock_timestamp() - started;
+  started := clock_timestamp();
+  PERFORM sum(msar.cast_to_mathesar_money(money, ',', '.', '$', '')) FROM cast_benchmark;
+  given_time := clock_timestamp() - started;
+  RETURN NEXT diag(
+    format('mathesar_money: %s finding separators, %s given them', finding_time, given_time)
+  );
+  RETURN NEXT cmp_ok(
+    given_time, '<', finding_time, 'Casting to mathesar_money with separators is faster'
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+
 CREATE OR REPLACE FUNCTION __setup_mathesar_money_inference() RETURNS SETOF TEXT AS $$
 BEGIN
   CREATE TABLE moneyinfer (
@@ -7926,6 +8624,162 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- msar.enable_record_summary_cache ---------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION test_record_summary_cache() RETURNS SETOF TEXT AS $$
+DECLARE
+  templates jsonb;
+  cars_template jsonb := '[[3, 2], " ", [2]]';
+BEGIN
+  CREATE TABLE makers (id int PRIMARY KEY, name text);
+  CREATE TABLE cars (id int PRIMARY KEY, model text, maker int REFERENCES makers);
+  INSERT INTO makers VALUES (1, 'Ford'), (2, 'Fiat');
+  INSERT INTO cars VALUES (1, 'Focus', 1), (2, 'Panda', 2);
+  templates := jsonb_build_object('cars'::regclass::oid, cars_template);
+
+  PERFORM msar.enable_record_summary_cache('cars', templates);
+  RETURN NEXT is(
+    msar.get_usable_summary_cache('cars'::regclass, cars_template),
+    msar.get_summary_cache('cars'::regclass)
+  );
+  -- The cache isn't used for other templates.
+  RETURN NEXT is(
+    msar.get_usable_summary_cache('cars'::regclass, msar.auto_generate_record_summary_template('cars')),
+    NULL
+  );
+
+  -- Changes to the table are applied to the cache.
+  INSERT INTO cars VALUES (3, 'Punto', 2);
+  UPDATE cars SET id = 4, model = 'Fiesta' WHERE id = 1;
+  DELETE FROM cars WHERE id = 2;
+  RETURN NEXT results_eq(
+    format('SELECT key, summary FROM %s ORDER BY key', msar.get_summary_cache('cars'::regclass)),
+    $v$VALUES (3, 'Fiat Punto'), (4, 'Ford Fiesta')$v$
+  );
+  RETURN NEXT is(
+    msar.list_by_record_summaries('cars'::regclass, 10, 0, 'fiesta', templates),
+    '{"count": 1, "mapping": null, "results": [{"key": 4, "summary": "Ford Fiesta"}]}'
+  );
+
+  -- Updates of linked tables refresh the summaries showing the updated records.
+  UPDATE makers SET name = 'FIAT' WHERE id = 2;
+  RETURN NEXT is(
+    msar.get_usable_summary_cache('cars'::regclass, cars_template),
+    msar.get_summary_cache('cars'::regclass)
+  );
+  RETURN NEXT results_eq(
+    format('SELECT key, summary FROM %s ORDER BY key', msar.get_summary_cache('cars'::regclass)),
+    $v$VALUES (3, 'FIAT Punto'), (4, 'Ford Fiesta')$v$
+  );
+
+  -- Updates of tables the template no longer links to make the cache stale, so summaries are
+  -- rendered on the fly.
+  ALTER TABLE cars DROP CONSTRAINT cars_maker_fkey;
+  UPDATE makers SET name = 'Fiat' WHERE id = 2;
+  RETURN NEXT is(msar.get_usable_summary_cache('cars'::regclass, cars_template), NULL);
+  RETURN NEXT is(
+    msar.list_by_record_summaries('cars'::regclass, 10, 0, 'punto', templates),
+    '{"count": 1, "mapping": null, "results": [{"key": 3, "summary": " Punto"}]}'
+  );
+
+  -- Enabling the cache again refreshes it.
+  ALTER TABLE cars ADD CONSTRAINT cars_maker_fkey FOREIGN KEY (maker) REFERENCES makers;
+  PERFORM msar.enable_record_summary_cache('cars', templates);
+  RETURN NEXT results_eq(
+    format('SELECT key, summary FROM %s ORDER BY key', msar.get_summary_cache('cars'::regclass)),
+    $v$VALUES (3, 'Fiat Punto'), (4, 'Ford Fiesta')$v$
+  );
+  TRUNCATE cars;
+  RETURN NEXT is_empty(format('SELECT * FROM %s', msar.get_summary_cache('cars'::regclass)));
+
+  -- Users may not create objects in the msar_summary_cache schema.
+  RETURN NEXT is(
+    ARRAY(
+      SELECT privilege_type
+      FROM pg_namespace, aclexplode(nspacl)
+      WHERE nspname = 'msar_summary_cache' AND grantee = 0
+    ),
+    ARRAY['USAGE']
+  );
+
+  PERFORM msar.disable_record_summary_cache('cars');
+  RETURN NEXT is(msar.get_summary_cache('cars'::regclass), NULL);
+  RETURN NEXT is(msar.get_summary_cache_meta('cars'::regclass), NULL);
+  RETURN NEXT is_empty(
+    $q$SELECT 1 FROM pg_trigger WHERE tgrelid IN ('cars'::regclass, 'makers'::regclass)$q$
+  );
+  RETURN NEXT is(to_regproc(msar.get_summary_cache_trigger_function('cars')), NULL);
+  RETURN NEXT lives_ok($q$INSERT INTO cars VALUES (5, 'Ka', 1)$q$);
+  RETURN NEXT lives_ok($q$UPDATE makers SET name = 'FORD' WHERE id = 1$q$);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_record_summary_cache_orphaned() RETURNS SETOF TEXT AS $$
+DECLARE
+  cars_id oid;
+BEGIN
+  CREATE TABLE makers (id int PRIMARY KEY, name text);
+  CREATE TABLE cars (id int PRIMARY KEY, model text, maker int REFERENCES makers);
+  INSERT INTO makers VALUES (1, 'Ford');
+  INSERT INTO cars VALUES (1, 'Focus', 1);
+  cars_id := 'cars'::regclass::oid;
+  PERFORM msar.enable_record_summary_cache(
+    'cars', jsonb_build_object(cars_id, '[[3, 2], " ", [2]]'::jsonb)
+  );
+
+  -- A cache isn't dropped along with its table, but it's no longer used.
+  DROP TABLE cars;
+  RETURN NEXT isnt(msar.get_summary_cache(cars_id), NULL);
+  RETURN NEXT ok(msar.is_summary_cache_orphaned(cars_id));
+  RETURN NEXT is(msar.get_usable_summary_cache(cars_id, '[[3, 2], " ", [2]]'), NULL);
+  -- The trigger left on the linked table does nothing.
+  RETURN NEXT lives_ok($q$UPDATE makers SET name = 'FORD' WHERE id = 1$q$);
+
+  PERFORM msar.drop_orphaned_summary_caches();
+  RETURN NEXT is(msar.get_summary_cache(cars_id), NULL);
+  RETURN NEXT is(msar.get_summary_cache_meta(cars_id), NULL);
+  RETURN NEXT lives_ok($q$UPDATE makers SET name = 'Ford' WHERE id = 1$q$);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_move_column_in_summary_templates() RETURNS SETOF TEXT AS $$
+DECLARE
+  makers_id oid;
+  cars_id oid;
+BEGIN
+  CREATE TABLE makers (id int PRIMARY KEY, name text, country text);
+  CREATE TABLE cars (id int PRIMARY KEY, model text, maker int REFERENCES makers);
+  makers_id := 'makers'::regclass::oid;
+  cars_id := 'cars'::regclass::oid;
+
+  -- Parts ending at the moved column are changed, whether in the column's table or linked to it.
+  RETURN NEXT is(
+    msar.move_column_in_summary_templates(
+      makers_id,
+      2::smallint,
+      4::smallint,
+      jsonb_build_object(
+        makers_id, '[[2], " (", [3], ")"]'::jsonb,
+        cars_id, '[[3, 2], " ", [2], " ", [3, 3]]'::jsonb
+      )
+    ),
+    jsonb_build_object(
+      makers_id, '[[4], " (", [3], ")"]'::jsonb,
+      cars_id, '[[3, 4], " ", [2], " ", [3, 3]]'::jsonb
+    )
+  );
+  -- Templates not referring to the moved column are left out.
+  RETURN NEXT is(
+    msar.move_column_in_summary_templates(
+      cars_id, 3::smallint, 4::smallint, jsonb_build_object(makers_id, '[[3]]'::jsonb)
+    ),
+    '{}'::jsonb
+  );
+END;
+$$ LANGUAGE plpgsql;
+
 -- msar.form_insert -------------------------------------------------------------------------------
 
 CREATE OR REPLACE FUNCTION __setup_items_books_authors_insert() RETURNS SETOF TEXT AS $$
@@ -8352,3 +9206,184 @@ BEGIN
   );
 END;
 $$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_get_joinable_tables_from() RETURNS SETOF TEXT AS $$
+DECLARE
+  fingerprint text;
+BEGIN
+  CREATE TABLE authors (id integer PRIMARY KEY, name text);
+  CREATE TABLE books (id integer PRIMARY KEY, author integer REFERENCES authors);
+  CREATE TABLE items (id integer PRIMARY KEY, book integer REFERENCES books);
+  CREATE TABLE publishers (id integer PRIMARY KEY, name text);
+  CREATE TABLE awards (id integer PRIMARY KEY, publisher integer REFERENCES publishers);
+
+  RETURN NEXT results_eq(
+    $q$
+      SELECT target::regclass::text, depth, multiple_results
+      FROM msar.get_joinable_tables_from('items'::regclass, 2)
+      ORDER BY depth
+    $q$,
+    $v$VALUES ('books', 1, false), ('authors', 2, false)$v$
+  );
+  -- All paths found start at the base table.
+  RETURN NEXT is_empty(
+    $q$
+      SELECT * FROM msar.get_joinable_tables_from('books'::regclass, 3)
+      WHERE base <> 'books'::regclass::oid OR target = 'publishers'::regclass::oid
+    $q$
+  );
+  RETURN NEXT set_eq(
+    $q$SELECT * FROM msar.get_joinable_tables(2) WHERE base = 'books'::regclass::oid$q$,
+    $q$SELECT * FROM msar.get_joinable_tables_from('books'::regclass, 2)$q$
+  );
+
+  fingerprint := msar.get_joinable_tables_fingerprint();
+  RETURN NEXT is(msar.get_joinable_tables_fingerprint(), fingerprint);
+  CREATE TABLE unlinked (id integer PRIMARY KEY);
+  ALTER TABLE unlinked ADD COLUMN name text;
+  RETURN NEXT is(msar.get_joinable_tables_fingerprint(), fingerprint);
+  ALTER TABLE authors RENAME COLUMN name TO full_name;
+  RETURN NEXT isnt(msar.get_joinable_tables_fingerprint(), fingerprint);
+  fingerprint := msar.get_joinable_tables_fingerprint();
+  ALTER TABLE unlinked ADD COLUMN book integer REFERENCES books;
+  RETURN NEXT isnt(msar.get_joinable_tables_fingerprint(), fingerprint);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_get_linked_table_oids() RETURNS SETOF TEXT AS $$
+BEGIN
+  CREATE TABLE authors (id integer PRIMARY KEY, name text);
+  CREATE TABLE publishers (id integer PRIMARY KEY, name text);
+  CREATE TABLE books (
+    id integer PRIMARY KEY,
+    author integer REFERENCES authors,
+    coauthor integer REFERENCES authors,
+    publisher integer REFERENCES publishers
+  );
+  RETURN NEXT set_eq(
+    $q$SELECT unnest(msar.get_linked_table_oids('books'::regclass))$q$,
+    $q$VALUES ('authors'::regclass::oid), ('publishers'::regclass::oid)$q$
+  );
+  RETURN NEXT is(msar.get_linked_table_oids('authors'::regclass), ARRAY[]::oid[]);
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_online_retype() RETURNS SETOF TEXT AS $f$
+DECLARE
+  tab_id regclass;
+  col_type jsonb := '{"name": "integer"}';
+  new_col_id smallint;
+BEGIN
+  CREATE TABLE online_retypes (id integer PRIMARY KEY, val text NOT NULL DEFAULT '5', other text);
+  COMMENT ON COLUMN online_retypes.val IS 'some values';
+  INSERT INTO online_retypes SELECT i, (i * 10)::text, 'o' || i FROM generate_series(1, 5) AS i;
+  tab_id := 'online_retypes'::regclass;
+
+  RETURN NEXT is(
+    msar.start_online_retype(tab_id, 2::smallint, col_type),
+    '{"shadow_attnum": 4, "estimated_rows": 0}'::jsonb
+  );
+  -- New and updated values are synced by the trigger.
+  INSERT INTO online_retypes (id, val) VALUES (6, '60');
+  UPDATE online_retypes SET val = '11' WHERE id = 1;
+  UPDATE online_retypes SET other = 'p' WHERE id = 2;
+  RETURN NEXT results_eq(
+    'SELECT id, __msar_retype_2 FROM online_retypes ORDER BY id',
+    $$VALUES (1, 11), (2, NULL), (3, NULL), (4, NULL), (5, NULL), (6, 60)$$
+  );
+  -- The shadow column is hidden from Mathesar.
+  RETURN NEXT is(
+    (SELECT jsonb_agg(col -> 'name') FROM jsonb_array_elements(msar.get_column_info(tab_id)) AS x(col)),
+    '["id", "val", "other"]'::jsonb
+  );
+  RETURN NEXT is(msar.get_selectable_columns(tab_id), '{"1": "id", "2": "val", "3": "other"}'::jsonb);
+
+  RETURN NEXT is(
+    msar.backfill_online_retype(tab_id, 2::smallint, col_type, '{}', NULL, 4),
+    '{"count": 4, "last_key": "4"}'::jsonb
+  );
+  RETURN NEXT is(
+    msar.backfill_online_retype(tab_id, 2::smallint, col_type, '{}', '4', 4),
+    '{"count": 2, "last_key": "6"}'::jsonb
+  );
+  RETURN NEXT is(
+    msar.backfill_online_retype(tab_id, 2::smallint, col_type, '{}', '6', 4),
+    '{"count": 0, "last_key": null}'::jsonb
+  );
+  RETURN NEXT ok(msar.add_online_retype_not_null_check(tab_id, 2::smallint));
+  PERFORM msar.validate_online_retype_not_null_check(tab_id, 2::smallint);
+
+  new_col_id := msar.finish_online_retype(tab_id, 2::smallint, col_type);
+  RETURN NEXT is(new_col_id, 4::smallint);
+  RETURN NEXT col_type_is('online_retypes', 'val', 'integer');
+  RETURN NEXT col_not_null('online_retypes', 'val');
+  RETURN NEXT col_default_is('online_retypes', 'val', 5);
+  RETURN NEXT is(msar.col_description(tab_id, new_col_id), 'some values');
+  RETURN NEXT hasnt_column('online_retypes', '__msar_retype_2');
+  RETURN NEXT results_eq(
+    'SELECT id, val FROM online_retypes ORDER BY id',
+    $$VALUES (1, 11), (2, 20), (3, 30), (4, 40), (5, 50), (6, 60)$$
+  );
+  RETURN NEXT is(
+    (SELECT count(*) FROM pg_constraint WHERE conrelid = tab_id AND contype = 'c'),
+    0::bigint
+  );
+  RETURN NEXT is(
+    (SELECT count(*) FROM pg_trigger WHERE tgrelid = tab_id AND NOT tgisinternal),
+    0::bigint
+  );
+  RETURN NEXT is(
+    (SELECT count(*) FROM pg_proc WHERE starts_with(proname::text, '__msar_retype_')),
+    0::bigint
+  );
+END;
+$f$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION test_online_retype_errors() RETURNS SETOF TEXT AS $f$
+DECLARE
+  tab_id regclass;
+BEGIN
+  CREATE TABLE online_retypes (id integer PRIMARY KEY, val text, indexed text UNIQUE);
+  CREATE TABLE online_retypes_no_pkey (val text);
+  INSERT INTO online_retypes VALUES (1, 'x', 'a');
+  tab_id := 'online_retypes'::regclass;
+
+  RETURN NEXT throws_ok(
+    format(
+      'SELECT msar.start_online_retype(%s, 1::smallint, ''{"name": "integer"}'')',
+      'online_retypes_no_pkey'::regclass::oid
+    ),
+    'P0001',
+    'Only columns of tables with a single-column primary key may be retyped online'
+  );
+  RETURN NEXT throws_ok(
+    format(
+      'SELECT msar.start_online_retype(%s, 3::smallint, ''{"name": "integer"}'')', tab_id::oid
+    ),
+    'P0001',
+    'Columns with dependent objects (e.g., indexes, constraints, or views) may not be retyped online'
+  );
+  -- Values which can't be cast fail the batch, which can then be cancelled.
+  PERFORM msar.start_online_retype(tab_id, 2::smallint, '{"name": "integer"}');
+  -- Writes of values which can't be cast fail while the column is being retyped.
+  RETURN NEXT throws_ok($$INSERT INTO online_retypes VALUES (3, 'z', 'c')$$, '22P02');
+  RETURN NEXT throws_ok(
+    format(
+      'SELECT msar.backfill_online_retype(%s, 2::smallint, ''{"name": "integer"}'', ''{}'', NULL, 10)',
+      tab_id::oid
+    ),
+    '22P02'
+  );
+  PERFORM msar.cancel_online_retype(tab_id, 2::smallint);
+  RETURN NEXT hasnt_column('online_retypes', '__msar_retype_2');
+  RETURN NEXT is(
+    (SELECT count(*) FROM pg_proc WHERE starts_with(proname::text, '__msar_retype_')),
+    0::bigint
+  );
+  RETURN NEXT lives_ok($$INSERT INTO online_retypes VALUES (2, 'y', 'b')$$);
+END;
+$f$ LANGUAGE plpgsql;
@@ -1,4 +1,8 @@
+from decimal import Decimal
 import json
+
+from psycopg import sql
+
 from db import connection as db_conn
 from db.columns import _transform_column_alter_dict
 
@@ -37,6 +41,14 @@ def list_joinable_tables(table_oid, conn, max_depth):
     return db_conn.exec_msar_func(conn, 'get_joinable_tables', max_depth, table_oid).fetchone()[0]
 
 
+def get_joinable_tables_fingerprint(conn):
+    return db_conn.exec_msar_func(conn, 'get_joinable_tables_fingerprint').fetchone()[0]
+
+
+def list_linked_table_oids(table_oid, conn):
+    return db_conn.exec_msar_func(conn, 'get_linked_table_oids', table_oid).fetchone()[0]
+
+
 def get_preview(table_oid, column_list, conn, limit=20):
     """
     Preview an imported table. Returning the records from the specified columns of the table.
@@ -173,7 +185,52 @@ def drop_table_from_database(table_oid, conn, cascade=False):
     ).fetchone()[0]
 
 
-def infer_table_column_data_types(conn, table_oid):
+def list_search_indexes(table_oid, conn):
+    """
+    List the searchable columns of a table, along with their search indexes.
+
+    Args:
+        table_oid: The OID of the table whose search indexes we'll list.
+
+    Returns:
+        A list of dicts with the `attnum` of each string or uuid column,
+        and the `index_name` and `index_size` (in bytes) of its trigram
+        index (or None if the column isn't indexed).
+    """
+    return db_conn.exec_msar_func(
+        conn, 'list_search_indexes', table_oid
+    ).fetchone()[0]
+
+
+def add_search_indexes(table_oid, column_attnums, conn):
+    """
+    Add trigram indexes so searches of the given columns can use them.
+
+    Installs the `pg_trgm` extension if necessary.
+
+    Args:
+        table_oid: The OID of the table containing the columns.
+        column_attnums: The attnums of the columns to index.
+    """
+    db_conn.exec_msar_func(
+        conn, 'add_search_indexes', table_oid, column_attnums
+    )
+
+
+def drop_search_indexes(table_oid, column_attnums, conn):
+    """
+    Drop the search indexes of the given columns.
+
+    Args:
+        table_oid: The OID of the table containing the columns.
+        column_attnums: The attnums of the columns whose indexes we'll drop.
+    """
+    db_conn.exec_msar_func(
+        conn, 'drop_search_indexes', table_oid, column_attnums
+    )
+
+
+def infer_table_column_data_types(conn, table_oid, sample_size=10000):
     """
     Infer the best type for each column in the table.
 
@@ -182,13 +239,37 @@ def infer_table_column_data_types(conn, table_oid):
 
     Args:
         tab_id: The OID of the table whose columns we're inferring types for.
+        sample_size: The maximum number of rows to base the inference on.
+            Smaller tables are inferred from all of their rows.
 
     The response JSON will have attnum keys, and values will be the
     result of `format_type` for the inferred type of each column.
     Restricted to columns to which the user has access.
     """
     return db_conn.exec_msar_func(
-        conn, 'infer_table_column_data_types', table_oid
+        conn, 'infer_table_column_data_types', table_oid, sample_size
+    ).fetchone()[0]
+
+
+def infer_import_column_data_types(conn, table_oid, column_samples):
+    """
+    Infer the best type for each column of an imported table from samples.
+
+    Args:
+        table_oid: The OID of the imported table.
+        column_samples: A list with a dict for each text column of the
+            table, in order, each with the "values" sampled from the
+            column, the "candidates" types not ruled out for it, and the
+            "stats" to keep with its suggested type.
+
+    The response JSON has the same form as that of
+    `infer_table_column_data_types`, but the table isn't read.
+    """
+    return db_conn.exec_msar_func(
+        conn,
+        'infer_import_column_data_types',
+        table_oid,
+        json.dumps(column_samples)
     ).fetchone()[0]
 
 
@@ -225,6 +306,30 @@ def split_table(
     }
 
 
+def _float_numbers(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, list):
+        return [_float_numbers(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _float_numbers(v) for k, v in value.items()}
+    return value
+
+
+def load_record_with_exact_numbers(data):
+    """
+    Decode a JSON record, keeping its non-integer numbers as Decimals.
+
+    Only numbers which are values of the record itself are kept exact;
+    those nested in arrays or objects are decoded as floats, as usual.
+    """
+    record = json.loads(data, parse_float=Decimal)
+    return {
+        key: value if isinstance(value, Decimal) else _float_numbers(value)
+        for key, value in record.items()
+    }
+
+
 def fetch_table_in_chunks(
     conn,
     table_oid,
@@ -233,7 +338,8 @@ def fetch_table_in_chunks(
     order=None,
     filter=None,
     with_column_header=True,
-    batch_size=2000
+    batch_size=2000,
+    exact_numbers=False,
 ):
     with conn.transaction():
         with db_conn.exec_msar_func_server_cursor(
@@ -244,6 +350,7 @@ def fetch_table_in_chunks(
             offset,
             _json_or_none(order),
             _json_or_none(filter),
+            json_loads=load_record_with_exact_numbers if exact_numbers else None,
         ) as server_cursor:
             if with_column_header:
                 columns = server_cursor.fetchone()[0]
@@ -255,6 +362,47 @@ def fetch_table_in_chunks(
                 yield [record[0] for record in records]
 
 
+def copy_table_to_csv_in_chunks(
+    conn,
+    table_oid,
+    limit=None,
+    offset=None,
+    order=None,
+    filter=None,
+):
+    """
+    Yield a table's records as CSV (with a header row) in chunks of bytes.
+
+    The CSV is produced by PostgreSQL with `COPY ... TO STDOUT`, and
+    passed along without building Python objects for the rows, so it's
+    much faster than `fetch_table_in_chunks` for large tables. Values
+    are in their PostgreSQL text form.
+
+    Args:
+        table_oid: The OID of the table whose records we'll export.
+        limit: The maximum number of rows we'll export.
+        offset: The number of rows to skip before exporting records from
+                following rows.
+        order: An array of ordering definition objects.
+        filter: An array of filter definition objects.
+    """
+    export_query = db_conn.exec_msar_func(
+        conn,
+        'build_table_export_query',
+        table_oid,
+        limit,
+        offset,
+        _json_or_none(order),
+        _json_or_none(filter),
+    ).fetchone()[0]
+    copy_sql = sql.SQL("COPY ({}) TO STDOUT WITH (FORMAT csv, HEADER true)").format(
+        sql.SQL(export_query)
+    )
+    with conn.cursor() as cursor, cursor.copy(copy_sql) as copy:
+        for data in copy:
+            yield bytes(data)
+
+
 def set_primary_key_column_on_table(
         conn,
         table_oid,
@@ -2,6 +2,7 @@ from sqlalchemy import inspect, text
 from db.deprecated.queries.base import DBQuery, InitialColumn, JoinParameter
 from db.deprecated.columns import get_column_attnum_from_name as get_attnum
 from db.deprecated.transforms import base as tbase
+from db.deprecated.transforms.operations import apply
 from db.deprecated.metadata import get_empty_metadata
 from db.deprecated.utils import engine_to_psycopg_conn
 from mathesar.utils.explorations import run_exploration
@@ -339,6 +340,48 @@ def test_DBQuery_all_sa_columns_map_overwriting(engine_with_library):
     assert actual_columns == expect_columns
 
 
+def test_DBQuery_applies_each_transformation_once(engine_with_library, monkeypatch):
+    engine, schema = engine_with_library
+    checkouts_oid = _get_oid_from_table("Checkouts", schema, engine)
+    metadata = get_empty_metadata()
+    initial_columns = [
+        InitialColumn(
+            checkouts_oid,
+            get_attnum(checkouts_oid, 'id', engine, metadata=metadata),
+            alias='Checkout'
+        ),
+        InitialColumn(
+            checkouts_oid,
+            get_attnum(checkouts_oid, 'Due Date', engine, metadata=metadata),
+            alias='Due Date'
+        ),
+    ]
+    transformations = [
+        tbase.Filter(spec={"not": [{"null": [{"column_name": ["Due Date"]}]}]}),
+        tbase.Order(spec=[{"field": "Due Date", "direction": "asc"}]),
+        tbase.Limit(spec=10),
+    ]
+    dbq = DBQuery(
+        checkouts_oid,
+        initial_columns,
+        engine,
+        transformations=transformations,
+        metadata=metadata,
+    )
+    applied_transforms = []
+    original_apply_transform = apply._apply_transform
+
+    def _counting_apply_transform(relation, transform):
+        applied_transforms.append(transform)
+        return original_apply_transform(relation, transform)
+
+    monkeypatch.setattr(apply, '_apply_transform', _counting_apply_transform)
+    dbq.all_sa_columns_map
+    dbq.sa_output_columns
+    dbq.transformed_relation
+    assert applied_transforms == transformations
+
+
 def test_run_explorations(db, engine_with_library):
     # This test exists to make sure we're able to run explorations with both TCP & Unix socket connections to postgres.
     engine, schema = engine_with_library
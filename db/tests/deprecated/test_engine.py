@@ -0,0 +1,44 @@
+import pytest
+
+from db.deprecated import engine as engine_module
+
+
+@pytest.fixture(autouse=True)
+def empty_engine_cache():
+    engine_module.clear_engine_cache()
+    yield
+    engine_module.clear_engine_cache()
+
+
+def _get_engine(username='alice', password='pass1234', database='mathesar'):
+    return engine_module.get_cached_future_engine_with_custom_types(
+        username, password, 'localhost', database, 5432
+    )
+
+
+def test_get_cached_engine_reuses_engine():
+    assert _get_engine() is _get_engine()
+
+
+def test_get_cached_engine_per_role_and_database():
+    engine = _get_engine()
+    assert _get_engine(username='bob') is not engine
+    assert _get_engine(database='other') is not engine
+
+
+def test_get_cached_engine_password_change():
+    engine = _get_engine()
+    new_engine = _get_engine(password='newpass')
+    assert new_engine is not engine
+    assert new_engine.url.password == 'newpass'
+    assert _get_engine(password='newpass') is new_engine
+
+
+def test_get_cached_engine_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(engine_module, 'ENGINE_CACHE_SIZE', 2)
+    first_engine = _get_engine(username='a')
+    second_engine = _get_engine(username='b')
+    _get_engine(username='a')
+    _get_engine(username='c')
+    assert _get_engine(username='a') is first_engine
+    assert _get_engine(username='b') is not second_engine
@@ -0,0 +1,77 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from db import connection
+
+
+@pytest.fixture
+def mocked_pool_class():
+    with patch.object(connection, 'ConnectionPool') as mock_pool_class:
+        mock_pool_class.side_effect = lambda **kw: MagicMock(kwargs=kw['kwargs'])
+        yield mock_pool_class
+    connection._connection_pools.clear()
+
+
+def _conn_kwargs(**overrides):
+    return {
+        'host': 'localhost',
+        'port': 5432,
+        'dbname': 'mydb',
+        'user': 'alice',
+        'password': 'pass1',
+        'sslmode': 'prefer',
+        **overrides,
+    }
+
+
+def test_pooled_connection_reuses_pool(mocked_pool_class):
+    connection.mathesar_pooled_connection(**_conn_kwargs())
+    connection.mathesar_pooled_connection(**_conn_kwargs())
+    assert mocked_pool_class.call_count == 1
+    connection.mathesar_pooled_connection(**_conn_kwargs(user='bob'))
+    assert mocked_pool_class.call_count == 2
+
+
+def test_pooled_connection_replaces_pool_on_password_change(mocked_pool_class):
+    connection.mathesar_pooled_connection(**_conn_kwargs())
+    old_pool = connection._connection_pools[('localhost', 5432, 'mydb', 'alice', 'prefer')]
+    connection.mathesar_pooled_connection(**_conn_kwargs(password='pass2'))
+    new_pool = connection._connection_pools[('localhost', 5432, 'mydb', 'alice', 'prefer')]
+    old_pool.close.assert_called_once()
+    assert new_pool is not old_pool
+    assert new_pool.kwargs['password'] == 'pass2'
+
+
+def test_close_connection_pools_matches_key_parts(mocked_pool_class):
+    connection.mathesar_pooled_connection(**_conn_kwargs())
+    connection.mathesar_pooled_connection(**_conn_kwargs(dbname='otherdb'))
+    connection.mathesar_pooled_connection(**_conn_kwargs(user='bob'))
+    assert connection.close_connection_pools(host='localhost', user='alice') == 2
+    assert list(connection._connection_pools) == [
+        ('localhost', 5432, 'mydb', 'bob', 'prefer')
+    ]
+    assert connection.close_connection_pools() == 1
+    assert connection._connection_pools == {}
+
+
+def test_close_connection_pools_unknown_field():
+    with pytest.raises(ValueError):
+        connection.close_connection_pools(password='pass1')
+
+
+def test_get_connection_pool_stats(mocked_pool_class):
+    connection.mathesar_pooled_connection(**_conn_kwargs())
+    pool = connection._connection_pools[('localhost', 5432, 'mydb', 'alice', 'prefer')]
+    pool.get_stats.return_value = {'pool_size': 2, 'pool_available': 1}
+    assert connection.get_connection_pool_stats() == [
+        {
+            'host': 'localhost',
+            'port': 5432,
+            'dbname': 'mydb',
+            'user': 'alice',
+            'sslmode': 'prefer',
+            'pool_size': 2,
+            'pool_available': 1,
+        }
+    ]
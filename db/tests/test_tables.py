@@ -1,3 +1,4 @@
+from decimal import Decimal
 import json
 from unittest.mock import patch
 from db import connection, tables
@@ -27,3 +28,13 @@ def test_alter_table():
         "description": "this is a comment",
         "columns": {},
     })
+
+
+def test_load_record_with_exact_numbers():
+    record = tables.load_record_with_exact_numbers(
+        b'{"1": 12345678901234567890.123456789, "2": 7, "3": [1.5], "4": "a"}'
+    )
+    assert record == {
+        '1': Decimal('12345678901234567890.123456789'), '2': 7, '3': [1.5], '4': 'a'
+    }
+    assert isinstance(record['3'][0], float)
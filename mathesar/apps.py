@@ -5,3 +5,6 @@ class MathesarConfig(AppConfig):
     """Initialization manager."""
 
     name = "mathesar"
+
+    def ready(self):
+        from mathesar import signals  # noqa
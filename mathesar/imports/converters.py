@@ -0,0 +1,133 @@
+"""
+Functions converting imported text values to Python values of a column's type.
+
+Each converter accepts a subset of the values accepted by the casting function
+Mathesar uses for the same type (`msar.cast_to_<type>`), and returns the same
+result for them. Values outside that subset raise `UnconvertibleValueError`, so
+that the caller can fall back to casting in the database instead.
+"""
+from decimal import Decimal
+import re
+import uuid
+
+from mathesar.imports.type_sniffer import get_numeric_parts
+
+
+class UnconvertibleValueError(ValueError):
+    pass
+
+
+# Postgres only skips ASCII whitespace around numbers, hence `re.ASCII`.
+_INTEGER_PATTERN = re.compile(r'\s*[+-]?[0-9]+\s*', re.ASCII)
+_FLOAT_PATTERN = re.compile(
+    r'\s*[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\s*', re.ASCII
+)
+_UUID_HEX = r'[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}'
+_UUID_PATTERN = re.compile(rf'{_UUID_HEX}|\{{{_UUID_HEX}\}}')
+_BOOLEAN_VALUES = {
+    '1': True, 'on': True, 't': True, 'true': True, 'y': True, 'yes': True,
+    '0': False, 'off': False, 'f': False, 'false': False, 'n': False, 'no': False,
+}
+_INTEGER_BOUNDS = {
+    'smallint': 2 ** 15,
+    'integer': 2 ** 31,
+    'bigint': 2 ** 63,
+}
+
+
+def _convert_text(value):
+    return value
+
+
+def _get_integer_converter(bound):
+    def convert(value):
+        if _INTEGER_PATTERN.fullmatch(value) is None:
+            raise UnconvertibleValueError(value)
+        result = int(value)
+        if not -bound <= result < bound:
+            raise UnconvertibleValueError(value)
+        return result
+    return convert
+
+
+def _convert_boolean(value):
+    try:
+        return _BOOLEAN_VALUES[value.lower()]
+    except KeyError:
+        raise UnconvertibleValueError(value)
+
+
+def _convert_double_precision(value):
+    if _FLOAT_PATTERN.fullmatch(value) is None:
+        raise UnconvertibleValueError(value)
+    result = float(value)
+    # Postgres rejects values out of range, rather than rounding them.
+    if result in (float('inf'), float('-inf')) or (
+        result == 0 and any(c in '123456789' for c in re.split('[eE]', value)[0])
+    ):
+        raise UnconvertibleValueError(value)
+    return result
+
+
+def _convert_numeric(value):
+    numeric_parts = get_numeric_parts(value)
+    if numeric_parts is None:
+        raise UnconvertibleValueError(value)
+    digits, group_sep, decimal_p = numeric_parts
+    if group_sep is not None:
+        digits = digits.replace(group_sep, '')
+    if decimal_p is not None:
+        digits = digits.replace(decimal_p, '.', 1)
+    return Decimal('-' + digits if value.startswith('-') else digits)
+
+
+def _convert_uuid(value):
+    if _UUID_PATTERN.fullmatch(value) is None:
+        raise UnconvertibleValueError(value)
+    return uuid.UUID(value.strip('{}'))
+
+
+_CONVERTERS = {
+    'text': _convert_text,
+    'character varying': _convert_text,
+    'character': _convert_text,
+    'boolean': _convert_boolean,
+    'double precision': _convert_double_precision,
+    'numeric': _convert_numeric,
+    'uuid': _convert_uuid,
+    **{
+        type_name: _get_integer_converter(bound)
+        for type_name, bound in _INTEGER_BOUNDS.items()
+    },
+}
+
+
+def get_converter(type_name):
+    """
+    Return the converter for the given type, or None if there isn't one.
+    """
+    return _CONVERTERS.get(type_name)
+
+
+def get_row_converter(column_indices, type_names):
+    """
+    Return a function converting a row of text values for a binary COPY.
+
+    The returned function picks the values at `column_indices` from a row,
+    and converts each to the type at the same position in `type_names`.
+    Returns None if any of the types has no converter.
+    """
+    converters = [get_converter(type_name) for type_name in type_names]
+    if None in converters:
+        return None
+    indexed_converters = list(zip(column_indices, converters))
+
+    def convert_row(row):
+        try:
+            return [
+                None if row[i] is None else convert(row[i])
+                for i, convert in indexed_converters
+            ]
+        except IndexError:
+            raise UnconvertibleValueError(row)
+    return convert_row
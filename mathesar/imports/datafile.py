@@ -1,12 +1,28 @@
+from contextlib import closing, contextmanager
+from itertools import islice
+import queue
+import threading
+
 import clevercsv as csv
 
 from db.constants import COLUMN_NAME_TEMPLATE
 from db.identifiers import truncate_if_necessary
-from db.tables import create_and_import_from_rows
-from db.records import insert_from_select
+from db.tables import create_and_import_from_rows, infer_import_column_data_types
+from db.records import (
+    copy_rows_into_table,
+    insert_from_select,
+    prepare_binary_copy_into_table,
+)
 
+from mathesar.imports.converters import UnconvertibleValueError, get_row_converter
+from mathesar.imports.type_sniffer import ColumnTypeSniffer
 from mathesar.models.base import DataFile
 
+IMPORT_BATCH_SIZE = 5000
+MAX_PENDING_IMPORT_BATCHES = 8
+
+_DONE_READING = object()
+
 
 def copy_datafile_to_table(
     user,
@@ -16,23 +32,79 @@ def copy_datafile_to_table(
     conn,
     comment=None,
     import_into_temp_table=False,
-    header_to_validate=[]
+    header_to_validate=[],
+    progress_callback=None
 ):
+    """
+    Copy the rows of a data file into a new table.
+
+    The file is parsed in a background thread while the parsed rows are
+    being copied, in batches, into the table.
+
+    Args:
+        progress_callback: If given, this is called with the number of rows
+            and bytes read so far, after each batch is copied.
+    """
     data_file = DataFile.objects.get(id=data_file_id, user=user)
-    file_path = data_file.file.path
-    header = data_file.header
+    table_name = table_name or data_file.base_name
+    header_to_validate = header_to_validate if import_into_temp_table else None
+
+    with _read_datafile(data_file, header_to_validate) as (f, column_names, processed_rows):
+        # Rows imported into temp tables are moved into existing tables, so
+        # there are no types to suggest for them.
+        sniffer = None if import_into_temp_table else ColumnTypeSniffer(len(column_names))
+        rows = _read_rows_in_background(
+            processed_rows if sniffer is None else sniffer.sniff(processed_rows),
+            f.buffer.tell,
+            progress_callback,
+        )
+        with closing(rows):
+            import_info = create_and_import_from_rows(
+                rows,
+                table_name,
+                schema_oid,
+                column_names,
+                conn,
+                comment=comment,
+                import_into_temp_table=import_into_temp_table
+            )
+
+    column_type_suggestions = None
+    if sniffer is not None:
+        column_type_suggestions = infer_import_column_data_types(
+            conn, import_info['table_oid'], sniffer.get_column_samples()
+        )
+
+    return {
+        "oid": import_info['table_oid'],
+        "name": import_info.get('table_name'),
+        "renamed_columns": import_info.get('renamed_columns'),
+        "pkey_column_attnum": import_info.get('pkey_column_attnum'),
+        "column_type_suggestions": column_type_suggestions,
+    }
+
+
+@contextmanager
+def _read_datafile(data_file, header_to_validate=None):
+    """
+    Open a data file, yielding the file, its column names, and its rows.
+
+    Empty values in the rows are replaced by None.
+
+    Args:
+        header_to_validate: If given, the header of the file must match
+            this list of (index, name) pairs.
+    """
     dialect = csv.dialect.SimpleDialect(
         data_file.delimiter,
         data_file.quotechar,
         data_file.escapechar
     )
-    table_name = table_name or data_file.base_name
-
-    with open(file_path, "r", newline="") as f:
+    with open(data_file.file.path, "r", newline="") as f:
         reader = csv.reader(f, dialect)
-        if header:
+        if data_file.header:
             raw_col_names = next(reader)
-            if import_into_temp_table:
+            if header_to_validate is not None:
                 assert list(enumerate(raw_col_names)) == header_to_validate, "Parsing mismatch"
             column_names = _process_column_names(raw_col_names)
         else:
@@ -40,23 +112,58 @@ def copy_datafile_to_table(
                 f"{COLUMN_NAME_TEMPLATE}{i}" for i in range(len(next(reader)))
             ]
             f.seek(0)
-        processed_rows = ([None if val == '' else val for val in row] for row in reader)
-        import_info = create_and_import_from_rows(
-            processed_rows,
-            table_name,
-            schema_oid,
-            column_names,
-            conn,
-            comment=comment,
-            import_into_temp_table=import_into_temp_table
-        )
+        yield f, column_names, ([None if val == '' else val for val in row] for row in reader)
 
-    return {
-        "oid": import_info['table_oid'],
-        "name": import_info.get('table_name'),
-        "renamed_columns": import_info.get('renamed_columns'),
-        "pkey_column_attnum": import_info.get('pkey_column_attnum'),
-    }
+
+def _read_rows_in_background(rows, get_bytes_read, progress_callback=None):
+    """
+    Yield the given rows, reading them in batches in a background thread.
+
+    This lets parsing the file overlap with copying the rows into the
+    database. The generator must be closed when it's no longer needed, so
+    that the background thread stops.
+    """
+    batches = queue.Queue(maxsize=MAX_PENDING_IMPORT_BATCHES)
+    stop_reading = threading.Event()
+
+    def put(item):
+        while not stop_reading.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def read_batches():
+        try:
+            row_iter = iter(rows)
+            while not stop_reading.is_set():
+                batch = list(islice(row_iter, IMPORT_BATCH_SIZE))
+                if not batch:
+                    break
+                put((batch, get_bytes_read()))
+            put(_DONE_READING)
+        except Exception as e:
+            put(e)
+
+    reader = threading.Thread(target=read_batches, daemon=True)
+    reader.start()
+    rows_read = 0
+    try:
+        while True:
+            item = batches.get()
+            if item is _DONE_READING:
+                return
+            if isinstance(item, Exception):
+                raise item
+            batch, bytes_read = item
+            yield from batch
+            rows_read += len(batch)
+            if progress_callback is not None:
+                progress_callback(rows_read, bytes_read)
+    finally:
+        stop_reading.set()
+        reader.join()
 
 
 def _process_column_names(column_names):
@@ -79,11 +186,34 @@ def _process_column_names(column_names):
 
 
 def insert_into_existing_table(user, data_file_id, target_table_oid, mappings, conn):
+    """
+    Insert the rows of a data file into an existing table.
+
+    When every target column has a type we can convert to on the client,
+    the values are converted while reading the file, and copied straight
+    into the table using binary COPY. Otherwise, or when a value can't be
+    converted on the client, the rows are copied into a temp table and
+    cast into the target table by the database.
+    """
     header_to_validate = sorted([
         (
             i["csv_column"]["index"], i["csv_column"].get("name")
         ) for i in mappings
     ], key=lambda x: x[0])  # sometimes we don't have "name" when there is no header.
+    column_mappings = [
+        (int(i["csv_column"]["index"]), i["table_column"])
+        for i in mappings if i["table_column"] is not None
+    ]
+    try:
+        with conn.transaction():
+            inserted_rows = _copy_datafile_into_table(
+                user, data_file_id, target_table_oid, column_mappings, header_to_validate, conn
+            )
+    except UnconvertibleValueError:
+        inserted_rows = None
+    if inserted_rows is not None:
+        return inserted_rows
+
     temp_table = copy_datafile_to_table(
         user,
         data_file_id,
@@ -96,10 +226,36 @@ def insert_into_existing_table(user, data_file_id, target_table_oid, mappings, c
     )
     validated_mappings = [
         {
-            'src_table_attnum': int(i["csv_column"]["index"]) + 1,  # The src/temp table attnums are indexed starting from 1
+            'src_table_attnum': csv_index + 1,  # The src/temp table attnums are indexed starting from 1
             # but, the indicies we receive from the frontend start from 0, hence the +1.
-            'dst_table_attnum': i["table_column"]
-        } for i in mappings if i["table_column"] is not None
+            'dst_table_attnum': table_attnum
+        } for csv_index, table_attnum in column_mappings
     ]
     inserted_rows = insert_from_select(conn, temp_table["oid"], target_table_oid, validated_mappings)
     return inserted_rows
+
+
+def _copy_datafile_into_table(
+        user, data_file_id, target_table_oid, column_mappings, header_to_validate, conn
+):
+    """
+    Copy the rows of a data file into an existing table using binary COPY.
+
+    Returns the number of rows copied, or None if some target column has a
+    type we can't convert to on the client. Raises UnconvertibleValueError
+    if some value can't be converted on the client.
+    """
+    if not column_mappings:
+        return None
+    csv_indices, table_attnums = zip(*column_mappings)
+    copy_info = prepare_binary_copy_into_table(conn, target_table_oid, list(table_attnums))
+    if copy_info is None:
+        return None
+    convert_row = get_row_converter(csv_indices, copy_info['column_types'])
+    if convert_row is None:
+        return None
+    data_file = DataFile.objects.get(id=data_file_id, user=user)
+    with _read_datafile(data_file, header_to_validate) as (f, _, processed_rows):
+        rows = _read_rows_in_background(map(convert_row, processed_rows), f.buffer.tell)
+        with closing(rows):
+            return copy_rows_into_table(conn, copy_info, rows)
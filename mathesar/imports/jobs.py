@@ -0,0 +1,137 @@
+"""
+Functions for running imports in the background, and tracking their progress.
+
+The progress of each import is stored in an `ImportJob`, so that it can be
+polled from any web server process, not only the one running the import.
+Imports interrupted by the process stopping are marked as failed when
+polled (see `mathesar.utils.jobs`).
+"""
+import threading
+import time
+
+from django.db import connection as django_connection
+from django.db.models import F
+from django.utils import timezone
+
+from mathesar.imports.datafile import copy_datafile_to_table
+from mathesar.models.base import DataFile, ImportJob, user_database_connection
+from mathesar.utils.connections import get_connection_params
+from mathesar.utils.jobs import fail_stale_job, heartbeat
+from mathesar.utils.tables import set_table_meta_data
+
+# The minimum number of seconds between saving the progress of an import.
+PROGRESS_SAVE_INTERVAL = 1
+
+
+def start_import_job(user, data_file_id, table_name, schema_oid, database_id, comment=None):
+    """
+    Start importing a data file into a new table, in a background thread.
+
+    Returns the `ImportJob` tracking the import.
+    """
+    # Resolve these first, so problems connecting are reported right away.
+    connection_params = get_connection_params(database_id, user)
+    data_file = DataFile.objects.get(id=data_file_id, user=user)
+    job = ImportJob.objects.create(
+        user=user,
+        database_id=database_id,
+        data_file=data_file,
+        total_bytes=data_file.file.size,
+    )
+    threading.Thread(
+        target=_run_import_job,
+        args=(
+            job.id, user, connection_params, data_file_id, table_name, schema_oid,
+            database_id, comment
+        ),
+        daemon=True,
+    ).start()
+    return job
+
+
+def get_import_job(import_job_id, user):
+    job = ImportJob.objects.get(id=import_job_id, user=user)
+    fail_stale_job(job)
+    return job
+
+
+def get_import_job_eta(job):
+    """
+    Return the estimated number of seconds until the import finishes.
+
+    The estimate assumes the rest of the file is read as fast as the part
+    read so far. Returns None if there isn't enough progress to estimate.
+    """
+    if job.status != ImportJob.status_choices.RUNNING:
+        return 0
+    if job.bytes_processed == 0:
+        return None
+    elapsed = (job.updated_at - job.created_at).total_seconds()
+    bytes_left = max(job.total_bytes - job.bytes_processed, 0)
+    return elapsed * bytes_left / job.bytes_processed
+
+
+class _ProgressSaver:
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.last_saved = 0
+        self.rows_processed = 0
+
+    def __call__(self, rows_processed, bytes_processed):
+        self.rows_processed = rows_processed
+        now = time.monotonic()
+        if now - self.last_saved >= PROGRESS_SAVE_INTERVAL:
+            self.last_saved = now
+            _update_import_job(
+                self.job_id,
+                rows_processed=rows_processed,
+                bytes_processed=bytes_processed,
+            )
+
+
+def _update_import_job(job_id, **fields):
+    # `update` doesn't set `auto_now` fields, so we set `updated_at` here.
+    ImportJob.objects.filter(id=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def _run_import_job(
+        job_id, user, connection_params, data_file_id, table_name, schema_oid, database_id, comment
+):
+    save_progress = _ProgressSaver(job_id)
+    try:
+        with heartbeat(ImportJob, job_id), user_database_connection(**connection_params) as conn:
+            import_result = copy_datafile_to_table(
+                user,
+                data_file_id,
+                table_name,
+                schema_oid,
+                conn,
+                comment=comment,
+                progress_callback=save_progress,
+            )
+        set_table_meta_data(
+            import_result['oid'],
+            {
+                'mathesar_added_pkey_attnum': import_result['pkey_column_attnum'],
+                'column_type_suggestions': import_result.get('column_type_suggestions'),
+            },
+            database_id,
+        )
+    except Exception as e:
+        _update_import_job(job_id, status=ImportJob.status_choices.FAILED, error=str(e))
+    else:
+        _update_import_job(
+            job_id,
+            status=ImportJob.status_choices.SUCCEEDED,
+            rows_processed=save_progress.rows_processed,
+            bytes_processed=F('total_bytes'),
+            result={
+                'oid': import_result['oid'],
+                'name': import_result['name'],
+                'renamed_columns': import_result.get('renamed_columns'),
+            },
+        )
+    finally:
+        # This thread's connection to the Django database isn't closed by
+        # the request cycle, so we close it ourselves.
+        django_connection.close()
@@ -0,0 +1,177 @@
+"""
+A streaming sniffer of column types for rows being imported.
+
+The sniffer observes each row as it's passed along to `COPY`, so that the
+table doesn't need to be read again to suggest column types. For each
+column, it records the ratio of nulls, the candidate types which haven't
+been ruled out, the separators used by number-like values, and a bounded
+set of distinct values. The final choice of type is made by the database
+from those values (see `msar.infer_import_column_data_types`), so that it
+matches the casting functions used when the column is actually retyped.
+"""
+import json
+import re
+
+# Mirrors the order of `msar.get_type_inference_sequence()`.
+TYPE_INFERENCE_SEQUENCE = (
+    'boolean',
+    'date',
+    'numeric',
+    'mathesar_types.mathesar_money',
+    'uuid',
+    'timestamp without time zone',
+    'timestamp with time zone',
+    'time without time zone',
+    'interval',
+    'mathesar_types.email',
+    'mathesar_types.mathesar_json_array',
+    'mathesar_types.mathesar_json_object',
+    'mathesar_types.uri',
+)
+
+_BOOLEAN_STRINGS = frozenset(
+    ['1', '0', 't', 'f', 'true', 'false', 'y', 'n', 'yes', 'no', 'on', 'off']
+)
+_UUID_HEX_DIGITS = re.compile(r'[0-9a-fA-F]{32}')
+# Same as the pattern used by `msar.get_numeric_array`.
+_NUMERIC_PATTERN = re.compile(
+    r"^(?:[+-]?([0-9]{4,}(?:([,.])[0-9]+)?|[0-9]{1,3}(?:([,.])[0-9]{1,2}|[0-9]{4,})?"
+    r"|[0-9]{1,3}(,)[0-9]{3}(\.)[0-9]+|[0-9]{1,3}(\.)[0-9]{3}(,)[0-9]+"
+    r"|[0-9]{1,3}(?:(,)[0-9]{3}){2,}(?:(\.)[0-9]+)?|[0-9]{1,3}(?:(\.)[0-9]{3}){2,}(?:(,)[0-9]+)?"
+    r"|[0-9]{1,3}(?:( )[0-9]{3})+(?:([,.])[0-9]+)?|[0-9]{1,2}(?:(,)[0-9]{2})+,[0-9]{3}(?:(\.)[0-9]+)?"
+    r"|[0-9]{1,3}(?:(')[0-9]{3})+(?:([.])[0-9]+)?))$"
+)
+_NUMERIC_GROUP_SEP_GROUPS = (3, 5, 7, 9, 11, 13, 15)
+_NUMERIC_DECIMAL_P_GROUPS = (1, 2, 4, 6, 8, 10, 12, 14, 16)
+
+
+def get_numeric_parts(value):
+    """
+    Split a number-like string into its digits, group separator and decimal point.
+
+    This mirrors `msar.get_numeric_array`, returning None for values that
+    can't be cast to `numeric`, and None for separators which aren't used.
+    """
+    # `fullmatch`, since `$` would also match before a trailing newline.
+    numeric_match = _NUMERIC_PATTERN.fullmatch(value)
+    if numeric_match is None:
+        return None
+    groups = numeric_match.groups()
+    group_sep = next((groups[i] for i in _NUMERIC_GROUP_SEP_GROUPS if groups[i] is not None), None)
+    decimal_p = next((groups[i] for i in _NUMERIC_DECIMAL_P_GROUPS if groups[i] is not None), None)
+    return groups[0], group_sep, decimal_p
+
+
+def _is_boolean(value):
+    return value.lower() in _BOOLEAN_STRINGS
+
+
+def _is_uuid(value):
+    # Postgres allows braces, and hyphens between groups of hex digits.
+    return _UUID_HEX_DIGITS.fullmatch(value.strip('{}').replace('-', '')) is not None
+
+
+_JSON_OPENERS = {list: '[', dict: '{'}
+
+
+def _is_json_of_type(value, json_type):
+    try:
+        return isinstance(json.loads(value), json_type)
+    except ValueError:
+        return False
+    except RecursionError:
+        # Postgres parses JSON nested deeper than Python can, so we keep
+        # the candidate, and leave the database to decide.
+        return value.lstrip().startswith(_JSON_OPENERS[json_type])
+
+
+# Types we can rule out in Python. Each check must accept every value that
+# the corresponding database casting function accepts.
+_TYPE_CHECKS = {
+    'boolean': _is_boolean,
+    'uuid': _is_uuid,
+    'mathesar_types.mathesar_json_array': lambda v: _is_json_of_type(v, list),
+    'mathesar_types.mathesar_json_object': lambda v: _is_json_of_type(v, dict),
+}
+
+
+class _ColumnStats:
+    def __init__(self, max_values):
+        self.max_values = max_values
+        self.null_count = 0
+        self.candidates = list(TYPE_INFERENCE_SEQUENCE)
+        self.group_seps = set()
+        self.decimal_ps = set()
+        self.values = {}
+
+    def observe(self, value):
+        if value is None:
+            self.null_count += 1
+            return
+        if value in self.values:
+            return
+        if len(self.values) < self.max_values:
+            self.values[value] = None
+        self.candidates = [
+            candidate for candidate in self.candidates
+            if candidate not in _TYPE_CHECKS or _TYPE_CHECKS[candidate](value)
+        ]
+        numeric_parts = get_numeric_parts(value)
+        if numeric_parts is not None:
+            _, group_sep, decimal_p = numeric_parts
+            if group_sep is not None:
+                self.group_seps.add(group_sep)
+            if decimal_p is not None:
+                self.decimal_ps.add(decimal_p)
+
+
+class ColumnTypeSniffer:
+    """
+    Collect type statistics about the columns of rows as they stream past.
+
+    Use `sniff` to wrap an iterable of rows, then `get_column_samples` (to
+    infer types in the database) once it's consumed.
+
+    Args:
+        column_count: The number of columns in each row.
+        max_values: The maximum number of distinct values to keep for each
+            column. Values past this limit are still checked against the
+            candidate types, and counted.
+    """
+
+    def __init__(self, column_count, max_values=10000):
+        self.row_count = 0
+        self.columns = [_ColumnStats(max_values) for _ in range(column_count)]
+
+    def sniff(self, rows):
+        for row in rows:
+            self.row_count += 1
+            for column, value in zip(self.columns, row):
+                column.observe(value)
+            yield row
+
+    def get_column_samples(self):
+        """
+        Return, for each column, its sampled values, candidate types, and
+        stats (see `get_column_stats`).
+
+        The stats are kept alongside the suggested types of the columns.
+        """
+        return [
+            {'values': list(column.values), 'candidates': column.candidates, 'stats': stats}
+            for column, stats in zip(self.columns, self.get_column_stats())
+        ]
+
+    def get_column_stats(self):
+        """
+        Return, for each column, its null ratio, and the separators of its
+        number-like values.
+        """
+        return [
+            {
+                'null_ratio': column.null_count / self.row_count if self.row_count else None,
+                'group_seps': sorted(column.group_seps),
+                'decimal_ps': sorted(column.decimal_ps),
+            }
+            for column in self.columns
+        ]
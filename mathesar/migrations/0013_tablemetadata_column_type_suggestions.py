@@ -0,0 +1,18 @@
+# Generated manually
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mathesar", "0012_alter_user_username"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tablemetadata",
+            name="column_type_suggestions",
+            field=models.JSONField(null=True),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated manually
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("mathesar", "0014_importjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RetypeJob",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("table_oid", models.PositiveBigIntegerField()),
+                ("attnum", models.SmallIntegerField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("RUNNING", "Running"),
+                            ("SUCCEEDED", "Succeeded"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="RUNNING",
+                        max_length=128,
+                    ),
+                ),
+                ("rows_processed", models.PositiveBigIntegerField(default=0)),
+                ("total_rows", models.PositiveBigIntegerField(default=0)),
+                ("result", models.JSONField(null=True)),
+                ("error", models.CharField(null=True)),
+                ("database", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="mathesar.database")),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
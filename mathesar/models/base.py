@@ -7,7 +7,9 @@ from encrypted_fields.fields import EncryptedCharField, EncryptedJSONField
 
 from db.sql.install import uninstall, install
 from db.analytics import get_object_counts
-from db.connection import mathesar_connection
+from db.connection import (
+    close_connection_pools, mathesar_connection, mathesar_pooled_connection
+)
 from mathesar import __version__
 from mathesar.models import exceptions
 
@@ -58,6 +60,10 @@ class Server(BaseModel):
             ),
         ]
 
+    def close_connection_pools(self):
+        """Close all pooled connections to databases on this server."""
+        close_connection_pools(host=self.host, port=self.port)
+
 
 class Database(BaseModel):
     name = models.CharField(max_length=128)
@@ -105,7 +111,7 @@ class Database(BaseModel):
 
     def uninstall_sql(
             self,
-            schemas_to_remove=['msar', '__msar', 'mathesar_types'],
+            schemas_to_remove=['msar', '__msar', 'mathesar_types', 'msar_summary_cache'],
             strict=True,
             role_name=None,
             password=None,
@@ -175,6 +181,12 @@ class Database(BaseModel):
 
         return self.connect_manually(role.name, role.password)
 
+    def close_connection_pools(self):
+        """Close all pooled connections to this database, for any role."""
+        close_connection_pools(
+            host=self.server.host, port=self.server.port, dbname=self.name
+        )
+
 
 class ConfiguredRole(BaseModel):
     name = models.CharField(max_length=255)
@@ -193,6 +205,22 @@ class ConfiguredRole(BaseModel):
             )
         ]
 
+    def set_password(self, password):
+        """
+        Set and save the password for the role.
+
+        Pooled connections authenticated with the old password are closed.
+        """
+        self.password = password
+        self.save()
+        self.close_connection_pools()
+
+    def close_connection_pools(self):
+        """Close all pooled connections using this role, for any database."""
+        close_connection_pools(
+            host=self.server.host, port=self.server.port, user=self.name
+        )
+
 
 class UserDatabaseRoleMap(BaseModel):
     user = models.ForeignKey('User', on_delete=models.CASCADE)
@@ -208,8 +236,9 @@ class UserDatabaseRoleMap(BaseModel):
         ]
 
     @property
-    def connection(self):
-        return mathesar_connection(
+    def connection_params(self):
+        """Return the keyword arguments needed to connect as this role."""
+        return dict(
             host=self.server.host,
             port=self.server.port,
             dbname=self.database.name,
@@ -219,6 +248,26 @@ class UserDatabaseRoleMap(BaseModel):
             application_name='mathesar.models.base.UserDatabaseRoleMap.connection',
         )
 
+    @property
+    def connection(self):
+        """Return a connection to the database, using the configured role."""
+        return user_database_connection(**self.connection_params)
+
+
+def user_database_connection(**connection_params):
+    """
+    Return a connection to a user database using the given parameters.
+
+    When connection pooling is enabled, this is a context manager which
+    borrows a connection from the pool for the (server, database, role,
+    sslmode) and returns it on exit.
+    """
+    if settings.MATHESAR_CONNECTION_POOL_ENABLED:
+        return mathesar_pooled_connection(
+            **connection_params, **settings.MATHESAR_CONNECTION_POOL_OPTIONS
+        )
+    return mathesar_connection(**connection_params)
+
 
 class ColumnMetaData(BaseModel):
     database = models.ForeignKey('Database', on_delete=models.CASCADE)
@@ -283,6 +332,7 @@ class TableMetaData(BaseModel):
     record_summary_template = models.JSONField(null=True)
     mathesar_added_pkey_attnum = models.PositiveIntegerField(null=True)
     user_tracking_attnum = models.SmallIntegerField(null=True)
+    column_type_suggestions = models.JSONField(null=True)
 
     class Meta:
         constraints = [
@@ -411,6 +461,38 @@ class DataFile(BaseModel):
     quotechar = models.CharField(max_length=1, default='"', blank=True)
 
 
+class ImportJob(BaseModel):
+    status_choices = models.TextChoices("status", "RUNNING SUCCEEDED FAILED")
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    database = models.ForeignKey('Database', on_delete=models.CASCADE)
+    data_file = models.ForeignKey('DataFile', on_delete=models.SET_NULL, null=True)
+    status = models.CharField(
+        max_length=128, choices=status_choices.choices, default=status_choices.RUNNING
+    )
+    rows_processed = models.PositiveBigIntegerField(default=0)
+    bytes_processed = models.PositiveBigIntegerField(default=0)
+    total_bytes = models.PositiveBigIntegerField(default=0)
+    result = models.JSONField(null=True)
+    error = models.CharField(null=True)
+
+
+class RetypeJob(BaseModel):
+    status_choices = models.TextChoices("status", "RUNNING SUCCEEDED FAILED")
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    database = models.ForeignKey('Database', on_delete=models.CASCADE)
+    table_oid = models.PositiveBigIntegerField()
+    attnum = models.SmallIntegerField()
+    status = models.CharField(
+        max_length=128, choices=status_choices.choices, default=status_choices.RUNNING
+    )
+    rows_processed = models.PositiveBigIntegerField(default=0)
+    total_rows = models.PositiveBigIntegerField(default=0)
+    result = models.JSONField(null=True)
+    error = models.CharField(null=True)
+
+
 class DownloadLink(BaseModel):
     mash = models.CharField(primary_key=True, editable=False)
     sessions = models.ManyToManyField(Session)
@@ -0,0 +1,137 @@
+"""
+JSON-RPC handling, with concurrent processing of read-only batches.
+
+A JSON-RPC batch is a list of calls sent in one request. The frontend
+makes many read-only calls when loading a page, and sending them as a
+batch saves a round trip for each. When every call of a batch is
+read-only (see `is_read_only_method`):
+
+- Calls on the same database share a connection to it, and a snapshot of
+  it (see `mathesar.rpc.utils.shared_connection`). They're made in order.
+- Calls on different databases, and calls not on a user database at all,
+  are independent, so they're made concurrently.
+
+Other batches are processed one call at a time, in order, since later
+calls may depend on the changes made by earlier ones.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections as django_connections
+from modernrpc.exceptions import RPCException
+from modernrpc.handlers import JSONRPCHandler
+
+from mathesar.rpc.utils import shared_connection
+
+READ_ONLY_METHOD_PREFIXES = ('get', 'list', 'search')
+
+
+def is_read_only_method(method_name):
+    """
+    Return whether the named RPC method only reads data.
+
+    By convention, that's the case for methods whose names (after the
+    last dot) start with one of `READ_ONLY_METHOD_PREFIXES`.
+    """
+    return (
+        isinstance(method_name, str)
+        and method_name.rpartition('.')[2].startswith(READ_ONLY_METHOD_PREFIXES)
+    )
+
+
+def _get_database_id(request_data):
+    params = request_data.get('params')
+    if not isinstance(params, dict):
+        return None
+    try:
+        return int(params.get('database_id'))
+    except (TypeError, ValueError):
+        return None
+
+
+class MathesarJSONRPCHandler(JSONRPCHandler):
+    def process_request(self, request_body, context):
+        try:
+            parsed_request = self.parse_request(request_body)
+        except RPCException:
+            # Let the default handler report the error.
+            return super().process_request(request_body, context)
+
+        if not isinstance(parsed_request, list):
+            return self.dumps_result(self.process_single_request(parsed_request, context))
+
+        if all(
+            isinstance(request_data, dict) and is_read_only_method(request_data.get('method'))
+            for request_data in parsed_request
+        ):
+            results = self.process_read_only_batch(parsed_request, context)
+        else:
+            results = [
+                self.process_single_request(request_data, context)
+                for request_data in parsed_request
+            ]
+        dumped_results = [
+            self.dumps_result(result) for result in results if not result.is_notification
+        ]
+        return f"[{', '.join(dumped_results)}]" if dumped_results else ""
+
+    def process_read_only_batch(self, parsed_request, context):
+        """
+        Process a batch of read-only calls, returning their results in order.
+        """
+        database_calls = {}
+        independent_calls = []
+        for index, request_data in enumerate(parsed_request):
+            database_id = _get_database_id(request_data)
+            if database_id is None:
+                independent_calls.append((None, [index]))
+            else:
+                database_calls.setdefault(database_id, []).append(index)
+        call_groups = list(database_calls.items()) + independent_calls
+
+        # Make sure the lazily loaded user is loaded before it's shared
+        # between threads.
+        context.request.user.pk
+        results = [None] * len(parsed_request)
+
+        def process_call_group(call_group):
+            database_id, indices = call_group
+            for index, result in zip(
+                indices,
+                self._process_call_group(
+                    database_id, [parsed_request[i] for i in indices], context
+                ),
+            ):
+                results[index] = result
+
+        if len(call_groups) == 1:
+            process_call_group(call_groups[0])
+        else:
+            def process_call_group_in_thread(call_group):
+                try:
+                    process_call_group(call_group)
+                finally:
+                    # Connections to the Django database are per thread, and
+                    # aren't closed by the request cycle for these threads.
+                    django_connections.close_all()
+
+            max_workers = min(len(call_groups), settings.MATHESAR_RPC_BATCH_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(process_call_group_in_thread, call_groups))
+        return results
+
+    def _process_call_group(self, database_id, requests_data, context):
+        results = []
+        if database_id is not None and len(requests_data) > 1:
+            try:
+                with shared_connection(database_id, context.request.user):
+                    for request_data in requests_data:
+                        results.append(self.process_single_request(request_data, context))
+            except Exception:
+                # We couldn't connect, or finish the transaction. Make the
+                # remaining calls on their own, so each reports its error.
+                pass
+        return results + [
+            self.process_single_request(request_data, context)
+            for request_data in requests_data[len(results):]
+        ]
@@ -1,7 +1,7 @@
 """
 Classes and functions exposed to the RPC endpoint for managing table columns.
 """
-from typing import Literal, Optional, TypedDict
+from typing import Any, Literal, Optional, TypedDict
 
 from modernrpc.core import REQUEST_KEY
 
@@ -10,13 +10,15 @@ from db.columns import (
     add_pkey_column_to_table,
     alter_columns_in_table,
     drop_columns_from_table,
-    get_column_info_for_table
+    get_column_info_for_table,
+    validate_column_cast,
 )
 from mathesar.rpc.columns.metadata import ColumnMetaDataBlob
 from mathesar.rpc.decorators import mathesar_rpc_method
 from mathesar.rpc.utils import connect
 from mathesar.utils.columns import get_columns_meta_data
 from mathesar.utils.download_links import reset_file_column_mash
+from mathesar.utils.retype_jobs import get_retype_job, start_retype_job
 from mathesar.utils.tables import set_table_meta_data
 
 
@@ -215,6 +217,86 @@ class ColumnInfo(TypedDict):
         )
 
 
+class CastFailure(TypedDict):
+    """
+    A value of a column which can't be cast to a new type.
+
+    Attributes:
+        key: The primary key value of the record containing the value.
+        value: The value, as text.
+        error: The error raised when casting the value.
+    """
+    key: Any
+    value: str
+    error: str
+
+
+class CastValidationResult(TypedDict):
+    """
+    The result of checking whether a column's values can be cast to a new type.
+
+    Attributes:
+        checked_count: The number of non-null values checked.
+        failure_count: The number of checked values which can't be cast.
+            Unless an exact count was requested, checking stops once
+            `max_failures` values have failed.
+        failures: The first failing values, in primary key order.
+        complete: Whether all values of the column were checked.
+    """
+    checked_count: int
+    failure_count: int
+    failures: list[CastFailure]
+    complete: bool
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            checked_count=d["checked_count"],
+            failure_count=d["failure_count"],
+            failures=[CastFailure(**f) for f in d["failures"]],
+            complete=d["complete"],
+        )
+
+
+class RetypeJobInfo(TypedDict):
+    """
+    Information about the progress of a column retype running in the background.
+
+    Attributes:
+        id: The Django id of the retype job.
+        status: One of `RUNNING`, `SUCCEEDED`, or `FAILED`.
+        table_oid: The OID of the table containing the column.
+        attnum: The attnum of the column being retyped.
+        rows_processed: The number of rows retyped so far.
+        total_rows: The estimated number of rows in the table.
+        new_attnum: The attnum of the column once the retype has succeeded.
+            The retyped column replaces the original one, so its attnum
+            changes.
+        error: The reason the retype failed, if it has.
+    """
+    id: int
+    status: Literal['RUNNING', 'SUCCEEDED', 'FAILED']
+    table_oid: int
+    attnum: int
+    rows_processed: int
+    total_rows: int
+    new_attnum: Optional[int]
+    error: Optional[str]
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(
+            id=model.id,
+            status=model.status,
+            table_oid=model.table_oid,
+            attnum=model.attnum,
+            rows_processed=model.rows_processed,
+            total_rows=model.total_rows,
+            new_attnum=model.result['attnum'] if model.result else None,
+            error=model.error,
+        )
+
+
 @mathesar_rpc_method(name="columns.list", auth="login")
 def list_(*, table_oid: int, database_id: int, **kwargs) -> list[ColumnInfo]:
     """
@@ -337,6 +419,122 @@ def patch(
         return alter_columns_in_table(table_oid, column_data_list, conn)
 
 
+@mathesar_rpc_method(name="columns.validate_cast", auth="login")
+def validate_cast(
+        *,
+        column_data: SettableColumnInfo,
+        table_oid: int,
+        database_id: int,
+        max_failures: int = 20,
+        sample_size: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        exact_count: bool = False,
+        **kwargs
+) -> CastValidationResult:
+    """
+    Check which values of a column can't be cast to a new type, without altering it.
+
+    Values are cast in the same way as by `columns.patch`, so this can
+    be used to find values that would make a type change fail, before
+    making it. Only tables with a single-column primary key are
+    supported.
+
+    For large tables, pass `sample_size` to only check the first values
+    (in primary key order), or `time_budget` to stop checking after some
+    time. Checking also stops once `max_failures` values have failed,
+    unless `exact_count` is passed. In each case, `complete` tells
+    whether all values were checked.
+
+    Args:
+        column_data: Describes the column and the type to check. Only its
+            `id`, `type`, `type_options`, and `cast_options` are used.
+        table_oid: Identity of the table containing the column.
+        database_id: The Django id of the database containing the table.
+        max_failures: The maximum number of failing values to return.
+        sample_size: The number of non-null values to check.
+        time_budget: The number of seconds after which to stop checking.
+        exact_count: Whether to keep checking after `max_failures` values
+            have failed, to count all failing values.
+
+    Returns:
+        The number of failing values, and the first of them.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    with connect(database_id, user) as conn:
+        result = validate_column_cast(
+            table_oid,
+            column_data,
+            conn,
+            max_failures=max_failures,
+            sample_size=sample_size,
+            time_budget=time_budget,
+            exact_count=exact_count,
+        )
+    return CastValidationResult.from_dict(result)
+
+
+@mathesar_rpc_method(name="columns.start_online_retype", auth="login")
+def start_online_retype(
+        *,
+        column_data: SettableColumnInfo,
+        table_oid: int,
+        database_id: int,
+        batch_size: int = 10000,
+        **kwargs
+) -> RetypeJobInfo:
+    """
+    Start changing the type of a column in the background, without blocking the table.
+
+    Unlike `columns.patch`, which blocks all reads and writes of the
+    table until every row is retyped, this retypes rows in batches, and
+    only blocks the table briefly at the end, to replace the column with
+    the retyped one. Use `columns.get_online_retype_progress` to find
+    out when the retype finishes.
+
+    While the retype runs, writes of values to the column which can't be
+    cast to the new type fail. The new values are kept in a hidden
+    column, which isn't listed with the table's columns or records.
+    Retypes interrupted by Mathesar restarting are marked as failed, and
+    cancelled, when their progress is next polled.
+
+    The column keeps its name, nullability, default, description and
+    metadata, but gets a new attnum. Only columns of tables with a
+    single-column primary key, and without indexes, constraints (other
+    than NOT NULL), or views depending on them, are supported.
+
+    Args:
+        column_data: Describes the column and its new type. Only its
+            `id`, `type`, `type_options`, and `cast_options` are used.
+        table_oid: Identity of the table containing the column.
+        database_id: The Django id of the database containing the table.
+        batch_size: The number of rows to retype in each transaction.
+
+    Returns:
+        The progress of the started retype.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    job = start_retype_job(
+        user, table_oid, column_data, database_id, batch_size=batch_size
+    )
+    return RetypeJobInfo.from_model(job)
+
+
+@mathesar_rpc_method(name="columns.get_online_retype_progress", auth="login")
+def get_online_retype_progress(*, retype_job_id: int, **kwargs) -> RetypeJobInfo:
+    """
+    Get the progress of a retype started with `columns.start_online_retype`.
+
+    Args:
+        retype_job_id: The Django id of the retype job.
+
+    Returns:
+        The progress of the retype, and the new attnum of the column once
+        it's done.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    return RetypeJobInfo.from_model(get_retype_job(retype_job_id, user))
+
+
 @mathesar_rpc_method(name="columns.delete", auth="login")
 def delete(
         *, column_attnums: list[int], table_oid: int, database_id: int, **kwargs
@@ -8,6 +8,7 @@ from modernrpc.core import REQUEST_KEY
 from db import links, tables
 from mathesar.rpc.decorators import mathesar_rpc_method
 from mathesar.rpc.utils import connect
+from mathesar.utils.tables import get_import_type_suggestions
 
 
 @mathesar_rpc_method(name="data_modeling.add_foreign_key_column", auth="login")
@@ -87,6 +88,9 @@ def suggest_types(*, table_oid: int, database_id: int, **kwargs) -> dict:
     Currently we only suggest different types for columns which originate
     as type `text`.
 
+    For tables whose import hasn't been verified yet, the types inferred
+    while importing are returned, without reading the table.
+
     Args:
         table_oid: The OID of the table whose columns we're inferring types for.
         database_id: The Django id of the database containing the table.
@@ -98,6 +102,9 @@ def suggest_types(*, table_oid: int, database_id: int, **kwargs) -> dict:
     """
     user = kwargs.get(REQUEST_KEY).user
     with connect(database_id, user) as conn:
+        import_type_suggestions = get_import_type_suggestions(table_oid, database_id)
+        if import_type_suggestions is not None:
+            return import_type_suggestions
         return tables.infer_table_column_data_types(conn, table_oid)
 
 
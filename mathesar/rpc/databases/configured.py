@@ -117,7 +117,7 @@ class DisconnectResult(TypedDict):
 def disconnect(
         *,
         database_id: int,
-        schemas_to_remove: list[str] = ['msar', '__msar', 'mathesar_types'],
+        schemas_to_remove: list[str] = ['msar', '__msar', 'mathesar_types', 'msar_summary_cache'],
         strict: bool = True,
         role_name: str = None,
         password: str = None,
@@ -168,6 +168,7 @@ def disconnect(
         # Connection is broken, skip SQL cleanup and just remove the database record
         sql_cleaned = False
 
+    database.close_connection_pools()
     database.delete()
     server_db_count = len(Database.objects.filter(server=database.server))
     if disconnect_db_server and server_db_count == 0:
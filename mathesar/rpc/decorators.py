@@ -10,8 +10,8 @@ from modernrpc.auth.basic import (
     http_basic_auth_superuser_required,
 )
 from mathesar.analytics import wire_analytics
-from mathesar.models import base as models, exceptions
 from mathesar.rpc.exceptions.handlers import handle_rpc_exceptions
+from mathesar.utils.connections import get_connection_params
 from mathesar.utils.download_links import maintain_download_links
 
 MAINTENANCE_DONE = "maintenance_done"
@@ -79,10 +79,7 @@ def ensure_db_authorization(f):
         user = kwargs.get(REQUEST_KEY).user
         if user.is_superuser:
             return f(*args, **kwargs)
-        database_id = kwargs[DATABASE_ID_KEY]
-        try:
-            models.UserDatabaseRoleMap.objects.get(database__id=database_id, user=user)
-        except models.UserDatabaseRoleMap.DoesNotExist:
-            raise exceptions.NoConnectionAvailable
+        # Raises NoConnectionAvailable if the user has no role configured.
+        get_connection_params(kwargs[DATABASE_ID_KEY], user)
         return f(*args, **kwargs)
     return wrapper
@@ -19,7 +19,7 @@ from mathesar.utils.forms import (
     get_form_source_info,
     submit_form,
 )
-from mathesar.utils.tables import get_table_record_summary_templates
+from mathesar.utils.record_summary_templates import get_record_summary_templates
 from mathesar.rpc.records import RecordSummaryList
 
 
@@ -403,7 +403,7 @@ def list_related_records(
             limit=limit,
             offset=offset,
             search=search,
-            table_record_summary_templates=get_table_record_summary_templates(database_id),
+            table_record_summary_templates=get_record_summary_templates(database_id, [table_oid]),
         )
     return RecordSummaryList.from_dict(record_info)
 
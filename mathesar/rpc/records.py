@@ -4,6 +4,7 @@ Classes and functions exposed to the RPC endpoint for managing table records.
 
 from typing import Any, Literal, Optional, TypedDict, Union
 
+from django.conf import settings
 from modernrpc.core import REQUEST_KEY
 
 from db.records import (
@@ -14,11 +15,16 @@ from db.records import (
     add_record_to_table,
     patch_record_in_table,
     list_by_record_summaries,
+    enable_record_summary_cache,
+    disable_record_summary_cache,
 )
 from mathesar.rpc.decorators import mathesar_rpc_method
 from mathesar.rpc.utils import connect
 from mathesar.utils.columns import get_columns_meta_data
-from mathesar.utils.tables import get_table_meta_data, get_table_record_summary_templates
+from mathesar.utils.record_summary_templates import (
+    get_linked_record_summary_templates, get_record_summary_templates
+)
+from mathesar.utils.tables import get_table_meta_data
 from mathesar.utils.download_links import get_download_links
 from mathesar.utils.user_display import (
     apply_track_editing_user,
@@ -187,7 +193,13 @@ class RecordList(TypedDict):
     given row, for the given column.
 
     Attributes:
-        count: The total number of records in the table.
+        count: The total number of records in the table. This is `null`
+            if the `count_mode` is `"none"`.
+        count_mode: The kind of count given: `"exact"`, `"estimated"`
+            (from table statistics or the query planner), or `"none"`.
+        next_cursor: When listing records with `use_cursor`, the cursor
+            to pass to get the following page. `null` on the last page,
+            and when not using cursors.
         results: An array of record objects.
         grouping: Information for displaying grouped records.
         linked_record_smmaries: Information for previewing foreign key
@@ -197,7 +209,9 @@ class RecordList(TypedDict):
             attachments.
     """
 
-    count: int
+    count: Optional[int]
+    count_mode: Literal["exact", "estimated", "none"]
+    next_cursor: Optional[str]
     results: list[dict]
     grouping: GroupingResponse
     linked_record_summaries: dict[str, dict[str, str]]
@@ -209,6 +223,8 @@ class RecordList(TypedDict):
     def from_dict(cls, d):
         return cls(
             count=d["count"],
+            count_mode=d.get("count_mode"),
+            next_cursor=d.get("next_cursor"),
             results=d["results"],
             grouping=d.get("grouping"),
             linked_record_summaries=d.get("linked_record_summaries"),
@@ -310,6 +326,9 @@ def list_(
         grouping: Grouping = None,
         joined_columns: list[dict] = None,
         return_record_summaries: bool = False,
+        count_mode: Literal["exact", "estimated", "none", "auto"] = "exact",
+        use_cursor: bool = False,
+        cursor: str = None,
         **kwargs
 ) -> RecordList:
     """
@@ -328,6 +347,22 @@ def list_(
             "join_path" represents linkages via a simple many-to-many mapping to a column in another table.
         return_record_summaries: Whether to return summaries of retrieved
             records.
+        count_mode: How to count the records matching the filter:
+            - `"exact"` (default): count them. This scans every matching
+              record, which can be slow for large tables.
+            - `"estimated"`: use the table statistics (when unfiltered)
+              or the query planner's estimate (when filtered).
+            - `"none"`: don't count records.
+            - `"auto"`: use the estimate when it's large (see the
+              `MATHESAR_COUNT_ESTIMATE_THRESHOLD` setting), and an exact
+              count otherwise.
+        use_cursor: Whether to return a `next_cursor` for keyset
+            pagination.
+        cursor: The `next_cursor` from the previous page. Rather than
+            skipping `offset` rows from the start, we seek directly to
+            the rows following that page, which stays fast deep into
+            large tables. It must be used with the same `order` as the
+            previous page. Implies `use_cursor`, and `offset` is ignored.
 
     Returns:
         The requested records, along with some metadata.
@@ -345,9 +380,13 @@ def list_(
             group=grouping,
             joined_columns=joined_columns,
             return_record_summaries=return_record_summaries,
-            table_record_summary_templates=get_table_record_summary_templates(
-                database_id
+            table_record_summary_templates=get_linked_record_summary_templates(
+                conn, database_id, table_oid, joined_columns
             ),
+            count_mode=count_mode,
+            count_estimate_threshold=settings.MATHESAR_COUNT_ESTIMATE_THRESHOLD,
+            use_cursor=use_cursor,
+            cursor=cursor,
         )
 
     record_info["download_links"] = get_download_links(
@@ -408,7 +447,9 @@ def get(
             joined_columns,
             return_record_summaries=return_record_summaries,
             table_record_summary_templates={
-                **get_table_record_summary_templates(database_id),
+                **get_linked_record_summary_templates(
+                    conn, database_id, table_oid, joined_columns
+                ),
                 **(table_record_summary_templates or {}),
             },
         )
@@ -469,8 +510,8 @@ def add(
             record_def,
             table_oid,
             return_record_summaries=return_record_summaries,
-            table_record_summary_templates=get_table_record_summary_templates(
-                database_id
+            table_record_summary_templates=get_linked_record_summary_templates(
+                conn, database_id, table_oid
             ),
         )
 
@@ -526,8 +567,8 @@ def patch(
             record_id,
             table_oid,
             return_record_summaries=return_record_summaries,
-            table_record_summary_templates=get_table_record_summary_templates(
-                database_id
+            table_record_summary_templates=get_linked_record_summary_templates(
+                conn, database_id, table_oid
             ),
         )
 
@@ -575,6 +616,7 @@ def search(
         limit: int = 10,
         offset: int = 0,
         return_record_summaries: bool = False,
+        count_mode: Literal["exact", "estimated", "none", "auto"] = "exact",
         **kwargs
 ) -> RecordList:
     """
@@ -596,6 +638,8 @@ def search(
             following rows.
         return_record_summaries: Whether to return summaries of retrieved
             records.
+        count_mode: How to count the records matching the search. See
+            `records.list` for the options.
 
     Returns:
         The requested records, along with some metadata.
@@ -610,9 +654,11 @@ def search(
             limit=limit,
             offset=offset,
             return_record_summaries=return_record_summaries,
-            table_record_summary_templates=get_table_record_summary_templates(
-                database_id
+            table_record_summary_templates=get_linked_record_summary_templates(
+                conn, database_id, table_oid
             ),
+            count_mode=count_mode,
+            count_estimate_threshold=settings.MATHESAR_COUNT_ESTIMATE_THRESHOLD,
         )
 
     record_info["download_links"] = get_download_links(
@@ -665,9 +711,52 @@ def list_summaries(
             limit=limit,
             offset=offset,
             search=search,
-            table_record_summary_templates=get_table_record_summary_templates(
-                database_id
+            table_record_summary_templates=get_record_summary_templates(
+                database_id, [table_oid]
             ),
             linked_record_path=linked_record_path,
         )
     return RecordSummaryList.from_dict(record_info)
+
+
+@mathesar_rpc_method(name="records.enable_summary_cache", auth="login")
+def enable_summary_cache(*, table_oid: int, database_id: int, **kwargs) -> None:
+    """
+    Cache the record summaries of a table, to speed up listing and searching them.
+
+    The cache is kept up to date as the records of the table, and of the
+    tables linked from its record summary template, change. Calling this
+    again rebuilds the cache, which is needed after changing the
+    template, or the foreign keys it follows. Until then, summaries are
+    rendered on the fly.
+
+    Only members of the role owning the table may cache its record
+    summaries, and only they read from the cache.
+
+    Args:
+        table_oid: Identity of the table in the user's database.
+        database_id: The Django id of the database containing the table.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    with connect(database_id, user) as conn:
+        enable_record_summary_cache(
+            conn,
+            table_oid,
+            table_record_summary_templates=get_record_summary_templates(
+                database_id, [table_oid]
+            ),
+        )
+
+
+@mathesar_rpc_method(name="records.disable_summary_cache", auth="login")
+def disable_summary_cache(*, table_oid: int, database_id: int, **kwargs) -> None:
+    """
+    Drop the record summary cache of a table, if it has one.
+
+    Args:
+        table_oid: Identity of the table in the user's database.
+        database_id: The Django id of the database containing the table.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    with connect(database_id, user) as conn:
+        disable_record_summary_cache(conn, table_oid)
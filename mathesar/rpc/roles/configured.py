@@ -80,6 +80,7 @@ def delete(*, configured_role_id: int, **kwargs):
         configured_role_id: The Django id of the ConfiguredRole model instance.
     """
     configured_role = ConfiguredRole.objects.get(id=configured_role_id)
+    configured_role.close_connection_pools()
     configured_role.delete()
 
 
@@ -98,5 +99,4 @@ def set_password(
         password: The password for the role.
     """
     configured_role = ConfiguredRole.objects.get(id=configured_role_id)
-    configured_role.password = password
-    configured_role.save()
+    configured_role.set_password(password)
@@ -2,6 +2,7 @@ from typing import TypedDict, Optional
 
 from modernrpc.core import REQUEST_KEY
 
+from db.connection import get_connection_pool_stats
 from mathesar.models.base import Server
 from mathesar.rpc.decorators import mathesar_rpc_method
 
@@ -31,6 +32,73 @@ class ConfiguredServerInfo(TypedDict):
         )
 
 
+class ConnectionPoolStats(TypedDict):
+    """
+    Information about a pool of connections to a user database.
+
+    Attributes:
+        host: The host of the database server.
+        port: The port of the database server.
+        dbname: The name of the database on the server.
+        user: The name of the role used by connections in the pool.
+        sslmode: SSL mode for the connections.
+        pool_min: The minimum number of connections kept in the pool.
+        pool_max: The maximum number of connections in the pool.
+        pool_size: The number of connections currently managed by the pool.
+        pool_available: The number of idle connections in the pool.
+        requests_waiting: The number of requests waiting for a connection.
+        requests_num: The number of connection requests served.
+        requests_queued: The number of requests that had to wait.
+        requests_wait_ms: The total time spent waiting for a connection.
+        requests_errors: The number of requests which failed (e.g., timeout).
+        connections_num: The number of connection attempts.
+        connections_ms: The total time spent establishing connections.
+        connections_errors: The number of failed connection attempts.
+        connections_lost: The number of connections found broken on check.
+    """
+    host: str
+    port: Optional[int]
+    dbname: str
+    user: str
+    sslmode: str
+    pool_min: int
+    pool_max: int
+    pool_size: int
+    pool_available: int
+    requests_waiting: int
+    requests_num: Optional[int]
+    requests_queued: Optional[int]
+    requests_wait_ms: Optional[int]
+    requests_errors: Optional[int]
+    connections_num: Optional[int]
+    connections_ms: Optional[int]
+    connections_errors: Optional[int]
+    connections_lost: Optional[int]
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            host=d["host"],
+            port=d["port"],
+            dbname=d["dbname"],
+            user=d["user"],
+            sslmode=d["sslmode"],
+            pool_min=d["pool_min"],
+            pool_max=d["pool_max"],
+            pool_size=d["pool_size"],
+            pool_available=d["pool_available"],
+            requests_waiting=d["requests_waiting"],
+            requests_num=d.get("requests_num"),
+            requests_queued=d.get("requests_queued"),
+            requests_wait_ms=d.get("requests_wait_ms"),
+            requests_errors=d.get("requests_errors"),
+            connections_num=d.get("connections_num"),
+            connections_ms=d.get("connections_ms"),
+            connections_errors=d.get("connections_errors"),
+            connections_lost=d.get("connections_lost"),
+        )
+
+
 class ConfiguredServerPatch(TypedDict):
     """
     Information to be changed about a server
@@ -77,6 +145,7 @@ def patch(*, server_id: int, patch: ConfiguredServerPatch, **kwargs) -> Configur
         An object describing the server.
     """
     server = Server.objects.get(id=server_id)
+    server.close_connection_pools()
     if "host" in patch:
         server.host = patch.get("host")
     if "port" in patch:
@@ -85,3 +154,18 @@ def patch(*, server_id: int, patch: ConfiguredServerPatch, **kwargs) -> Configur
         server.sslmode = patch.get("sslmode")
     server.save()
     return ConfiguredServerInfo.from_model(server)
+
+
+@mathesar_rpc_method(name="servers.configured.list_connection_pools")
+def list_connection_pools(**kwargs) -> list[ConnectionPoolStats]:
+    """
+    List the connection pools of this Mathesar process, with their stats.
+
+    Pools are created lazily, per server, database, role, and SSL mode,
+    and live in each worker process separately. So the stats describe
+    only the process that handles the request.
+
+    Returns:
+        A list of connection pool details.
+    """
+    return [ConnectionPoolStats.from_dict(s) for s in get_connection_pool_stats()]
@@ -12,9 +12,9 @@ from db.tables import (
     get_preview,
     get_table,
     get_table_info,
-    list_joinable_tables,
 )
 from mathesar.imports.datafile import copy_datafile_to_table
+from mathesar.imports.jobs import get_import_job, get_import_job_eta, start_import_job
 from mathesar.rpc.columns import (
     CreatablePkColumnInfo,
     CreatableColumnInfo,
@@ -25,6 +25,7 @@ from mathesar.rpc.constraints import CreatableConstraintInfo
 from mathesar.rpc.decorators import mathesar_rpc_method
 from mathesar.rpc.tables.metadata import TableMetaDataBlob
 from mathesar.rpc.utils import connect
+from mathesar.utils.joinable_tables import get_joinable_tables
 from mathesar.utils.tables import (
     list_tables_meta_data,
     get_table_meta_data,
@@ -89,6 +90,44 @@ class AddedTableInfo(TypedDict):
         )
 
 
+class ImportJobInfo(TypedDict):
+    """
+    Information about the progress of an import running in the background.
+
+    Attributes:
+        id: The Django id of the import job.
+        status: One of `RUNNING`, `SUCCEEDED`, or `FAILED`.
+        rows_processed: The number of rows imported so far.
+        bytes_processed: The number of bytes of the file read so far.
+        total_bytes: The size of the file being imported.
+        eta_seconds: The estimated number of seconds until the import
+            finishes, if there's enough progress to estimate it.
+        table: The table created by the import, once it's succeeded.
+        error: The reason the import failed, if it has.
+    """
+    id: int
+    status: Literal['RUNNING', 'SUCCEEDED', 'FAILED']
+    rows_processed: int
+    bytes_processed: int
+    total_bytes: int
+    eta_seconds: Optional[float]
+    table: Optional[AddedTableInfo]
+    error: Optional[str]
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(
+            id=model.id,
+            status=model.status,
+            rows_processed=model.rows_processed,
+            bytes_processed=model.bytes_processed,
+            total_bytes=model.total_bytes,
+            eta_seconds=get_import_job_eta(model),
+            table=AddedTableInfo.from_dict(model.result) if model.result else None,
+            error=model.error,
+        )
+
+
 class SettableTableInfo(TypedDict):
     """
     Information about a table, restricted to settable fields.
@@ -334,13 +373,64 @@ def import_(
 
     set_table_meta_data(
         import_result['oid'],
-        {'mathesar_added_pkey_attnum': import_result['pkey_column_attnum']},
+        {
+            'mathesar_added_pkey_attnum': import_result['pkey_column_attnum'],
+            'column_type_suggestions': import_result.get('column_type_suggestions'),
+        },
         database_id,
     )
 
     return AddedTableInfo.from_dict(import_result)
 
 
+@mathesar_rpc_method(name="tables.start_import", auth="login")
+def start_import(
+    *,
+    data_file_id: int,
+    schema_oid: int,
+    database_id: int,
+    table_name: Optional[str] = None,
+    comment: Optional[str] = None,
+    **kwargs
+) -> ImportJobInfo:
+    """
+    Start importing a CSV/TSV into a table, in the background.
+
+    Unlike `tables.import`, this returns right away. Use
+    `tables.get_import_progress` to find out when the import finishes.
+
+    Args:
+        data_file_id: The Django id of the DataFile containing desired CSV/TSV.
+        schema_oid: Identity of the schema in the user's database.
+        database_id: The Django id of the database containing the table.
+        table_name: Name of the table to be imported.
+        comment: The comment for the new table.
+
+    Returns:
+        The progress of the started import.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    job = start_import_job(
+        user, data_file_id, table_name, schema_oid, database_id, comment=comment
+    )
+    return ImportJobInfo.from_model(job)
+
+
+@mathesar_rpc_method(name="tables.get_import_progress", auth="login")
+def get_import_progress(*, import_job_id: int, **kwargs) -> ImportJobInfo:
+    """
+    Get the progress of an import started with `tables.start_import`.
+
+    Args:
+        import_job_id: The Django id of the import job.
+
+    Returns:
+        The progress of the import, and the created table once it's done.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    return ImportJobInfo.from_model(get_import_job(import_job_id, user))
+
+
 @mathesar_rpc_method(name="tables.get_import_preview", auth="login")
 def get_import_preview(
     *,
@@ -378,6 +468,8 @@ def list_joinable(
     """
     List details for joinable tables.
 
+    Results are cached until foreign keys, or the tables they link, change.
+
     Args:
         table_oid: Identity of the table to get joinable tables for.
         database_id: The Django id of the database containing the table.
@@ -388,7 +480,7 @@ def list_joinable(
     """
     user = kwargs.get(REQUEST_KEY).user
     with connect(database_id, user) as conn:
-        joinable_dict = list_joinable_tables(table_oid, conn, max_depth)
+        joinable_dict = get_joinable_tables(conn, database_id, table_oid, max_depth)
         return JoinableTableInfo.from_dict(joinable_dict)
 
 
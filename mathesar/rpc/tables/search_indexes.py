@@ -0,0 +1,106 @@
+"""
+Classes and functions exposed to the RPC endpoint for managing the
+indexes used by record searches.
+"""
+from typing import Optional, TypedDict
+
+from modernrpc.core import REQUEST_KEY
+
+from db.tables import (
+    list_search_indexes, add_search_indexes, drop_search_indexes
+)
+from mathesar.rpc.decorators import mathesar_rpc_method
+from mathesar.rpc.utils import connect
+
+
+class SearchIndexInfo(TypedDict):
+    """
+    Information about the search index of a column.
+
+    Attributes:
+        attnum: The attnum of a column searched by substring (i.e., a
+            string or uuid column).
+        index_name: The name of the column's trigram index, or `null` if
+            the column isn't indexed.
+        index_size: The size of the index in bytes, or `null` if the
+            column isn't indexed.
+    """
+    attnum: int
+    index_name: Optional[str]
+    index_size: Optional[int]
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            attnum=d["attnum"],
+            index_name=d["index_name"],
+            index_size=d["index_size"],
+        )
+
+
+@mathesar_rpc_method(name="tables.search_indexes.list", auth="login")
+def list_(*, table_oid: int, database_id: int, **kwargs) -> list[SearchIndexInfo]:
+    """
+    List the columns of a table searched by substring, and their indexes.
+
+    Args:
+        table_oid: The OID of the table whose search indexes we'll list.
+        database_id: The Django id of the database containing the table.
+
+    Returns:
+        A list of search index details, one per searchable column.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    with connect(database_id, user) as conn:
+        raw_index_list = list_search_indexes(table_oid, conn)
+    return [SearchIndexInfo.from_dict(i) for i in raw_index_list]
+
+
+@mathesar_rpc_method(name="tables.search_indexes.add", auth="login")
+def add(
+        *, table_oid: int, column_attnums: list[int], database_id: int, **kwargs
+) -> list[SearchIndexInfo]:
+    """
+    Add trigram indexes to columns, so `records.search` can use them.
+
+    Without an index, searching a column scans the whole table. The
+    `pg_trgm` extension is installed if necessary, which requires the
+    user's role to be able to create extensions on the database. Only
+    string and uuid columns can be indexed. Columns which already have a
+    search index are skipped.
+
+    Args:
+        table_oid: The OID of the table containing the columns.
+        column_attnums: The attnums of the columns to index.
+        database_id: The Django id of the database containing the table.
+
+    Returns:
+        The search index details of the table after the operation.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    with connect(database_id, user) as conn:
+        add_search_indexes(table_oid, column_attnums, conn)
+        raw_index_list = list_search_indexes(table_oid, conn)
+    return [SearchIndexInfo.from_dict(i) for i in raw_index_list]
+
+
+@mathesar_rpc_method(name="tables.search_indexes.delete", auth="login")
+def delete(
+        *, table_oid: int, column_attnums: list[int], database_id: int, **kwargs
+) -> list[SearchIndexInfo]:
+    """
+    Drop the search indexes of columns.
+
+    Args:
+        table_oid: The OID of the table containing the columns.
+        column_attnums: The attnums of the columns whose indexes we'll drop.
+        database_id: The Django id of the database containing the table.
+
+    Returns:
+        The search index details of the table after the operation.
+    """
+    user = kwargs.get(REQUEST_KEY).user
+    with connect(database_id, user) as conn:
+        drop_search_indexes(table_oid, column_attnums, conn)
+        raw_index_list = list_search_indexes(table_oid, conn)
+    return [SearchIndexInfo.from_dict(i) for i in raw_index_list]
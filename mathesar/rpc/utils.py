@@ -1,12 +1,65 @@
-from mathesar.models.base import Database
+from contextlib import contextmanager
+import threading
+
+from mathesar.models.base import user_database_connection
+from mathesar.utils.connections import get_connection_params
+
+_shared_connections = threading.local()
 
 
 def connect(database_id, user):
     """
     Get a psycopg database connection.
 
+    The connection parameters are resolved through a process-local cache,
+    so this doesn't hit the Django database for repeated calls.
+
+    Within a `shared_connection` block for the database, the shared
+    connection is returned instead, inside a savepoint.
+
     Args:
         database_id: The Django id of the Database used for connecting.
         user: A user model instance who'll connect to the database.
     """
-    return Database.objects.get(id=database_id).connect_user(user)
+    conn = _get_shared_connections().get(int(database_id))
+    if conn is not None:
+        return _savepoint(conn)
+    return user_database_connection(**get_connection_params(database_id, user))
+
+
+@contextmanager
+def shared_connection(database_id, user):
+    """
+    Share a connection, and a snapshot, between calls to `connect`.
+
+    Within the block, calls to `connect` for the database (from the same
+    thread) use a single connection, in a single REPEATABLE READ
+    transaction, so they all see the database in the same state. Each use
+    of the connection is wrapped in a savepoint, so that an error doesn't
+    affect the uses after it.
+
+    Args:
+        database_id: The Django id of the Database used for connecting.
+        user: A user model instance who'll connect to the database.
+    """
+    with connect(database_id, user) as conn:
+        with conn.transaction():
+            conn.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ')
+            shared_connections = _get_shared_connections()
+            shared_connections[int(database_id)] = conn
+            try:
+                yield conn
+            finally:
+                del shared_connections[int(database_id)]
+
+
+def _get_shared_connections():
+    if not hasattr(_shared_connections, 'by_database_id'):
+        _shared_connections.by_database_id = {}
+    return _shared_connections.by_database_id
+
+
+@contextmanager
+def _savepoint(conn):
+    with conn.transaction():
+        yield conn
@@ -0,0 +1,45 @@
+"""
+Signal receivers keeping Mathesar's process-local caches consistent with
+the models they're derived from.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mathesar.models.base import (
+    ConfiguredRole, Database, Server, TableMetaData, UserDatabaseRoleMap
+)
+from mathesar.utils.connections import invalidate_connection_params
+from mathesar.utils.joinable_tables import invalidate_joinable_tables
+from mathesar.utils.record_summary_templates import invalidate_record_summary_templates
+
+
+@receiver([post_save, post_delete], sender=Server)
+def invalidate_server_connection_params(sender, instance, **kwargs):
+    invalidate_connection_params(server_id=instance.id)
+
+
+@receiver([post_save, post_delete], sender=Database)
+def invalidate_database_connection_params(sender, instance, **kwargs):
+    invalidate_connection_params(database_id=instance.id)
+
+
+@receiver([post_save, post_delete], sender=Database)
+def invalidate_database_joinable_tables(sender, instance, **kwargs):
+    invalidate_joinable_tables(database_id=instance.id)
+
+
+@receiver([post_save, post_delete], sender=TableMetaData)
+def invalidate_table_record_summary_templates(sender, instance, **kwargs):
+    invalidate_record_summary_templates(database_id=instance.database_id)
+
+
+@receiver([post_save, post_delete], sender=ConfiguredRole)
+def invalidate_role_connection_params(sender, instance, **kwargs):
+    invalidate_connection_params(configured_role_id=instance.id)
+
+
+@receiver([post_save, post_delete], sender=UserDatabaseRoleMap)
+def invalidate_role_map_connection_params(sender, instance, **kwargs):
+    invalidate_connection_params(
+        database_id=instance.database_id, user_id=instance.user_id
+    )
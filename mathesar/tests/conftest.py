@@ -11,7 +11,7 @@ from django.test import Client as APIClient
 
 from db import connection
 from mathesar.models.users import User
-from mathesar.rpc.decorators import models
+from mathesar.rpc import decorators
 
 
 @pytest.fixture
@@ -50,8 +50,8 @@ def always_authorized():
     """
     Bypass endpoint db authorization check while testing.
     """
-    with patch.object(models.UserDatabaseRoleMap.objects, "get") as mock:
-        mock.return_value = object()
+    with patch.object(decorators, "get_connection_params") as mock:
+        mock.return_value = {}
         yield mock
 
 
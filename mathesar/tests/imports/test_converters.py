@@ -0,0 +1,55 @@
+from decimal import Decimal
+import uuid
+
+import pytest
+
+from mathesar.imports import converters
+
+convert_test_list = [
+    ('text', ' a ', ' a '),
+    ('integer', ' -12 ', -12),
+    ('bigint', '9223372036854775807', 9223372036854775807),
+    ('boolean', 'YES', True),
+    ('boolean', 'off', False),
+    ('double precision', '1.5e3', 1500.0),
+    ('numeric', '1,234.5', Decimal('1234.5')),
+    ('numeric', '-1.234.567,8', Decimal('-1234567.8')),
+    ('uuid', '{A0EEBC99-9C0B-4EF8-BB6D-6BB9BD380A11}', uuid.UUID('a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11')),
+]
+
+
+@pytest.mark.parametrize('type_name,value,expect', convert_test_list)
+def test_convert(type_name, value, expect):
+    assert converters.get_converter(type_name)(value) == expect
+
+
+unconvertible_test_list = [
+    ('smallint', '32768'),
+    ('integer', '1.0'),
+    ('boolean', 'maybe'),
+    ('double precision', 'NaN'),
+    ('double precision', '1e400'),
+    ('numeric', '1.234'),
+    ('numeric', '123\n'),
+    ('integer', '12\xa0'),
+    ('double precision', '1.5\u2003'),
+    ('uuid', '{a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11'),
+]
+
+
+@pytest.mark.parametrize('type_name,value', unconvertible_test_list)
+def test_convert_unconvertible(type_name, value):
+    with pytest.raises(converters.UnconvertibleValueError):
+        converters.get_converter(type_name)(value)
+
+
+def test_get_row_converter():
+    convert_row = converters.get_row_converter([2, 0], ['integer', 'text'])
+    assert convert_row(['a', 'b', '3']) == [3, 'a']
+    assert convert_row([None, 'b', None]) == [None, None]
+    with pytest.raises(converters.UnconvertibleValueError):
+        convert_row(['a'])
+
+
+def test_get_row_converter_unknown_type():
+    assert converters.get_row_converter([0, 1], ['integer', 'mathesar_types.email']) is None
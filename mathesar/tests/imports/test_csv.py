@@ -1,7 +1,9 @@
+import io
+
 import pytest
 
 from mathesar.errors import InvalidTableError
-from mathesar.utils.csv import get_sv_dialect
+from mathesar.utils.csv import get_file_encoding, get_sv_dialect
 
 
 get_dialect_test_list = [
@@ -34,3 +36,67 @@ def test_sv_get_dialect_exceptions(file):
     with pytest.raises(InvalidTableError):
         with open(file, "r") as sv_file:
             get_sv_dialect(sv_file)
+
+
+def test_get_file_encoding_samples_large_files(monkeypatch):
+    from mathesar.utils import csv as csv_utils
+    read_sizes = []
+
+    class TrackedBytesIO(io.BytesIO):
+        def read(self, size=-1):
+            read_sizes.append(size)
+            return super().read(size)
+
+    monkeypatch.setattr(csv_utils, 'ENCODING_SCAN_CHUNK_SIZE', 4096)
+    file = TrackedBytesIO(
+        ('id,name,city\n' + ''.join(
+            f'{i},José Müller,Zürich Straße {i}\n' for i in range(100000)
+        )).encode()
+    )
+    assert get_file_encoding(file) == 'utf-8'
+    assert file.tell() == 0
+    assert -1 not in read_sizes
+
+
+def test_get_file_encoding_ascii_prefix():
+    file = io.BytesIO(b'id,name\n' * 100000 + 'é,ü\n'.encode())
+    assert get_file_encoding(file) == 'utf-8'
+    assert file.tell() == 0
+
+
+def test_get_file_encoding_ascii_sample_of_cp1252_file(monkeypatch):
+    from mathesar.utils import csv as csv_utils
+    monkeypatch.setattr(csv_utils, 'ENCODING_SAMPLE_WINDOWS', 0)
+    monkeypatch.setattr(csv_utils, 'ENCODING_SCAN_CHUNK_SIZE', 4096)
+    file = io.BytesIO(
+        b'id,name\n' * 100000
+        + ''.join(f'{i},José Müller à Zürich\n' for i in range(100)).encode('cp1252')
+    )
+    encoding = get_file_encoding(file)
+    assert encoding != 'utf-8'
+    assert file.tell() == 0
+    # The guessed single-byte encoding may differ from cp1252, but must
+    # decode the whole file.
+    file.read().decode(encoding)
+
+
+def test_get_file_encoding_small_file():
+    file = io.BytesIO('名前,値\n一,二\n'.encode('utf-16'))
+    assert get_file_encoding(file) == 'UTF-16'
+
+
+def test_get_file_encoding_prefers_utf8_to_doubtful_guess(monkeypatch):
+    import charset_normalizer
+    monkeypatch.setattr(
+        charset_normalizer, 'detect',
+        lambda sample: {'encoding': 'cp1252', 'confidence': 0.5},
+    )
+    assert get_file_encoding(io.BytesIO('a,ü\n'.encode())) == 'utf-8'
+    assert get_file_encoding(io.BytesIO('a,ü\n'.encode('cp1252'))) == 'cp1252'
+
+
+def test_scan_for_encoding():
+    from mathesar.utils.csv import _scan_for_encoding
+    file = io.BytesIO('a,ü\n'.encode('cp1252') * 10)
+    assert _scan_for_encoding(file, ['utf-8', None, 'cp1252']) == 'cp1252'
+    assert _scan_for_encoding(file, ['utf-8', 'ascii']) is None
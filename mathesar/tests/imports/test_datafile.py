@@ -0,0 +1,24 @@
+import pytest
+
+from mathesar.imports import datafile
+
+
+def test_read_rows_in_background(monkeypatch):
+    monkeypatch.setattr(datafile, 'IMPORT_BATCH_SIZE', 3)
+    progress = []
+    rows = datafile._read_rows_in_background(
+        iter([[i] for i in range(7)]),
+        lambda: 100,
+        lambda rows_read, bytes_read: progress.append((rows_read, bytes_read)),
+    )
+    assert list(rows) == [[i] for i in range(7)]
+    assert progress == [(3, 100), (6, 100), (7, 100)]
+
+
+def test_read_rows_in_background_raises_parsing_errors():
+    def bad_rows():
+        yield ['a']
+        raise ValueError('bad row')
+
+    with pytest.raises(ValueError, match='bad row'):
+        list(datafile._read_rows_in_background(bad_rows(), lambda: 0))
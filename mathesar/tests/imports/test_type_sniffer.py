@@ -0,0 +1,64 @@
+from mathesar.imports.type_sniffer import ColumnTypeSniffer, TYPE_INFERENCE_SEQUENCE
+
+
+def test_sniff_passes_rows_through():
+    rows = [['1', 'a'], ['2', None]]
+    sniffer = ColumnTypeSniffer(2)
+    assert list(sniffer.sniff(iter(rows))) == rows
+    assert sniffer.row_count == 2
+
+
+def test_sniff_candidates():
+    rows = [
+        ['yes', '1', '{"a": 1}', 'A0EEBC99-9C0B-4EF8-BB6D-6BB9BD380A11', 'x'],
+        ['No', '0', '{}', '{a0eebc999c0b4ef8bb6d6bb9bd380a12}', None],
+        [None, '12', None, None, None],
+    ]
+    sniffer = ColumnTypeSniffer(5)
+    list(sniffer.sniff(rows))
+    samples = sniffer.get_column_samples()
+    assert samples[0]['candidates'] == [
+        t for t in TYPE_INFERENCE_SEQUENCE
+        if t not in ('uuid', 'mathesar_types.mathesar_json_array', 'mathesar_types.mathesar_json_object')
+    ]
+    assert 'boolean' not in samples[1]['candidates']
+    assert 'mathesar_types.mathesar_json_array' not in samples[2]['candidates']
+    assert 'mathesar_types.mathesar_json_object' in samples[2]['candidates']
+    assert 'uuid' in samples[3]['candidates']
+    assert 'uuid' not in samples[4]['candidates']
+
+
+def test_sniff_deeply_nested_json():
+    sniffer = ColumnTypeSniffer(1)
+    list(sniffer.sniff([['[' * 1500 + ']' * 1500]]))
+    candidates = sniffer.get_column_samples()[0]['candidates']
+    assert 'mathesar_types.mathesar_json_array' in candidates
+    assert 'mathesar_types.mathesar_json_object' not in candidates
+
+
+def test_sniff_values_are_distinct_and_bounded():
+    sniffer = ColumnTypeSniffer(1, max_values=2)
+    list(sniffer.sniff([['a'], ['a'], [None], ['b'], ['c'], ['t']]))
+    assert sniffer.get_column_samples()[0]['values'] == ['a', 'b']
+    # Values past the limit are still checked against the candidates.
+    assert 'boolean' not in sniffer.get_column_samples()[0]['candidates']
+
+
+def test_sniff_stats():
+    rows = [['1,234.5', None], ['1.000.000', None], ['7', 'x'], [None, None]]
+    sniffer = ColumnTypeSniffer(2)
+    list(sniffer.sniff(rows))
+    stats = sniffer.get_column_stats()
+    assert stats[0]['null_ratio'] == 0.25
+    assert stats[0]['group_seps'] == [',', '.']
+    assert stats[0]['decimal_ps'] == ['.']
+    assert stats[1]['null_ratio'] == 0.75
+    assert stats[1]['group_seps'] == []
+
+
+def test_sniff_samples_include_stats():
+    sniffer = ColumnTypeSniffer(1)
+    list(sniffer.sniff([['1,5'], [None]]))
+    assert sniffer.get_column_samples()[0]['stats'] == {
+        'null_ratio': 0.5, 'group_seps': [], 'decimal_ps': [',']
+    }
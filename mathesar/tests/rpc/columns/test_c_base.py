@@ -8,8 +8,10 @@ Fixtures:
 """
 import json
 from contextlib import contextmanager
+from datetime import timedelta
 
 from mathesar.rpc import columns
+from mathesar.models.base import RetypeJob
 from mathesar.models.users import User
 
 
@@ -227,3 +229,119 @@ def test_add_primary_key_column(rf, monkeypatch, mocked_exec_msar_func):
     assert call_args[3] == "IDENTITY"
     assert call_args[4] is True
     assert call_args[5] == 'Identity'
+
+
+def test_columns_validate_cast(rf, monkeypatch, mocked_exec_msar_func):
+    request = rf.post('/api/rpc/v0/', data={})
+    request.user = User(username='alice', password='pass1234')
+    table_oid = 23457
+    database_id = 2
+    column_data = {
+        "id": 3,
+        "type": "numeric",
+        "type_options": {"precision": 8},
+        "cast_options": {"group_sep": ",", "decimal_p": "."},
+    }
+
+    @contextmanager
+    def mock_connect(_database_id, user):
+        if _database_id == 2 and user.username == 'alice':
+            try:
+                yield True
+            finally:
+                pass
+        else:
+            raise AssertionError('incorrect parameters passed')
+
+    monkeypatch.setattr(columns.base, 'connect', mock_connect)
+    expect_result = {
+        "checked_count": 10000,
+        "failure_count": 1,
+        "failures": [{"key": 7, "value": "abc", "error": "invalid input syntax"}],
+        "complete": False,
+    }
+    mocked_exec_msar_func.fetchone.return_value = [expect_result]
+    actual_result = columns.validate_cast(
+        column_data=column_data,
+        table_oid=table_oid,
+        database_id=database_id,
+        sample_size=10000,
+        time_budget=2.5,
+        request=request
+    )
+    call_args = mocked_exec_msar_func.call_args_list[0][0]
+    assert actual_result == expect_result
+    assert call_args[1] == 'validate_column_cast'
+    assert call_args[2] == table_oid
+    assert call_args[3] == 3
+    assert call_args[4] == json.dumps({"name": "numeric", "options": {"precision": 8}})
+    assert call_args[5] == json.dumps({"group_sep": ",", "decimal_p": "."})
+    assert call_args[6] == 20  # max_failures
+    assert call_args[7] == 10000  # sample_size
+    assert call_args[8] == timedelta(seconds=2.5)  # time_budget
+    assert call_args[9] is False  # exact_count
+
+
+def test_columns_start_online_retype(rf, monkeypatch):
+    request = rf.post('/api/rpc/v0/', data={})
+    request.user = User(username='alice', password='pass1234')
+    column_data = {"id": 3, "type": "numeric"}
+
+    def mock_start_retype_job(user, table_oid, _column_data, database_id, batch_size):
+        if (
+            user != request.user
+            or table_oid != 23457
+            or _column_data != column_data
+            or database_id != 2
+            or batch_size != 500
+        ):
+            raise AssertionError('incorrect parameters passed')
+        return RetypeJob(id=5, table_oid=table_oid, attnum=3, total_rows=1000)
+    monkeypatch.setattr(columns.base, 'start_retype_job', mock_start_retype_job)
+    retype_job_info = columns.start_online_retype(
+        column_data=column_data,
+        table_oid=23457,
+        database_id=2,
+        batch_size=500,
+        request=request
+    )
+    assert retype_job_info == {
+        "id": 5,
+        "status": "RUNNING",
+        "table_oid": 23457,
+        "attnum": 3,
+        "rows_processed": 0,
+        "total_rows": 1000,
+        "new_attnum": None,
+        "error": None,
+    }
+
+
+def test_columns_get_online_retype_progress(rf, monkeypatch):
+    request = rf.post('/api/rpc/v0/', data={})
+    request.user = User(username='alice', password='pass1234')
+    jobs = {
+        5: RetypeJob(id=5, table_oid=23457, attnum=3, rows_processed=400, total_rows=1000),
+        6: RetypeJob(
+            id=6,
+            status='SUCCEEDED',
+            table_oid=23457,
+            attnum=3,
+            rows_processed=1000,
+            total_rows=1000,
+            result={"attnum": 9},
+        ),
+    }
+
+    def mock_get_retype_job(retype_job_id, user):
+        if user != request.user:
+            raise AssertionError('incorrect parameters passed')
+        return jobs[retype_job_id]
+    monkeypatch.setattr(columns.base, 'get_retype_job', mock_get_retype_job)
+    running_info = columns.get_online_retype_progress(retype_job_id=5, request=request)
+    assert running_info["status"] == "RUNNING"
+    assert running_info["rows_processed"] == 400
+    assert running_info["new_attnum"] is None
+    succeeded_info = columns.get_online_retype_progress(retype_job_id=6, request=request)
+    assert succeeded_info["status"] == "SUCCEEDED"
+    assert succeeded_info["new_attnum"] == 9
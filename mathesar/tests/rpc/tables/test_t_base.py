@@ -7,11 +7,14 @@ Fixtures:
     mocked_exec_msar_func(mathesar/tests/conftest.py): Lets you patch the exec_msar_func() for testing.
 """
 import json
+from datetime import datetime, timedelta
 from decimal import Decimal
 from contextlib import contextmanager
 
 from mathesar.rpc import tables
+from mathesar.models.base import ImportJob
 from mathesar.models.users import User
+from mathesar.utils.joinable_tables import invalidate_joinable_tables
 
 
 def test_tables_list(rf, monkeypatch, mocked_exec_msar_func):
@@ -206,7 +209,10 @@ def test_tables_import(rf, monkeypatch):
 
     def mock_set_meta_data(table_oid, metadata, _database_id):
         assert table_oid == 1964474
-        assert metadata == {"mathesar_added_pkey_attnum": 1}
+        assert metadata == {
+            "mathesar_added_pkey_attnum": 1,
+            "column_type_suggestions": {"1": {"type": "integer"}, "2": {"type": "boolean"}},
+        }
         assert _database_id == 11
 
     def mock_table_import(_user, _data_file_id, table_name, _schema_oid, conn, comment):
@@ -216,7 +222,12 @@ def test_tables_import(rf, monkeypatch):
             and _data_file_id != data_file_id
         ):
             raise AssertionError('incorrect parameters passed')
-        return {"oid": 1964474, "name": "imported_table", "pkey_column_attnum": 1}
+        return {
+            "oid": 1964474,
+            "name": "imported_table",
+            "pkey_column_attnum": 1,
+            "column_type_suggestions": {"1": {"type": "integer"}, "2": {"type": "boolean"}},
+        }
     monkeypatch.setattr(tables.base, 'connect', mock_connect)
     monkeypatch.setattr(tables.base, 'set_table_meta_data', mock_set_meta_data)
     monkeypatch.setattr(tables.base, 'copy_datafile_to_table', mock_table_import)
@@ -232,6 +243,79 @@ def test_tables_import(rf, monkeypatch):
     }
 
 
+def test_tables_start_import(rf, monkeypatch):
+    request = rf.post('/api/rpc/v0', data={})
+    request.user = User(username='alice', password='pass1234')
+
+    def mock_start_import_job(user, data_file_id, table_name, schema_oid, database_id, comment):
+        if (
+            user != request.user
+            or data_file_id != 10
+            or table_name != 'imported_table'
+            or schema_oid != 2200
+            or database_id != 11
+        ):
+            raise AssertionError('incorrect parameters passed')
+        return ImportJob(id=3, total_bytes=1000)
+    monkeypatch.setattr(tables.base, 'start_import_job', mock_start_import_job)
+    import_job_info = tables.start_import(
+        data_file_id=10,
+        table_name='imported_table',
+        schema_oid=2200,
+        database_id=11,
+        request=request
+    )
+    assert import_job_info == {
+        "id": 3,
+        "status": "RUNNING",
+        "rows_processed": 0,
+        "bytes_processed": 0,
+        "total_bytes": 1000,
+        "eta_seconds": None,
+        "table": None,
+        "error": None,
+    }
+
+
+def test_tables_get_import_progress(rf, monkeypatch):
+    request = rf.post('/api/rpc/v0', data={})
+    request.user = User(username='alice', password='pass1234')
+    started = datetime(2025, 1, 1)
+    jobs = {
+        3: ImportJob(
+            id=3,
+            rows_processed=500,
+            bytes_processed=250,
+            total_bytes=1000,
+            created_at=started,
+            updated_at=started + timedelta(seconds=10),
+        ),
+        4: ImportJob(
+            id=4,
+            status='SUCCEEDED',
+            rows_processed=2000,
+            bytes_processed=1000,
+            total_bytes=1000,
+            result={"oid": 1964474, "name": "imported_table", "renamed_columns": None},
+        ),
+    }
+
+    def mock_get_import_job(import_job_id, user):
+        if user != request.user:
+            raise AssertionError('incorrect parameters passed')
+        return jobs[import_job_id]
+    monkeypatch.setattr(tables.base, 'get_import_job', mock_get_import_job)
+    running_info = tables.get_import_progress(import_job_id=3, request=request)
+    assert running_info["status"] == "RUNNING"
+    assert running_info["eta_seconds"] == 30
+    assert running_info["table"] is None
+    succeeded_info = tables.get_import_progress(import_job_id=4, request=request)
+    assert succeeded_info["eta_seconds"] == 0
+    assert succeeded_info["table"] == {
+        "oid": 1964474, "name": "imported_table", "renamed_columns": None
+    }
+
+
 def test_tables_preview(rf, monkeypatch, mocked_exec_msar_func):
     request = rf.post('/api/rpc/v0', data={})
     request.user = User(username='alice', password='pass1234')
@@ -330,9 +414,14 @@ def test_list_joinable(rf, monkeypatch, mocked_exec_msar_func):
         }
     }
     monkeypatch.setattr(tables.base, 'connect', mock_connect)
+    invalidate_joinable_tables()
     mocked_exec_msar_func.fetchone.return_value = [expected_dict]
     actual_dict = tables.list_joinable(table_oid=2254329, database_id=11, max_depth=1, request=request)
-    call_args = mocked_exec_msar_func.call_args_list[0][0]
+    fingerprint_call_args = mocked_exec_msar_func.call_args_list[0][0]
+    call_args = mocked_exec_msar_func.call_args_list[1][0]
+    invalidate_joinable_tables()
     assert expected_dict == actual_dict
+    assert fingerprint_call_args[1] == 'get_joinable_tables_fingerprint'
+    assert call_args[1] == 'get_joinable_tables'
     assert call_args[2] == 1
     assert call_args[3] == table_oid
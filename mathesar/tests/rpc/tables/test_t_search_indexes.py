@@ -0,0 +1,82 @@
+"""
+This file tests the table search index RPC functions.
+
+Fixtures:
+    rf(pytest-django): Provides mocked `Request` objects.
+    monkeypatch(pytest): Lets you monkeypatch an object for testing.
+    mocked_exec_msar_func(mathesar/tests/conftest.py): Lets you patch the exec_msar_func() for testing.
+"""
+from contextlib import contextmanager
+
+from mathesar.rpc.tables import search_indexes
+from mathesar.models.users import User
+
+_username = 'alice'
+_password = 'pass1234'
+_database_id = 2
+_table_oid = 123456
+_search_index_list = [
+    {"attnum": 2, "index_name": "atable_col2_idx", "index_size": 16384},
+    {"attnum": 3, "index_name": None, "index_size": None},
+]
+
+
+@contextmanager
+def mock_connect(database_id, user):
+    if database_id == _database_id and user.username == _username:
+        try:
+            yield True
+        finally:
+            pass
+    else:
+        raise AssertionError('incorrect parameters passed')
+
+
+def _make_request(rf):
+    request = rf.post('/api/rpc/v0/', data={})
+    request.user = User(username=_username, password=_password)
+    return request
+
+
+def test_search_indexes_list(rf, monkeypatch, mocked_exec_msar_func):
+    monkeypatch.setattr(search_indexes, 'connect', mock_connect)
+    mocked_exec_msar_func.fetchone.return_value = [_search_index_list]
+    actual_response = search_indexes.list_(
+        table_oid=_table_oid, database_id=_database_id, request=_make_request(rf)
+    )
+    call_args = mocked_exec_msar_func.call_args_list[0][0]
+    assert actual_response == _search_index_list
+    assert call_args[1] == 'list_search_indexes'
+    assert call_args[2] == _table_oid
+
+
+def test_search_indexes_add(rf, monkeypatch, mocked_exec_msar_func):
+    monkeypatch.setattr(search_indexes, 'connect', mock_connect)
+    mocked_exec_msar_func.fetchone.return_value = [_search_index_list]
+    actual_response = search_indexes.add(
+        table_oid=_table_oid,
+        column_attnums=[2],
+        database_id=_database_id,
+        request=_make_request(rf),
+    )
+    add_call_args = mocked_exec_msar_func.call_args_list[0][0]
+    assert actual_response == _search_index_list
+    assert add_call_args[1] == 'add_search_indexes'
+    assert add_call_args[2] == _table_oid
+    assert add_call_args[3] == [2]
+    assert mocked_exec_msar_func.call_args_list[1][0][1] == 'list_search_indexes'
+
+
+def test_search_indexes_delete(rf, monkeypatch, mocked_exec_msar_func):
+    monkeypatch.setattr(search_indexes, 'connect', mock_connect)
+    mocked_exec_msar_func.fetchone.return_value = [_search_index_list]
+    actual_response = search_indexes.delete(
+        table_oid=_table_oid,
+        column_attnums=[2, 3],
+        database_id=_database_id,
+        request=_make_request(rf),
+    )
+    drop_call_args = mocked_exec_msar_func.call_args_list[0][0]
+    assert actual_response == _search_index_list
+    assert drop_call_args[1] == 'drop_search_indexes'
+    assert drop_call_args[3] == [2, 3]
@@ -0,0 +1,98 @@
+"""
+This file tests the processing of JSON-RPC batches.
+
+Fixtures:
+    monkeypatch(pytest): Lets you monkeypatch an object for testing.
+"""
+from contextlib import contextmanager
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from modernrpc.handlers.jsonhandler import JsonSuccessResult
+
+from mathesar.rpc import batch
+
+
+@pytest.mark.parametrize('method_name,expect_read_only', [
+    ('records.list', True),
+    ('tables.get_with_metadata', True),
+    ('columns.list_with_metadata', True),
+    ('records.search', True),
+    ('records.add', False),
+    ('tables.metadata.set', False),
+    ('databases.privileges.replace_for_roles', False),
+    (None, False),
+])
+def test_is_read_only_method(method_name, expect_read_only):
+    assert batch.is_read_only_method(method_name) is expect_read_only
+
+
+@pytest.fixture
+def mocked_handler(monkeypatch):
+    handler = batch.MathesarJSONRPCHandler(entry_point='test')
+    active = threading.local()
+    handler.shared_connections = []
+    handler.calls = []
+
+    @contextmanager
+    def mock_shared_connection(database_id, user):
+        handler.shared_connections.append(database_id)
+        active.database_id = database_id
+        try:
+            yield
+        finally:
+            active.database_id = None
+
+    def mock_process_single_request(request_data, context):
+        handler.calls.append(
+            (request_data['id'], getattr(active, 'database_id', None))
+        )
+        result = JsonSuccessResult(request_data['method'])
+        result.set_jsonrpc_data(request_id=request_data['id'], version='2.0')
+        return result
+
+    monkeypatch.setattr(batch, 'shared_connection', mock_shared_connection)
+    monkeypatch.setattr(handler, 'process_single_request', mock_process_single_request)
+    return handler
+
+
+def _make_request(request_id, method, **params):
+    return {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+
+
+def test_read_only_batch_shares_connections(mocked_handler):
+    request_body = json.dumps([
+        _make_request(1, 'records.list', database_id=1, table_oid=2),
+        _make_request(2, 'schemas.list', database_id=2),
+        _make_request(3, 'tables.get_with_metadata', database_id=1, table_oid=3),
+        _make_request(4, 'databases.configured.list'),
+    ])
+    response = json.loads(mocked_handler.process_request(request_body, MagicMock()))
+    assert [r['id'] for r in response] == [1, 2, 3, 4]
+    assert [r['result'] for r in response] == [
+        'records.list', 'schemas.list', 'tables.get_with_metadata', 'databases.configured.list'
+    ]
+    # Only calls on the same database share a connection.
+    assert mocked_handler.shared_connections == [1]
+    assert sorted(mocked_handler.calls) == [(1, 1), (2, None), (3, 1), (4, None)]
+
+
+def test_batch_with_writes_is_sequential(mocked_handler):
+    request_body = json.dumps([
+        _make_request(1, 'records.add', database_id=1, table_oid=2, record_def={}),
+        _make_request(2, 'records.list', database_id=1, table_oid=2),
+        _make_request(3, 'records.get', database_id=1, table_oid=2, record_id=1),
+    ])
+    response = json.loads(mocked_handler.process_request(request_body, MagicMock()))
+    assert [r['id'] for r in response] == [1, 2, 3]
+    assert mocked_handler.shared_connections == []
+    assert mocked_handler.calls == [(1, None), (2, None), (3, None)]
+
+
+def test_single_request_is_not_batched(mocked_handler):
+    request_body = json.dumps(_make_request(1, 'records.list', database_id=1, table_oid=2))
+    response = json.loads(mocked_handler.process_request(request_body, MagicMock()))
+    assert response['result'] == 'records.list'
+    assert mocked_handler.shared_connections == []
@@ -104,6 +104,9 @@ def test_suggest_types(rf, monkeypatch, mocked_exec_msar_func):
             raise AssertionError('incorrect parameters passed')
 
     monkeypatch.setattr(data_modeling, 'connect', mock_connect)
+    monkeypatch.setattr(
+        data_modeling, 'get_import_type_suggestions', lambda *args: None
+    )
     data_modeling.suggest_types(
         table_oid=_table_oid,
         database_id=_database_id,
@@ -113,6 +116,43 @@ def test_suggest_types(rf, monkeypatch, mocked_exec_msar_func):
     assert call_args[2] == _table_oid
 
 
+def test_suggest_types_after_import(rf, monkeypatch, mocked_exec_msar_func):
+    _username = 'alice'
+    _password = 'pass1234'
+    _table_oid = 12345
+    _database_id = 2
+    _suggestions = {'1': {'type': 'integer'}, '2': {'type': 'boolean'}}
+    request = rf.post('/api/rpc/v0/', data={})
+    request.user = User(username=_username, password=_password)
+
+    @contextmanager
+    def mock_connect(database_id, user):
+        if database_id == _database_id and user.username == _username:
+            try:
+                yield True
+            finally:
+                pass
+        else:
+            raise AssertionError('incorrect parameters passed')
+
+    def mock_get_import_type_suggestions(table_oid, database_id):
+        if table_oid != _table_oid or database_id != _database_id:
+            raise AssertionError('incorrect parameters passed')
+        return _suggestions
+
+    monkeypatch.setattr(data_modeling, 'connect', mock_connect)
+    monkeypatch.setattr(
+        data_modeling, 'get_import_type_suggestions', mock_get_import_type_suggestions
+    )
+    result = data_modeling.suggest_types(
+        table_oid=_table_oid,
+        database_id=_database_id,
+        request=request,
+    )
+    assert result == _suggestions
+    mocked_exec_msar_func.assert_not_called()
+
+
 def test_split_table(rf, monkeypatch, mocked_exec_msar_func):
     _username = 'alice'
     _password = 'pass1234'
@@ -85,6 +85,11 @@ METHODS = [
         "columns.delete",
         [user_is_authenticated]
     ),
+    (
+        columns.get_online_retype_progress,
+        "columns.get_online_retype_progress",
+        [user_is_authenticated]
+    ),
     (
         columns.list_,
         "columns.list",
@@ -105,6 +110,16 @@ METHODS = [
         "columns.reset_mash",
         [user_is_superuser]
     ),
+    (
+        columns.start_online_retype,
+        "columns.start_online_retype",
+        [user_is_authenticated]
+    ),
+    (
+        columns.validate_cast,
+        "columns.validate_cast",
+        [user_is_authenticated]
+    ),
 
     (
         columns.metadata.list_,
@@ -339,6 +354,16 @@ METHODS = [
         "records.list_summaries",
         [user_is_authenticated]
     ),
+    (
+        records.enable_summary_cache,
+        "records.enable_summary_cache",
+        [user_is_authenticated]
+    ),
+    (
+        records.disable_summary_cache,
+        "records.disable_summary_cache",
+        [user_is_authenticated]
+    ),
     (
         roles.list_,
         "roles.list",
@@ -433,6 +458,11 @@ METHODS = [
         "servers.configured.list",
         [user_is_authenticated]
     ),
+    (
+        servers.configured.list_connection_pools,
+        "servers.configured.list_connection_pools",
+        [user_is_superuser]
+    ),
     (
         servers.configured.patch,
         "servers.configured.patch",
@@ -459,6 +489,11 @@ METHODS = [
         "tables.get_import_preview",
         [user_is_authenticated]
     ),
+    (
+        tables.get_import_progress,
+        "tables.get_import_progress",
+        [user_is_authenticated]
+    ),
     (
         tables.import_,
         "tables.import",
@@ -489,6 +524,11 @@ METHODS = [
         "tables.patch",
         [user_is_authenticated]
     ),
+    (
+        tables.start_import,
+        "tables.start_import",
+        [user_is_authenticated]
+    ),
 
     (
         tables.privileges.list_direct,
@@ -517,6 +557,22 @@ METHODS = [
         [user_is_authenticated]
     ),
 
+    (
+        tables.search_indexes.add,
+        "tables.search_indexes.add",
+        [user_is_authenticated]
+    ),
+    (
+        tables.search_indexes.delete,
+        "tables.search_indexes.delete",
+        [user_is_authenticated]
+    ),
+    (
+        tables.search_indexes.list_,
+        "tables.search_indexes.list",
+        [user_is_authenticated]
+    ),
+
     (
         users.add,
         "users.add",
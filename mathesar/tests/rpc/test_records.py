@@ -11,6 +11,8 @@ from contextlib import contextmanager
 
 from unittest.mock import MagicMock
 
+from django.conf import settings
+
 from mathesar.rpc import records
 from mathesar.models.users import User
 
@@ -36,6 +38,8 @@ def test_records_list(rf, monkeypatch, mocked_exec_msar_func):
     monkeypatch.setattr(records, 'connect', mock_connect)
     expect_records_list = {
         "count": 50123,
+        "count_mode": "exact",
+        "next_cursor": None,
         "results": [{"1": "abcde", "2": 12345}, {"1": "fghij", "2": 67890}],
         "grouping": {
             "columns": [2],
@@ -66,6 +70,10 @@ def test_records_list(rf, monkeypatch, mocked_exec_msar_func):
     assert call_args[8] is None  # joined_columns
     assert call_args[9] is True  # return_record_summaries
     assert call_args[10] == json.dumps({})  # summary template
+    assert call_args[11] == "exact"  # count_mode
+    assert call_args[12] == settings.MATHESAR_COUNT_ESTIMATE_THRESHOLD
+    assert call_args[13] is False  # use_cursor
+    assert call_args[14] is None  # cursor
 
 
 def test_records_get(rf, monkeypatch, mocked_exec_msar_func):
@@ -90,6 +98,8 @@ def test_records_get(rf, monkeypatch, mocked_exec_msar_func):
     monkeypatch.setattr(records, 'connect', mock_connect)
     expect_record = {
         "count": 1,
+        "count_mode": "exact",
+        "next_cursor": None,
         "results": [{"1": "abcde", "2": 12345}, {"1": "fghij", "2": 67890}],
         "grouping": None,
         "linked_record_summaries": {"2": {"12345": "blkjdfslkj"}},
@@ -257,6 +267,8 @@ def test_records_search(rf, monkeypatch, mocked_exec_msar_func):
     monkeypatch.setattr(records, 'connect', mock_connect)
     expect_records_list = {
         "count": 50123,
+        "count_mode": "exact",
+        "next_cursor": None,
         "results": [{"1": "abcde", "2": 12345}, {"1": "fghij", "2": 67890}],
         "grouping": None,
         "linked_record_summaries": {"2": {"12345": "blkjdfslkj"}},
@@ -278,3 +290,38 @@ def test_records_search(rf, monkeypatch, mocked_exec_msar_func):
     assert call_args[5] == 0   # offset
     assert call_args[6] is True  # return_record_summaries
     assert call_args[7] == json.dumps({})  # table_record_summary_templates
+    assert call_args[8] == "exact"  # count_mode
+    assert call_args[9] == settings.MATHESAR_COUNT_ESTIMATE_THRESHOLD
+
+
+def test_records_enable_summary_cache(rf, monkeypatch, mocked_exec_msar_func):
+    username = 'alice'
+    password = 'pass1234'
+    table_oid = 23457
+    database_id = 2
+    request = rf.post('/api/rpc/v0/', data={})
+    request.user = User(username=username, password=password)
+
+    @contextmanager
+    def mock_connect(_database_id, user):
+        if _database_id == database_id and user.username == username:
+            try:
+                yield True
+            finally:
+                pass
+        else:
+            raise AssertionError('incorrect parameters passed')
+
+    monkeypatch.setattr(records, 'connect', mock_connect)
+    monkeypatch.setattr(
+        records,
+        'get_record_summary_templates',
+        lambda _database_id, _table_oids: {table_oid: [[2]]},
+    )
+    records.enable_summary_cache(
+        table_oid=table_oid, database_id=database_id, request=request
+    )
+    call_args = mocked_exec_msar_func.call_args_list[0][0]
+    assert call_args[1] == 'enable_record_summary_cache'
+    assert call_args[2] == table_oid
+    assert call_args[3] == json.dumps({table_oid: [[2]]})
@@ -0,0 +1,73 @@
+"""
+Test the cache of resolved user database connection parameters in
+mathesar/utils/connections.py.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mathesar.models import exceptions
+from mathesar.models.base import UserDatabaseRoleMap
+from mathesar.utils import connections
+
+
+@pytest.fixture(autouse=True)
+def clear_connection_params_cache():
+    connections.invalidate_connection_params()
+    yield
+    connections.invalidate_connection_params()
+
+
+def _make_role_map(database_id=2, user_id=7, server_id=3, configured_role_id=5):
+    role_map = MagicMock()
+    role_map.database_id = database_id
+    role_map.user_id = user_id
+    role_map.server_id = server_id
+    role_map.configured_role_id = configured_role_id
+    role_map.connection_params = {'user': f'role{configured_role_id}'}
+    return role_map
+
+
+@pytest.fixture
+def mocked_role_map_get():
+    with patch.object(UserDatabaseRoleMap.objects, 'select_related') as mock:
+        yield mock.return_value.get
+
+
+def test_get_connection_params_is_cached(mocked_role_map_get):
+    mocked_role_map_get.return_value = _make_role_map()
+    user = MagicMock(id=7)
+    assert connections.get_connection_params(2, user) == {'user': 'role5'}
+    assert connections.get_connection_params('2', user) == {'user': 'role5'}
+    assert mocked_role_map_get.call_count == 1
+
+
+def test_get_connection_params_expires(mocked_role_map_get, settings):
+    settings.MATHESAR_CONNECTION_PARAMS_CACHE_TTL = 0
+    mocked_role_map_get.return_value = _make_role_map()
+    user = MagicMock(id=7)
+    connections.get_connection_params(2, user)
+    connections.get_connection_params(2, user)
+    assert mocked_role_map_get.call_count == 2
+
+
+def test_get_connection_params_no_role_map(mocked_role_map_get):
+    mocked_role_map_get.side_effect = UserDatabaseRoleMap.DoesNotExist
+    with pytest.raises(exceptions.NoConnectionAvailable):
+        connections.get_connection_params(2, MagicMock(id=7))
+
+
+@pytest.mark.parametrize('match,expect_refetch', [
+    ({'configured_role_id': 5}, True),
+    ({'configured_role_id': 6}, False),
+    ({'server_id': 3}, True),
+    ({'database_id': 2, 'user_id': 7}, True),
+    ({'database_id': 2, 'user_id': 8}, False),
+])
+def test_invalidate_connection_params(mocked_role_map_get, match, expect_refetch):
+    mocked_role_map_get.return_value = _make_role_map()
+    user = MagicMock(id=7)
+    connections.get_connection_params(2, user)
+    connections.invalidate_connection_params(**match)
+    connections.get_connection_params(2, user)
+    assert mocked_role_map_get.call_count == (2 if expect_refetch else 1)
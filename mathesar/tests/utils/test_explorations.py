@@ -0,0 +1,38 @@
+from collections import namedtuple
+from datetime import date
+from unittest.mock import MagicMock
+
+from mathesar.utils import explorations
+
+
+def test_exploration_chunker_streams_batches(monkeypatch):
+    Row = namedtuple('Row', ['id', 'day'])
+    batches = [
+        [Row(1, date(2024, 1, 2)), Row(2, date(2024, 1, 3))],
+        [Row(3, None)],
+    ]
+    db_query = MagicMock()
+    db_query.sa_output_columns = [MagicMock(), MagicMock()]
+    db_query.sa_output_columns[0].name = 'id'
+    db_query.sa_output_columns[1].name = 'day'
+    db_query.stream_records.return_value = iter(batches)
+    engine = MagicMock()
+    monkeypatch.setattr(explorations, 'get_exploration', MagicMock())
+    monkeypatch.setattr(
+        explorations,
+        '_build_exploration_query',
+        lambda exploration_def, conn: (db_query, engine, None, []),
+    )
+
+    chunks = list(
+        explorations.exploration_chunker(None, 1, 1, limit=100000, batch_size=2)
+    )
+
+    assert chunks == [
+        ('id', 'day'),
+        [{'id': 1, 'day': '2024-01-02'}, {'id': 2, 'day': '2024-01-03'}],
+        [{'id': 3, 'day': None}],
+    ]
+    db_query.stream_records.assert_called_once_with(2, limit=100000, offset=None)
+    db_query.get_records.assert_not_called()
+    engine.dispose.assert_not_called()
@@ -0,0 +1,95 @@
+from decimal import Decimal
+import io
+import json
+import zipfile
+
+import pyarrow.parquet as pq
+import pytest
+
+from mathesar.utils import exporters
+
+_columns = {'1': 'id', '2': 'name', '3': 'amount', '4': 'tags'}
+_column_types = {'1': 'integer', '2': 'text', '3': 'numeric(5, 2)', '4': '_array'}
+_record_chunks = [
+    [
+        {'1': 1, '2': 'a', '3': 1.5, '4': [1, 2]},
+        {'1': 2, '2': None, '3': None, '4': None},
+    ],
+    [{'1': 3, '2': 'c', '3': 2, '4': ['x']}],
+]
+
+
+@pytest.mark.parametrize('name', ['csv', 'ndjson', 'parquet', 'xlsx'])
+def test_get_exporter(name):
+    exporter = exporters.get_exporter(name)
+    assert exporter.name == name
+    assert exporter.file_extension == name
+
+
+def test_get_exporter_unknown():
+    assert exporters.get_exporter('pdf') is None
+
+
+def test_write_csv():
+    csv_text = ''.join(exporters.write_csv(_columns, iter(_record_chunks)))
+    assert csv_text.splitlines() == [
+        'id,name,amount,tags', '1,a,1.5,"[1, 2]"', '2,,,', "3,c,2,['x']",
+    ]
+
+
+def test_write_ndjson():
+    ndjson_text = ''.join(exporters.write_ndjson(_columns, iter(_record_chunks)))
+    assert [json.loads(line) for line in ndjson_text.splitlines()] == [
+        {'id': 1, 'name': 'a', 'amount': 1.5, 'tags': [1, 2]},
+        {'id': 2, 'name': None, 'amount': None, 'tags': None},
+        {'id': 3, 'name': 'c', 'amount': 2, 'tags': ['x']},
+    ]
+
+
+def test_write_parquet():
+    parquet_bytes = b''.join(
+        exporters.write_parquet(_columns, iter(_record_chunks), _column_types)
+    )
+    parquet_file = pq.ParquetFile(io.BytesIO(parquet_bytes))
+    assert parquet_file.num_row_groups == 2
+    table = parquet_file.read()
+    assert [str(field.type) for field in table.schema] == [
+        'int64', 'string', 'string', 'string'
+    ]
+    assert table.to_pylist() == [
+        {'id': 1, 'name': 'a', 'amount': '1.5', 'tags': '[1, 2]'},
+        {'id': 2, 'name': None, 'amount': None, 'tags': None},
+        {'id': 3, 'name': 'c', 'amount': '2', 'tags': '["x"]'},
+    ]
+
+
+def test_write_parquet_keeps_numeric_precision():
+    exporter = exporters.get_exporter('parquet')
+    assert exporter.exact_numbers
+    parquet_bytes = b''.join(
+        exporter.writer(
+            {'1': 'amount'},
+            iter([[{'1': Decimal('12345678901234567890.123456789')}]]),
+            {'1': 'numeric'},
+        )
+    )
+    table = pq.ParquetFile(io.BytesIO(parquet_bytes)).read()
+    assert table.to_pylist() == [{'amount': '12345678901234567890.123456789'}]
+
+
+def test_write_xlsx():
+    xlsx_bytes = b''.join(
+        exporters.write_xlsx(_columns, iter(_record_chunks), read_size=1024)
+    )
+    assert xlsx_bytes.startswith(b'PK')
+
+
+def test_write_xlsx_splits_sheets(monkeypatch):
+    monkeypatch.setattr(exporters, 'XLSX_MAX_ROWS', 2)
+    xlsx_bytes = b''.join(exporters.write_xlsx(_columns, iter(_record_chunks)))
+    with zipfile.ZipFile(io.BytesIO(xlsx_bytes)) as xlsx_file:
+        sheet_names = [
+            name for name in xlsx_file.namelist()
+            if name.startswith('xl/worksheets/sheet')
+        ]
+    assert len(sheet_names) == 3
@@ -0,0 +1,48 @@
+"""
+Test the detection of interrupted jobs in mathesar/utils/jobs.py.
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from mathesar.models.base import Database, ImportJob, Server
+from mathesar.models.users import User
+from mathesar.utils import jobs
+
+
+@pytest.fixture
+def import_job():
+    user = User.objects.create(username='alice')
+    server = Server.objects.create(host='example.com', port=5432)
+    database = Database.objects.create(name='mathesar', server=server)
+    return ImportJob.objects.create(user=user, database=database, total_bytes=1000)
+
+
+def _set_updated_at(job, seconds_ago):
+    ImportJob.objects.filter(id=job.id).update(
+        updated_at=timezone.now() - timedelta(seconds=seconds_ago)
+    )
+    job.refresh_from_db()
+
+
+def test_fail_stale_job_recent(import_job):
+    assert not jobs.fail_stale_job(import_job)
+    assert import_job.status == 'RUNNING'
+
+
+def test_fail_stale_job_stale(import_job):
+    _set_updated_at(import_job, jobs.STALE_JOB_TIMEOUT + 1)
+    assert jobs.fail_stale_job(import_job)
+    assert import_job.status == 'FAILED'
+    assert import_job.error == jobs.STALE_JOB_ERROR
+    # A job is only marked as failed once.
+    _set_updated_at(import_job, jobs.STALE_JOB_TIMEOUT + 1)
+    assert not jobs.fail_stale_job(import_job)
+
+
+def test_fail_stale_job_finished(import_job):
+    ImportJob.objects.filter(id=import_job.id).update(status='SUCCEEDED')
+    _set_updated_at(import_job, jobs.STALE_JOB_TIMEOUT + 1)
+    assert not jobs.fail_stale_job(import_job)
+    assert import_job.status == 'SUCCEEDED'
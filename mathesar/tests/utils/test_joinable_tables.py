@@ -0,0 +1,65 @@
+"""
+Test the cache of joinable tables in mathesar/utils/joinable_tables.py.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from mathesar.utils import joinable_tables
+
+
+@pytest.fixture(autouse=True)
+def clear_joinable_tables_cache():
+    joinable_tables.invalidate_joinable_tables()
+    yield
+    joinable_tables.invalidate_joinable_tables()
+
+
+@pytest.fixture
+def mocked_db(monkeypatch):
+    db = MagicMock()
+    db.fingerprint = 'abc'
+    monkeypatch.setattr(
+        joinable_tables, 'get_joinable_tables_fingerprint', lambda conn: db.fingerprint
+    )
+    db.list_joinable_tables.side_effect = lambda table_oid, conn, max_depth: {
+        'joinable_tables': [table_oid, max_depth, db.fingerprint]
+    }
+    monkeypatch.setattr(joinable_tables, 'list_joinable_tables', db.list_joinable_tables)
+    return db
+
+
+def test_get_joinable_tables_is_cached(mocked_db):
+    first = joinable_tables.get_joinable_tables('conn', 2, 123, 3)
+    second = joinable_tables.get_joinable_tables('conn', '2', 123, 3)
+    assert first == second == {'joinable_tables': [123, 3, 'abc']}
+    assert mocked_db.list_joinable_tables.call_count == 1
+
+
+def test_get_joinable_tables_keyed_by_table_and_depth(mocked_db):
+    joinable_tables.get_joinable_tables('conn', 2, 123, 3)
+    joinable_tables.get_joinable_tables('conn', 2, 123, 2)
+    joinable_tables.get_joinable_tables('conn', 2, 456, 3)
+    joinable_tables.get_joinable_tables('conn', 5, 123, 3)
+    assert mocked_db.list_joinable_tables.call_count == 4
+
+
+def test_get_joinable_tables_fingerprint_change(mocked_db):
+    joinable_tables.get_joinable_tables('conn', 2, 123, 3)
+    joinable_tables.get_joinable_tables('conn', 2, 456, 3)
+    mocked_db.fingerprint = 'def'
+    assert joinable_tables.get_joinable_tables('conn', 2, 123, 3) == {
+        'joinable_tables': [123, 3, 'def']
+    }
+    # Results found with the old fingerprint are dropped, not just replaced.
+    assert joinable_tables._joinable_tables_cache[2]['results'].keys() == {(123, 3)}
+    assert mocked_db.list_joinable_tables.call_count == 3
+
+
+def test_invalidate_joinable_tables(mocked_db):
+    joinable_tables.get_joinable_tables('conn', 2, 123, 3)
+    joinable_tables.get_joinable_tables('conn', 5, 123, 3)
+    joinable_tables.invalidate_joinable_tables(database_id=2)
+    joinable_tables.get_joinable_tables('conn', 2, 123, 3)
+    joinable_tables.get_joinable_tables('conn', 5, 123, 3)
+    assert mocked_db.list_joinable_tables.call_count == 3
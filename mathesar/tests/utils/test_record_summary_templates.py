@@ -0,0 +1,90 @@
+"""
+Test the cache of record summary templates in mathesar/utils/record_summary_templates.py.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from mathesar.models.base import Database, Server, TableMetaData
+from mathesar.utils import record_summary_templates
+
+
+@pytest.fixture(autouse=True)
+def clear_record_summary_templates_cache():
+    record_summary_templates.invalidate_record_summary_templates()
+    yield
+    record_summary_templates.invalidate_record_summary_templates()
+
+
+@pytest.fixture
+def database():
+    server = Server.objects.create(host='example.com', port=5432)
+    database = Database.objects.create(name='mathesar', server=server)
+    TableMetaData.objects.create(database=database, table_oid=123, record_summary_template=[[2]])
+    TableMetaData.objects.create(database=database, table_oid=456, record_summary_template=[[3]])
+    TableMetaData.objects.create(database=database, table_oid=789, record_summary_template=None)
+    return database
+
+
+@pytest.fixture
+def mocked_list_linked_table_oids(monkeypatch):
+    mocked = MagicMock(return_value=[456, 789])
+    monkeypatch.setattr(record_summary_templates, 'list_linked_table_oids', mocked)
+    return mocked
+
+
+def test_get_record_summary_templates_scoped(database):
+    assert record_summary_templates.get_record_summary_templates(
+        database.id, [123, '789', 1000]
+    ) == {123: [[2]]}
+
+
+def test_get_linked_record_summary_templates(database, mocked_list_linked_table_oids):
+    assert record_summary_templates.get_linked_record_summary_templates(
+        'conn', database.id, 789
+    ) == {456: [[3]]}
+    mocked_list_linked_table_oids.assert_called_once_with(789, 'conn')
+
+
+def test_get_linked_record_summary_templates_joined_columns(
+        database, mocked_list_linked_table_oids
+):
+    mocked_list_linked_table_oids.return_value = []
+    joined_columns = [{'alias': 'a', 'join_path': [[[789, 1], [1000, 2]], [[1000, 3], [123, 1]]]}]
+    assert record_summary_templates.get_linked_record_summary_templates(
+        'conn', database.id, 789, joined_columns
+    ) == {123: [[2]]}
+
+
+def test_get_linked_record_summary_templates_skips_lookup(
+        database, mocked_list_linked_table_oids
+):
+    TableMetaData.objects.filter(table_oid=456).delete()
+    assert record_summary_templates.get_linked_record_summary_templates(
+        'conn', database.id, 123
+    ) == {123: [[2]]}
+    mocked_list_linked_table_oids.assert_not_called()
+
+
+def test_templates_cached_until_changed(database, django_assert_num_queries):
+    record_summary_templates.get_record_summary_templates(database.id, [123])
+    # Only the version is checked for a cached entry.
+    with django_assert_num_queries(1):
+        record_summary_templates.get_record_summary_templates(database.id, [123])
+    TableMetaData.objects.filter(table_oid=123).update(record_summary_template=[[4]])
+    # `update` doesn't fire signals, but changes the number of templates.
+    TableMetaData.objects.filter(table_oid=456).update(record_summary_template=None)
+    assert record_summary_templates.get_record_summary_templates(
+        database.id, [123, 456]
+    ) == {123: [[4]]}
+
+
+def test_templates_invalidated_on_save(database):
+    record_summary_templates.get_record_summary_templates(database.id, [123])
+    table_meta_data = TableMetaData.objects.get(table_oid=123)
+    table_meta_data.record_summary_template = [[5]]
+    table_meta_data.save()
+    assert database.id not in record_summary_templates._templates_cache
+    assert record_summary_templates.get_record_summary_templates(
+        database.id, [123]
+    ) == {123: [[5]]}
@@ -0,0 +1,127 @@
+"""
+Test the online retype jobs in mathesar/utils/retype_jobs.py.
+"""
+from contextlib import nullcontext
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from django.utils import timezone
+
+from mathesar.models.base import ColumnMetaData, Database, RetypeJob, Server, TableMetaData
+from mathesar.models.users import User
+from mathesar.utils import columns, retype_jobs
+from mathesar.utils.columns import move_column_meta_data
+from mathesar.utils.jobs import STALE_JOB_TIMEOUT
+
+COLUMN_DATA = {"id": 2, "type": "integer"}
+
+
+@pytest.fixture
+def database():
+    server = Server.objects.create(host='example.com', port=5432)
+    return Database.objects.create(name='mathesar', server=server)
+
+
+@pytest.fixture
+def retype_job(database):
+    user = User.objects.create(username='alice')
+    return RetypeJob.objects.create(
+        user=user, database=database, table_oid=123, attnum=2, total_rows=10
+    )
+
+
+@pytest.fixture
+def mocked_cancel(monkeypatch):
+    monkeypatch.setattr(retype_jobs, 'heartbeat', lambda model, job_id: nullcontext())
+    monkeypatch.setattr(retype_jobs, 'django_connection', MagicMock())
+    monkeypatch.setattr(retype_jobs, 'mathesar_connection', lambda **params: nullcontext('conn'))
+    mocked_cancel = MagicMock()
+    monkeypatch.setattr(retype_jobs, '_cancel', mocked_cancel)
+    return mocked_cancel
+
+
+def _run(retype_job):
+    retype_jobs._run_retype_job(
+        retype_job.id, {'dbname': 'mathesar'}, 123, COLUMN_DATA, retype_job.database_id, 1000
+    )
+    retype_job.refresh_from_db()
+
+
+def test_move_column_meta_data(database):
+    ColumnMetaData.objects.create(database=database, table_oid=123, attnum=2, display_width=50)
+    ColumnMetaData.objects.create(database=database, table_oid=123, attnum=4, display_width=80)
+    ColumnMetaData.objects.create(database=database, table_oid=456, attnum=2, display_width=90)
+    TableMetaData.objects.create(database=database, table_oid=123, column_order=[3, 2, 1])
+    move_column_meta_data(123, 2, 4, database.id, 'conn')
+    assert list(
+        ColumnMetaData.objects.filter(table_oid=123).values_list('attnum', 'display_width')
+    ) == [(4, 50)]
+    assert ColumnMetaData.objects.get(table_oid=456).attnum == 2
+    assert TableMetaData.objects.get(table_oid=123).column_order == [3, 4, 1]
+
+
+def test_move_column_meta_data_templates(monkeypatch, database):
+    TableMetaData.objects.create(
+        database=database, table_oid=123, record_summary_template=[[2], ' ', [3]]
+    )
+    TableMetaData.objects.create(
+        database=database, table_oid=456, record_summary_template=[[5, 3]]
+    )
+    TableMetaData.objects.create(database=database, table_oid=789, column_order=[1])
+    mocked_move = MagicMock(return_value={'123': [[4], ' ', [3]]})
+    monkeypatch.setattr(columns, 'move_column_in_summary_templates', mocked_move)
+    move_column_meta_data(123, 2, 4, database.id, 'conn')
+    mocked_move.assert_called_once_with(
+        123, 2, 4, {123: [[2], ' ', [3]], 456: [[5, 3]]}, 'conn'
+    )
+    assert TableMetaData.objects.get(table_oid=123).record_summary_template == [[4], ' ', [3]]
+    assert TableMetaData.objects.get(table_oid=456).record_summary_template == [[5, 3]]
+
+
+def test_run_retype_job_succeeded(monkeypatch, retype_job, mocked_cancel):
+    monkeypatch.setattr(retype_jobs, '_retype', MagicMock(return_value=(10, 4)))
+    mocked_move = MagicMock()
+    monkeypatch.setattr(retype_jobs, 'move_column_meta_data', mocked_move)
+    _run(retype_job)
+    assert retype_job.status == 'SUCCEEDED'
+    assert retype_job.rows_processed == 10
+    assert retype_job.result == {'attnum': 4}
+    assert retype_job.error is None
+    mocked_move.assert_called_once_with(123, 2, 4, retype_job.database_id, 'conn')
+    mocked_cancel.assert_not_called()
+
+
+def test_run_retype_job_cancels_on_failure(monkeypatch, retype_job, mocked_cancel):
+    monkeypatch.setattr(retype_jobs, '_retype', MagicMock(side_effect=ValueError('bad value')))
+    _run(retype_job)
+    assert retype_job.status == 'FAILED'
+    assert retype_job.error == 'bad value'
+    assert retype_job.result is None
+    mocked_cancel.assert_called_once_with({'dbname': 'mathesar'}, 123, 2)
+
+
+def test_run_retype_job_metadata_failure(monkeypatch, retype_job, mocked_cancel):
+    monkeypatch.setattr(retype_jobs, '_retype', MagicMock(return_value=(10, 4)))
+    monkeypatch.setattr(
+        retype_jobs, 'move_column_meta_data', MagicMock(side_effect=ValueError('oops'))
+    )
+    _run(retype_job)
+    # The column was replaced, so the client must be told its new attnum.
+    assert retype_job.status == 'SUCCEEDED'
+    assert retype_job.result == {'attnum': 4}
+    assert 'oops' in retype_job.error
+    mocked_cancel.assert_not_called()
+
+
+def test_get_retype_job_cancels_stale_job(monkeypatch, retype_job, mocked_cancel):
+    monkeypatch.setattr(
+        retype_jobs, 'get_connection_params', lambda database_id, user: {'dbname': 'mathesar'}
+    )
+    assert retype_jobs.get_retype_job(retype_job.id, retype_job.user).status == 'RUNNING'
+    mocked_cancel.assert_not_called()
+    RetypeJob.objects.filter(id=retype_job.id).update(
+        updated_at=timezone.now() - timedelta(seconds=STALE_JOB_TIMEOUT + 1)
+    )
+    assert retype_jobs.get_retype_job(retype_job.id, retype_job.user).status == 'FAILED'
+    mocked_cancel.assert_called_once_with({'dbname': 'mathesar'}, 123, 2)
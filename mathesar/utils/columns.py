@@ -1,4 +1,5 @@
-from mathesar.models.base import ColumnMetaData, Database
+from db.columns import move_column_in_summary_templates
+from mathesar.models.base import ColumnMetaData, Database, TableMetaData
 
 
 def get_columns_meta_data(table_oid, database_id):
@@ -18,3 +19,54 @@ def set_columns_meta_data(column_meta_data_list, table_oid, database_id):
             defaults=meta_data_dict
         )
     return get_columns_meta_data(table_oid, database_id)
+
+
+def move_column_meta_data(table_oid, old_attnum, new_attnum, database_id, conn):
+    """
+    Move the metadata of a column to a new attnum, e.g., after it's replaced.
+
+    This moves the column's display options, its place in the table's
+    column order, and its references in record summary templates (of its
+    table, or of tables linked to it). The user database connection is
+    used to follow the templates' foreign keys.
+    """
+    columns_meta_data = get_columns_meta_data(table_oid, database_id)
+    columns_meta_data.filter(attnum=new_attnum).delete()
+    columns_meta_data.filter(attnum=old_attnum).update(attnum=new_attnum)
+    table_meta_data = TableMetaData.objects.filter(
+        database__id=database_id, table_oid=table_oid
+    ).first()
+    if table_meta_data is not None and table_meta_data.column_order:
+        table_meta_data.column_order = [
+            new_attnum if attnum == old_attnum else attnum
+            for attnum in table_meta_data.column_order
+        ]
+        table_meta_data.save()
+    _move_column_in_summary_templates(
+        table_oid, old_attnum, new_attnum, database_id, conn
+    )
+
+
+def _move_column_in_summary_templates(table_oid, old_attnum, new_attnum, database_id, conn):
+    tables_meta_data = {
+        table_meta_data.table_oid: table_meta_data
+        for table_meta_data in TableMetaData.objects.filter(
+            database__id=database_id, record_summary_template__isnull=False
+        )
+    }
+    if not tables_meta_data:
+        return
+    moved_templates = move_column_in_summary_templates(
+        table_oid,
+        old_attnum,
+        new_attnum,
+        {
+            template_table_oid: table_meta_data.record_summary_template
+            for template_table_oid, table_meta_data in tables_meta_data.items()
+        },
+        conn,
+    )
+    for template_table_oid, template in moved_templates.items():
+        table_meta_data = tables_meta_data[int(template_table_oid)]
+        table_meta_data.record_summary_template = template
+        table_meta_data.save()
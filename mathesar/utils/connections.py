@@ -0,0 +1,83 @@
+"""
+Process-local cache of resolved user database connection parameters.
+
+Resolving how a user connects to a database takes a chain of Django
+queries (the Database, the UserDatabaseRoleMap, its Server and its
+ConfiguredRole) plus decrypting the role's password. We do that once per
+(database, user) and keep the result here.
+
+Entries are invalidated explicitly (by model signals, see
+`mathesar.signals`) whenever any model in the chain changes. Since
+signals only fire in the process making the change, entries also expire
+after `MATHESAR_CONNECTION_PARAMS_CACHE_TTL` seconds, which bounds how
+long other worker processes can keep using stale parameters.
+"""
+import threading
+import time
+
+from django.conf import settings
+
+from mathesar.models.base import UserDatabaseRoleMap
+from mathesar.models import exceptions
+
+_INVALIDATION_FIELDS = ('database_id', 'user_id', 'server_id', 'configured_role_id')
+
+_connection_params_cache = {}
+_connection_params_cache_lock = threading.Lock()
+
+
+def get_connection_params(database_id, user):
+    """
+    Return the kwargs for connecting the user to the given database.
+
+    Raises NoConnectionAvailable if the user has no role configured for
+    the database.
+
+    Args:
+        database_id: The Django id of the Database.
+        user: A user model instance who'll connect to the database.
+    """
+    key = (int(database_id), user.id)
+    now = time.monotonic()
+    with _connection_params_cache_lock:
+        entry = _connection_params_cache.get(key)
+    if entry is not None and entry['expires_at'] > now:
+        return entry['connection_params']
+
+    try:
+        role_map = UserDatabaseRoleMap.objects.select_related(
+            'database', 'server', 'configured_role'
+        ).get(database__id=database_id, user=user)
+    except UserDatabaseRoleMap.DoesNotExist:
+        raise exceptions.NoConnectionAvailable
+    connection_params = role_map.connection_params
+    with _connection_params_cache_lock:
+        _connection_params_cache[key] = {
+            'expires_at': now + settings.MATHESAR_CONNECTION_PARAMS_CACHE_TTL,
+            'database_id': role_map.database_id,
+            'user_id': role_map.user_id,
+            'server_id': role_map.server_id,
+            'configured_role_id': role_map.configured_role_id,
+            'connection_params': connection_params,
+        }
+    return connection_params
+
+
+def invalidate_connection_params(**match):
+    """
+    Drop cached connection parameters matching all the given ids.
+
+    Any of `database_id`, `user_id`, `server_id`, and
+    `configured_role_id` may be given. With no arguments, the whole cache
+    is cleared.
+    """
+    unknown_fields = set(match) - set(_INVALIDATION_FIELDS)
+    if unknown_fields:
+        raise ValueError(f"Unknown invalidation field(s): {sorted(unknown_fields)}")
+    with _connection_params_cache_lock:
+        stale_keys = [
+            key for key, entry in _connection_params_cache.items()
+            if all(entry[field] == value for field, value in match.items())
+        ]
+        for key in stale_keys:
+            del _connection_params_cache[key]
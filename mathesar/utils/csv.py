@@ -1,3 +1,7 @@
+import codecs
+import os
+import random
+
 import clevercsv as csv
 
 from mathesar.errors import InvalidTableError
@@ -6,6 +10,14 @@ from mathesar.errors import InvalidTableError
 ALLOWED_DELIMITERS = ",\t:|;"
 SAMPLE_SIZE = 1000000
 CHECK_ROWS = 10
+ENCODING_SAMPLE_SIZE = 65536
+ENCODING_SAMPLE_WINDOWS = 4
+ENCODING_WINDOW_SIZE = 16384
+ENCODING_MIN_CONFIDENCE = 0.9
+ENCODING_SCAN_CHUNK_SIZE = 1048576
+_WIDE_BOMS = (
+    codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE
+)
 
 
 def is_valid_csv(data):
@@ -18,20 +30,109 @@ def is_valid_csv(data):
 
 def get_file_encoding(file):
     """
-    Given a file, uses charset_normalizer if installed or chardet which is
-    installed as part of clevercsv module to detect the file encoding. Returns a
-    default value of utf-8-sig if encoding could not be detected or detection
-    libraries are missing.
+    Given a binary file, uses charset_normalizer to detect the file encoding.
+    Returns a default value of utf-8 if encoding could not be detected.
+
+    Detection runs on a bounded sample of the file (see
+    `_get_encoding_sample`), so the whole file isn't read into memory. If
+    the detected encoding has a low confidence, the file is scanned in
+    chunks to check whether UTF-8, or else the detected encoding, can
+    decode all of it. If the sample is ASCII, but the file isn't UTF-8,
+    detection runs again on the first chunk UTF-8 can't decode.
     """
     from charset_normalizer import detect
-    # Sample Size reduces the accuracy
-    encoding = detect(file.read()).get('encoding', None)
+    sample, is_whole_file = _get_encoding_sample(file)
+    result = detect(sample)
+    encoding = result.get('encoding', None)
+    if encoding == 'ascii' and not is_whole_file:
+        # Parts of the file we haven't sampled could have any character.
+        # UTF-8 decodes ASCII text the same way, and covers the rest, if
+        # the file is UTF-8 at all.
+        undecodable_chunk = _find_undecodable_chunk(file, 'utf-8')
+        if undecodable_chunk is None:
+            encoding = 'utf-8'
+        else:
+            encoding = detect(undecodable_chunk).get('encoding', None)
+            encoding = _scan_for_encoding(file, [encoding]) or encoding
+    elif encoding is None or (result.get('confidence') or 0) < ENCODING_MIN_CONFIDENCE:
+        # A doubtful guess is often a single-byte encoding, which decodes
+        # anything. Few files which aren't UTF-8 decode as UTF-8 though.
+        encoding = _scan_for_encoding(file, ['utf-8', encoding]) or encoding
     file.seek(0)
     if encoding is not None:
         return encoding
     return "utf-8"
 
 
+def _get_encoding_sample(file):
+    """
+    Return a sample of the bytes of a file for detecting its encoding, and
+    whether the sample holds the whole file.
+
+    The sample consists of the start of the file, plus a few windows taken
+    from (repeatably) random offsets. Partial lines at the edges of each
+    part are dropped, so that multi-byte characters aren't cut.
+    """
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+    if size <= ENCODING_SAMPLE_SIZE + ENCODING_SAMPLE_WINDOWS * ENCODING_WINDOW_SIZE:
+        return file.read(), True
+    prefix = file.read(ENCODING_SAMPLE_SIZE)
+    if prefix.startswith(_WIDE_BOMS):
+        # Cutting at newline bytes would misalign wide characters.
+        return prefix, False
+    prefix = prefix[:prefix.rfind(b'\n') + 1] or prefix
+    sample_parts = [prefix]
+    rng = random.Random(size)
+    offsets = sorted(
+        rng.randrange(ENCODING_SAMPLE_SIZE, size - ENCODING_WINDOW_SIZE)
+        for _ in range(ENCODING_SAMPLE_WINDOWS)
+    )
+    for offset in offsets:
+        file.seek(offset)
+        window = file.read(ENCODING_WINDOW_SIZE)
+        start, end = window.find(b'\n') + 1, window.rfind(b'\n') + 1
+        if 0 < start < end:
+            sample_parts.append(window[start:end])
+    return b''.join(sample_parts), False
+
+
+def _scan_for_encoding(file, candidates):
+    """
+    Return the first of the candidate encodings which decodes the whole file.
+
+    The file is read in chunks, so it's never entirely in memory. Returns
+    None if none of the candidates decodes the file.
+    """
+    for encoding in dict.fromkeys(c for c in candidates if c is not None):
+        try:
+            if _find_undecodable_chunk(file, encoding) is None:
+                return encoding
+        except LookupError:
+            continue
+    return None
+
+
+def _find_undecodable_chunk(file, encoding):
+    """
+    Return the first chunk of a file which the encoding can't decode, or
+    None if it decodes the whole file.
+
+    A file ending with a partial character gives an empty chunk.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    file.seek(0)
+    chunk = b''
+    try:
+        while chunk := file.read(ENCODING_SCAN_CHUNK_SIZE):
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return chunk
+    return None
+
+
 def get_sv_dialect(file):
     """
     Given a *sv file, generate a dialect to parse it.
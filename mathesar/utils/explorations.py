@@ -1,8 +1,9 @@
-from db.deprecated.engine import create_future_engine_with_custom_types
+from db.deprecated.engine import get_cached_future_engine_with_custom_types
 from db.deprecated.metadata import get_empty_metadata
 from db.deprecated.queries.base import DBQuery, InitialColumn, JoinParameter
 from db.deprecated.queries.operations.process import get_transforms_with_summarizes_speced
-from db.tables import get_table
+from db.deprecated.columns import get_column_names_from_attnums
+from db.deprecated.tables import get_table_names_from_oids
 from db.deprecated.transforms.base import Summarize
 from db.deprecated.transforms.operations.deserialize import deserialize_transformation
 from db.deprecated.functions.base import (
@@ -106,8 +107,21 @@ def _serialize_records_for_json(records):
     return serialized_results
 
 
-def run_exploration(exploration_def, conn, limit=100, offset=0):
-    engine = create_future_engine_with_custom_types(
+def _build_exploration_query(exploration_def, conn):
+    """
+    Build the DBQuery for an exploration definition.
+
+    This fills in the default display names and the speced summarize
+    transformations in `exploration_def`.
+
+    The engine is shared between calls for the same role and database, so
+    tables reflected for earlier runs are reused until their DDL changes.
+
+    Returns:
+        A tuple of the DBQuery, the engine and metadata it uses, and the
+        processed initial columns.
+    """
+    engine = get_cached_future_engine_with_custom_types(
         conn.info.user,
         conn.info.password,
         conn.info.host,
@@ -160,6 +174,13 @@ def run_exploration(exploration_def, conn, limit=100, offset=0):
         transformations,
         exploration_def.get("display_names", {})
     )
+    return db_query, engine, metadata, processed_initial_columns
+
+
+def run_exploration(exploration_def, conn, limit=100, offset=0):
+    db_query, engine, metadata, processed_initial_columns = _build_exploration_query(
+        exploration_def, conn
+    )
     query_results = db_query.get_records(limit=limit, offset=offset)
 
     raw_results = [r._asdict() for r in query_results]
@@ -192,10 +213,19 @@ def exploration_chunker(
     exploration_id,
     limit=None,
     offset=None,
-    batch_size=2000
+    batch_size=2000,
+    with_column_types=False,
 ):
-    limit = min(limit or 50000, 50000)  # We cap limit at 50000
-    # so that we can avoid loading explorations > 50000 rows into memory.
+    """
+    Yield the output column names of an exploration, then its records in
+    lists of at most `batch_size`.
+
+    If `with_column_types` is set, the column names are yielded as a dict
+    mapping each name to the name of the column's database type.
+
+    The records are streamed from a server-side cursor, so only one batch
+    is held in memory at a time, however many records the exploration has.
+    """
     exp_model = get_exploration(exploration_id, database_id)
     exploration_def = {
         "database_id": exp_model.database.id,
@@ -204,11 +234,15 @@ def exploration_chunker(
         "display_names": exp_model.display_names,
         "transformations": exp_model.transformations,
     }
-    exp_results = run_exploration(exploration_def, conn, limit, offset)
-    yield exp_results["output_columns"]
-    records = exp_results["records"]
-    for i in range(0, records["count"], batch_size):
-        yield records["results"][i:i + batch_size]
+    db_query, _, _, _ = _build_exploration_query(exploration_def, conn)
+    if with_column_types:
+        yield {
+            sa_col.name: sa_col.db_type.id for sa_col in db_query.sa_output_columns
+        }
+    else:
+        yield tuple(sa_col.name for sa_col in db_query.sa_output_columns)
+    for records in db_query.stream_records(batch_size, limit=limit, offset=offset):
+        yield _serialize_records_for_json(r._asdict() for r in records)
 
 
 def _get_exploration_column_metadata(
@@ -219,20 +253,41 @@ def _get_exploration_column_metadata(
     engine,
     metadata
 ):
+    """
+    Describe each column used in an exploration.
+
+    The column metadata, input table names, and input column names of all
+    columns are each fetched with a single query.
+    """
+    initial_columns_by_alias = {col.alias: col for col in processed_initial_columns}
+    all_sa_columns_map = db_query.all_sa_columns_map
+    initial_column_of_alias = {
+        alias: initial_columns_by_alias.get(alias) for alias in all_sa_columns_map
+    }
+    used_initial_columns = [
+        col for col in initial_column_of_alias.values() if col is not None
+    ]
+    column_metadata_map = _get_column_metadata_map(
+        exploration_def["database_id"],
+        [
+            (initial_column_of_alias[alias].reloid, sa_col.column_attnum)
+            for alias, sa_col in all_sa_columns_map.items()
+            if initial_column_of_alias[alias] is not None
+        ],
+    )
+    input_table_names = get_table_names_from_oids(
+        [col.reloid for col in used_initial_columns], engine, metadata
+    )
+    input_column_names = get_column_names_from_attnums(
+        [(col.reloid, col.attnum) for col in used_initial_columns], engine, metadata
+    )
+    display_names = exploration_def.get("display_names", None)
     exploration_column_metadata = {}
-    for alias, sa_col in db_query.all_sa_columns_map.items():
-        initial_column = None
-        for col in processed_initial_columns:
-            if alias == col.alias:
-                initial_column = col
-        column_metadata = ColumnMetaData.objects.filter(
-            database__id=exploration_def["database_id"],
-            table_oid=initial_column.reloid,
-            attnum=sa_col.column_attnum
-        ).first() if initial_column else None
-        input_table_name = get_table(initial_column.reloid, conn)["name"] if initial_column else None
-        input_column_name = initial_column.get_name(engine, metadata) if initial_column else None
-        display_names = exploration_def.get("display_names", None)
+    for alias, sa_col in all_sa_columns_map.items():
+        initial_column = initial_column_of_alias[alias]
+        column_metadata = column_metadata_map.get(
+            (initial_column.reloid, sa_col.column_attnum)
+        ) if initial_column else None
         exploration_column_metadata[alias] = {
             "alias": alias,
             "display_name": display_names.get(alias) if display_names is not None else None,
@@ -241,14 +296,36 @@ def _get_exploration_column_metadata(
             "type_options": sa_col.type_options,
             "metadata": ColumnMetaDataRecord.from_model(column_metadata) if column_metadata else None,
             "is_initial_column": True if initial_column else False,
-            "input_column_name": input_column_name,
-            "input_table_name": input_table_name,
+            "input_column_name": input_column_names.get(
+                (initial_column.reloid, initial_column.attnum)
+            ) if initial_column else None,
+            "input_table_name": input_table_names.get(initial_column.reloid) if initial_column else None,
             "input_table_id": initial_column.reloid if initial_column else None,
             "input_alias": db_query.get_input_alias_for_output_alias(alias)
         }
     return exploration_column_metadata
 
 
+def _get_column_metadata_map(database_id, table_oid_attnum_pairs):
+    """
+    Return a dict mapping (table oid, attnum) pairs to their ColumnMetaData.
+    """
+    pairs = set(table_oid_attnum_pairs)
+    if not pairs:
+        return {}
+    column_metadata_query = ColumnMetaData.objects.filter(
+        database__id=database_id,
+        table_oid__in={oid for oid, _ in pairs},
+        attnum__in={attnum for _, attnum in pairs},
+    )
+    column_metadata_map = {}
+    for column_metadata in column_metadata_query:
+        key = (column_metadata.table_oid, column_metadata.attnum)
+        if key in pairs:
+            column_metadata_map.setdefault(key, column_metadata)
+    return column_metadata_map
+
+
 def _get_default_display_names_for_summarize_transforms(transformations, current_display_names=dict()):
     default_display_names = dict()
     if not current_display_names:
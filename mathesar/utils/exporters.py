@@ -0,0 +1,234 @@
+"""
+Streaming writers for exporting records in various file formats.
+
+Each writer is a generator function taking:
+
+    columns: A dict mapping the key of each column in the records to the
+        name it should have in the exported file.
+    record_chunks: An iterable of lists of records (dicts keyed like
+        `columns`), e.g., from `db.tables.fetch_table_in_chunks`.
+    column_types: (optional) A dict mapping the key of each column to the
+        name of its PostgreSQL type, for typed formats.
+
+Writers registered with `exact_numbers` expect non-integer numbers to be
+`Decimal`s, so that numeric values can be written without losing digits.
+
+and yielding the exported file in chunks of `str` or `bytes`. Writers
+only hold one chunk of records in memory at a time.
+
+Writers are registered by format name with `register_exporter`, and
+looked up with `get_exporter`.
+"""
+import csv
+import json
+import os
+import tempfile
+from io import RawIOBase, StringIO
+from typing import Callable, NamedTuple
+
+
+class Exporter(NamedTuple):
+    name: str
+    content_type: str
+    file_extension: str
+    writer: Callable
+    exact_numbers: bool = False
+
+
+_exporters = {}
+
+
+def register_exporter(name, content_type, file_extension, exact_numbers=False):
+    """Register the decorated writer function under the given format name."""
+    def decorator(writer):
+        _exporters[name] = Exporter(
+            name, content_type, file_extension, writer, exact_numbers
+        )
+        return writer
+    return decorator
+
+
+def get_exporter(name):
+    """Return the Exporter for the given format name, or None."""
+    return _exporters.get(name)
+
+
+def list_export_formats():
+    return list(_exporters)
+
+
+def _get_base_type_name(type_name):
+    """Strip modifiers, e.g., `numeric(5, 2)` -> `numeric`."""
+    return (type_name or '').split('(')[0].strip()
+
+
+def _stringify(value):
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+@register_exporter('csv', 'text/csv', 'csv')
+def write_csv(columns, record_chunks, column_types=None):
+    csv_buffer = StringIO()
+    csv_writer = csv.DictWriter(csv_buffer, fieldnames=columns.keys())
+
+    csv_writer.writerow(columns)
+    for records in record_chunks:
+        yield csv_buffer.getvalue()
+        csv_buffer.seek(0)
+        csv_buffer.truncate(0)
+        csv_writer.writerows(records)
+    yield csv_buffer.getvalue()
+
+
+@register_exporter('ndjson', 'application/x-ndjson', 'ndjson')
+def write_ndjson(columns, record_chunks, column_types=None):
+    for records in record_chunks:
+        yield ''.join(
+            json.dumps(
+                {name: record.get(key) for key, name in columns.items()},
+                default=str,
+            ) + '\n'
+            for record in records
+        )
+
+
+class _ChunkSink(RawIOBase):
+    """A write-only file object which collects written bytes until drained."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+_PARQUET_TYPE_CONVERTERS = {
+    'smallint': ('int64', int),
+    'integer': ('int64', int),
+    'bigint': ('int64', int),
+    'real': ('float64', float),
+    'double precision': ('float64', float),
+    # Written as strings (from Decimals), since a float would lose
+    # precision, and the precision and scale needed for a decimal aren't
+    # always known.
+    'numeric': ('string', str),
+    'boolean': ('bool_', bool),
+}
+
+
+@register_exporter(
+    'parquet', 'application/vnd.apache.parquet', 'parquet', exact_numbers=True
+)
+def write_parquet(columns, record_chunks, column_types=None):
+    """
+    Write a Parquet file, with one row group per chunk of records.
+
+    Integer, floating point, and boolean columns get the corresponding
+    Parquet types. Other columns, including numeric ones, are written as
+    strings, in the same format as in other exports.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    column_types = column_types or {}
+    fields = []
+    converters = []
+    for key, name in columns.items():
+        arrow_type_name, converter = _PARQUET_TYPE_CONVERTERS.get(
+            _get_base_type_name(column_types.get(key)), ('string', _stringify)
+        )
+        fields.append(pa.field(name, getattr(pa, arrow_type_name)()))
+        converters.append((key, converter))
+    schema = pa.schema(fields)
+
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as parquet_writer:
+        for records in record_chunks:
+            if not records:
+                continue
+            parquet_writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(
+                            [
+                                None if record.get(key) is None else converter(record[key])
+                                for record in records
+                            ],
+                            type=field.type,
+                        )
+                        for (key, converter), field in zip(converters, fields)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield sink.drain()
+    yield sink.drain()
+
+
+# The maximum number of rows in an Excel worksheet, including the header.
+XLSX_MAX_ROWS = 1048576
+
+
+def _stringify_for_xlsx(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return value
+
+
+@register_exporter(
+    'xlsx',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'xlsx',
+)
+def write_xlsx(columns, record_chunks, column_types=None, read_size=65536):
+    """
+    Write an Excel workbook, with as many sheets as the rows need.
+
+    Each sheet starts with the header row. Rows are flushed to a
+    temporary file as they're written, so memory use is bounded. Since an
+    XLSX file is a zip archive, it's only streamed once all of the rows
+    have been written.
+    """
+    import xlsxwriter
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workbook_path = os.path.join(temp_dir, 'export.xlsx')
+        workbook = xlsxwriter.Workbook(
+            workbook_path,
+            {'constant_memory': True, 'strings_to_numbers': False, 'strings_to_formulas': False},
+        )
+        header = list(columns.values())
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, header)
+        row_idx = 1
+        for records in record_chunks:
+            for record in records:
+                if row_idx == XLSX_MAX_ROWS:
+                    worksheet = workbook.add_worksheet()
+                    worksheet.write_row(0, 0, header)
+                    row_idx = 1
+                if worksheet.write_row(
+                    row_idx, 0, [_stringify_for_xlsx(record.get(key)) for key in columns]
+                ) == -1:
+                    raise ValueError(f'Could not write row {row_idx} of the sheet.')
+                row_idx += 1
+        workbook.close()
+        with open(workbook_path, 'rb') as workbook_file:
+            while data := workbook_file.read(read_size):
+                yield data
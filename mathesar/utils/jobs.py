@@ -0,0 +1,78 @@
+"""
+Functions for detecting background jobs which were interrupted.
+
+Jobs (e.g., imports) run in daemon threads of a web server process, so
+they stop without a trace when the process does, e.g., when it's recycled
+or redeployed. While a job runs, a heartbeat thread keeps advancing its
+`updated_at`, so that a running job whose `updated_at` has stopped
+advancing can be recognized, and marked as failed.
+"""
+from contextlib import contextmanager
+from datetime import timedelta
+import threading
+
+from django.db import connection as django_connection
+from django.utils import timezone
+
+# The number of seconds between heartbeats of a running job.
+HEARTBEAT_INTERVAL = 10
+# The number of seconds without a heartbeat after which a running job is
+# assumed to have been interrupted.
+STALE_JOB_TIMEOUT = 120
+
+STALE_JOB_ERROR = 'The job was interrupted, e.g., by Mathesar restarting.'
+
+
+@contextmanager
+def heartbeat(model, job_id):
+    """
+    Advance the `updated_at` of a running job regularly, until exiting.
+
+    Args:
+        model: The model of the job, with `status` and `updated_at` fields.
+        job_id: The Django id of the job.
+    """
+    stopped = threading.Event()
+
+    def beat():
+        try:
+            while not stopped.wait(HEARTBEAT_INTERVAL):
+                model.objects.filter(
+                    id=job_id, status=model.status_choices.RUNNING
+                ).update(updated_at=timezone.now())
+        finally:
+            django_connection.close()
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+
+
+def is_job_stale(job):
+    return (
+        job.status == job.status_choices.RUNNING
+        and timezone.now() - job.updated_at > timedelta(seconds=STALE_JOB_TIMEOUT)
+    )
+
+
+def fail_stale_job(job):
+    """
+    Mark a job as failed if it's been interrupted, returning whether it was.
+
+    The job is refreshed if it's marked as failed. Only one caller marks a
+    given job as failed, so that it can clean up after the job safely.
+    """
+    if not is_job_stale(job):
+        return False
+    marked = type(job).objects.filter(
+        id=job.id, status=job.status_choices.RUNNING, updated_at=job.updated_at
+    ).update(
+        status=job.status_choices.FAILED,
+        error=STALE_JOB_ERROR,
+        updated_at=timezone.now(),
+    )
+    job.refresh_from_db()
+    return marked == 1
@@ -0,0 +1,59 @@
+"""
+Process-local cache of the tables joinable to each table of a database.
+
+Finding joinable tables means searching the graph of foreign keys in a
+user database, which gets expensive as the graph grows, and the UI asks
+for them whenever a table page or the exploration editor opens. We keep
+the results for each database along with a fingerprint of the catalog
+entries they were found from (see `msar.get_joinable_tables_fingerprint`).
+Getting the fingerprint is cheap, and as soon as it changes, all results
+for the database are dropped, so no result outlives a DDL change.
+
+Joinable tables are found from the catalog, which every role can read,
+so results are shared between users of a database.
+"""
+import threading
+
+from db.tables import get_joinable_tables_fingerprint, list_joinable_tables
+
+_joinable_tables_cache = {}
+_joinable_tables_cache_lock = threading.Lock()
+
+
+def get_joinable_tables(conn, database_id, table_oid, max_depth):
+    """
+    Return the tables joinable to a table, reusing earlier results if valid.
+
+    Args:
+        conn: A psycopg connection to the user database.
+        database_id: The Django id of the database containing the table.
+        table_oid: The OID of the table to get joinable tables for.
+        max_depth: Specifies how far to search for joinable tables.
+    """
+    fingerprint = get_joinable_tables_fingerprint(conn)
+    database_id = int(database_id)
+    key = (int(table_oid), max_depth)
+    with _joinable_tables_cache_lock:
+        entry = _joinable_tables_cache.get(database_id)
+        if entry is not None and entry['fingerprint'] == fingerprint and key in entry['results']:
+            return entry['results'][key]
+
+    joinable_tables = list_joinable_tables(table_oid, conn, max_depth)
+    with _joinable_tables_cache_lock:
+        entry = _joinable_tables_cache.get(database_id)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            entry = {'fingerprint': fingerprint, 'results': {}}
+            _joinable_tables_cache[database_id] = entry
+        entry['results'][key] = joinable_tables
+    return joinable_tables
+
+
+def invalidate_joinable_tables(database_id=None):
+    """
+    Drop cached joinable tables of the given database, or of all databases.
+    """
+    with _joinable_tables_cache_lock:
+        if database_id is None:
+            _joinable_tables_cache.clear()
+        else:
+            _joinable_tables_cache.pop(int(database_id), None)
@@ -0,0 +1,101 @@
+"""
+Process-local cache of the record summary templates of each database.
+
+Record summary templates are stored in `TableMetaData`, and most calls
+returning records need some of them to render summaries. Rather than
+loading every `TableMetaData` of the database for each call, and sending
+all of the templates to the user database to be parsed there, we keep the
+templates of each database here, and send only the templates of the tables
+whose summaries a call may render.
+
+Entries are versioned by the number of templates in the database and the
+latest time one of them was saved. Checking the version is a single
+aggregate query, so templates changed by other worker processes are used
+right away. Entries are also dropped (by model signals, see
+`mathesar.signals`) whenever a table's metadata changes in this process.
+"""
+import threading
+
+from django.db.models import Count, Max
+
+from db.tables import list_linked_table_oids
+from mathesar.models.base import TableMetaData
+
+_templates_cache = {}
+_templates_cache_lock = threading.Lock()
+
+
+def _get_database_templates(database_id):
+    database_id = int(database_id)
+    entries = TableMetaData.objects.filter(
+        database__id=database_id, record_summary_template__isnull=False
+    )
+    version = entries.aggregate(count=Count('id'), updated_at=Max('updated_at'))
+    with _templates_cache_lock:
+        entry = _templates_cache.get(database_id)
+    if entry is not None and entry['version'] == version:
+        return entry['templates']
+
+    templates = dict(entries.values_list('table_oid', 'record_summary_template'))
+    with _templates_cache_lock:
+        _templates_cache[database_id] = {'version': version, 'templates': templates}
+    return templates
+
+
+def _get_templates_of_tables(templates, table_oids):
+    return {
+        table_oid: templates[table_oid]
+        for table_oid in map(int, table_oids)
+        if table_oid in templates
+    }
+
+
+def get_record_summary_templates(database_id, table_oids):
+    """
+    Return the record summary templates of the given tables of a database.
+
+    The result maps table OIDs to templates, for those of the tables which
+    have a template.
+
+    Args:
+        database_id: The Django id of the database containing the tables.
+        table_oids: The OIDs of the tables whose templates we want.
+    """
+    return _get_templates_of_tables(_get_database_templates(database_id), table_oids)
+
+
+def get_linked_record_summary_templates(conn, database_id, table_oid, joined_columns=None):
+    """
+    Return the record summary templates needed to list records of a table.
+
+    These are the templates of the table itself, of the tables referenced
+    by its foreign keys, and of the tables at the end of any joined
+    columns. The referenced tables are only looked up in the user database
+    if some other table of the database has a template.
+
+    Args:
+        conn: A psycopg connection to the user database.
+        database_id: The Django id of the database containing the table.
+        table_oid: The OID of the table whose records will be listed.
+        joined_columns: The joined columns (as passed to `records.list`)
+            to be listed along with the records.
+    """
+    templates = _get_database_templates(database_id)
+    table_oids = {int(table_oid)} | {
+        int(joined_column['join_path'][-1][-1][0])
+        for joined_column in joined_columns or []
+    }
+    if templates.keys() - table_oids:
+        table_oids.update(list_linked_table_oids(table_oid, conn))
+    return _get_templates_of_tables(templates, table_oids)
+
+
+def invalidate_record_summary_templates(database_id=None):
+    """
+    Drop cached templates of the given database, or of all databases.
+    """
+    with _templates_cache_lock:
+        if database_id is None:
+            _templates_cache.clear()
+        else:
+            _templates_cache.pop(int(database_id), None)
@@ -0,0 +1,174 @@
+"""
+Functions for retyping columns online in the background, and tracking their progress.
+
+Retyping a column with `columns.patch` rewrites its table while holding a
+lock blocking all reads and writes. An online retype instead fills a new
+column in short batches, each in its own transaction, and only locks the
+table briefly at the end, to replace the column (see
+`msar.start_online_retype`). The progress of each retype is stored in a
+`RetypeJob`, so that it can be polled from any web server process.
+
+While a column is being retyped, writes of values to it which can't be
+cast to the new type fail. Retypes interrupted by the process stopping
+are marked as failed and cancelled when polled (see `mathesar.utils.jobs`).
+"""
+import threading
+import time
+
+from django.db import connection as django_connection
+from django.utils import timezone
+from psycopg.errors import LockNotAvailable
+
+from db.columns import (
+    add_online_retype_not_null_check,
+    backfill_online_retype,
+    cancel_online_retype,
+    finish_online_retype,
+    start_online_retype,
+    validate_online_retype_not_null_check,
+)
+from db.connection import mathesar_connection
+from mathesar.models.base import RetypeJob, user_database_connection
+from mathesar.utils.columns import move_column_meta_data
+from mathesar.utils.connections import get_connection_params
+from mathesar.utils.jobs import fail_stale_job, heartbeat
+
+# The minimum number of seconds between saving the progress of a retype.
+PROGRESS_SAVE_INTERVAL = 1
+# How long to wait for the lock needed to replace the column, before
+# letting other queries through and trying again.
+FINISH_LOCK_TIMEOUT = '2s'
+FINISH_ATTEMPTS = 10
+
+
+def start_retype_job(user, table_oid, column_data, database_id, batch_size=10000):
+    """
+    Start retyping a column online, in a background thread.
+
+    The new column is added before returning, so that problems such as an
+    unsupported column are reported right away.
+
+    Returns the `RetypeJob` tracking the retype.
+    """
+    connection_params = get_connection_params(database_id, user)
+    with user_database_connection(**connection_params) as conn:
+        with conn.transaction():
+            started = start_online_retype(table_oid, column_data, conn)
+    job = RetypeJob.objects.create(
+        user=user,
+        database_id=database_id,
+        table_oid=table_oid,
+        attnum=column_data['id'],
+        total_rows=started['estimated_rows'],
+    )
+    threading.Thread(
+        target=_run_retype_job,
+        args=(job.id, connection_params, table_oid, column_data, database_id, batch_size),
+        daemon=True,
+    ).start()
+    return job
+
+
+def get_retype_job(retype_job_id, user):
+    job = RetypeJob.objects.get(id=retype_job_id, user=user)
+    if fail_stale_job(job):
+        _cancel(get_connection_params(job.database_id, user), job.table_oid, job.attnum)
+    return job
+
+
+def _update_retype_job(job_id, **fields):
+    # `update` doesn't set `auto_now` fields, so we set `updated_at` here.
+    RetypeJob.objects.filter(id=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def _backfill(job_id, table_oid, column_data, batch_size, conn):
+    rows_processed = 0
+    last_saved = 0
+    after_key = None
+    while True:
+        with conn.transaction():
+            batch = backfill_online_retype(
+                table_oid, column_data, after_key, batch_size, conn
+            )
+        if batch['count'] == 0:
+            return rows_processed
+        rows_processed += batch['count']
+        after_key = batch['last_key']
+        now = time.monotonic()
+        if now - last_saved >= PROGRESS_SAVE_INTERVAL:
+            last_saved = now
+            _update_retype_job(job_id, rows_processed=rows_processed)
+
+
+def _finish(table_oid, column_data, conn):
+    for attempt in range(FINISH_ATTEMPTS):
+        try:
+            with conn.transaction():
+                conn.execute(f"SET LOCAL lock_timeout = '{FINISH_LOCK_TIMEOUT}'")
+                return finish_online_retype(table_oid, column_data, conn)
+        except LockNotAvailable:
+            if attempt == FINISH_ATTEMPTS - 1:
+                raise
+
+
+def _cancel(connection_params, table_oid, attnum):
+    # This uses a new connection, since the one running the retype may be
+    # broken. Errors are ignored, so that the error which made the retype
+    # fail is the one reported.
+    try:
+        with mathesar_connection(**connection_params) as conn:
+            cancel_online_retype(table_oid, attnum, conn)
+    except Exception:
+        pass
+
+
+def _retype(job_id, connection_params, table_oid, column_data, batch_size):
+    attnum = column_data['id']
+    # The backfill can take a long time, so we use a dedicated connection,
+    # rather than holding one from the pool.
+    with mathesar_connection(**connection_params) as conn:
+        rows_processed = _backfill(job_id, table_oid, column_data, batch_size, conn)
+        with conn.transaction():
+            has_not_null_check = add_online_retype_not_null_check(table_oid, attnum, conn)
+        if has_not_null_check:
+            with conn.transaction():
+                validate_online_retype_not_null_check(table_oid, attnum, conn)
+        return rows_processed, _finish(table_oid, column_data, conn)
+
+
+def _get_retype_job_result(job_id, connection_params, table_oid, column_data, database_id, batch_size):
+    attnum = column_data['id']
+    try:
+        with heartbeat(RetypeJob, job_id):
+            try:
+                rows_processed, new_attnum = _retype(
+                    job_id, connection_params, table_oid, column_data, batch_size
+                )
+            except Exception:
+                _cancel(connection_params, table_oid, attnum)
+                raise
+    except Exception as e:
+        return {'status': RetypeJob.status_choices.FAILED, 'error': str(e)}
+    # The column has been replaced at this point, so the retype succeeded
+    # even if its metadata can't be moved to its new attnum.
+    try:
+        with mathesar_connection(**connection_params) as conn:
+            move_column_meta_data(table_oid, attnum, new_attnum, database_id, conn)
+        error = None
+    except Exception as e:
+        error = f"The column was retyped, but its metadata couldn't be moved: {e}"
+    return {
+        'status': RetypeJob.status_choices.SUCCEEDED,
+        'rows_processed': rows_processed,
+        'result': {'attnum': new_attnum},
+        'error': error,
+    }
+
+
+def _run_retype_job(job_id, *args):
+    try:
+        _update_retype_job(job_id, **_get_retype_job_result(job_id, *args))
+    finally:
+        # This thread's connection to the Django database isn't closed by
+        # the request cycle, so we close it ourselves.
+        django_connection.close()
@@ -27,13 +27,13 @@ def set_table_meta_data(table_oid, metadata, database_id):
     )[0]
 
 
-def get_table_record_summary_templates(database_id):
+def get_import_type_suggestions(table_oid, database_id):
     """
-    Returns a dict of table OIDs to record summary template for all tables in a database.
+    Returns the column types suggested while importing the table.
+
+    Returns None if there aren't any, or the import has been verified.
     """
-    entries = TableMetaData.objects.filter(database__id=database_id)
-    return {
-        entry.table_oid: entry.record_summary_template
-        for entry in entries
-        if entry.record_summary_template is not None
-    }
+    entry = TableMetaData.objects.filter(
+        table_oid=table_oid, database__id=database_id
+    ).exclude(import_verified=True).first()
+    return entry.column_type_suggestions if entry is not None else None
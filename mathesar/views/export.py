@@ -1,15 +1,17 @@
-import csv
-from io import StringIO
-
 from django.contrib.auth.decorators import login_required
 from django import forms
 from django.http import StreamingHttpResponse, JsonResponse
+from django.utils.http import content_disposition_header
 
-from mathesar.utils.explorations import exploration_chunker
+from mathesar.utils.explorations import exploration_chunker, get_exploration
+from mathesar.utils.exporters import get_exporter, list_export_formats
 from mathesar.rpc.utils import connect
 from mathesar.rpc.records import Filter, OrderBy
 
-from db.tables import fetch_table_in_chunks
+from db.columns import get_column_info_for_table
+from db.tables import copy_table_to_csv_in_chunks, fetch_table_in_chunks, get_table
+
+EXPORT_FORMAT_CHOICES = [(name, name) for name in list_export_formats()]
 
 
 class ExportExplorationQueryForm(forms.Form):
@@ -17,6 +19,7 @@ class ExportExplorationQueryForm(forms.Form):
     exploration_id = forms.IntegerField(required=True)
     limit = forms.IntegerField(required=False)
     offset = forms.IntegerField(required=False)
+    format = forms.ChoiceField(choices=EXPORT_FORMAT_CHOICES, required=False)
 
 
 class ExportTableQueryForm(forms.Form):
@@ -24,54 +27,59 @@ class ExportTableQueryForm(forms.Form):
     table_oid = forms.IntegerField(required=True)
     filter = forms.JSONField(required=False)
     order = forms.JSONField(required=False)
+    format = forms.ChoiceField(choices=EXPORT_FORMAT_CHOICES, required=False)
+    fast = forms.BooleanField(required=False)
+
 
+def _make_export_response(chunks, export_format, name):
+    exporter = get_exporter(export_format)
+    response = StreamingHttpResponse(chunks, content_type=exporter.content_type)
+    response['Content-Disposition'] = content_disposition_header(
+        True, f'{name}.{exporter.file_extension}'
+    )
+    return response
 
-def export_exploration_csv_in_chunks(
+
+def export_exploration_in_chunks(
     user,
     database_id: int,
     exploration_id: int,
+    export_format: str = 'csv',
     **kwargs
 ):
     with connect(database_id, user) as conn:
-        csv_buffer = StringIO()
-        exploration_chunk_gen = exploration_chunker(conn, database_id, exploration_id, **kwargs)
-        columns = next(exploration_chunk_gen)
-        csv_writer = csv.DictWriter(csv_buffer, fieldnames=columns)
-
-        csv_writer.writeheader()  # writes column name(s) to csv.
-        value = csv_buffer.getvalue()
-        yield value
-        csv_buffer.seek(0)
-        csv_buffer.truncate(0)
-
-        for records in exploration_chunk_gen:
-            csv_writer.writerows(records)
-            value = csv_buffer.getvalue()
-            yield value
-            csv_buffer.seek(0)
-            csv_buffer.truncate(0)
-
-
-def stream_exploration_as_csv(
+        exploration_chunk_gen = exploration_chunker(
+            conn, database_id, exploration_id, with_column_types=True, **kwargs
+        )
+        column_types = next(exploration_chunk_gen)
+        yield from get_exporter(export_format).writer(
+            {name: name for name in column_types},
+            exploration_chunk_gen,
+            column_types,
+        )
+
+
+def stream_exploration(
     request,
     database_id: int,
     exploration_id: int,
     limit: int,
-    offset: int
+    offset: int,
+    export_format: str = 'csv',
 ) -> StreamingHttpResponse:
     user = request.user
-    response = StreamingHttpResponse(
-        export_exploration_csv_in_chunks(
+    return _make_export_response(
+        export_exploration_in_chunks(
             user,
             database_id,
             exploration_id,
+            export_format,
             limit=limit,
             offset=offset
         ),
-        content_type="text/csv"
+        export_format,
+        get_exploration(exploration_id, database_id).name,
     )
-    response['Content-Disposition'] = 'attachment'
-    return response
 
 
 @login_required
@@ -79,45 +87,47 @@ def export_exploration(request):
     form = ExportExplorationQueryForm(request.GET)
     if form.is_valid():
         data = form.cleaned_data
-        return stream_exploration_as_csv(
+        return stream_exploration(
             request=request,
             database_id=data['database_id'],
             exploration_id=data['exploration_id'],
             limit=data['limit'],
-            offset=data['offset']
+            offset=data['offset'],
+            export_format=data['format'] or 'csv',
         )
     else:
         return JsonResponse({'errors': form.errors}, status=400)
 
 
-def export_table_csv_in_chunks(
+def export_table_in_chunks(
     user,
     database_id: int,
     table_oid: int,
+    export_format: str = 'csv',
+    fast: bool = False,
     **kwargs
 ):
     with connect(database_id, user) as conn:
-        csv_buffer = StringIO()
-
-        table_fetch_gen = fetch_table_in_chunks(conn, table_oid, **kwargs)
-        columns = next(table_fetch_gen)
-        csv_writer = csv.DictWriter(csv_buffer, fieldnames=columns.keys())
-
-        csv_writer.writerow(columns)
-        value = csv_buffer.getvalue()
-        yield value
-        csv_buffer.seek(0)
-        csv_buffer.truncate(0)
-
-        for records in table_fetch_gen:
-            csv_writer.writerows(records)
-            value = csv_buffer.getvalue()
-            yield value
-            csv_buffer.seek(0)
-            csv_buffer.truncate(0)
+        if export_format == 'csv' and fast:
+            # PostgreSQL can write CSV itself, which is much faster, but
+            # with values in their PostgreSQL text form.
+            yield from copy_table_to_csv_in_chunks(conn, table_oid, **kwargs)
+            return
+        column_types = {
+            str(col['id']): col['type']
+            for col in get_column_info_for_table(table_oid, conn)
+        }
+        exporter = get_exporter(export_format)
+        table_chunk_gen = fetch_table_in_chunks(
+            conn, table_oid, exact_numbers=exporter.exact_numbers, **kwargs
+        )
+        columns = next(table_chunk_gen)
+        yield from exporter.writer(
+            columns, table_chunk_gen, column_types
+        )
 
 
-def stream_table_as_csv(
+def stream_table(
     request,
     database_id: int,
     table_oid: int,
@@ -125,22 +135,27 @@ def stream_table_as_csv(
     offset: int = None,
     order: list[OrderBy] = None,
     filter: Filter = None,
+    export_format: str = 'csv',
+    fast: bool = False,
 ) -> StreamingHttpResponse:
     user = request.user
-    response = StreamingHttpResponse(
-        export_table_csv_in_chunks(
+    with connect(database_id, user) as conn:
+        table_name = get_table(table_oid, conn)['name']
+    return _make_export_response(
+        export_table_in_chunks(
             user,
             database_id,
             table_oid,
+            export_format,
+            fast,
             limit=limit,
             offset=offset,
             order=order,
             filter=filter,
         ),
-        content_type="text/csv"
+        export_format,
+        table_name,
     )
-    response['Content-Disposition'] = 'attachment'
-    return response
 
 
 @login_required
@@ -148,12 +163,14 @@ def export_table(request):
     form = ExportTableQueryForm(request.GET)
     if form.is_valid():
         data = form.cleaned_data
-        return stream_table_as_csv(
+        return stream_table(
             request=request,
             database_id=data['database_id'],
             table_oid=data['table_oid'],
             filter=data['filter'],
-            order=data['order']
+            order=data['order'],
+            export_format=data['format'] or 'csv',
+            fast=data['fast'],
         )
     else:
         return JsonResponse({'errors': form.errors}, status=400)
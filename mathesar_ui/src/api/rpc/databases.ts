@@ -50,7 +50,11 @@ export interface RawDatabasePrivilegesForRole {
   direct: DatabasePrivilege[];
 }
 
-export type SystemSchema = 'msar' | '__msar' | 'mathesar_types';
+export type SystemSchema =
+  | 'msar'
+  | '__msar'
+  | 'mathesar_types'
+  | 'msar_summary_cache';
 
 export const databases = {
   get: rpcMethodTypeContainer<